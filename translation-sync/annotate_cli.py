@@ -1,22 +1,31 @@
 #!/usr/bin/env python3
-"""단일 번역 문서의 영어 원문 주석 진단·기록 CLI.
+"""번역 문서의 영어 원문 주석 진단·기록 CLI.
 
 사용법:
   python annotate_cli.py <version> <name>           # 진단(드리프트·검증 차이 출력, 미기록)
   python annotate_cli.py <version> <name> --write    # 정렬·검증 통과 시에만 병기본 기록
+  python annotate_cli.py --version <version> --all [--write] [--jobs N]
+  python annotate_cli.py --all-versions [--write] [--jobs N]
 
 영어 원문에 전처리와 후처리를 적용해 정규화한 뒤 한국어 본문과 정렬.
 정규화한 원문은 검증 기댓값과 동일하며, 한국어 본문과 현재 영어 원문의 일치 여부가 통과 조건.
+일괄 모드는 문서별 진단을 worker process로 나눠 실행하고 문서별 판정과 집계만 출력하며,
+``--write``는 통과한 문서 중 내용이 바뀐 문서만 모아 한 번에 기록한다.
 """
 from __future__ import annotations
 
+import os
 import re
 import sys
+from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 from sync import annotate, preprocess, postprocess, verify
-from sync.common.files import atomic_write_text
+from sync.common.files import atomic_write_batch, atomic_write_text
+from sync.common.stale_links import default_stale_link_registry
+from sync.common.versions import UNTRANSLATED_DOCUMENTS, load_versions
 
 REPO = Path(__file__).resolve().parents[1]
 _VERSION_RE = re.compile(r"^(?:master|(?:0|[1-9]\d*)\.x)$")
@@ -72,31 +81,40 @@ def _document_path(root: Path, version: str, name: str) -> Path:
     return candidate
 
 
-def main() -> int:
-    """명령줄 진입점 실행."""
+@dataclass(frozen=True)
+class _DocumentResult:
+    """문서 하나의 annotation 결과와 진단."""
 
-    if len(sys.argv) < 3:
-        print("usage: annotate_cli.py <version> <name> [--write]", file=sys.stderr)
-        return 2
-    version, name = sys.argv[1], sys.argv[2]
-    if not _VERSION_RE.fullmatch(version):
-        print(f"invalid version: {version}", file=sys.stderr)
-        return 2
-    if Path(name).name != name or not _DOCUMENT_RE.fullmatch(name):
-        print(f"invalid document: {name}", file=sys.stderr)
-        return 2
-    write = "--write" in sys.argv
+    version: str
+    name: str
+    path: Path
+    current: str
+    out: str
+    drifts: tuple[annotate.Drift, ...]
+    issues: tuple[str, ...]
+    expected: str
 
-    try:
-        enp = _document_path(
-            REPO / "i18n/en/docusaurus-plugin-content-docs",
-            version,
-            name,
-        )
-        kop = _document_path(REPO / "versioned_docs", version, name)
-    except ValueError as exc:
-        print(exc, file=sys.stderr)
-        return 2
+    @property
+    def clean(self) -> bool:
+        """드리프트와 검증 위반이 모두 없는지 여부."""
+
+        return not self.drifts and not self.issues
+
+
+def _annotate_document(version: str, name: str) -> _DocumentResult:
+    """영어 원문으로 한국어 문서를 다시 annotation하고 검증.
+
+    Raises:
+        ValueError: 허용된 로케일 루트 밖이거나 심볼릭 링크를 거치는 경로.
+        OSError: 문서를 읽을 수 없음.
+    """
+
+    enp = _document_path(
+        REPO / "i18n/en/docusaurus-plugin-content-docs",
+        version,
+        name,
+    )
+    kop = _document_path(REPO / "versioned_docs", version, name)
     en = enp.read_text(encoding="utf-8")
     ko = kop.read_text(encoding="utf-8")
 
@@ -104,16 +122,23 @@ def main() -> int:
     pre = preprocess.preprocess(en)
     expected = postprocess.postprocess(pre.text, version, pre.placeholders)
     issues = verify.verify(out, source=expected, version=version)
+    return _DocumentResult(
+        version=version,
+        name=name,
+        path=kop,
+        current=ko,
+        out=out,
+        drifts=tuple(drifts),
+        issues=tuple(issues),
+        expected=expected,
+    )
 
-    clean = (not drifts) and (not issues)
-    if clean and write:
-        atomic_write_text(kop, out)
-        print(f"OK written: {version}/{name}")
-        return 0
 
-    print(f"{'CLEAN' if clean else 'NEEDS-FIX'}: {version}/{name}  drift={len(drifts)} issues={issues}")
+def _print_details(result: _DocumentResult) -> None:
+    """드리프트와 검증 위반의 원문·번역 차이 출력."""
 
-    for drift in drifts:
+    out, expected, version = result.out, result.expected, result.version
+    for drift in result.drifts:
         if drift.op == "delete":
             print("  [EN-only / KO 누락 → 번역 추가 필요]")
             for line in drift.en_lines:
@@ -130,12 +155,13 @@ def main() -> int:
             for line in drift.ko_lines[:3]:
                 print(f"    KO~ {line}")
 
-    if issues:
+    if result.issues:
         ic_en, ic_ko = verify._inline_codes(expected), verify._inline_codes(out)
         if (ic_en - ic_ko) or (ic_ko - ic_en):
             print(f"  inline code only_EN={dict(ic_en - ic_ko)}  only_KO={dict(ic_ko - ic_en)}")
-        lt_en = verify._link_targets(expected, version=version)
-        lt_ko = verify._link_targets(out, version=version)
+        registry = default_stale_link_registry()
+        lt_en = verify._link_targets(expected, version=version, registry=registry)
+        lt_ko = verify._link_targets(out, version=version, registry=registry)
         if (lt_en - lt_ko) or (lt_ko - lt_en):
             print(f"  link only_EN={dict(lt_en - lt_ko)}  only_KO={dict(lt_ko - lt_en)}")
         cb_en, cb_ko = verify._fenced_code_blocks(expected), verify._fenced_code_blocks(out)
@@ -145,11 +171,170 @@ def main() -> int:
                 print(f"  codeblock only_EN: {b[:160]!r}")
             for b in list(sk - se)[:3]:
                 print(f"  codeblock only_KO: {b[:160]!r}")
-        if "missing original comment" in issues:
+        if "missing original comment" in result.issues:
             req, got = verify._required_comments(expected), verify._translated_comments(out)
             for c in [c for c in req if c not in got][:8]:
                 print(f"  missing comment: {c[:160]}")
-    return 0 if clean else 1
+
+
+def _bulk_documents(versions: list[str]) -> list[tuple[str, str]]:
+    """버전별로 영어 원문과 한국어 문서가 모두 있는 (버전, 문서) 목록."""
+
+    documents: list[tuple[str, str]] = []
+    for version in versions:
+        english = REPO / "i18n/en/docusaurus-plugin-content-docs" / f"version-{version}"
+        korean = REPO / "versioned_docs" / f"version-{version}"
+        documents.extend(
+            (version, path.name)
+            for path in sorted(english.glob("*.md"))
+            if path.name not in UNTRANSLATED_DOCUMENTS
+            and _DOCUMENT_RE.fullmatch(path.name)
+            and (korean / path.name).is_file()
+        )
+    return documents
+
+
+def _annotate_or_error(document: tuple[str, str]) -> _DocumentResult | str:
+    """worker용 문서 진단. 경로·읽기 오류는 출력할 메시지로 반환."""
+
+    version, name = document
+    try:
+        return _annotate_document(version, name)
+    except (OSError, UnicodeDecodeError, ValueError) as exc:
+        return f"{version}/{name}: {exc}"
+
+
+def _bulk_usage() -> int:
+    """일괄 모드 사용법 출력."""
+
+    print(
+        "usage: annotate_cli.py (--version <version> --all | --all-versions) "
+        "[--write] [--jobs N]",
+        file=sys.stderr,
+    )
+    return 2
+
+
+def _bulk_main(args: list[str]) -> int:
+    """여러 문서를 worker pool로 진단하고 집계 출력, 선택적으로 일괄 기록."""
+
+    write = "--write" in args
+    jobs = os.cpu_count() or 1
+    versions: list[str] | None = None
+    selected_all = False
+    index = 0
+    while index < len(args):
+        arg = args[index]
+        if arg in {"--version", "--jobs"}:
+            if index + 1 >= len(args):
+                return _bulk_usage()
+            value = args[index + 1]
+            index += 1
+            if arg == "--version":
+                if not _VERSION_RE.fullmatch(value):
+                    print(f"invalid version: {value}", file=sys.stderr)
+                    return 2
+                versions = [value]
+            elif not value.isdigit() or int(value) < 1:
+                print(f"invalid jobs: {value}", file=sys.stderr)
+                return 2
+            else:
+                jobs = int(value)
+        elif arg == "--all":
+            selected_all = True
+        elif arg == "--all-versions":
+            try:
+                versions = load_versions(REPO / "versions.json")
+            except (OSError, ValueError) as exc:
+                print(exc, file=sys.stderr)
+                return 2
+            selected_all = True
+        elif arg != "--write":
+            return _bulk_usage()
+        index += 1
+    if versions is None or not selected_all:
+        return _bulk_usage()
+
+    documents = _bulk_documents(versions)
+    if jobs == 1 or len(documents) <= 1:
+        results = [_annotate_or_error(document) for document in documents]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(_annotate_or_error, documents, chunksize=4))
+
+    errors = [result for result in results if isinstance(result, str)]
+    checked = [result for result in results if not isinstance(result, str)]
+    drift_ops: Counter[str] = Counter()
+    issue_counts: Counter[str] = Counter()
+    for result in checked:
+        drift_ops.update(drift.op for drift in result.drifts)
+        issue_counts.update(result.issues)
+        if not result.clean:
+            print(
+                f"NEEDS-FIX: {result.version}/{result.name}  "
+                f"drift={len(result.drifts)} issues={list(result.issues)}"
+            )
+    for error in errors:
+        print(f"ERROR: {error}", file=sys.stderr)
+
+    pending = [
+        result for result in checked if result.clean and result.out != result.current
+    ]
+    if write and pending:
+        atomic_write_batch(
+            [(result.path, result.out.encode("utf-8")) for result in pending]
+        )
+    clean = sum(result.clean for result in checked)
+    print(
+        f"documents={len(documents)} clean={clean} "
+        f"needs-fix={len(checked) - clean} errors={len(errors)} "
+        f"{'written' if write else 'changes'}={len(pending)}"
+    )
+    if drift_ops:
+        print("drift: " + " ".join(f"{op}={count}" for op, count in sorted(drift_ops.items())))
+    for issue, count in issue_counts.most_common():
+        print(f"issue: {count:>5}  {issue}")
+    if errors:
+        return 2
+    return 0 if clean == len(checked) else 1
+
+
+def main() -> int:
+    """명령줄 진입점 실행."""
+
+    if len(sys.argv) >= 2 and sys.argv[1].startswith("--"):
+        return _bulk_main(sys.argv[1:])
+    if len(sys.argv) < 3:
+        print("usage: annotate_cli.py <version> <name> [--write]", file=sys.stderr)
+        return 2
+    version, name = sys.argv[1], sys.argv[2]
+    if not _VERSION_RE.fullmatch(version):
+        print(f"invalid version: {version}", file=sys.stderr)
+        return 2
+    if Path(name).name != name or not _DOCUMENT_RE.fullmatch(name):
+        print(f"invalid document: {name}", file=sys.stderr)
+        return 2
+    write = "--write" in sys.argv
+
+    try:
+        result = _annotate_document(version, name)
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+
+    if result.clean and write:
+        atomic_write_text(result.path, result.out)
+        print(f"OK written: {version}/{name}")
+        return 0
+
+    print(
+        f"{'CLEAN' if result.clean else 'NEEDS-FIX'}: {version}/{name}  "
+        f"drift={len(result.drifts)} issues={list(result.issues)}"
+    )
+    _print_details(result)
+    return 0 if result.clean else 1
 
 
 if __name__ == "__main__":
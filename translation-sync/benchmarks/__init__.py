@@ -0,0 +1 @@
+"""실제 번역 말뭉치를 사용하는 로컬 성능 측정 모듈."""
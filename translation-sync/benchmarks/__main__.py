@@ -0,0 +1,35 @@
+"""벤치마크 묶음 실행기.
+
+사용법:
+  python -m benchmarks [SUITE] [SUITE 옵션...]
+
+SUITE를 생략하면 ``e2e``를 실행한다. 각 묶음의 옵션은
+``python -m benchmarks SUITE --help``로 확인한다.
+"""
+from __future__ import annotations
+
+import importlib
+import sys
+
+# 묶음 이름과 ``main(argv)``를 가진 모듈. 선택한 묶음의 모듈만 import한다.
+SUITES = {
+    "e2e": "benchmarks.e2e",
+    "markdown": "benchmarks.markdown_scanners",
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """선택한 벤치마크 묶음 실행."""
+
+    args = sys.argv[1:] if argv is None else argv
+    if args and args[0] in ("-l", "--list"):
+        print("\n".join(SUITES))
+        return 0
+    name = args[0] if args and args[0] in SUITES else "e2e"
+    if args and args[0] == name:
+        args = args[1:]
+    return importlib.import_module(SUITES[name]).main(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
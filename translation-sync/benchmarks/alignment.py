@@ -0,0 +1,159 @@
+"""annotation 블록 정렬 엔진 지연 측정.
+
+사용법:
+  python -m benchmarks.alignment [--documents N] [--stress-blocks N] [--skip-baseline]
+
+가장 블록이 많은 ``ja`` 문서 N개를 같은 버전 영어 원문으로 annotation하며 엔진별 정렬
+시간과 annotation 전체 시간을 측정한다. 기본 엔진(``auto``)의 병기 결과와 drift가
+``SequenceMatcher`` 기준 구현과 하나라도 다르면 실패한다.
+
+합성 stress 문서는 같은 코드 펜스와 문단 서명이 반복되는 블록 열에 1% 편집을 더해
+정렬만 측정한다. ``--skip-baseline``이면 수십 초가 걸리는 ``SequenceMatcher`` 측정을 생략한다.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from sync import annotate
+from sync.annotation import alignment
+
+REPO = Path(__file__).resolve().parents[2]
+_JA_ROOT = REPO / "i18n/ja/docusaurus-plugin-content-docs"
+_EN_ROOT = REPO / "i18n/en/docusaurus-plugin-content-docs"
+_REPEATED = (
+    ("text", "para"),
+    ("code", "```php\nreturn view('welcome');\n```"),
+    ("heading", 3),
+    ("text", "list"),
+)
+
+
+class _TimedEngine:
+    """정렬 엔진 호출 시간을 누적하는 wrapper."""
+
+    def __init__(self, engine: alignment.AlignmentEngine) -> None:
+        self.engine = engine
+        self.seconds = 0.0
+
+    def __call__(self, a: Sequence[int], b: Sequence[int]) -> list[alignment.Opcode]:
+        started = time.perf_counter()
+        try:
+            return self.engine(a, b)
+        finally:
+            self.seconds += time.perf_counter() - started
+
+
+def _largest_documents(count: int) -> list[tuple[Path, Path, str]]:
+    """블록 수가 가장 많은 (영어, 일본어, 버전) 문서 쌍."""
+
+    sized: list[tuple[int, Path, Path, str]] = []
+    for ja in _JA_ROOT.glob("version-*/*.md"):
+        en = _EN_ROOT / ja.parent.name / ja.name
+        if not en.is_file():
+            continue
+        lines = ja.read_text(encoding="utf-8").split("\n")
+        version = ja.parent.name.removeprefix("version-")
+        sized.append((len(annotate.split_blocks(lines)), en, ja, version))
+    sized.sort(key=lambda item: (-item[0], str(item[2])))
+    return [(en, ja, version) for _, en, ja, version in sized[:count]]
+
+
+def synthetic_signatures(blocks: int, seed: int = 0) -> tuple[list[tuple], list[tuple]]:
+    """반복 서명 위주 영어 블록 열과 1% 삭제·삽입을 더한 번역 블록 열."""
+
+    english: list[tuple] = []
+    for index in range(blocks):
+        match index % 10:
+            case 8:
+                english.append(("anchor", f"section-{index}"))
+            case 9:
+                english.append(("code", f"```php\n// example {index}\n```"))
+            case position:
+                english.append(_REPEATED[(0, 1, 0, 2, 0, 1, 0, 3)[position]])
+    rng = random.Random(seed)
+    translated = list(english)
+    for _ in range(blocks // 100):
+        position = rng.randrange(len(translated))
+        if rng.random() < 0.5:
+            del translated[position]
+        else:
+            translated.insert(position, rng.choice(_REPEATED))
+    return english, translated
+
+
+def _documents(args: argparse.Namespace) -> int:
+    """대형 ``ja`` 문서의 엔진별 annotation 측정과 기본 엔진 동등성 확인."""
+
+    documents = _largest_documents(args.documents)
+    totals = {name: [0.0, 0.0] for name in alignment.ENGINES}
+    differs = 0
+    for en_path, ja_path, version in documents:
+        english = en_path.read_text(encoding="utf-8")
+        japanese = ja_path.read_text(encoding="utf-8")
+        results = {}
+        for name, engine in alignment.ENGINES.items():
+            timed = _TimedEngine(engine)
+            started = time.perf_counter()
+            out, drifts = annotate.annotate(
+                english,
+                japanese,
+                version,
+                alignment_engine=timed,
+            )
+            totals[name][0] += timed.seconds
+            totals[name][1] += time.perf_counter() - started
+            results[name] = (out, [(d.op, d.en_lines, d.ko_lines) for d in drifts])
+        if results["auto"] != results["sequence-matcher"]:
+            print(f"auto engine differs: {ja_path}", file=sys.stderr)
+            return 1
+        differs += results["patience"] != results["sequence-matcher"]
+
+    print(f"ja documents: {len(documents)}  patience differs: {differs}")
+    for name, (aligned, total) in totals.items():
+        print(
+            f"  {name:<17} align {aligned * 1000:8.1f}ms"
+            f"  annotate {total * 1000:8.1f}ms"
+        )
+    return 0
+
+
+def _stress(args: argparse.Namespace) -> None:
+    """합성 대형 블록 열의 엔진별 정렬 시간."""
+
+    english, translated = synthetic_signatures(args.stress_blocks)
+    a, b = alignment.intern_signatures(english, translated)
+    print(f"synthetic: {len(a)} x {len(b)} blocks")
+    for name, engine in alignment.ENGINES.items():
+        if name == "sequence-matcher" and args.skip_baseline:
+            continue
+        started = time.perf_counter()
+        opcodes = engine(a, b)
+        elapsed = time.perf_counter() - started
+        matched = sum(i2 - i1 for op, i1, i2, _, _ in opcodes if op == "equal")
+        print(f"  {name:<17} {elapsed * 1000:10.1f}ms  matched {matched}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """대형 문서와 합성 stress 문서의 엔진별 정렬 시간 출력."""
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.alignment")
+    parser.add_argument("--documents", type=int, default=10)
+    parser.add_argument("--stress-blocks", type=int, default=20000)
+    parser.add_argument("--skip-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    status = _documents(args)
+    if status:
+        return status
+    _stress(args)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
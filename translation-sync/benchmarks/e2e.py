@@ -0,0 +1,439 @@
+"""실제 말뭉치로 전체 번역 경로 처리량 측정.
+
+사용법:
+  python -m benchmarks [e2e] [--workload NAME ...] [--version V] [--limit N]
+                       [--provider {identity,fake,fake-cli}] [--latency-ms MS]
+                       [--jitter-ms MS] [--pack N] [--repeat N]
+                       [--baseline PATH] [--save-baseline] [--tolerance R]
+
+실제 ``i18n/en``·``versioned_docs``·``i18n/ja`` 문서를 임시 저장소 root에 복사해
+작업량별 원문 변경을 만들고, ``main.translate_changes``로 사전검증 → 번역 →
+후처리 → 검증 → 기록을 실행한다. 작업 트리는 바꾸지 않는다.
+
+provider:
+  identity  ``render_identity_response``로 provider 호출 없이 응답 (기본값)
+  fake      ``benchmarks.fake_provider``의 loopback Responses 서버에
+            ``provider=openai`` 설정으로 요청. ``--latency-ms``·``--jitter-ms``
+            지연을 서버가 주입하므로 live adapter와 HTTP 왕복을 거친다. 응답은
+            live model처럼 ``{{version}}`` placeholder를 보존한다. ``--pack N``은
+            ``TRANSLATION_PACK_MAX_BLOCKS``로 작은 block을 묶음 요청으로 보낸다.
+  fake-cli  ``benchmarks.fake_provider``의 ``codex exec`` stub을 ``provider=cli``
+            설정으로 실행. 요청마다 CLI process와 격리 HOME을 새로 만드는
+            비용을 재며, ``--pack N``이면 묶음 하나를 process 하나로 보낸다.
+
+작업량:
+  create    한 버전 전체 문서 생성 (``--limit``로 문서 수 제한)
+  modify    모든 버전에 있는 문서 하나의 한 줄 수정
+  reorder   이름 있는 절 두 개의 순서 교체
+  table     가장 큰 표의 가운데 행 수정
+
+단계별 시간은 ``sync.runtime.trace``의 단계 이름으로 집계한다. 기준선은
+``--save-baseline``으로 JSON에 저장하고, 다음 실행은 기준선보다 docs/sec가
+``--tolerance`` 비율 넘게 낮으면 종료 코드 1로 끝난다.
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import main as sync_main
+from benchmarks.fake_provider import (
+    FakeProvider,
+    Scenario,
+    cli_config,
+    cli_requests,
+    write_cli_stub,
+)
+from sync import config, diff
+from sync.runtime import trace
+
+REPO = Path(__file__).resolve().parents[2]
+EN_ROOT = Path("i18n/en/docusaurus-plugin-content-docs")
+JA_ROOT = Path("i18n/ja/docusaurus-plugin-content-docs")
+KO_ROOT = Path("versioned_docs")
+DEFAULT_BASELINE = Path(".translation-benchmarks/e2e-baseline.json")
+LOCALES = ("ko", "ja")
+
+_NAMED_SECTION_RE = re.compile(r'^<a name="[^"]+"></a>\n## ', re.MULTILINE)
+_PLAIN_LINE_RE = re.compile(r"^[A-Z][^|<>`#\n]{40,}\.$", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class Edit:
+    """작업량 하나의 영어 원문 변경. ``old``가 ``None``이면 새 문서."""
+
+    version: str
+    document: str
+    old: str | None
+    new: str
+
+    @property
+    def path(self) -> str:
+        """저장소 기준 영어 원문 경로."""
+
+        return (EN_ROOT / f"version-{self.version}" / self.document).as_posix()
+
+
+def _versions() -> list[str]:
+    """``versions.json``의 지원 버전."""
+
+    return json.loads((REPO / "versions.json").read_text(encoding="utf-8"))
+
+
+def _documents(version: str) -> list[str]:
+    """버전의 영어 원문 문서 상대 경로, 이름 순."""
+
+    root = REPO / EN_ROOT / f"version-{version}"
+    return sorted(path.relative_to(root).as_posix() for path in root.rglob("*.md"))
+
+
+def _source(version: str, document: str) -> str:
+    """영어 원문."""
+
+    return (REPO / EN_ROOT / f"version-{version}" / document).read_text(encoding="utf-8")
+
+
+def create_workload(version: str, limit: int | None) -> list[Edit]:
+    """한 버전 문서 전체를 새로 만드는 변경."""
+
+    documents = _documents(version)[:limit]
+    return [Edit(version, document, None, _source(version, document)) for document in documents]
+
+
+def modify_workload(document: str) -> list[Edit]:
+    """모든 버전에서 같은 문서의 첫 일반 문단 한 줄을 바꾼 변경."""
+
+    edits: list[Edit] = []
+    for version in _versions():
+        if document not in _documents(version):
+            continue
+        old = _source(version, document)
+        match = _PLAIN_LINE_RE.search(old)
+        if match is None:
+            continue
+        line = match.group(0)
+        new = old[: match.start()] + line[:-1] + " in every release." + old[match.end() :]
+        edits.append(Edit(version, document, old, new))
+    return edits
+
+
+def _named_sections(text: str) -> list[tuple[int, int]]:
+    """``<a name>``으로 시작하는 2단계 절의 (시작, 끝) 위치."""
+
+    starts = [match.start() for match in _NAMED_SECTION_RE.finditer(text)]
+    return [
+        (start, starts[index + 1] if index + 1 < len(starts) else len(text))
+        for index, start in enumerate(starts)
+    ]
+
+
+def reorder_workload(version: str) -> list[Edit]:
+    """이름 있는 절이 가장 많은 문서에서 가운데 두 절의 순서를 바꾼 변경."""
+
+    candidates = [
+        (len(_named_sections(_source(version, document))), document)
+        for document in _documents(version)
+    ]
+    count, document = max(candidates)
+    if count < 3:
+        return []
+    old = _source(version, document)
+    sections = _named_sections(old)
+    middle = len(sections) // 2
+    (first_start, first_end), (_, second_end) = sections[middle - 1], sections[middle]
+    first = old[first_start:first_end]
+    second = old[first_end:second_end]
+    if not second.endswith("\n\n"):
+        return []
+    new = old[:first_start] + second + first + old[second_end:]
+    return [Edit(version, document, old, new)]
+
+
+def _largest_table(text: str) -> tuple[int, int]:
+    """가장 긴 연속 표 행 구간의 (시작 줄, 끝 줄)."""
+
+    best = (0, 0)
+    start = None
+    lines = text.split("\n")
+    for index, line in enumerate([*lines, ""]):
+        if line.startswith("|"):
+            start = index if start is None else start
+            continue
+        if start is not None and index - start > best[1] - best[0]:
+            best = (start, index)
+        start = None
+    return best
+
+
+def table_workload(version: str) -> list[Edit]:
+    """가장 큰 표가 있는 문서에서 표 가운데 본문 행의 마지막 칸을 바꾼 변경."""
+
+    candidates = []
+    for document in _documents(version):
+        start, end = _largest_table(_source(version, document))
+        candidates.append((end - start, document))
+    rows, document = max(candidates)
+    if rows < 3:
+        return []
+    old = _source(version, document)
+    lines = old.split("\n")
+    start, end = _largest_table(old)
+    index = (start + 2 + end) // 2
+    cells = lines[index].rstrip().rstrip("|").rstrip()
+    lines[index] = f"{cells} (updated) |"
+    return [Edit(version, document, old, "\n".join(lines))]
+
+
+def _copy(relative: Path, root: Path) -> None:
+    """저장소 파일 하나를 임시 root에 복사."""
+
+    source = REPO / relative
+    if source.is_file():
+        target = root / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, target)
+
+
+def _scratch(edits: list[Edit], root: Path) -> list[diff.SourceChange]:
+    """임시 root에 변경 전 locale 문서와 변경 후 원문을 두고 원문 변경 목록 반환."""
+
+    _copy(Path("versions.json"), root)
+    changes: list[diff.SourceChange] = []
+    for edit in edits:
+        target = root / edit.path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(edit.new, encoding="utf-8")
+        if edit.old is None:
+            changes.append(diff.SourceChange(path=edit.path, status="A"))
+            continue
+        for locale_root in (KO_ROOT, JA_ROOT):
+            _copy(locale_root / f"version-{edit.version}" / edit.document, root)
+        changes.append(
+            diff.SourceChange(
+                path=edit.path,
+                status="M",
+                hunks=diff.hunks_between(edit.old, edit.new),
+            )
+        )
+    return changes
+
+
+def _translate(
+    changes: list[diff.SourceChange],
+    root: Path,
+    run_trace: trace.RunTrace,
+    *,
+    scenario: Scenario | None,
+    pack: int,
+    cli: bool,
+) -> tuple[list[str], int | None]:
+    """변경을 번역하고 문제 목록과 가짜 provider가 받은 요청 수 반환.
+
+    ``scenario``가 ``None``이면 identity provider를, ``cli``이면 CLI stub을 쓴다.
+    """
+
+    if scenario is None:
+        cfg = config.Config(
+            provider="identity", values={"TRANSLATION_PROVIDER": "identity"}
+        )
+        issues = sync_main.translate_changes(
+            changes, cfg, repo_root=root, trace=run_trace
+        )
+        return issues, None
+    env = {"TRANSLATION_PACK_MAX_BLOCKS": str(pack)} if pack else {}
+    if cli:
+        stub = write_cli_stub(root / "fake-cli", scenario)
+        issues = sync_main.translate_changes(
+            changes, cli_config(stub, **env), repo_root=root, trace=run_trace
+        )
+        return issues, cli_requests(stub)
+    with FakeProvider(scenario) as provider:
+        issues = sync_main.translate_changes(
+            changes, provider.config(**env), repo_root=root, trace=run_trace
+        )
+        return issues, provider.state.requests
+
+
+def run_workload(
+    edits: list[Edit],
+    *,
+    scenario: Scenario | None = None,
+    pack: int = 0,
+    cli: bool = False,
+) -> dict[str, object]:
+    """작업량 한 번 실행의 처리량과 단계별 시간.
+
+    Args:
+        edits: 작업량 원문 변경.
+        scenario: 가짜 provider 시나리오. ``None``이면 identity provider.
+        pack: 가짜 provider 묶음 요청당 최대 block 수. 2 미만이면 묶지 않음.
+        cli: Responses 서버 대신 ``codex exec`` stub으로 요청할지 여부.
+    """
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        changes = _scratch(edits, root)
+        run_trace = trace.RunTrace(root / "trace.jsonl")
+        started = time.perf_counter()
+        issues, requests = _translate(
+            changes, root, run_trace, scenario=scenario, pack=pack, cli=cli
+        )
+        elapsed = time.perf_counter() - started
+        stages = {
+            total.stage: round(total.wall_seconds, 4) for total in run_trace.totals()
+        }
+        run_trace.close(stderr=io.StringIO())
+    if issues:
+        raise RuntimeError(f"workload failed: {issues[0]}")
+    result: dict[str, object] = {
+        "documents": len(edits),
+        "targets": len(edits) * len(LOCALES),
+        "seconds": round(elapsed, 4),
+        "docs_per_second": round(len(edits) / elapsed, 3),
+        "stages": stages,
+    }
+    if requests is not None:
+        result["provider_requests"] = requests
+    return result
+
+
+def _workloads(args: argparse.Namespace) -> dict[str, Callable[[], list[Edit]]]:
+    """이름별 작업량 구성 함수."""
+
+    return {
+        "create": lambda: create_workload(args.version, args.limit),
+        "modify": lambda: modify_workload(args.document),
+        "reorder": lambda: reorder_workload(args.version),
+        "table": lambda: table_workload(args.version),
+    }
+
+
+def compare(
+    results: dict[str, dict[str, object]],
+    baseline: dict[str, dict[str, object]],
+    tolerance: float,
+) -> list[str]:
+    """기준선보다 docs/sec가 허용 비율 넘게 낮은 작업량 목록."""
+
+    regressions: list[str] = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        before = float(previous["docs_per_second"])
+        after = float(result["docs_per_second"])
+        if after < before * (1 - tolerance):
+            regressions.append(
+                f"{name}: {after:.3f} docs/s < baseline {before:.3f} docs/s "
+                f"(-{(1 - after / before) * 100:.0f}%)"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """작업량별 처리량과 단계별 시간 출력, 기준선 비교."""
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks e2e")
+    parser.add_argument(
+        "--workload",
+        action="append",
+        choices=("create", "modify", "reorder", "table"),
+    )
+    parser.add_argument(
+        "--version",
+        default=next(version for version in _versions() if version != "master"),
+    )
+    parser.add_argument("--document", default="installation.md")
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument(
+        "--provider", choices=("identity", "fake", "fake-cli"), default="identity"
+    )
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--pack", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+    scenario = None
+    if args.provider != "identity":
+        try:
+            scenario = Scenario(
+                annotate=True,
+                latency_ms=args.latency_ms,
+                jitter_ms=args.jitter_ms,
+            )
+        except ValueError as exc:
+            parser.error(str(exc))
+    elif args.latency_ms or args.jitter_ms or args.pack:
+        parser.error(
+            "--latency-ms, --jitter-ms and --pack require a fake --provider"
+        )
+
+    builders = _workloads(args)
+    results: dict[str, dict[str, object]] = {}
+    for name in args.workload or list(builders):
+        edits = builders[name]()
+        if not edits:
+            print(f"{name}: no matching documents", file=sys.stderr)
+            continue
+        runs = [
+            run_workload(
+                edits,
+                scenario=scenario,
+                pack=args.pack,
+                cli=args.provider == "fake-cli",
+            )
+            for _ in range(args.repeat)
+        ]
+        result = min(runs, key=lambda run: float(run["seconds"]))
+        result["docs_per_second_median"] = round(
+            statistics.median(float(run["docs_per_second"]) for run in runs), 3
+        )
+        results[name] = result
+        stages = "  ".join(
+            f"{stage} {seconds:.2f}s" for stage, seconds in result["stages"].items()
+        )
+        requests = (
+            f"{result['provider_requests']:5} requests  "
+            if "provider_requests" in result
+            else ""
+        )
+        print(
+            f"{name:8} {result['documents']:4} docs  {result['seconds']:8.2f}s  "
+            f"{result['docs_per_second']:7.3f} docs/s  {requests}{stages}"
+        )
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(
+            json.dumps(results, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        print(f"baseline saved: {args.baseline}")
+        return 0
+    if not args.baseline.is_file():
+        return 0
+    regressions = compare(
+        results,
+        json.loads(args.baseline.read_text(encoding="utf-8")),
+        args.tolerance,
+    )
+    for regression in regressions:
+        print(f"regression: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
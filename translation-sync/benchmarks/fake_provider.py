@@ -0,0 +1,726 @@
+"""부하·동시성 검증용 로컬 가짜 provider.
+
+사용법:
+  python -m benchmarks.fake_provider [--port N] [--version V] [--annotate]
+                                     [--latency-ms MS]
+                                     [--jitter-ms MS] [--distribution NAME]
+                                     [--burst FAULT ...] [--fault-rate R]
+                                     [--fault FAULT] [--retry-after S] [--seed N]
+
+``POST /v1/responses``를 흉내 내는 loopback HTTP 서버와 ``provider=cli``용
+``codex exec`` stub을 제공한다. 응답 본문은 요청의 ``English Source`` section을
+``--version``으로 identity 렌더링한 결과이고, version이 없으면 원문을 그대로
+돌려준다. ``--annotate``는 version 없이도 annotation을 붙이되 live model처럼
+``{{version}}`` placeholder를 치환하지 않아 여러 버전 요청에 한 서버로 답한다.
+instructions(운영 프롬프트)의 문자로 목표 locale을 알 수 있으면 산문 줄 끝에
+목표 언어 표식을 붙여 응답 계약의 목표 언어 검증을 통과하게 한다. 묶음 요청에는
+block 구분선마다 같은 응답을 이어 답한다. 지연은
+``latency-ms``를 중심으로 ``uniform``(±jitter) 또는 ``exponential``(평균 jitter
+추가) 분포에서 seed로 결정적으로 뽑는다.
+
+장애는 요청 순서대로 먼저 ``--burst`` 목록을 소비하고, 그 뒤에는 ``--fault-rate``
+비율로 ``--fault``를 낸다. 장애 종류는 HTTP status(429, 5xx, ``Retry-After``
+포함), ``incomplete``(잘린 본문과 미완료 상태), ``empty``(빈 본문),
+``disconnect``(응답 없이 연결 종료)다. ``"stream": true`` 요청에는 Responses
+SSE event로 답한다. usage의 ``cached_tokens``는 같은 ``prompt_cache_key``로 받은
+직전 요청과 instructions·input 앞부분이 공백 단위로 겹치는 길이다.
+
+테스트는 ``FakeProvider``를 context manager로 열고 ``config()``로 base URL이
+재정의된 설정을 받는다. 재정의 key는 환경에서 읽지 않으므로 실제 실행에는 영향이
+없다.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+DISTRIBUTIONS = ("uniform", "exponential")
+RESPONSE_FAULTS = ("incomplete", "empty", "disconnect")
+_RETRY_AFTER_STATUSES = {429, 503}
+_PACKED_HEADING = "# Translation Sync Packed Input\n\n"
+_PACK_DELIMITER_RE = re.compile(r"^=== translation-sync block \d+ ===$", re.MULTILINE)
+_SOURCE_HEADING = "## English Source\n\n"
+_NEXT_HEADING = "\n## Existing Translation Context\n\n"
+_STREAM_DELTA_CHARS = 256
+# 목표 locale별로 산문 줄 끝에 붙이는 표식. 언어 검증의 문자 수 하한을 넘게 반복한다.
+_LOCALE_MARKERS = {"ko": "번역", "ja": "ほんやく"}
+_FENCE_RE = re.compile(r"^\s*(`{3,}|~{3,})")
+_NON_PROSE_PREFIXES = ("<", "#", "---", "===")
+_REFERENCE_DEFINITION_RE = re.compile(r"^\[[^\]]+\]:\s")
+_ADMONITION_LINE_RE = re.compile(r"^>[ \t]*\[![A-Za-z]+][ \t]*$")
+_SENTENCE_END = ".!?:"
+_FAKE_MODEL = "gpt-5.6-luna"
+# ``annotate`` 렌더링에서 ``{{version}}`` 자리를 잠시 대신하는 말뭉치에 없는 버전.
+_PLACEHOLDER_VERSION = "999.x"
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """가짜 provider의 응답·지연·장애 설정."""
+
+    version: str | None = None
+    annotate: bool = False
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    distribution: str = "uniform"
+    burst: tuple[str, ...] = ()
+    fault_rate: float = 0.0
+    fault: str = "503"
+    retry_after: float | None = 1.0
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        """분포와 장애 이름 검증."""
+
+        if self.distribution not in DISTRIBUTIONS:
+            raise ValueError(f"distribution must be one of: {', '.join(DISTRIBUTIONS)}")
+        for fault in (*self.burst, self.fault):
+            _validate_fault(fault)
+        object.__setattr__(self, "burst", tuple(self.burst))
+
+    def to_json(self) -> str:
+        """CLI stub에 넣을 JSON 표현."""
+
+        return json.dumps(asdict(self), sort_keys=True)
+
+    @classmethod
+    def from_json(cls, text: str) -> Scenario:
+        """``to_json`` 결과에서 복원."""
+
+        return cls(**json.loads(text))
+
+
+def _validate_fault(fault: str) -> None:
+    """HTTP 오류 status 또는 응답 장애 이름인지 확인."""
+
+    if fault in RESPONSE_FAULTS:
+        return
+    if not fault.isdigit() or not 400 <= int(fault) <= 599:
+        raise ValueError(
+            f"fault must be an HTTP error status or one of: {', '.join(RESPONSE_FAULTS)}"
+        )
+
+
+def source_from_request(text: str) -> str:
+    """렌더링된 번역 요청에서 ``English Source`` section 본문 추출.
+
+    section이 없으면 요청 전체를 원문으로 본다.
+    """
+
+    start = text.find(_SOURCE_HEADING)
+    if start < 0:
+        return text
+    start += len(_SOURCE_HEADING)
+    end = text.find(_NEXT_HEADING, start)
+    return text[start:] if end < 0 else text[start:end]
+
+
+def identity_output(text: str, version: str | None, *, annotate: bool = False) -> str:
+    """요청에 대한 결정적 identity 응답. 렌더링할 수 없으면 원문.
+
+    묶음 요청은 block마다 구분선 줄과 그 block의 응답을 이어 돌려준다.
+    ``version``이 없고 ``annotate``이면 ``{{version}}`` placeholder를 보존한다.
+    """
+
+    if text.startswith(_PACKED_HEADING):
+        delimiters = list(_PACK_DELIMITER_RE.finditer(text))
+        ends = [match.start() for match in delimiters[1:]] + [len(text)]
+        return "\n".join(
+            f"{match.group(0)}\n"
+            f"{identity_output(text[match.end() : end], version, annotate=annotate)}"
+            for match, end in zip(delimiters, ends, strict=True)
+        )
+    source = source_from_request(text)
+    if version is None and not annotate:
+        return source
+    from sync.verification.response_contract import render_identity_response
+
+    try:
+        if version is None:
+            return render_identity_response(source, _PLACEHOLDER_VERSION).replace(
+                _PLACEHOLDER_VERSION, "{{version}}"
+            )
+        return render_identity_response(source, version)
+    except (TypeError, ValueError):
+        return source
+
+
+def target_locale(instructions: str) -> str | None:
+    """운영 프롬프트의 문자로 짐작한 목표 locale. 알 수 없으면 ``None``."""
+
+    if any("\u3040" <= char <= "\u30ff" for char in instructions):
+        return "ja"
+    if any("\uac00" <= char <= "\ud7a3" for char in instructions):
+        return "ko"
+    return None
+
+
+def _marked(text: str, marker: str) -> str:
+    """영문자 수의 15%와 8자 중 긴 길이로 반복한 표식을 ``text`` 끝에 붙인 문자열.
+
+    문장 수가 바뀌지 않도록 끝 문장 부호가 있으면 그 앞에 둔다.
+    """
+
+    letters = sum(char.isalpha() for char in text)
+    repeated = marker * math.ceil(max(8, letters * 0.15) / len(marker))
+    body = text.rstrip(_SENTENCE_END)
+    return f"{body} {repeated}{text[len(body) :]}"
+
+
+def _localized_table(lines: list[str], locale: str, marker: str) -> list[str]:
+    """응답 계약의 셀 언어 검증을 그대로는 통과하지 못하는 표 셀에만 표식 추가."""
+
+    from sync.common.markdown import table_row_cells
+    from sync.verification import response_contract
+
+    separators = [
+        response_contract._table_line_signature(line)[0] == "separator"  # noqa: SLF001
+        for line in lines
+    ]
+    if not any(separators):
+        return lines
+    headers: list[str] | None = None
+    localized: list[str] = []
+    for line, separator in zip(lines, separators, strict=True):
+        if separator:
+            localized.append(line)
+            continue
+        cells = table_row_cells(line)
+        marked = [
+            cell
+            if response_contract._table_cell_language_is_valid(  # noqa: SLF001
+                cell,
+                cell,
+                locale,
+                header=(
+                    None
+                    if headers is None
+                    else headers[column] if column < len(headers) else None
+                ),
+                is_data_cell=headers is not None,
+            )
+            else _marked(cell, marker)
+            for column, cell in enumerate(cells)
+        ]
+        headers = cells if headers is None else headers
+        if marked == cells:
+            localized.append(line)
+            continue
+        ending = line[len(line.rstrip("\r\n")) :]
+        localized.append(f"| {' | '.join(marked)} |{ending}")
+    return localized
+
+
+def localized_output(text: str, locale: str | None) -> str:
+    """code fence·주석·heading 밖 산문 줄과 표 산문 셀에 목표 언어 표식 추가.
+
+    표식은 줄 끝 hard break와 문장 부호 앞에 둔다. 실제 번역처럼 admonition 뒤
+    lazy continuation 줄은 원문 주석 없이 인용으로 옮긴다. locale이 없으면 그대로
+    돌려준다.
+    """
+
+    marker = _LOCALE_MARKERS.get(locale or "")
+    if marker is None:
+        return text
+    lines: list[str] = []
+    table: list[str] = []
+    fence = ""
+    admonition = False
+    for line in text.splitlines(keepends=True):
+        body = line.rstrip()
+        stripped = body.lstrip()
+        if not fence and admonition and stripped:
+            if stripped.startswith("<!--"):
+                continue
+            if not stripped.startswith(">"):
+                body, line = f"> {body}", f"> {line}"
+                stripped = body
+        marker_line = bool(_ADMONITION_LINE_RE.match(stripped))
+        admonition = marker_line or (admonition and bool(stripped))
+        if not fence and stripped.startswith("|"):
+            table.append(line)
+            continue
+        lines.extend(_localized_table(table, locale, marker))
+        table.clear()
+        match = _FENCE_RE.match(line)
+        if match is not None and (not fence or match.group(1).startswith(fence)):
+            fence = "" if fence else match.group(1)[:3]
+            lines.append(line)
+            continue
+        if (
+            fence
+            or not stripped
+            or marker_line
+            or stripped.startswith(_NON_PROSE_PREFIXES)
+            or _REFERENCE_DEFINITION_RE.match(stripped)
+        ):
+            lines.append(line)
+            continue
+        tail = line[len(body) :]
+        if body.endswith("\\"):
+            body, tail = body[:-1], "\\" + tail
+        lines.append(f"{_marked(body, marker)}{tail}")
+    lines.extend(_localized_table(table, locale, marker))
+    return "".join(lines)
+
+
+def response_text(text: str, instructions: str, scenario: Scenario) -> str:
+    """요청과 instructions에 대한 결정적 가짜 번역 응답."""
+
+    return localized_output(
+        identity_output(text, scenario.version, annotate=scenario.annotate),
+        target_locale(instructions),
+    )
+
+
+def _draw_latency(scenario: Scenario, rng: random.Random) -> float:
+    """분포에서 뽑은 응답 지연 초."""
+
+    if scenario.distribution == "exponential":
+        extra = rng.expovariate(1 / scenario.jitter_ms) if scenario.jitter_ms else 0.0
+        return (scenario.latency_ms + extra) / 1000
+    jitter = rng.uniform(-scenario.jitter_ms, scenario.jitter_ms)
+    return max(0.0, scenario.latency_ms + jitter) / 1000
+
+
+def _outcome(scenario: Scenario, index: int, rng: random.Random) -> str:
+    """``index``번째 요청의 결과. 정상이면 ``ok``."""
+
+    if index < len(scenario.burst):
+        return scenario.burst[index]
+    if scenario.fault_rate and rng.random() < scenario.fault_rate:
+        return scenario.fault
+    return "ok"
+
+
+@dataclass
+class _ServerState:
+    """요청 순서, 동시 처리 수와 결과 집계."""
+
+    scenario: Scenario
+    rng: random.Random = field(init=False)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    requests: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    outcomes: Counter[str] = field(default_factory=Counter)
+    prefixes: dict[str, list[str]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """seed로 난수 생성기 준비."""
+
+        self.rng = random.Random(self.scenario.seed)
+
+    def begin(self) -> tuple[int, str, float]:
+        """요청 하나를 시작하고 순서 번호, 결과와 지연 결정."""
+
+        with self.lock:
+            index = self.requests
+            outcome = _outcome(self.scenario, index, self.rng)
+            delay = _draw_latency(self.scenario, self.rng)
+            self.requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            self.outcomes[outcome] += 1
+        return index, outcome, delay
+
+    def cached_tokens(self, key: str, words: list[str]) -> int:
+        """같은 cache key의 직전 요청과 겹치는 앞부분 단어 수를 세고 요청 기록."""
+
+        with self.lock:
+            previous = self.prefixes.get(key, [])
+            self.prefixes[key] = words
+        shared = 0
+        for left, right in zip(previous, words):
+            if left != right:
+                break
+            shared += 1
+        return shared
+
+    def end(self) -> None:
+        """요청 하나 종료."""
+
+        with self.lock:
+            self.in_flight -= 1
+
+
+def _response_body(
+    request_id: int,
+    status: str,
+    text: str,
+    input_tokens: int,
+    cached_tokens: int,
+) -> dict[str, object]:
+    """Responses API 형식의 응답 객체."""
+
+    return {
+        "id": f"resp_fake_{request_id}",
+        "object": "response",
+        "created_at": int(time.time()),
+        "model": _FAKE_MODEL,
+        "status": status,
+        "incomplete_details": (
+            {"reason": "max_output_tokens"} if status == "incomplete" else None
+        ),
+        "output": [
+            {
+                "id": f"msg_fake_{request_id}",
+                "type": "message",
+                "role": "assistant",
+                "status": "completed" if status == "completed" else "incomplete",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }
+        ],
+        "usage": {
+            "input_tokens": input_tokens,
+            "output_tokens": len(text.split()),
+            "total_tokens": input_tokens + len(text.split()),
+            "input_tokens_details": {"cached_tokens": cached_tokens},
+            "output_tokens_details": {"reasoning_tokens": 0},
+        },
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """``/responses`` POST 처리기."""
+
+    protocol_version = "HTTP/1.1"
+    server: FakeProviderServer
+
+    def log_message(self, format: str, *args: object) -> None:
+        """요청 로그 출력 생략."""
+
+    def do_POST(self) -> None:
+        """설정된 지연과 장애를 적용해 Responses 요청에 응답."""
+
+        length = int(self.headers.get("Content-Length", "0"))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if not self.path.rstrip("/").endswith("/responses"):
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": {"message": "not found"}})
+            return
+        state = self.server.state
+        index, outcome, delay = state.begin()
+        try:
+            time.sleep(delay)
+            self._respond(outcome, payload, index)
+        finally:
+            state.end()
+
+    def _respond(self, outcome: str, payload: dict[str, object], request_id: int) -> None:
+        """결과 종류에 맞는 HTTP 응답 기록."""
+
+        if outcome == "disconnect":
+            self.close_connection = True
+            return
+        if outcome.isdigit():
+            headers = {}
+            retry_after = self.server.state.scenario.retry_after
+            if int(outcome) in _RETRY_AFTER_STATUSES and retry_after is not None:
+                headers["Retry-After"] = f"{retry_after:g}"
+            self._send_json(
+                int(outcome),
+                {"error": {"message": "injected fault", "type": "fake_provider", "code": None}},
+                headers,
+            )
+            return
+        input_text = str(payload.get("input", ""))
+        text = response_text(
+            input_text,
+            str(payload.get("instructions") or ""),
+            self.server.state.scenario,
+        )
+        status = "completed"
+        if outcome == "empty":
+            text = ""
+        elif outcome == "incomplete":
+            text = text[: len(text) // 2]
+            status = "incomplete"
+        words = f"{payload.get('instructions') or ''}\n{input_text}".split()
+        cached = self.server.state.cached_tokens(
+            str(payload.get("prompt_cache_key") or ""), words
+        )
+        body = _response_body(request_id, status, text, len(words), cached)
+        if payload.get("stream"):
+            self._stream(body, text)
+        else:
+            self._send_json(HTTPStatus.OK, body)
+
+    def _send_json(
+        self,
+        status: int,
+        body: dict[str, object],
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """JSON 응답 기록."""
+
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _stream(self, body: dict[str, object], text: str) -> None:
+        """Responses SSE event 순서로 응답 기록 후 연결 종료."""
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        item_id = body["output"][0]["id"]  # type: ignore[index]
+        events: list[dict[str, object]] = [
+            {"type": "response.created", "response": {**body, "status": "in_progress", "output": []}},
+        ]
+        events.extend(
+            {
+                "type": "response.output_text.delta",
+                "item_id": item_id,
+                "output_index": 0,
+                "content_index": 0,
+                "delta": text[start : start + _STREAM_DELTA_CHARS],
+            }
+            for start in range(0, len(text), _STREAM_DELTA_CHARS)
+        )
+        final = "response.completed" if body["status"] == "completed" else "response.incomplete"
+        events.append({"type": final, "response": body})
+        for number, event in enumerate(events):
+            event["sequence_number"] = number
+            self.wfile.write(
+                f"event: {event['type']}\ndata: {json.dumps(event)}\n\n".encode("utf-8")
+            )
+            self.wfile.flush()
+
+
+class FakeProviderServer(ThreadingHTTPServer):
+    """시나리오 상태를 가진 threading HTTP 서버."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], scenario: Scenario) -> None:
+        """주소에 bind하고 집계 상태 준비."""
+
+        super().__init__(address, _Handler)
+        self.state = _ServerState(scenario)
+
+
+class FakeProvider:
+    """background thread에서 도는 가짜 Responses 서버."""
+
+    def __init__(self, scenario: Scenario | None = None, *, port: int = 0) -> None:
+        """loopback 주소에 서버를 bind. 요청 처리는 ``start``부터."""
+
+        self.server = FakeProviderServer(("127.0.0.1", port), scenario or Scenario())
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """OpenAI client에 넘길 base URL."""
+
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def state(self) -> _ServerState:
+        """요청 수, 최대 동시 처리 수와 결과 집계."""
+
+        return self.server.state
+
+    def config(self, **env: str):
+        """이 서버를 가리키는 검증된 ``openai`` provider 설정."""
+
+        from sync.runtime import config
+
+        loaded = config.load_config(
+            {
+                "TRANSLATION_PROVIDER": "openai",
+                "OPENAI_API_KEY": "fake-provider",
+                "TRANSLATION_MODEL": _FAKE_MODEL,
+                **env,
+            }
+        )
+        return config.Config(
+            provider=loaded.provider,
+            values={**loaded.values, config.OPENAI_BASE_URL_OVERRIDE_KEY: self.base_url},
+        )
+
+    def start(self) -> FakeProvider:
+        """요청 처리 시작."""
+
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """서버 종료."""
+
+        if self._thread.is_alive():
+            self.server.shutdown()
+            self._thread.join()
+        self.server.server_close()
+
+    def __enter__(self) -> FakeProvider:
+        """``start`` 후 자신을 반환."""
+
+        return self.start()
+
+    def __exit__(self, *_exc: object) -> None:
+        """``close`` 호출."""
+
+        self.close()
+
+
+def write_cli_stub(directory: Path, scenario: Scenario | None = None) -> Path:
+    """``codex exec``처럼 호출되는 실행 파일 ``directory/codex`` 생성.
+
+    CLI 실행 환경은 허용 목록 변수만 넘기므로 시나리오는 파일에 직접 넣고, 요청
+    순서는 ``directory/codex-requests``의 배타 생성 파일 이름으로 센다.
+    """
+
+    scenario = scenario or Scenario()
+    counter = directory / "codex-requests"
+    counter.mkdir(parents=True, exist_ok=True)
+    stub = directory / "codex"
+    stub.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        f"sys.path.insert(0, {str(Path(__file__).resolve().parents[1])!r})\n"
+        "from benchmarks.fake_provider import cli_main\n"
+        f"raise SystemExit(cli_main(sys.argv[1:], {scenario.to_json()!r}, {str(counter)!r}))\n",
+        encoding="utf-8",
+    )
+    stub.chmod(0o755)
+    return stub
+
+
+def cli_config(stub: Path, **env: str):
+    """``write_cli_stub``로 만든 stub을 실행하는 검증된 ``cli`` provider 설정."""
+
+    from sync.runtime import config
+
+    return config.load_config(
+        {
+            "TRANSLATION_PROVIDER": "cli",
+            "TRANSLATION_CLI_COMMAND": f"{stub} exec",
+            "CODEX_API_KEY": "fake-provider",
+            "TRANSLATION_MODEL": _FAKE_MODEL,
+            **env,
+        }
+    )
+
+
+def cli_requests(stub: Path) -> int:
+    """``stub``이 지금까지 받은 요청 수."""
+
+    return sum(1 for _ in (stub.parent / "codex-requests").iterdir())
+
+
+def _claim_request_index(counter: Path) -> int:
+    """여러 stub process 사이에서 겹치지 않는 요청 번호."""
+
+    index = 0
+    while True:
+        try:
+            os.close(os.open(counter / str(index), os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return index
+        except FileExistsError:
+            index += 1
+
+
+def cli_main(argv: list[str], scenario_json: str, counter: str) -> int:
+    """``codex exec`` stub 진입점.
+
+    HTTP 장애는 재시도 판정이 읽는 status 줄을 stderr에 쓰고 1로 끝난다. CLI에는
+    미완료 상태가 없으므로 ``incomplete``는 잘린 본문을, ``disconnect``는 연결
+    오류 문구를 남긴다.
+    """
+
+    scenario = Scenario.from_json(scenario_json)
+    if not argv or argv[0] != "exec" or "--output-last-message" not in argv:
+        print("fake codex supports only 'exec --output-last-message PATH'", file=sys.stderr)
+        return 2
+    output = Path(argv[argv.index("--output-last-message") + 1])
+    text = sys.stdin.read()
+    index = _claim_request_index(Path(counter))
+    rng = random.Random(scenario.seed + index)
+    outcome = _outcome(scenario, index, rng)
+    time.sleep(_draw_latency(scenario, rng))
+    if outcome.isdigit():
+        print(f"{outcome} injected fault", file=sys.stderr)
+        return 1
+    if outcome == "disconnect":
+        print("stream disconnected before completion", file=sys.stderr)
+        return 1
+    rendered = response_text(text, argv[-1], scenario)
+    if outcome == "empty":
+        rendered = ""
+    elif outcome == "incomplete":
+        rendered = rendered[: len(rendered) // 2]
+    output.write_text(rendered, encoding="utf-8")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """가짜 provider 서버를 foreground로 실행."""
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.fake_provider")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--version")
+    parser.add_argument("--annotate", action="store_true")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="uniform")
+    parser.add_argument("--burst", nargs="*", default=[])
+    parser.add_argument("--fault-rate", type=float, default=0.0)
+    parser.add_argument("--fault", default="503")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    try:
+        scenario = Scenario(
+            version=args.version,
+            annotate=args.annotate,
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            distribution=args.distribution,
+            burst=tuple(args.burst),
+            fault_rate=args.fault_rate,
+            fault=args.fault,
+            retry_after=args.retry_after,
+            seed=args.seed,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    provider = FakeProvider(scenario, port=args.port)
+    print(f"fake provider listening on {provider.base_url}", flush=True)
+    try:
+        provider.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        provider.server.server_close()
+    state = provider.state
+    print(
+        f"requests: {state.requests}, peak in flight: {state.peak_in_flight}, "
+        f"outcomes: {dict(state.outcomes)}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
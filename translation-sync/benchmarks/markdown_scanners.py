@@ -0,0 +1,232 @@
+"""Markdown 스캐너 함수의 말뭉치 처리 속도와 할당량 측정.
+
+사용법:
+  python -m benchmarks markdown [--scanner NAME ...] [--limit N] [--repeat N]
+                                [--alloc-samples N] [--baseline PATH]
+                                [--save-baseline] [--tolerance R]
+
+``i18n/en``, ``i18n/ja``, ``versioned_docs``의 모든 문서에 ``sync.common.markdown``
+공개 스캐너를 하나씩 실행한다. 문서 단위 함수는 문서 전체를, 줄 단위 함수는 해당
+줄(표 함수는 ``|``로 시작하는 줄)을 입력으로 쓴다. 긴 문서 결과를 재사용하는
+``lru_cache``는 호출마다 비워 실제 파싱 비용을 잰다.
+
+시간은 ``--repeat`` 회 중 가장 짧은 전체 시간을 입력 KB로 나눈 µs/KB, 할당량은
+``tracemalloc``으로 본 호출당 최대 할당 byte 평균이다. 할당량은 입력 중 고르게
+고른 ``--alloc-samples``개로만 잰다. 전체 시간이 큰 순서로 출력하므로 위쪽
+스캐너부터 최적화 대상으로 본다. 기준선은 ``--save-baseline``으로 저장하고, 다음
+실행은 µs/KB가 ``--tolerance`` 비율 넘게 늘면 종료 코드 1로 끝난다.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from sync.common import markdown
+
+REPO = Path(__file__).resolve().parents[2]
+CORPUS_ROOTS = (
+    Path("i18n/en/docusaurus-plugin-content-docs"),
+    Path("i18n/ja/docusaurus-plugin-content-docs"),
+    Path("versioned_docs"),
+)
+DEFAULT_BASELINE = Path(".translation-benchmarks/markdown-baseline.json")
+
+
+@dataclass(frozen=True)
+class Scanner:
+    """측정할 스캐너와 입력 단위."""
+
+    name: str
+    function: Callable[[str], object]
+    unit: str  # document, line, table-line
+
+
+SCANNERS = (
+    Scanner("markdown_links", markdown.markdown_links, "document"),
+    Scanner("markdown_autolinks", markdown.markdown_autolinks, "document"),
+    Scanner("reference_definitions", markdown.reference_definitions, "document"),
+    Scanner("reference_link_signatures", markdown.reference_link_signatures, "document"),
+    Scanner("html_comment_spans", markdown.html_comment_spans, "document"),
+    Scanner(
+        "standalone_html_comment_line_numbers",
+        markdown.standalone_html_comment_line_numbers,
+        "document",
+    ),
+    Scanner("mask_html_comments", markdown.mask_html_comments, "document"),
+    Scanner("mask_fenced_code_contents", markdown.mask_fenced_code_contents, "document"),
+    Scanner("front_matter_description", markdown.front_matter_description, "document"),
+    Scanner("inline_code_contents", markdown.inline_code_contents, "document"),
+    Scanner("html_tags", markdown.html_tags, "document"),
+    Scanner("strip_title_attrs", markdown.strip_title_attrs, "document"),
+    Scanner("table_row_cells", markdown.table_row_cells, "table-line"),
+    Scanner("gfm_table_row_cells", markdown.gfm_table_row_cells, "table-line"),
+    Scanner("fence_token", markdown.fence_token, "line"),
+    Scanner("is_heading_line", markdown.is_heading_line, "line"),
+    Scanner("is_non_annotatable_line", markdown.is_non_annotatable_line, "line"),
+)
+
+
+def corpus(limit: int | None = None) -> list[str]:
+    """측정 대상 문서 본문, 경로 순."""
+
+    paths = sorted(
+        path for root in CORPUS_ROOTS for path in (REPO / root).rglob("*.md")
+    )
+    return [path.read_text(encoding="utf-8") for path in paths[:limit]]
+
+
+def inputs(scanner: Scanner, documents: Iterable[str]) -> list[str]:
+    """스캐너 입력 단위로 나눈 입력 목록."""
+
+    if scanner.unit == "document":
+        return list(documents)
+    lines = [line for document in documents for line in document.splitlines(keepends=True)]
+    if scanner.unit == "table-line":
+        return [line for line in lines if line.lstrip().startswith("|")]
+    return lines
+
+
+def _clear_caches() -> None:
+    """``markdown`` 모듈의 ``lru_cache`` 결과 비우기."""
+
+    for value in vars(markdown).values():
+        clear = getattr(value, "cache_clear", None)
+        if callable(clear):
+            clear()
+
+
+def measure(
+    scanner: Scanner,
+    values: list[str],
+    repeat: int,
+    alloc_samples: int,
+) -> dict[str, float]:
+    """스캐너 하나의 전체 시간, µs/KB와 호출당 최대 할당."""
+
+    cached = scanner.unit == "document"
+    best = float("inf")
+    for _ in range(repeat):
+        elapsed = 0.0
+        for value in values:
+            if cached:
+                _clear_caches()
+            started = time.perf_counter()
+            scanner.function(value)
+            elapsed += time.perf_counter() - started
+        best = min(best, elapsed)
+
+    samples = values[:: max(1, len(values) // alloc_samples)] if alloc_samples else []
+    tracemalloc.start()
+    try:
+        peaks = 0
+        for value in samples:
+            if cached:
+                _clear_caches()
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            scanner.function(value)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks += peak - baseline
+    finally:
+        tracemalloc.stop()
+
+    kilobytes = sum(len(value.encode("utf-8")) for value in values) / 1024
+    calls = len(values)
+    return {
+        "calls": calls,
+        "kilobytes": round(kilobytes, 1),
+        "total_ms": round(best * 1000, 3),
+        "us_per_kb": round(best * 1_000_000 / kilobytes, 3) if kilobytes else 0.0,
+        "peak_bytes_per_call": round(peaks / len(samples), 1) if samples else 0.0,
+    }
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    """기준선보다 µs/KB가 허용 비율 넘게 늘어난 스캐너 목록."""
+
+    regressions: list[str] = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None or not previous["us_per_kb"]:
+            continue
+        before = float(previous["us_per_kb"])
+        after = float(result["us_per_kb"])
+        if after > before * (1 + tolerance):
+            regressions.append(
+                f"{name}: {after:.3f} us/KB > baseline {before:.3f} us/KB "
+                f"(+{(after / before - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """스캐너별 측정 결과 출력과 기준선 비교."""
+
+    names = [scanner.name for scanner in SCANNERS]
+    parser = argparse.ArgumentParser(prog="python -m benchmarks markdown")
+    parser.add_argument("--scanner", action="append", choices=names)
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--alloc-samples", type=int, default=2000)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    documents = corpus(args.limit)
+    selected = [scanner for scanner in SCANNERS if scanner.name in (args.scanner or names)]
+    results = {
+        scanner.name: measure(
+            scanner,
+            inputs(scanner, documents),
+            args.repeat,
+            args.alloc_samples,
+        )
+        for scanner in selected
+    }
+
+    total = sum(result["total_ms"] for result in results.values()) or 1.0
+    print(f"documents: {len(documents)}")
+    print(
+        f"{'scanner':38} {'calls':>8} {'total ms':>10} {'us/KB':>9} "
+        f"{'peak B/call':>12} {'share':>6}"
+    )
+    for name, result in sorted(results.items(), key=lambda item: -item[1]["total_ms"]):
+        print(
+            f"{name:38} {result['calls']:8} {result['total_ms']:10.1f} "
+            f"{result['us_per_kb']:9.2f} {result['peak_bytes_per_call']:12.0f} "
+            f"{result['total_ms'] / total * 100:5.1f}%"
+        )
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(
+            json.dumps(results, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        print(f"baseline saved: {args.baseline}")
+        return 0
+    if not args.baseline.is_file():
+        return 0
+    regressions = compare(
+        results,
+        json.loads(args.baseline.read_text(encoding="utf-8")),
+        args.tolerance,
+    )
+    for regression in regressions:
+        print(f"regression: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
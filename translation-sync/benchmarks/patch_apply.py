@@ -0,0 +1,110 @@
+"""PatchPlan segment 적용 지연 측정.
+
+사용법:
+  python -m benchmarks.patch_apply [--blocks N] [--every N] [--repeat N]
+
+annotation block N개로 된 합성 locale 문서에서 ``--every`` 번째 문단마다 원문을 바꾼
+계획을 만들고, 줄 버퍼를 쓰는 ``apply_segments``와 segment마다 문서 문자열을 다시
+조합하는 기준 구현을 비교한다. 두 결과가 byte 단위로 다르면 실패한다.
+"""
+from __future__ import annotations
+
+import argparse
+import difflib
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from sync.source import diff
+from sync.translation import patch
+
+
+def synthetic_plan(blocks: int, every: int) -> tuple[str, patch.PatchPlan, list[str]]:
+    """(기존 locale 문서, 문단 수정 계획, 번역 block 목록)."""
+
+    old = "\n\n".join(f"Paragraph {index} explains a feature." for index in range(blocks))
+    new = "\n\n".join(
+        f"Paragraph {index} explains a feature"
+        + (" in more detail." if index % every == 0 else ".")
+        for index in range(blocks)
+    )
+    existing = "\n".join(
+        f"<!-- Paragraph {index} explains a feature. -->\n문단 {index} 설명.\n"
+        for index in range(blocks)
+    )
+    hunks = diff._parse_unified_diff(  # noqa: SLF001
+        "\n".join(
+            difflib.unified_diff(old.splitlines(), new.splitlines(), lineterm="")
+        )
+    )
+    plan = patch.build_plan(hunks, new + "\n")
+    translated = [
+        f"<!-- Paragraph {index} explains a feature in more detail. -->\n"
+        f"문단 {index} 자세한 설명.\n"
+        for index in range(0, blocks, every)
+    ]
+    return existing, plan, translated
+
+
+def string_apply(existing: str, plan: patch.PatchPlan, translated: list[str]) -> str:
+    """segment마다 줄을 다시 나누고 문서 문자열을 다시 조합하는 기준 구현."""
+
+    original = patch.AnnotatedDocumentIndex.build(existing)
+    pairs = list(zip(plan.changes, translated, strict=True))
+    text = existing
+    for segment, block in reversed(pairs):
+        found = patch._find_old_blocks(original, segment)  # noqa: SLF001
+        lines = text.splitlines(keepends=True)
+        text = (
+            "".join(lines[: found[0].start])
+            + patch._resolved_replacement(found, block)  # noqa: SLF001
+            + "".join(lines[found[-1].end :])
+        )
+    return patch._ensure_single_eof_newline(text)  # noqa: SLF001
+
+
+def _best(function, repeat: int) -> tuple[float, str]:
+    """반복 측정 중 가장 짧은 시간(초)과 결과."""
+
+    best = float("inf")
+    result = ""
+    for _ in range(repeat):
+        patch._DOCUMENT_INDEXES.clear()  # noqa: SLF001
+        started = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    """줄 버퍼 적용과 문자열 재조합 기준 구현의 지연 출력."""
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.patch_apply")
+    parser.add_argument("--blocks", type=int, default=5000)
+    parser.add_argument("--every", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    existing, plan, translated = synthetic_plan(args.blocks, args.every)
+    changes = list(plan.changes)
+    buffered, buffered_result = _best(
+        lambda: patch.apply_segments(existing, changes, translated), args.repeat
+    )
+    rebuilt, rebuilt_result = _best(
+        lambda: string_apply(existing, plan, translated), args.repeat
+    )
+    if buffered_result != rebuilt_result:
+        print("line buffer result differs from string rebuild", file=sys.stderr)
+        return 1
+    planned, _ = _best(lambda: patch.apply_plan(existing, plan, translated), args.repeat)
+
+    print(f"blocks: {args.blocks}  segments: {len(changes)}  bytes: {len(existing.encode())}")
+    print(f"apply_segments (line buffer): {buffered * 1000:8.1f}ms")
+    print(f"string rebuild per segment:   {rebuilt * 1000:8.1f}ms")
+    print(f"apply_plan total:             {planned * 1000:8.1f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,149 @@
+"""오래된 링크 registry 규칙 조회 지연 측정.
+
+사용법:
+  python -m benchmarks.stale_links [--rules N] [--lookups N]
+
+버전마다 폐기·대체 규칙이 섞인 합성 registry로 ``StaleLinkRegistry.matching_rule``의
+색인 조회와 전체 규칙 선형 탐색을 같은 링크 목록에서 비교한다. 두 방식의 결과가
+하나라도 다르면 실패한다.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from sync.common.stale_links import (
+    StaleLinkRegistry,
+    StaleLinkRule,
+    _is_supported_target,
+    _matches_suffix_rule,
+)
+
+_VERSIONS = ("8.x", "9.x", "10.x", "11.x", "12.x", "13.x", "master")
+
+
+def _linear_matching_rule(
+    registry: StaleLinkRegistry,
+    target: str,
+    version: str | None,
+) -> StaleLinkRule | None:
+    """색인 도입 전 전체 규칙 선형 탐색 기준 구현."""
+
+    if not _is_supported_target(target):
+        return None
+    suffix_matches: list[StaleLinkRule] = []
+    for rule in registry.rules:
+        if rule.version != (version or "master"):
+            continue
+        if rule.target is None and target == rule.source:
+            return rule
+        if _matches_suffix_rule(rule, target):
+            suffix_matches.append(rule)
+    if not suffix_matches:
+        return None
+    return max(suffix_matches, key=lambda rule: len(rule.source.encode("utf-8")))
+
+
+def synthetic_registry(count: int) -> StaleLinkRegistry:
+    """버전별 폐기·파일 대체·anchor 대체 규칙을 고르게 섞은 registry."""
+
+    rules: list[StaleLinkRule] = []
+    per_version = max(count // len(_VERSIONS), 1)
+    for version in sorted(_VERSIONS):
+        for index in range(per_version):
+            match index % 3:
+                case 0:
+                    rules.append(
+                        StaleLinkRule(
+                            version,
+                            f"/docs/{version}/retired-{index}",
+                            None,
+                            "standalone-list-label",
+                        )
+                    )
+                case 1:
+                    rules.append(
+                        StaleLinkRule(
+                            version,
+                            f"page-{index}#section",
+                            f"page-{index}#renamed",
+                            None,
+                        )
+                    )
+                case _:
+                    rules.append(
+                        StaleLinkRule(version, f"#anchor-{index}", f"#new-{index}", None)
+                    )
+    return StaleLinkRegistry(b"", "", tuple(rules))
+
+
+def _targets(count: int, rules: int, rng: random.Random) -> list[tuple[str, str]]:
+    """적중·비적중·외부 링크가 섞인 (링크, 버전) 목록."""
+
+    per_version = max(rules // len(_VERSIONS), 1)
+    targets: list[tuple[str, str]] = []
+    for _ in range(count):
+        version = rng.choice(_VERSIONS)
+        index = rng.randrange(per_version * 2)
+        targets.append(
+            (
+                rng.choice(
+                    (
+                        f"/docs/{version}/retired-{index}",
+                        f"/docs/{version}/page-{index}#section",
+                        f"/docs/{version}/guide#anchor-{index}",
+                        f"https://laravel.com/docs/{version}/page-{index}#section",
+                        f"https://example.com/page-{index}#section",
+                    )
+                ),
+                version,
+            )
+        )
+    return targets
+
+
+def _timed(lookup, targets: list[tuple[str, str]]) -> tuple[float, list]:
+    """전체 조회 시간(초)과 결과 목록."""
+
+    started = time.perf_counter()
+    results = [lookup(target, version) for target, version in targets]
+    return time.perf_counter() - started, results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """색인 조회와 선형 탐색의 링크당 지연 출력."""
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.stale_links")
+    parser.add_argument("--rules", type=int, default=5000)
+    parser.add_argument("--lookups", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    registry = synthetic_registry(args.rules)
+    targets = _targets(args.lookups, args.rules, random.Random(0))
+    started = time.perf_counter()
+    registry.matching_rule("/docs/master/", "master")
+    built = time.perf_counter() - started
+    indexed, indexed_results = _timed(registry.matching_rule, targets)
+    linear, linear_results = _timed(
+        lambda target, version: _linear_matching_rule(registry, target, version),
+        targets,
+    )
+    if indexed_results != linear_results:
+        print("indexed lookup differs from linear scan", file=sys.stderr)
+        return 1
+
+    hits = sum(result is not None for result in indexed_results)
+    print(f"rules: {len(registry.rules)}  index build: {built * 1000:.1f}ms")
+    print(f"lookups: {len(targets)}  matched: {hits}")
+    print(f"indexed: {indexed / len(targets) * 1e6:.2f}us/link")
+    print(f"linear:  {linear / len(targets) * 1e6:.2f}us/link")
+    print(f"speedup: {linear / indexed:.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,84 @@
+"""번역 메모리 유사 블록 조회 지연 측정.
+
+사용법:
+  python -m benchmarks.translation_memory [--samples N] [--locale ko|ja]
+
+전체 버전 KO·JA 문서로 임시 번역 메모리를 만들고, 실제 annotation에서 단어 하나를
+바꾼 질의로 ``TranslationMemory.similar`` 지연을 측정한다. 색인 구축 시간은 실행당
+한 번 드는 비용이므로 조회 지연과 분리해 출력한다.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from sync.translation import memory
+
+REPO = Path(__file__).resolve().parents[2]
+
+
+def _mutated(comment: str, rng: random.Random) -> str:
+    """annotation의 단어 하나를 다른 단어로 바꾼 질의."""
+
+    words = comment.split(" ")
+    index = rng.randrange(len(words))
+    words[index] = "benchmark"
+    return " ".join(words)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """색인 구축과 유사 블록 조회 지연 출력."""
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.translation_memory")
+    parser.add_argument("--samples", type=int, default=1000)
+    parser.add_argument("--locale", choices=("ko", "ja"), default="ko")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tm = memory.TranslationMemory(Path(tmp) / memory.MEMORY_FILENAME, REPO)
+        started = time.perf_counter()
+        documents = tm.refresh()
+        refreshed = time.perf_counter()
+        index = tm._similarity_index(args.locale)
+        built = time.perf_counter()
+
+        rng = random.Random(0)
+        comments = [
+            comment for comment in index.comments if len(comment.split(" ")) >= 6
+        ]
+        queries = [
+            _mutated(comment, rng)
+            for comment in rng.sample(comments, min(args.samples, len(comments)))
+        ]
+        latencies: list[float] = []
+        hits = 0
+        for query in queries:
+            before = time.perf_counter()
+            suggestions = tm.similar(args.locale, [query])
+            latencies.append((time.perf_counter() - before) * 1000)
+            hits += bool(suggestions)
+        tm.close()
+
+    latencies.sort()
+    print(f"documents indexed: {documents} in {refreshed - started:.2f}s")
+    print(
+        f"{args.locale} similarity index: {len(index.comments)} annotations "
+        f"in {built - refreshed:.2f}s"
+    )
+    print(
+        f"lookups: {len(latencies)}  hit rate: {hits / max(len(latencies), 1):.1%}  "
+        f"median: {statistics.median(latencies):.3f}ms  "
+        f"p95: {latencies[int(len(latencies) * 0.95)]:.3f}ms  "
+        f"max: {latencies[-1]:.3f}ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,12 +9,21 @@
 """
 from __future__ import annotations
 
+import hashlib
+import math
 import os
 import re
 from collections import Counter
 import sys
-from collections.abc import Mapping
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import (
+    AbstractContextManager,
+    contextmanager,
+    nullcontext,
+    redirect_stdout,
+)
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from types import MappingProxyType
 
@@ -37,6 +46,10 @@ from sync.common import stale_links
 from sync.common.files import atomic_write_bytes, unlink_file
 from sync.common.markdown import split_line_ending
 from sync.common.versions import UNTRANSLATED_DOCUMENTS
+from sync.runtime import last_run, plan_report, profiling
+from sync.runtime import spans
+from sync.runtime import state as run_state
+from sync.runtime import trace as run_trace
 from sync.runtime.failure import (
     ErrorClassification,
     ExitCode,
@@ -48,6 +61,9 @@ from sync.runtime.failure import (
     final_exit_code,
     write_failure_report_exact,
 )
+from sync.translation import memory as translation_memory
+from sync.translation import plan_cache
+from sync.verification import contract_memo
 from sync.verification import document as document_verification
 
 SYNC_ROOT = Path(__file__).resolve().parent
@@ -58,8 +74,52 @@ JA_PROMPT_PATH = SYNC_ROOT / "prompt_jp.md"
 MAX_SEGMENT_VERIFICATION_ATTEMPTS = translate.MAX_COMPLETED_RESPONSE_ATTEMPTS
 _ANNOTATION_PREFIX_RE = re.compile(r"^\s*<!--.*?-->\s*\n?", re.DOTALL)
 _MISSING_PARTIAL_TRANSLATION = "missing existing translation for partial sync"
+# block 요청의 문서 문맥에 넣을 기존 번역 heading 수 상한.
+_DOCUMENT_CONTEXT_HEADINGS = 64
 FAILURE_REPORT_ENV = "TRANSLATION_FAILURE_REPORT"
 RUN_ID_ENV = "TRANSLATION_RUN_ID"
+# 실행 상태 디렉터리를 지정한 실행에서만 여는 응답 계약 판정 memo.
+_CONTRACT_MEMO: contract_memo.VerifiedBlockMemo | None = None
+# 실행 상태 디렉터리를 지정한 실행에서만 여는 말뭉치 단위 번역 메모리.
+_TRANSLATION_MEMORY: translation_memory.TranslationMemory | None = None
+# 실행 상태 디렉터리를 지정한 실행에서만 여는 PatchPlan 저장소.
+_PLAN_CACHE: plan_cache.PatchPlanCache | None = None
+# TRANSLATION_TRACE_REPORT를 지정한 실행에서만 측정하는 단계별 계측기.
+_TRACE = run_trace.RunTrace()
+# --profile-identity 실행은 검증까지만 하고 출력 파일을 기록·삭제하지 않는다.
+_WRITE_OUTPUTS = True
+_IDENTITY_CONFIG = config.Config(
+    provider="identity",
+    values={"TRANSLATION_PROVIDER": "identity"},
+)
+
+
+@dataclass(frozen=True)
+class _RunScope:
+    """원문 변경 반영 한 번이 쓰는 저장소 root와 단계 계측기."""
+
+    repo_root: Path
+    trace: run_trace.RunTrace
+
+
+# 진행 중인 원문 변경 반영의 범위. 밖에서는 ``REPO_ROOT``와 ``_TRACE``를 쓴다.
+_RUN_SCOPE: ContextVar[_RunScope | None] = ContextVar(
+    "translation_sync_run_scope", default=None
+)
+
+
+def _repo_root() -> Path:
+    """현재 실행 범위의 저장소 root."""
+
+    scope = _RUN_SCOPE.get()
+    return REPO_ROOT if scope is None else scope.repo_root
+
+
+def _trace() -> run_trace.RunTrace:
+    """현재 실행 범위의 단계 계측기."""
+
+    scope = _RUN_SCOPE.get()
+    return _TRACE if scope is None else scope.trace
 
 
 class OutputPathError(ValueError):
@@ -79,6 +139,7 @@ class _PreparedBlockTranslation:
     diff_text: str
     expected_source: str
     placeholders: Mapping[str, str]
+    document_context: str | None = None
 
 
 @dataclass(frozen=True)
@@ -96,6 +157,355 @@ class _PreparedTranslationTarget:
     reusable_blocks: Mapping[str, str] = MappingProxyType({})
 
 
+@dataclass
+class _SharedTranslations:
+    """같은 실행에서 버전 간 동일한 provider 요청의 검증된 응답 공유.
+
+    ``TranslationRequest.render()``는 version을 포함하지 않으므로 원문·기존 문맥·
+    diff가 같은 요청은 버전이 달라도 provider 입력이 byte 단위로 같다.
+    사전검증에서 두 번 이상 나타난 요청만 응답을 보관하며, 재사용한 응답도
+    버전마다 응답 계약·후처리·문서 검증을 다시 거친다.
+    """
+
+    keys: frozenset[str]
+    responses: dict[str, str] = field(default_factory=dict)
+    reused: int = 0
+
+    def response(
+        self,
+        request: translate.TranslationRequest,
+        locale: str | None,
+    ) -> str | None:
+        """앞선 버전에서 검증을 통과한 같은 요청의 provider 응답."""
+
+        cached = self.responses.get(_shared_request_key(request, locale))
+        if cached is not None:
+            self.reused += 1
+        return cached
+
+    def record(
+        self,
+        request: translate.TranslationRequest,
+        locale: str | None,
+        response: str,
+    ) -> None:
+        """응답 계약을 통과한 provider 응답을 공유 대상이면 보관."""
+
+        key = _shared_request_key(request, locale)
+        if key in self.keys:
+            self.responses.setdefault(key, response)
+
+
+# 사전검증이 버전 간 중복 요청을 찾은 실행에서만 설정하는 공유 응답표.
+_SHARED_TRANSLATIONS: _SharedTranslations | None = None
+# 번역 중인 대상에서 묶음 요청으로 미리 받아 응답 계약을 통과한 block 응답.
+# 첫 요청의 ``_shared_request_key``마다 한 번만 쓰고 대상이 끝나면 비운다.
+_PACKED_RESPONSES: dict[str, str] = {}
+
+
+def _shared_request_key(
+    request: translate.TranslationRequest,
+    locale: str | None,
+) -> str:
+    """교정 지침을 제외한 provider 입력과 locale의 digest."""
+
+    if request.verification_feedback is not None:
+        request = replace(request, verification_feedback=None)
+    payload = f"{locale or ''}\0{request.render()}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _target_blocks(
+    change: diff.SourceChange,
+    target: _PreparedTranslationTarget,
+    cfg: config.Config,
+    locale: str | None,
+) -> Iterator[tuple[str, translate.TranslationRequest | None]]:
+    """준비된 대상 블록의 처리 방식과 provider 요청.
+
+    처리 방식은 ``provider``, ``provider-free``, ``reused``이며 요청은
+    ``provider`` 블록에만 붙는다.
+    """
+
+    plan = target.plan
+    if plan.is_create:
+        for owner in plan.create_blocks:
+            if not owner.provider_required:
+                yield "provider-free", None
+            elif _reused_create_block(
+                owner, target.reusable_blocks, cfg, change, locale
+            ) is not None:
+                yield "reused", None
+            else:
+                yield "provider", _translation_request(
+                    owner.source,
+                    None,
+                    version=change.version,
+                    locale=locale,
+                )
+        return
+    if plan.is_noop or target.state is patch_utils.PlanState.TARGET:
+        return
+    for block_change in plan.changes:
+        if block_change.needs_translation and block_change.provider_free:
+            yield "provider-free", None
+    for prepared in target.block_requests.values():
+        if _remembered_translation(
+            prepared.request_source, cfg, change, locale
+        ) is not None:
+            yield "reused", None
+            continue
+        yield "provider", _translation_request(
+            prepared.request_source,
+            prepared.existing_context,
+            version=change.version,
+            diff_text=prepared.diff_text,
+            locale=locale,
+            document_context=prepared.document_context,
+        )
+
+
+def _provider_requests(
+    change: diff.SourceChange,
+    target: _PreparedTranslationTarget,
+    cfg: config.Config,
+    locale: str | None,
+) -> Iterator[translate.TranslationRequest]:
+    """준비된 대상이 실제로 provider에 보낼 교정 전 요청."""
+
+    for _, request in _target_blocks(change, target, cfg, locale):
+        if request is not None:
+            yield request
+
+
+def _share_cross_version_requests(
+    changes: list[diff.SourceChange],
+    prepared_targets: Mapping[tuple[str, str], _PreparedTranslationTarget],
+    cfg: config.Config,
+) -> int:
+    """버전 간 중복 provider 요청을 찾아 실행 공유표를 설정.
+
+    Returns:
+        한 번만 번역하고 다른 버전에 재사용할 요청 수.
+    """
+
+    global _SHARED_TRANSLATIONS
+    _SHARED_TRANSLATIONS = None
+    if cfg.provider == "identity":
+        # identity 응답은 version 치환을 포함하므로 버전 간 공유할 수 없다.
+        return 0
+    counts: Counter[str] = Counter()
+    versions: dict[str, set[str]] = {}
+    for change in changes:
+        for locale in ("ko", "ja"):
+            target = prepared_targets.get((change.path, locale))
+            if target is None:
+                continue
+            for request in _provider_requests(change, target, cfg, locale):
+                key = _shared_request_key(request, locale)
+                counts[key] += 1
+                versions.setdefault(key, set()).add(change.version)
+    shared = frozenset(
+        key
+        for key, count in counts.items()
+        if count > 1 and len(versions[key]) > 1
+    )
+    if shared:
+        _SHARED_TRANSLATIONS = _SharedTranslations(keys=shared)
+    return sum(counts[key] - 1 for key in shared)
+
+
+def _plan_report(
+    changes: list[diff.SourceChange],
+    prepared_targets: Mapping[tuple[str, str], _PreparedTranslationTarget],
+    cfg: config.Config,
+    prompts: Mapping[str, str],
+    *,
+    concurrency: int,
+    request_seconds: float | None,
+) -> plan_report.PlanReport:
+    """사전검증한 대상의 provider 요청·token 집계.
+
+    다른 버전과 같은 요청은 실제 실행과 같은 순서로 처음 나온 대상에서만
+    provider 요청으로 센다.
+    """
+
+    budget = cfg.request_budget()
+    seen: set[str] = set()
+    targets: list[plan_report.PlannedTarget] = []
+    for change in changes:
+        if change.status == "D":
+            continue
+        for locale in ("ko", "ja"):
+            target = prepared_targets[(change.path, locale)]
+            counts: Counter[str] = Counter()
+            input_tokens: int | None = 0
+            for kind, request in _target_blocks(change, target, cfg, locale):
+                if request is not None:
+                    key = _shared_request_key(request, locale)
+                    if (
+                        _SHARED_TRANSLATIONS is not None
+                        and key in _SHARED_TRANSLATIONS.keys
+                        and key in seen
+                    ):
+                        kind = "shared"
+                    else:
+                        seen.add(key)
+                        tokens = translate.request_input_tokens(
+                            request, cfg, prompts[locale]
+                        )
+                        input_tokens = (
+                            None
+                            if tokens is None or input_tokens is None
+                            else input_tokens + tokens
+                        )
+                counts[kind] += 1
+            targets.append(
+                plan_report.PlannedTarget(
+                    version=change.version,
+                    document=change.document,
+                    locale=locale,
+                    state="noop" if target.plan.is_noop else target.state.value,
+                    provider_blocks=counts["provider"],
+                    provider_free_blocks=counts["provider-free"],
+                    reused_blocks=counts["reused"],
+                    shared_blocks=counts["shared"],
+                    input_tokens=input_tokens if counts["provider"] else 0,
+                    reserved_output_tokens=(
+                        None
+                        if budget is None
+                        else counts["provider"] * budget.reserved_output_tokens
+                    ),
+                )
+            )
+    if request_seconds is None and budget is not None:
+        request_seconds = float(budget.request_timeout_seconds)
+    return plan_report.PlanReport(
+        targets=tuple(targets),
+        deleted_documents=sum(change.status == "D" for change in changes),
+        concurrency=concurrency,
+        request_seconds=request_seconds,
+        run_timeout_seconds=None if budget is None else budget.run_timeout_seconds,
+    )
+
+
+def _requested_translation(
+    request: translate.TranslationRequest,
+    cfg: config.Config,
+    prompt: str,
+    *,
+    locale: str | None,
+    deadline: float | None,
+    attempt_counter: translate.ProviderAttemptCounter | None,
+) -> str:
+    """묶음 요청·공유표의 검증된 응답 또는 새 provider 응답."""
+
+    if request.verification_feedback is None:
+        packed = _PACKED_RESPONSES.pop(_shared_request_key(request, locale), None)
+        if packed is not None:
+            return packed
+    if _SHARED_TRANSLATIONS is not None and request.verification_feedback is None:
+        cached = _SHARED_TRANSLATIONS.response(request, locale)
+        if cached is not None:
+            return cached
+    return translate.translate_request(
+        request,
+        cfg,
+        prompt,
+        deadline=deadline,
+        attempt_counter=attempt_counter,
+    )
+
+
+@contextmanager
+def _packed_target_responses(
+    change: diff.SourceChange,
+    target: _PreparedTranslationTarget,
+    cfg: config.Config,
+    prompt: str,
+    *,
+    locale: str | None,
+    deadline: float | None,
+    attempt_counter: translate.ProviderAttemptCounter | None,
+) -> Iterator[None]:
+    """대상의 작은 provider 요청을 묶어 번역하고 통과한 block 응답을 미리 채움.
+
+    block별 응답은 단일 요청과 같은 복구와 응답 계약 검증을 거친다. 분리되지
+    않았거나 계약을 통과하지 못한 block, 묶음 호출이 실패한 block은 채우지 않아
+    평소처럼 개별 요청으로 번역된다.
+    """
+
+    try:
+        if translate.pack_limit(cfg) >= 2:
+            _prefill_packed_responses(
+                change,
+                target,
+                cfg,
+                prompt,
+                locale=locale,
+                deadline=deadline,
+                attempt_counter=attempt_counter,
+            )
+        yield
+    finally:
+        _PACKED_RESPONSES.clear()
+
+
+def _prefill_packed_responses(
+    change: diff.SourceChange,
+    target: _PreparedTranslationTarget,
+    cfg: config.Config,
+    prompt: str,
+    *,
+    locale: str | None,
+    deadline: float | None,
+    attempt_counter: translate.ProviderAttemptCounter | None,
+) -> None:
+    """묶음 요청 결과 중 응답 계약을 통과한 block 응답을 기록."""
+
+    shared = _SHARED_TRANSLATIONS.responses if _SHARED_TRANSLATIONS is not None else {}
+    requests = [
+        request
+        for request in _provider_requests(change, target, cfg, locale)
+        if _shared_request_key(request, locale) not in shared
+    ]
+    for group in translate.pack_requests(requests, cfg, prompt):
+        packed = translate.PackedTranslationRequest(
+            tuple(requests[index] for index in group)
+        )
+        try:
+            parts = translate.translate_packed(
+                packed,
+                cfg,
+                prompt,
+                deadline=deadline,
+                attempt_counter=attempt_counter,
+            )
+        except translate.RunDeadlineExceeded:
+            raise
+        except translate.IncompleteTranslation:
+            continue
+        if parts is None:
+            continue
+        for request, part in zip(packed.requests, parts, strict=True):
+            translated = part
+            if cfg.provider != "identity":
+                translated = _repaired_provider_response(request.source, part)
+            if not _contract_issues(translated, request.source, cfg, change, locale):
+                _PACKED_RESPONSES[_shared_request_key(request, locale)] = part
+
+
+def _record_shared_translation(
+    request: translate.TranslationRequest,
+    locale: str | None,
+    response: str,
+) -> None:
+    """응답 계약을 통과한 provider 응답을 실행 공유표에 기록."""
+
+    if _SHARED_TRANSLATIONS is not None:
+        _SHARED_TRANSLATIONS.record(request, locale, response)
+
+
 def _provider_issue_code(exc: translate.IncompleteTranslation) -> IssueCode:
     """번역 provider 예외를 안정된 문제 코드로 변환."""
 
@@ -271,7 +681,7 @@ def _translation_failure_events(
 def _validated_output_path(path: Path) -> Path:
     """허용된 로케일 루트 안에서 심볼릭 링크를 거치지 않는 출력 경로 검증."""
 
-    root = REPO_ROOT.absolute()
+    root = _repo_root().absolute()
     candidate = path.absolute()
     allowed_roots = (
         root / "versioned_docs",
@@ -288,7 +698,7 @@ def _validated_output_path(path: Path) -> Path:
             raise OutputPathError(f"unsafe translation output path: {path}")
 
     resolved = candidate.resolve(strict=False)
-    resolved_root = REPO_ROOT.resolve()
+    resolved_root = _repo_root().resolve()
     resolved_allowed_roots = (
         resolved_root / "versioned_docs",
         resolved_root / "i18n" / "ja" / "docusaurus-plugin-content-docs",
@@ -306,7 +716,7 @@ def _ko_output(change: diff.SourceChange) -> Path:
     """원문 변경에 대응하는 한국어 출력 경로 반환."""
 
     return (
-        REPO_ROOT
+        _repo_root()
         / "versioned_docs"
         / f"version-{change.version}"
         / change.document
@@ -317,7 +727,7 @@ def _ja_output(change: diff.SourceChange) -> Path:
     """원문 변경에 대응하는 일본어 출력 경로 반환."""
 
     return (
-        REPO_ROOT
+        _repo_root()
         / "i18n"
         / "ja"
         / "docusaurus-plugin-content-docs"
@@ -338,7 +748,7 @@ def _validate_file_states(changes: list[diff.SourceChange]) -> list[str]:
 def _english_source_issue(change: diff.SourceChange) -> str | None:
     """영어 원문 파일의 존재 상태가 변경 상태와 어긋나는지 판정."""
 
-    source = REPO_ROOT / change.path
+    source = _repo_root() / change.path
     expected = change.status in {"A", "M"}
     if (source.is_file() and not source.is_symlink()) == expected:
         return None
@@ -431,7 +841,7 @@ def _admitted_added_locale(
 
     try:
         document = dest.read_bytes().decode("utf-8")
-        source = (REPO_ROOT / change.path).read_text(encoding="utf-8")
+        source = (_repo_root() / change.path).read_text(encoding="utf-8")
         preprocessed = preprocess.preprocess(source)
         if _verify_and_admit_document(
             dest,
@@ -468,7 +878,11 @@ def _preflight_all_translation_targets(
     cfg: config.Config,
     prompts: Mapping[str, str],
 ) -> tuple[dict[tuple[str, str], _PreparedTranslationTarget], list[str]]:
-    """첫 로케일 기록 전에 모든 대상의 계획·입력·요청 예산 검증."""
+    """첫 로케일 기록 전에 모든 대상의 계획·입력·요청 예산 검증.
+
+    모든 대상이 준비되면 버전 간 동일한 provider 요청을 찾아 한 번만 번역하도록
+    실행 공유표를 설정한다.
+    """
 
     prepared: dict[tuple[str, str], _PreparedTranslationTarget] = {}
     issues: list[str] = []
@@ -480,13 +894,19 @@ def _preflight_all_translation_targets(
             ("ja", _ja_output(change)),
         ):
             try:
-                prepared[(change.path, locale)] = _prepare_translation_target(
-                    change,
-                    cfg,
-                    prompts[locale],
-                    dest,
-                    locale,
-                )
+                with _trace().stage(
+                    "preflight",
+                    version=change.version,
+                    document=change.document,
+                    locale=locale,
+                ):
+                    prepared[(change.path, locale)] = _prepare_translation_target(
+                        change,
+                        cfg,
+                        prompts[locale],
+                        dest,
+                        locale,
+                    )
             except (
                 OutputPathError,
                 config.ConfigError,
@@ -499,6 +919,13 @@ def _preflight_all_translation_targets(
                 issues.append(
                     f"{locale} {change.path}: {_preflight_exception_issue(exc)}"
                 )
+    if not issues:
+        shared_requests = _share_cross_version_requests(changes, prepared, cfg)
+        if shared_requests:
+            print(
+                f"reusing {shared_requests} provider request(s) across versions",
+                file=sys.stderr,
+            )
     return prepared, issues
 
 
@@ -543,7 +970,7 @@ def _sidebar_versions(changes: list[diff.SourceChange], version: str | None) ->
     """전체 사이드바 검증에 사용할 정규 버전 순서 반환."""
 
     del changes, version
-    return sidebar.load_versions(REPO_ROOT)
+    return sidebar.load_versions(_repo_root())
 
 
 def _load_prompts() -> dict[str, str]:
@@ -591,7 +1018,7 @@ def _sort_changes(
 
     if not changes:
         return []
-    versions = sidebar.load_versions(REPO_ROOT)
+    versions = sidebar.load_versions(_repo_root())
     rank = {version: index for index, version in enumerate(versions)}
     unknown = sorted(
         {change.version for change in changes if change.version not in rank},
@@ -618,8 +1045,10 @@ def _translation_request(
     version: str | None = None,
     diff_text: str | None = None,
     verification_feedback: str | None = None,
+    locale: str | None = None,
+    document_context: str | None = None,
 ) -> translate.TranslationRequest:
-    """응답 계약 버전을 포함한 구조화된 번역 요청 생성."""
+    """응답 계약 버전과 번역 메모리 유사 블록을 포함한 구조화된 번역 요청 생성."""
 
     return translate.TranslationRequest(
         source=source,
@@ -628,6 +1057,21 @@ def _translation_request(
         verification_feedback=verification_feedback,
         version=version,
         response_contract_version=response_contract.RESPONSE_CONTRACT_VERSION,
+        similar_translations=_similar_translations(source, locale),
+        document_context=document_context,
+    )
+
+
+def _similar_translations(source: str, locale: str | None) -> tuple[str, ...]:
+    """요청 원문 annotation과 영어 표현이 비슷한 기존 번역 블록."""
+
+    if _TRANSLATION_MEMORY is None or locale is None:
+        return ()
+    return tuple(
+        _TRANSLATION_MEMORY.similar(
+            locale,
+            response_contract._required_comments(source),
+        )
     )
 
 
@@ -670,18 +1114,36 @@ def _contract_issues(
     change: diff.SourceChange,
     locale: str | None,
 ) -> list[str]:
-    """프로바이더 응답을 현재 로케일과 고정된 응답 계약으로 검증."""
+    """프로바이더 응답을 현재 로케일과 고정된 응답 계약으로 검증.
 
-    contract_source = (
-        response_contract.identity_source_view(source, change.version)
-        if cfg.provider == "identity"
-        else source
-    )
-    return response_contract.verify(
+    실행 상태 memo가 열려 있으면 같은 원문·응답·판정 범위의 이전 판정을 재사용한다.
+    identity 판정은 version 치환 원문에 의존하므로 범위에 version을 포함한다.
+    """
+
+    identity = cfg.provider == "identity"
+
+    def compute() -> list[str]:
+        """응답 계약 판정을 새로 계산."""
+
+        contract_source = (
+            response_contract.identity_source_view(source, change.version)
+            if identity
+            else source
+        )
+        return response_contract.verify(
+            translated,
+            contract_source,
+            locale=None if identity else locale,
+            contract_version=response_contract.RESPONSE_CONTRACT_VERSION,
+        )
+
+    if _CONTRACT_MEMO is None:
+        return compute()
+    return _CONTRACT_MEMO.issues(
         translated,
-        contract_source,
-        locale=None if cfg.provider == "identity" else locale,
-        contract_version=response_contract.RESPONSE_CONTRACT_VERSION,
+        source,
+        scope=f"identity:{change.version}" if identity else f"locale:{locale}",
+        compute=compute,
     )
 
 
@@ -720,16 +1182,25 @@ def _translate_added_document(
                 write=False,
             ):
                 return []
-        translated_blocks, contract_issue = _translate_create_blocks(
-            target.plan.create_blocks,
+        with _packed_target_responses(
             change,
+            target,
             cfg,
             prompt,
             locale=locale,
             deadline=deadline,
             attempt_counter=attempt_counter,
-            reusable=target.reusable_blocks,
-        )
+        ):
+            translated_blocks, contract_issue = _translate_create_blocks(
+                target.plan.create_blocks,
+                change,
+                cfg,
+                prompt,
+                locale=locale,
+                deadline=deadline,
+                attempt_counter=attempt_counter,
+                reusable=target.reusable_blocks,
+            )
         if contract_issue is not None:
             return [contract_issue]
         translated = patch_utils.apply_plan(
@@ -737,11 +1208,12 @@ def _translate_added_document(
             target.plan,
             translated_blocks,
         )
-        out = postprocess.postprocess(
-            translated,
-            change.version,
-            target.placeholders,
-        )
+        with _trace().stage("postprocess"):
+            out = postprocess.postprocess(
+                translated,
+                change.version,
+                target.placeholders,
+            )
         if target.preserved_front_matter is not None:
             out = f"{target.preserved_front_matter}\n{out}"
         out = _normalized_locale_document(out, locale)
@@ -843,25 +1315,30 @@ def _translate_create_owner(
     feedback: str | None = None
     issues: list[str] = []
     for attempt in range(MAX_SEGMENT_VERIFICATION_ATTEMPTS):
-        translated = translate.translate_request(
-            _translation_request(
-                source,
-                None,
-                version=change.version,
-                verification_feedback=feedback,
-            ),
+        request = _translation_request(
+            source,
+            None,
+            version=change.version,
+            verification_feedback=feedback,
+            locale=locale,
+        )
+        response = _requested_translation(
+            request,
             cfg,
             prompt,
+            locale=locale,
             deadline=deadline,
             attempt_counter=attempt_counter,
         )
         if attempt_counter is not None:
             attempt_counter.record_response_evaluation()
+        translated = response
         if cfg.provider != "identity":
             translated = _repaired_provider_response(source, translated)
         issues = _contract_issues(translated, source, cfg, change, locale)
         translate.require_run_deadline(deadline)
         if not issues:
+            _record_shared_translation(request, locale, response)
             return translated, None
         retryable = response_contract.supports_feedback_retry(
             translated,
@@ -927,6 +1404,7 @@ def _prepare_block_translation(
     existing: str,
     *,
     placeholders: Mapping[str, str] | None = None,
+    locale: str | None = None,
 ) -> _PreparedBlockTranslation:
     """블록 번역 요청 준비."""
 
@@ -953,11 +1431,14 @@ def _prepare_block_translation(
         patch_utils.diff_text(block_change),
         restore_map,
     )
+    document_context = _document_context(existing, placeholders)
     request = _translation_request(
         request_source,
         existing_context,
         version=change.version,
         diff_text=diff_text,
+        locale=locale,
+        document_context=document_context,
     )
     translate.preflight_request(request, cfg, prompt)
     return _PreparedBlockTranslation(
@@ -966,9 +1447,34 @@ def _prepare_block_translation(
         diff_text=diff_text,
         expected_source=expected_source,
         placeholders=restore_map,
+        document_context=document_context,
     )
 
 
+def _document_context(
+    existing: str,
+    placeholders: Mapping[str, str] | None,
+) -> str | None:
+    """같은 문서의 block 요청이 공유할 기존 번역의 annotation 달린 heading 목록.
+
+    원문 heading annotation과 번역 heading 쌍은 문서 용어집 역할을 하며, 문서마다
+    한 번 정해져 block 요청 사이에 byte 단위로 같다. 문서 단위 복원 매핑이 있으면
+    block 원문과 같은 placeholder로 가린다.
+    """
+
+    headings = [
+        text.rstrip("\n")
+        for comment, text in translation_memory.annotated_blocks(existing).items()
+        if comment.startswith("#")
+    ][:_DOCUMENT_CONTEXT_HEADINGS]
+    if not headings:
+        return None
+    context = "\n".join(headings) + "\n"
+    if placeholders is not None:
+        context = _mask_with_restore_map(context, placeholders)
+    return context
+
+
 def _mask_with_restore_map(
     text: str,
     placeholders: Mapping[str, str],
@@ -1006,26 +1512,40 @@ def _translate_block_change(
         prompt,
         existing,
         placeholders=placeholders,
+        locale=locale,
+    )
+    remembered = _remembered_translation(
+        prepared.request_source,
+        cfg,
+        change,
+        locale,
     )
+    if remembered is not None:
+        return _finished_block_translation(remembered, change, cfg, prepared)
     feedback: str | None = None
     contract_issues: list[str] = []
 
     for attempt in range(MAX_SEGMENT_VERIFICATION_ATTEMPTS):
-        translated = translate.translate_request(
-            _translation_request(
-                prepared.request_source,
-                prepared.existing_context,
-                version=change.version,
-                diff_text=prepared.diff_text,
-                verification_feedback=feedback,
-            ),
+        request = _translation_request(
+            prepared.request_source,
+            prepared.existing_context,
+            version=change.version,
+            diff_text=prepared.diff_text,
+            verification_feedback=feedback,
+            locale=locale,
+            document_context=prepared.document_context,
+        )
+        response = _requested_translation(
+            request,
             cfg,
             prompt,
+            locale=locale,
             deadline=deadline,
             attempt_counter=attempt_counter,
         )
         if attempt_counter is not None:
             attempt_counter.record_response_evaluation()
+        translated = response
         if cfg.provider != "identity":
             translated = _repaired_provider_response(prepared.request_source, translated)
         contract_issues = _contract_issues(
@@ -1054,18 +1574,8 @@ def _translate_block_change(
             )
             continue
 
-        out = postprocess.postprocess(
-            translated,
-            change.version,
-            prepared.placeholders,
-        )
-        if cfg.provider == "identity":
-            return out
-        return _repair_segment_translation(
-            prepared.expected_source,
-            out,
-            change.version,
-        )
+        _record_shared_translation(request, locale, response)
+        return _finished_block_translation(translated, change, cfg, prepared)
 
     if contract_issues:
         raise translate.IncompleteTranslation(
@@ -1074,6 +1584,29 @@ def _translate_block_change(
     raise translate.IncompleteTranslation("provider response contract failed")
 
 
+def _finished_block_translation(
+    translated: str,
+    change: diff.SourceChange,
+    cfg: config.Config,
+    prepared: _PreparedBlockTranslation,
+) -> str:
+    """응답 계약을 통과한 블록 번역에 후처리와 결정적 복구 적용."""
+
+    with _trace().stage("postprocess"):
+        out = postprocess.postprocess(
+            translated,
+            change.version,
+            prepared.placeholders,
+        )
+    if cfg.provider == "identity":
+        return out
+    return _repair_segment_translation(
+        prepared.expected_source,
+        out,
+        change.version,
+    )
+
+
 def _render_provider_free_change(
     change: diff.SourceChange,
     block_change: patch_utils.BlockChange,
@@ -1129,7 +1662,7 @@ def _preflight_create_plan(
     for owner in plan.create_blocks:
         if not owner.provider_required:
             continue
-        if reusable and _reused_create_block(
+        if _reused_create_block(
             owner, reusable, cfg, change, locale
         ) is not None:
             continue
@@ -1137,6 +1670,7 @@ def _preflight_create_plan(
             owner.source,
             None,
             version=change.version,
+            locale=locale,
         )
         translate.preflight_request(request, cfg, prompt)
 
@@ -1154,6 +1688,13 @@ _DEGRADABLE_VERIFICATION_CODES = (
 def _repaired_provider_response(source: str, translated: str) -> str:
     """live provider 응답에 결정적 복구를 순서대로 적용."""
 
+    with _trace().stage("repair"):
+        return _apply_provider_repairs(source, translated)
+
+
+def _apply_provider_repairs(source: str, translated: str) -> str:
+    """provider 응답 복구 단계 실행."""
+
     try:
         translated = repair.repair_preserved_markup(source, translated).text
     except repair.RepairError:
@@ -1186,15 +1727,7 @@ def _annotated_locale_blocks(existing: str | None) -> dict[str, str]:
     같은 annotation이 두 번 이상 나타나면 대응이 모호하므로 제외한다.
     """
 
-    if not existing:
-        return {}
-    blocks = patch_utils._blocks(existing)
-    counts = Counter(block.comment for block in blocks)
-    return {
-        block.comment: block.text
-        for block in blocks
-        if counts[block.comment] == 1
-    }
+    return translation_memory.annotated_blocks(existing)
 
 
 def _reused_create_block(
@@ -1207,20 +1740,41 @@ def _reused_create_block(
     """영어 원문이 그대로인 owner의 기존 번역 블록 재사용 결과.
 
     canonical annotation이 정확히 하나이고 기존 문서에서 유일하게 대응하며
-    응답 계약을 그대로 통과할 때만 재사용한다.
+    응답 계약을 그대로 통과할 때만 재사용한다. 기존 문서에 없으면 번역
+    메모리의 같은 annotation 후보를 같은 조건으로 확인한다.
     """
 
-    if not reusable:
-        return None
-    required = response_contract._required_comments(owner.source)
-    if len(required) != 1:
-        return None
-    candidate = reusable.get(required[0])
-    if candidate is None:
+    return _remembered_translation(owner.source, cfg, change, locale, reusable)
+
+
+def _remembered_translation(
+    source: str,
+    cfg: config.Config,
+    change: diff.SourceChange,
+    locale: str | None,
+    reusable: Mapping[str, str] = MappingProxyType({}),
+) -> str | None:
+    """annotation 하나짜리 원문 블록의 검증된 기존 번역.
+
+    같은 문서의 블록을 먼저, 말뭉치 번역 메모리의 후보를 다음으로 확인하며
+    응답 계약을 통과한 첫 후보만 반환한다.
+    """
+
+    if not reusable and (_TRANSLATION_MEMORY is None or locale is None):
         return None
-    if _contract_issues(candidate, owner.source, cfg, change, locale):
+    required = response_contract._required_comments(source)
+    if len(required) != 1:
         return None
-    return candidate
+    candidates: list[str] = []
+    local = reusable.get(required[0])
+    if local is not None:
+        candidates.append(local)
+    if _TRANSLATION_MEMORY is not None and locale is not None:
+        candidates.extend(_TRANSLATION_MEMORY.candidates(locale, required[0]))
+    for candidate in dict.fromkeys(candidates):
+        if not _contract_issues(candidate, source, cfg, change, locale):
+            return candidate
+    return None
 
 
 def _issues_allow_regeneration(issues: list[str]) -> bool:
@@ -1242,12 +1796,12 @@ def _degraded_create_target(
 ) -> _PreparedTranslationTarget:
     """부분 patch로 처리할 수 없는 수정 문서의 전체 재생성 계획."""
 
-    source = (REPO_ROOT / change.path).read_text(encoding="utf-8")
+    source = (_repo_root() / change.path).read_text(encoding="utf-8")
     preprocessed = preprocess.preprocess(source)
     placeholders: Mapping[str, str] = MappingProxyType(
         dict(preprocessed.placeholders)
     )
-    plan = patch_utils.build_create_plan(preprocessed.text)
+    plan = _create_plan(preprocessed.text)
     reusable = MappingProxyType(_annotated_locale_blocks(existing))
     _preflight_create_plan(change, plan, cfg, prompt, reusable, locale)
     preserved = (
@@ -1279,6 +1833,7 @@ def _preflight_modified_plan(
     prompt: str,
     existing: str,
     placeholders: Mapping[str, str],
+    locale: str | None = None,
 ) -> dict[int, _PreparedBlockTranslation]:
     """수정 계획의 블록 요청과 프로바이더 비호출 미리보기 적용 가능성 검증."""
 
@@ -1306,6 +1861,7 @@ def _preflight_modified_plan(
             prompt,
             existing,
             placeholders=placeholders,
+            locale=locale,
         )
         prepared[id(block_change)] = block_preflight
         previews.append(
@@ -1338,7 +1894,7 @@ def _prepare_translation_target(
     """로케일별 번역 대상 사전 준비."""
 
     dest = _validated_output_path(dest)
-    source = (REPO_ROOT / change.path).read_text(encoding="utf-8")
+    source = (_repo_root() / change.path).read_text(encoding="utf-8")
 
     if change.status == "A":
         preprocessed = preprocess.preprocess(source)
@@ -1359,8 +1915,8 @@ def _prepare_translation_target(
         )
         if admitted:
             existing, existing_bytes = None, None
-        plan = patch_utils.build_create_plan(preprocessed.text)
-        state = patch_utils.plan_state(existing, plan)
+        plan = _create_plan(preprocessed.text)
+        state = _plan_state(existing, plan)
         if not admitted:
             # no-op으로 끝날 작업을 요청 예산 검사로 실패시키지 않는다.
             _preflight_create_plan(
@@ -1395,7 +1951,7 @@ def _prepare_translation_target(
     try:
         plan, pair = _build_modified_plan(change, source)
         placeholders = MappingProxyType(dict(pair.current.placeholders))
-        state = patch_utils.plan_state(existing, plan)
+        state = _plan_state(existing, plan)
         block_requests = _preflight_modified_plan(
             change,
             plan,
@@ -1404,6 +1960,7 @@ def _prepare_translation_target(
             prompt,
             existing,
             placeholders,
+            locale,
         )
     except patch_utils.PatchError as exc:
         print(f"degrading to full re-translation: {change.path}: {exc}")
@@ -1424,6 +1981,13 @@ def _prepare_translation_target(
 def _repair_segment_translation(source: str, translated: str, version: str) -> str:
     """번역 구간의 보존 서식 복구."""
 
+    with _trace().stage("repair"):
+        return _repaired_segment(source, translated, version)
+
+
+def _repaired_segment(source: str, translated: str, version: str) -> str:
+    """번역 구간 복구 후보 중 검증을 통과하는 결과 선택."""
+
     translated = _repair_blockquote_segment(source, translated)
     translated = repair.restore_list_markers(source, translated)
     candidates = [translated]
@@ -1547,13 +2111,54 @@ def _build_modified_plan(
         current,
         change.version,
     )
-    plan = patch_utils.build_plan(
-        diff.hunks_between(*normalized),
-        normalized[1],
+    plan = _cached_plan(
+        "modified",
+        normalized,
+        lambda: patch_utils.build_plan(
+            diff.hunks_between(*normalized),
+            normalized[1],
+        ),
     )
     return plan, pair
 
 
+def _cached_plan(
+    kind: str,
+    sources: tuple[str, ...],
+    build: Callable[[], patch_utils.PatchPlan],
+) -> patch_utils.PatchPlan:
+    """실행 상태 저장소에 있으면 재사용하고 없으면 새로 만든 계획."""
+
+    if _PLAN_CACHE is None:
+        return build()
+    return _PLAN_CACHE.plan(_PLAN_CACHE.key(kind, *sources), build)
+
+
+def _create_plan(source: str) -> patch_utils.PatchPlan:
+    """전처리한 원문의 전체 생성 계획."""
+
+    return _cached_plan(
+        "create",
+        (source,),
+        lambda: patch_utils.build_create_plan(source),
+    )
+
+
+def _plan_state(
+    existing: str | None,
+    plan: patch_utils.PatchPlan,
+) -> patch_utils.PlanState:
+    """기존 locale 문서의 계획 상태, 실행 상태 저장소가 있으면 재사용."""
+
+    if _PLAN_CACHE is None:
+        return patch_utils.plan_state(existing, plan)
+    return _PLAN_CACHE.state(
+        plan,
+        existing,
+        lambda: patch_utils.plan_state(existing, plan),
+    )
+
+
 def _annotation_source(
     source: str,
     version: str,
@@ -1657,13 +2262,14 @@ def _verify_and_admit_document(
     """문서를 검증하고 승인된 결과를 선택적으로 기록."""
 
     try:
-        result = _document_verification_result(
-            locale_document,
-            source,
-            version,
-            placeholders,
-            canonicalize=canonicalize,
-        )
+        with _trace().stage("verify"):
+            result = _document_verification_result(
+                locale_document,
+                source,
+                version,
+                placeholders,
+                canonicalize=canonicalize,
+            )
     except (UnicodeDecodeError, ValueError, stale_links.StaleLinkRegistryError) as exc:
         return [
             (
@@ -1681,12 +2287,26 @@ def _verify_and_admit_document(
                 f"[{IssueCode.UNCLASSIFIED_INTERNAL.value}]"
             )
         ]
-    if write:
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        atomic_write_bytes(dest, result.artifact.locale_bytes)
+    if write and _WRITE_OUTPUTS:
+        with _trace().stage("admit"):
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_bytes(dest, result.artifact.locale_bytes)
+            _remember_admitted_document(dest, result.artifact.locale_bytes)
     return []
 
 
+def _remember_admitted_document(dest: Path, locale_bytes: bytes) -> None:
+    """승인되어 기록된 locale 문서를 번역 메모리에 반영."""
+
+    if _TRANSLATION_MEMORY is None:
+        return
+    try:
+        document = locale_bytes.decode("utf-8")
+    except UnicodeDecodeError:
+        return
+    _TRANSLATION_MEMORY.record_document(dest, document)
+
+
 def _translate_one(
     change: diff.SourceChange,
     cfg: config.Config,
@@ -1852,18 +2472,28 @@ def _translate_partial_document(
     )
     if _unguarded_code_change_is_already_valid(dest, target, existing_bytes, change):
         return []
-    translated_blocks = _translated_plan_blocks(
+    with _packed_target_responses(
         change,
         target,
         cfg,
         prompt,
-        existing,
         locale=locale,
         deadline=deadline,
         attempt_counter=attempt_counter,
-    )
+    ):
+        translated_blocks = _translated_plan_blocks(
+            change,
+            target,
+            cfg,
+            prompt,
+            existing,
+            locale=locale,
+            deadline=deadline,
+            attempt_counter=attempt_counter,
+        )
     out = patch_utils.apply_plan(existing, target.plan, translated_blocks)
-    out = postprocess.postprocess(out, change.version, target.placeholders)
+    with _trace().stage("postprocess"):
+        out = postprocess.postprocess(out, change.version, target.placeholders)
     return dest, target, out, expected_source
 
 
@@ -1957,17 +2587,39 @@ def _translated_plan_blocks(
 
 
 def _sync_sidebars(versions: list[str]) -> list[str]:
-    """사이드바 동기화."""
+    """사이드바 동기화. 실행 상태 디렉터리가 있으면 digest 색인을 함께 사용."""
 
+    state_dir = run_state.state_directory()
     failures: list[str] = []
-    for result in sidebar.sync_versions(versions, write=True, repo_root=REPO_ROOT):
+    for result in sidebar.sync_versions(
+        versions,
+        write=True,
+        repo_root=_repo_root(),
+        index_path=(
+            None if state_dir is None else state_dir / sidebar.SIDEBAR_INDEX_FILENAME
+        ),
+    ):
         for issue in result.issues:
             failures.append(f"{result.version}: {issue}")
     return failures
 
 
 
-_VALUE_OPTIONS = {"--doc", "--version"}
+_VALUE_OPTIONS = {
+    "--doc",
+    "--version",
+    "--plan-concurrency",
+    "--plan-request-seconds",
+    "--profile-dir",
+}
+# 값을 생략할 수 있는 option과 허용 값. 첫 값이 생략했을 때의 값이다.
+_OPTIONAL_VALUE_OPTIONS = {
+    "--plan-only": plan_report.PLAN_REPORT_FORMATS,
+    "--profile": profiling.PROFILE_MODES,
+}
+# 값을 받지 않는 option.
+_FLAG_OPTIONS = {"--profile-identity"}
+
 
 def _parse_args(args: list[str]) -> dict[str, str]:
     """명령행 선택자 파싱."""
@@ -1979,6 +2631,26 @@ def _parse_args(args: list[str]) -> dict[str, str]:
         argument = args[index]
         option, separator, inline_value = argument.partition("=")
 
+        if option in _FLAG_OPTIONS:
+            if separator:
+                raise config.ConfigError(f"{option} does not take a value")
+            if option in values:
+                raise config.ConfigError(f"{option} may only be specified once")
+            values[option] = ""
+            index += 1
+            continue
+        if option in _OPTIONAL_VALUE_OPTIONS:
+            if option in values:
+                raise config.ConfigError(f"{option} may only be specified once")
+            choices = _OPTIONAL_VALUE_OPTIONS[option]
+            value = inline_value if separator else choices[0]
+            if value not in choices:
+                raise config.ConfigError(
+                    f"{option} must be one of: {', '.join(choices)}"
+                )
+            values[option] = value
+            index += 1
+            continue
         if option not in _VALUE_OPTIONS:
             raise config.ConfigError(f"unknown argument: {argument}")
         value, index = _parse_value_option(
@@ -2005,7 +2677,7 @@ def _parse_value_option(
     Args:
         args: 전체 명령행 인수.
         index: 현재 option 위치.
-        option: ``--doc`` 또는 ``--version``.
+        option: 값을 요구하는 option.
         inline_value: ``=`` 뒤 inline 값 또는 ``None``.
         values: 이미 파싱한 option 값.
 
@@ -2030,15 +2702,385 @@ def _parse_value_option(
     return value, index
 
 
+def _progress_output(plan_only: str | None) -> AbstractContextManager[object]:
+    """계획 보고서만 표준 출력에 남도록 진행 출력을 표준 오류로 돌리는 context."""
+
+    return redirect_stdout(sys.stderr) if plan_only else nullcontext()
+
+
+def _print_plan_report(
+    changes: list[diff.SourceChange],
+    prepared_targets: Mapping[tuple[str, str], _PreparedTranslationTarget],
+    cfg: config.Config,
+    prompts: Mapping[str, str],
+    output_format: str,
+    concurrency: int,
+    request_seconds: float | None,
+) -> None:
+    """사전검증 결과의 계획 보고서를 표준 출력에 기록."""
+
+    report = _plan_report(
+        changes,
+        prepared_targets,
+        cfg,
+        prompts,
+        concurrency=concurrency,
+        request_seconds=request_seconds,
+    )
+    if output_format == "json":
+        print(plan_report.render_json(report))
+    else:
+        print(plan_report.render_text(report))
+
+
+def _plan_options(values: Mapping[str, str]) -> tuple[int, float | None]:
+    """``--plan-only`` 예상 시간 계산의 동시 요청 수와 요청당 시간.
+
+    Raises:
+        ConfigError: 값이 양수가 아니거나 ``--plan-only`` 없이 지정됨.
+    """
+
+    for option in ("--plan-concurrency", "--plan-request-seconds"):
+        if option in values and "--plan-only" not in values:
+            raise config.ConfigError(f"{option} requires --plan-only")
+    try:
+        concurrency = int(values.get("--plan-concurrency", "1"))
+        seconds = values.get("--plan-request-seconds")
+        request_seconds = None if seconds is None else float(seconds)
+    except ValueError as exc:
+        raise config.ConfigError(f"invalid plan option: {exc}") from exc
+    if concurrency < 1:
+        raise config.ConfigError("--plan-concurrency must be a positive integer")
+    if request_seconds is not None and not (
+        math.isfinite(request_seconds) and request_seconds > 0
+    ):
+        raise config.ConfigError("--plan-request-seconds must be a positive number")
+    return concurrency, request_seconds
+
+
+def _profile_options(values: Mapping[str, str]) -> profiling.TargetProfiler | None:
+    """``--profile`` 대상별 측정기, 지정하지 않으면 ``None``.
+
+    Raises:
+        ConfigError: profile option이 ``--profile`` 없이 또는 ``--plan-only``와 함께 지정됨.
+    """
+
+    mode = values.get("--profile")
+    for option in ("--profile-dir", "--profile-identity"):
+        if option in values and mode is None:
+            raise config.ConfigError(f"{option} requires --profile")
+    if mode is None:
+        return None
+    if "--plan-only" in values:
+        raise config.ConfigError("--profile cannot be combined with --plan-only")
+    directory = Path(values.get("--profile-dir", profiling.DEFAULT_PROFILE_DIR))
+    return profiling.TargetProfiler(mode, directory)
+
+
+def _target_profile(
+    profiler: profiling.TargetProfiler | None,
+    change: diff.SourceChange,
+    locale: str,
+) -> AbstractContextManager[object]:
+    """번역 대상 하나의 profile context. 측정하지 않으면 빈 context."""
+
+    if profiler is None:
+        return nullcontext()
+    return profiler.target(change.version, change.document, locale)
+
+
+def _open_run_state() -> None:
+    """설정된 실행 상태 디렉터리의 memo, 번역 메모리와 계획 저장소 열기.
+
+    Raises:
+        ValueError: 실행 상태 디렉터리 설정이 잘못됨.
+    """
+
+    global _CONTRACT_MEMO, _TRANSLATION_MEMORY, _PLAN_CACHE
+    state_dir = run_state.state_directory()
+    _CONTRACT_MEMO = contract_memo.open_memo(state_dir)
+    _TRANSLATION_MEMORY = translation_memory.open_memory(state_dir, REPO_ROOT)
+    _PLAN_CACHE = plan_cache.open_plan_cache(state_dir)
+
+
+def _close_run_state() -> None:
+    """열린 실행 상태 저장소를 닫고 다음 실행을 위해 비우기."""
+
+    global _CONTRACT_MEMO, _TRANSLATION_MEMORY, _PLAN_CACHE
+    if _CONTRACT_MEMO is not None:
+        _CONTRACT_MEMO.close()
+        _CONTRACT_MEMO = None
+    if _TRANSLATION_MEMORY is not None:
+        _TRANSLATION_MEMORY.close()
+        _TRANSLATION_MEMORY = None
+    if _PLAN_CACHE is not None:
+        _PLAN_CACHE.close()
+        _PLAN_CACHE = None
+
+
+def _reset_run_globals() -> None:
+    """실행별 전역 상태를 초기값으로 되돌리고 열린 실행 상태 저장소 닫기.
+
+    ``main()``과 ``translate_changes()``가 실행을 끝낼 때 호출한다. 실행 사이에
+    남으면 안 되는 전역 상태를 추가하면 여기서 함께 초기화한다.
+    """
+
+    global _TRACE, _WRITE_OUTPUTS, _SHARED_TRANSLATIONS
+    _TRACE = run_trace.RunTrace()
+    _WRITE_OUTPUTS = True
+    _SHARED_TRANSLATIONS = None
+    _PACKED_RESPONSES.clear()
+    _close_run_state()
+
+
+def _last_run_inputs(version: str | None) -> tuple[Path, str] | None:
+    """빠른 종료 판정에 쓸 상태 디렉터리와 입력 digest.
+
+    상태 디렉터리와 기존 고정 매니페스트가 모두 있을 때만 판정한다. 설정 오류나
+    읽을 수 없는 입력은 ``None``으로 돌려 일반 실행이 같은 오류를 보고하게 한다.
+    """
+
+    try:
+        state_dir = run_state.state_directory()
+    except ValueError:
+        return None
+    manifest_value = os.environ.get(upstream.MANIFEST_ENV, "").strip()
+    if state_dir is None or not manifest_value:
+        return None
+    try:
+        manifest = Path(manifest_value).resolve().read_bytes()
+        expected_digest = os.environ.get(upstream.MANIFEST_DIGEST_ENV, "").strip()
+        if expected_digest and upstream.manifest_digest(manifest) != expected_digest:
+            return None
+        digest = last_run.input_digest(
+            REPO_ROOT,
+            manifest=manifest,
+            registry_path=stale_links.REGISTRY_PATH,
+            entrypoint=Path(__file__).resolve(),
+            version=version,
+        )
+    except (OSError, ValueError):
+        return None
+    return state_dir, digest
+
+
+@dataclass(frozen=True)
+class _ChangeFailure:
+    """원문 변경 반영을 멈춘 단계와 문제 목록."""
+
+    stage: str
+    issues: list[str]
+    change: diff.SourceChange | None = None
+    locale: str | None = None
+    attempt_counter: translate.ProviderAttemptCounter | None = None
+
+
+@dataclass(frozen=True)
+class _ChangeOutcome:
+    """원문 변경 반영 결과. 끝까지 반영했으면 ``failure``가 ``None``."""
+
+    prepared_targets: dict[tuple[str, str], _PreparedTranslationTarget]
+    failure: _ChangeFailure | None = None
+
+
+def _apply_changes(
+    changes: list[diff.SourceChange],
+    cfg: config.Config,
+    prompts: Mapping[str, str],
+    *,
+    repo_root: Path,
+    trace: run_trace.RunTrace,
+    deadline: float | None,
+    plan_only: str | None = None,
+    profiler: profiling.TargetProfiler | None = None,
+    skip_deletes: bool = False,
+) -> _ChangeOutcome:
+    """파일 상태 검증 → 사전검증 → 삭제·ko·ja 번역으로 원문 변경 반영.
+
+    ``main()``과 ``translate_changes()``가 함께 쓰는 단계 순서다. ``repo_root``와
+    ``trace``는 이 호출 안에서만 실행 범위로 쓰고 모듈 전역은 바꾸지 않는다.
+    ``plan_only``이면 사전검증까지만 하고, ``skip_deletes``이면 삭제를 건너뛴다.
+    """
+
+    scope = _RUN_SCOPE.set(_RunScope(repo_root=repo_root, trace=trace))
+    try:
+        with trace.stage("source-diff"):
+            issues = _validate_file_states(changes)
+        if issues:
+            return _ChangeOutcome({}, _ChangeFailure("source-diff", issues))
+        with _progress_output(plan_only):
+            prepared_targets, issues = _preflight_all_translation_targets(
+                changes,
+                cfg,
+                prompts,
+            )
+        if issues:
+            return _ChangeOutcome(prepared_targets, _ChangeFailure("preflight", issues))
+        if plan_only:
+            return _ChangeOutcome(prepared_targets)
+        for change in changes:
+            if change.status == "D":
+                if skip_deletes:
+                    continue
+                issues = _delete_outputs(change)
+                if issues:
+                    return _ChangeOutcome(
+                        prepared_targets,
+                        _ChangeFailure("delete", issues, change=change),
+                    )
+                continue
+            for locale, dest in (
+                ("ko", _ko_output(change)),
+                ("ja", _ja_output(change)),
+            ):
+                print(f"translating: {locale} {change.path}", file=sys.stderr, flush=True)
+                prepared = prepared_targets[(change.path, locale)]
+                attempt_counter = translate.ProviderAttemptCounter(
+                    count_tokens=trace.enabled
+                )
+                with trace.stage(
+                    "translate",
+                    version=change.version,
+                    document=change.document,
+                    locale=locale,
+                ) as span, _target_profile(profiler, change, locale):
+                    if spans.enabled():
+                        spans.set_attribute("plan_id", plan_cache.plan_id(prepared.plan))
+                    try:
+                        issues = _translate_one(
+                            change,
+                            cfg,
+                            prompts[locale],
+                            dest,
+                            locale=locale,
+                            deadline=deadline,
+                            prepared_target=prepared,
+                            attempt_counter=attempt_counter,
+                        )
+                    finally:
+                        span.record_provider(attempt_counter)
+                if issues:
+                    return _ChangeOutcome(
+                        prepared_targets,
+                        _ChangeFailure(
+                            "translate",
+                            issues,
+                            change=change,
+                            locale=locale,
+                            attempt_counter=attempt_counter,
+                        ),
+                    )
+        return _ChangeOutcome(prepared_targets)
+    finally:
+        _RUN_SCOPE.reset(scope)
+
+
+def translate_changes(
+    changes: list[diff.SourceChange],
+    cfg: config.Config,
+    *,
+    repo_root: Path | None = None,
+    trace: run_trace.RunTrace | None = None,
+) -> list[str]:
+    """원문 변경 목록을 ko·ja 출력에 반영하는 내장용 실행 진입점.
+
+    원문 동기화와 변경 감지가 끝난 저장소에서 ``main()``과 같은 파일 상태 검증,
+    사전검증, 번역·검증·기록 단계를 실행한다. 사이드바 동기화와 실패 보고서
+    기록은 하지 않고, 실행 상태 디렉터리의 저장소도 열지 않는다. 모듈 전역의
+    ``REPO_ROOT``와 계측기는 바꾸지 않으므로 중첩 호출에도 안전하다.
+
+    Args:
+        changes: 반영할 원문 변경.
+        cfg: 번역 provider 설정.
+        repo_root: 입력과 출력을 둘 저장소 root. 생략하면 ``REPO_ROOT``.
+        trace: 단계별 시간을 기록할 계측기. 호출자가 닫는다.
+
+    Returns:
+        처음 실패한 단계의 문제 목록. 모두 반영했으면 빈 목록.
+    """
+
+    outcome = _apply_changes(
+        changes,
+        cfg,
+        _load_prompts(),
+        repo_root=repo_root or REPO_ROOT,
+        trace=trace or run_trace.RunTrace(),
+        deadline=config.required_run_deadline(cfg),
+    )
+    return [] if outcome.failure is None else outcome.failure.issues
+
+
+def _change_failure_exit(failure: _ChangeFailure) -> int:
+    """원문 변경 반영 실패를 출력하고 단계별 실패 보고서로 종료 코드 반환."""
+
+    if failure.stage == "source-diff":
+        for issue in failure.issues:
+            print(f"file state failed: {issue}", file=sys.stderr)
+        return _finish_sync_failures(
+            [
+                FailureEvent(
+                    code=IssueCode.FILE_STATE_CONFLICT,
+                    stage="translation-input",
+                    message=issue,
+                )
+                for issue in failure.issues
+            ]
+        )
+    if failure.stage == "preflight":
+        for issue in failure.issues:
+            print(f"translation preflight failed: {issue}", file=sys.stderr)
+        return _finish_sync_failures(
+            [
+                _diagnostic_failure_event(
+                    issue,
+                    stage="translation-preflight",
+                    fallback=IssueCode.INVALID_RUNTIME_OPTION,
+                )
+                for issue in failure.issues
+            ]
+        )
+    change = failure.change
+    assert change is not None
+    if failure.stage == "delete":
+        message = f"{change.path}: {', '.join(failure.issues)}"
+        print(f"delete failed: {message}", file=sys.stderr, flush=True)
+        return _sync_failure(
+            IssueCode.OUTPUT_PATH_FORBIDDEN,
+            stage="translation-delete",
+            message=message,
+            version=change.version,
+            document=change.path,
+        )
+    print(
+        f"verify failed: {failure.locale} {change.path}: {failure.issues}",
+        file=sys.stderr,
+        flush=True,
+    )
+    print("stopping after first verification failure", file=sys.stderr, flush=True)
+    return _finish_sync_failures(
+        _translation_failure_events(
+            failure.issues,
+            attempt_counter=failure.attempt_counter,
+            change=change,
+            locale=failure.locale,
+        )
+    )
+
 
 def _run() -> int:
     """명령줄 진입점 실행."""
 
+    global _WRITE_OUTPUTS
     try:
         values = _parse_args(sys.argv[1:])
+        concurrency, request_seconds = _plan_options(values)
+        profiler = _profile_options(values)
     except config.ConfigError as exc:
         print(f"configuration failed: {exc}", file=sys.stderr)
         return 1
+    plan_only = values.get("--plan-only")
+    # provider 호출 없이 결정적 CPU 경로만 측정하는 offline profile.
+    profile_identity = "--profile-identity" in values
 
     version = values.get("--version")
     doc = values.get("--doc")
@@ -2057,38 +3099,64 @@ def _run() -> int:
             print(f"configuration failed: {exc}", file=sys.stderr)
             return 1
 
+    # 0. 마지막 성공 실행과 입력이 같으면 설정·원문 동기화 없이 종료
+    fast_path = not (plan_only or profile_identity or doc) and profiler is None
+    if fast_path and (inputs := _last_run_inputs(version)) is not None:
+        if last_run.is_unchanged(*inputs):
+            print("no input changes since last successful run")
+            return 0
+
     # 1. 설정 확인 (실패 시 원문 캐시를 변경하지 않음)
-    try:
-        cfg = config.load_config()
-    except config.ConfigError as exc:
-        print(f"configuration failed: {exc}", file=sys.stderr)
-        return _sync_failure(
-            exc.issue_code,
-            stage="configuration",
-            message=str(exc),
-        )
+    with _TRACE.stage("configuration"):
+        try:
+            cfg = _IDENTITY_CONFIG if profile_identity else config.load_config()
+        except config.ConfigError as exc:
+            print(f"configuration failed: {exc}", file=sys.stderr)
+            return _sync_failure(
+                exc.issue_code,
+                stage="configuration",
+                message=str(exc),
+            )
 
-    try:
-        prompts = _load_prompts()
-    except prompt.PromptError as exc:
-        print(f"prompt loading failed: {exc}", file=sys.stderr)
-        return _sync_failure(
-            IssueCode.REQUIRED_CONFIG_MISSING,
-            stage="configuration",
-            message=str(exc),
-        )
-    try:
-        run_deadline = config.required_run_deadline(cfg)
-    except config.ConfigError as exc:
-        print(f"configuration failed: {exc}", file=sys.stderr)
-        return _sync_failure(
-            exc.issue_code,
-            stage="configuration",
-            message=str(exc),
-        )
+        try:
+            prompts = _load_prompts()
+        except prompt.PromptError as exc:
+            print(f"prompt loading failed: {exc}", file=sys.stderr)
+            return _sync_failure(
+                IssueCode.REQUIRED_CONFIG_MISSING,
+                stage="configuration",
+                message=str(exc),
+            )
+        try:
+            run_deadline = config.required_run_deadline(cfg)
+        except config.ConfigError as exc:
+            print(f"configuration failed: {exc}", file=sys.stderr)
+            return _sync_failure(
+                exc.issue_code,
+                stage="configuration",
+                message=str(exc),
+            )
+        try:
+            if plan_only:
+                # 계획 보고서는 실행 상태 저장소를 열거나 기록하지 않고 설정만 검증.
+                run_state.state_directory()
+            else:
+                _open_run_state()
+        except ValueError as exc:
+            print(f"configuration failed: {exc}", file=sys.stderr)
+            return _sync_failure(
+                IssueCode.INVALID_RUNTIME_OPTION,
+                stage="configuration",
+                message=str(exc),
+            )
 
-    # 2. 원문 동기화 (i18n/en 적재)
-    upstream_exit = upstream.main(version=version, doc=doc)
+    # 2. 원문 동기화 (i18n/en 적재). offline profile은 적재된 원문을 그대로 사용
+    if profile_identity:
+        _WRITE_OUTPUTS = False
+        upstream_exit = 0
+    else:
+        with _TRACE.stage("source-sync"), _progress_output(plan_only):
+            upstream_exit = upstream.main(version=version, doc=doc)
     if upstream_exit != 0:
         print("upstream sync failed", file=sys.stderr)
         return _sync_failure(
@@ -2103,7 +3171,8 @@ def _run() -> int:
 
     # 3. 변경 감지
     try:
-        changes = _select_changes(version=version, doc=doc)
+        with _TRACE.stage("source-diff"):
+            changes = _select_changes(version=version, doc=doc)
     except (SourcePathError, diff.SourceDiffError) as exc:
         print(f"source diff failed: {exc}", file=sys.stderr)
         return _sync_failure(
@@ -2111,8 +3180,17 @@ def _run() -> int:
             stage="source-diff",
             message=str(exc),
         )
+    if not changes and plan_only:
+        _print_plan_report(
+            [], {}, cfg, prompts, plan_only, concurrency, request_seconds
+        )
+        return 0
+    if not changes and profile_identity:
+        print("no source changes to profile")
+        return 0
     if not changes:
-        sidebar_failures = _sync_sidebars(_sidebar_versions([], version))
+        with _TRACE.stage("sidebar"):
+            sidebar_failures = _sync_sidebars(_sidebar_versions([], version))
         for failure in sidebar_failures:
             print(f"sidebar sync failed: {failure}", file=sys.stderr)
         if sidebar_failures:
@@ -2127,92 +3205,43 @@ def _run() -> int:
                     for failure in sidebar_failures
                 ]
             )
+        if fast_path and (inputs := _last_run_inputs(version)) is not None:
+            last_run.record_success(*inputs)
         print("no source changes to translate")
         return 0
 
-    state_issues = _validate_file_states(changes)
-    if state_issues:
-        for issue in state_issues:
-            print(f"file state failed: {issue}", file=sys.stderr)
-        return _finish_sync_failures(
-            [
-                FailureEvent(
-                    code=IssueCode.FILE_STATE_CONFLICT,
-                    stage="translation-input",
-                    message=issue,
-                )
-                for issue in state_issues
-            ]
-        )
-
-    prepared_targets, preflight_issues = _preflight_all_translation_targets(
+    outcome = _apply_changes(
         changes,
         cfg,
         prompts,
+        repo_root=REPO_ROOT,
+        trace=_TRACE,
+        deadline=run_deadline,
+        plan_only=plan_only,
+        profiler=profiler,
+        skip_deletes=profile_identity,
     )
-    if preflight_issues:
-        for issue in preflight_issues:
-            print(f"translation preflight failed: {issue}", file=sys.stderr)
-        return _finish_sync_failures(
-            [
-                _diagnostic_failure_event(
-                    issue,
-                    stage="translation-preflight",
-                    fallback=IssueCode.INVALID_RUNTIME_OPTION,
-                )
-                for issue in preflight_issues
-            ]
-        )
+    if outcome.failure is not None:
+        return _change_failure_exit(outcome.failure)
 
-    # 4. 변경 문서: ko·ja 각각 전처리 → 번역 → 후처리 → 검증 → 출력
-    for change in changes:
-        if change.status == "D":
-            issues = _delete_outputs(change)
-            if issues:
-                message = f"{change.path}: {', '.join(issues)}"
-                print(f"delete failed: {message}", file=sys.stderr, flush=True)
-                return _sync_failure(
-                    IssueCode.OUTPUT_PATH_FORBIDDEN,
-                    stage="translation-delete",
-                    message=message,
-                    version=change.version,
-                    document=change.path,
-                )
-            continue
+    if plan_only:
+        _print_plan_report(
+            changes,
+            outcome.prepared_targets,
+            cfg,
+            prompts,
+            plan_only,
+            concurrency,
+            request_seconds,
+        )
+        return 0
 
-        for locale, locale_prompt, dest in (
-            ("ko", prompts["ko"], _ko_output(change)),
-            ("ja", prompts["ja"], _ja_output(change)),
-        ):
-            print(f"translating: {locale} {change.path}", file=sys.stderr, flush=True)
-            attempt_counter = translate.ProviderAttemptCounter()
-            issues = _translate_one(
-                change,
-                cfg,
-                locale_prompt,
-                dest,
-                locale=locale,
-                deadline=run_deadline,
-                prepared_target=prepared_targets[(change.path, locale)],
-                attempt_counter=attempt_counter,
-            )
-            if issues:
-                print(
-                    f"verify failed: {locale} {change.path}: {issues}",
-                    file=sys.stderr,
-                    flush=True,
-                )
-                print("stopping after first verification failure", file=sys.stderr, flush=True)
-                return _finish_sync_failures(
-                    _translation_failure_events(
-                        issues,
-                        attempt_counter=attempt_counter,
-                        change=change,
-                        locale=locale,
-                    )
-                )
+    if profile_identity:
+        print(f"profiled {len(changes)} doc(s) into ko, ja without writing outputs")
+        return 0
 
-    sidebar_failures = _sync_sidebars(_sidebar_versions(changes, version))
+    with _TRACE.stage("sidebar"):
+        sidebar_failures = _sync_sidebars(_sidebar_versions(changes, version))
     for failure in sidebar_failures:
         print(f"sidebar sync failed: {failure}", file=sys.stderr)
     if sidebar_failures:
@@ -2235,6 +3264,9 @@ def _run() -> int:
 def main() -> int:
     """예상하지 못한 실행 환경·내부 오류를 안정된 종료 코드로 변환."""
 
+    global _TRACE
+    _TRACE = run_trace.open_trace()
+    spans.install(spans.open_tracer(os.environ.get(RUN_ID_ENV, "").strip() or None))
     try:
         return _run()
     except OSError:
@@ -2251,6 +3283,10 @@ def main() -> int:
             stage="runner",
             message="unexpected internal error",
         )
+    finally:
+        _TRACE.close()
+        _reset_run_globals()
+        spans.shutdown()
 
 
 if __name__ == "__main__":
@@ -3,38 +3,59 @@
 원문, 전처리, 번역, 후처리, 검증 및 사이드바 관련 책임을 하위 패키지로 분리.
 기존 최상위 import 경로는 모듈 별칭으로 유지.
 ``sync.sidebar``는 하위 모듈을 포함한 패키지이므로 별칭으로 덮어쓰지 않음.
+
+별칭 모듈은 처음 속성에 접근할 때 실행한다. ``annotate_cli``나 ``--help``처럼
+일부 단계만 쓰는 실행은 쓰지 않는 단계와 그 의존성을 import하지 않는다.
 """
 from __future__ import annotations
 
+import importlib
+import importlib.util
 import sys
-
-from .annotation import annotate
-from .postprocessing import postprocess, repair
-from .preprocessing import preprocess
-from .runtime import config
-from . import sidebar
-from .source import diff, upstream
-from .translation import patch, prompt, translate
-from .verification import response_contract, verify
+from types import ModuleType
 
 _ALIASES = {
-    "annotate": annotate,
-    "config": config,
-    "diff": diff,
-    "patch": patch,
-    "postprocess": postprocess,
-    "preprocess": preprocess,
-    "prompt": prompt,
-    "repair": repair,
-    "response_contract": response_contract,
-    "sidebar": sidebar,
-    "translate": translate,
-    "upstream": upstream,
-    "verify": verify,
+    "annotate": "sync.annotation.annotate",
+    "config": "sync.runtime.config",
+    "diff": "sync.source.diff",
+    "patch": "sync.translation.patch",
+    "postprocess": "sync.postprocessing.postprocess",
+    "preprocess": "sync.preprocessing.preprocess",
+    "prompt": "sync.translation.prompt",
+    "repair": "sync.postprocessing.repair",
+    "response_contract": "sync.verification.response_contract",
+    "sidebar": "sync.sidebar",
+    "translate": "sync.translation.translate",
+    "upstream": "sync.source.upstream",
+    "verify": "sync.verification.verify",
 }
 
-for name, module in _ALIASES.items():
-    if name != "sidebar":
-        sys.modules[f"{__name__}.{name}"] = module
+
+def _lazy_module(name: str) -> ModuleType:
+    """처음 속성에 접근할 때 실행되는 정규 모듈. 이미 import된 모듈은 그대로."""
+
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    parent, _, child = name.rpartition(".")
+    package = importlib.import_module(parent)
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    setattr(package, child, module)
+    return module
+
+
+for _alias, _name in _ALIASES.items():
+    _module = _lazy_module(_name)
+    globals()[_alias] = _module
+    if _alias != "sidebar":
+        sys.modules[f"{__name__}.{_alias}"] = _module
+del _alias, _name, _module
 
 __all__ = tuple(_ALIASES)
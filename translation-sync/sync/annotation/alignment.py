@@ -0,0 +1,281 @@
+"""정렬 블록 서명 열의 opcode 계산 엔진.
+
+``annotate``는 영어·번역 블록 서명을 정수 ID로 interning한 뒤 엔진에 넘기고,
+``difflib.SequenceMatcher.get_opcodes()``와 같은 형식의 opcode 목록을 받아 병기에 사용.
+
+- ``sequence_matcher_opcodes``: ``difflib.SequenceMatcher(autojunk=False)`` 기준 구현
+- ``patience_opcodes``: 양쪽에 한 번씩만 나오는 서명을 증가 부분열로 고정하고,
+  고정점 사이 구간만 선형 공간 Myers 이분법으로 정렬
+- ``auto_opcodes``: 기본 엔진. 서명 쌍 수가 ``SEQUENCE_MATCHER_MAX_CELLS`` 이하이면
+  ``SequenceMatcher``, 초과하면 patience 엔진 사용
+
+``SequenceMatcher``는 반복 서명이 많은 긴 문서(같은 코드 펜스가 반복되는 문서)에서
+최장 일치 탐색이 제곱 시간으로 늘어남.
+patience 엔진은 고정점 사이 구간을 O((N+M)·D) 시간과 O(N+M) 공간으로 처리.
+두 엔진은 최장 일치 우선과 최소 편집 우선의 차이로 drift 구간에서 다른 정렬을 고를 수 있으므로,
+실제 문서 크기에서는 기존 판정을 그대로 유지하고 상한을 넘는 문서에서만 patience로 전환.
+"""
+from __future__ import annotations
+
+import bisect
+import difflib
+from collections.abc import Callable, Hashable, Sequence
+
+Opcode = tuple[str, int, int, int, int]
+AlignmentEngine = Callable[[Sequence[int], Sequence[int]], list[Opcode]]
+
+# 가장 긴 번역 문서(약 1,600블록)보다 넉넉한 2,000×2,000 서명 쌍
+SEQUENCE_MATCHER_MAX_CELLS = 4_000_000
+
+
+def intern_signatures(
+    a: Sequence[Hashable],
+    b: Sequence[Hashable],
+) -> tuple[list[int], list[int]]:
+    """두 서명 열을 같은 정수 ID 공간으로 변환."""
+
+    ids: dict[Hashable, int] = {}
+    a_ids = [ids.setdefault(sig, len(ids)) for sig in a]
+    b_ids = [ids.setdefault(sig, len(ids)) for sig in b]
+    return a_ids, b_ids
+
+
+def sequence_matcher_opcodes(a: Sequence[int], b: Sequence[int]) -> list[Opcode]:
+    """``difflib.SequenceMatcher(autojunk=False)`` opcode."""
+
+    return difflib.SequenceMatcher(a=a, b=b, autojunk=False).get_opcodes()
+
+
+def _opcodes(
+    blocks: list[tuple[int, int, int]],
+    len_a: int,
+    len_b: int,
+) -> list[Opcode]:
+    """정렬된 일치 구간을 ``SequenceMatcher``와 같은 규칙의 opcode로 변환.
+
+    인접한 일치 구간은 하나로 합치고, 일치 구간 사이가 양쪽 모두 비어 있지 않으면
+    ``replace``, 한쪽만 남으면 ``delete`` 또는 ``insert``로 기록.
+    """
+
+    merged: list[tuple[int, int, int]] = []
+    for i, j, size in blocks:
+        if merged:
+            last_i, last_j, last_size = merged[-1]
+            if last_i + last_size == i and last_j + last_size == j:
+                merged[-1] = (last_i, last_j, last_size + size)
+                continue
+        merged.append((i, j, size))
+    merged.append((len_a, len_b, 0))
+
+    opcodes: list[Opcode] = []
+    i = j = 0
+    for ai, bj, size in merged:
+        if i < ai and j < bj:
+            opcodes.append(("replace", i, ai, j, bj))
+        elif i < ai:
+            opcodes.append(("delete", i, ai, j, bj))
+        elif j < bj:
+            opcodes.append(("insert", i, ai, j, bj))
+        i, j = ai + size, bj + size
+        if size:
+            opcodes.append(("equal", ai, i, bj, j))
+    return opcodes
+
+
+def _middle_split(
+    a: Sequence[int],
+    b: Sequence[int],
+    alo: int,
+    ahi: int,
+    blo: int,
+    bhi: int,
+) -> tuple[int, int] | None:
+    """Myers 양방향 탐색으로 최소 편집 경로가 지나는 분할점 반환.
+
+    양끝 공통 부분을 제거한 구간만 받으며, 공통 서명이 전혀 없으면 ``None``.
+    """
+
+    len_a = ahi - alo
+    len_b = bhi - blo
+    max_d = (len_a + len_b + 1) // 2
+    offset = max_d
+    size = 2 * max_d + 2
+    forward = [-1] * size
+    backward = [-1] * size
+    forward[offset + 1] = 0
+    backward[offset + 1] = 0
+    delta = len_a - len_b
+    front = delta % 2 != 0
+    k1_start = k1_end = k2_start = k2_end = 0
+    for d in range(max_d):
+        for k1 in range(-d + k1_start, d + 1 - k1_end, 2):
+            k1_offset = offset + k1
+            if k1 == -d or (k1 != d and forward[k1_offset - 1] < forward[k1_offset + 1]):
+                x1 = forward[k1_offset + 1]
+            else:
+                x1 = forward[k1_offset - 1] + 1
+            y1 = x1 - k1
+            while x1 < len_a and y1 < len_b and a[alo + x1] == b[blo + y1]:
+                x1 += 1
+                y1 += 1
+            forward[k1_offset] = x1
+            if x1 > len_a:
+                k1_end += 2
+            elif y1 > len_b:
+                k1_start += 2
+            elif front:
+                k2_offset = offset + delta - k1
+                if 0 <= k2_offset < size and backward[k2_offset] != -1:
+                    if x1 >= len_a - backward[k2_offset]:
+                        return x1, y1
+        for k2 in range(-d + k2_start, d + 1 - k2_end, 2):
+            k2_offset = offset + k2
+            if k2 == -d or (k2 != d and backward[k2_offset - 1] < backward[k2_offset + 1]):
+                x2 = backward[k2_offset + 1]
+            else:
+                x2 = backward[k2_offset - 1] + 1
+            y2 = x2 - k2
+            while (
+                x2 < len_a
+                and y2 < len_b
+                and a[ahi - 1 - x2] == b[bhi - 1 - y2]
+            ):
+                x2 += 1
+                y2 += 1
+            backward[k2_offset] = x2
+            if x2 > len_a:
+                k2_end += 2
+            elif y2 > len_b:
+                k2_start += 2
+            elif not front:
+                k1_offset = offset + delta - k2
+                if 0 <= k1_offset < size and forward[k1_offset] != -1:
+                    x1 = forward[k1_offset]
+                    if x1 >= len_a - x2:
+                        return x1, offset + x1 - k1_offset
+    return None
+
+
+def _myers_blocks(
+    a: Sequence[int],
+    b: Sequence[int],
+    alo: int,
+    ahi: int,
+    blo: int,
+    bhi: int,
+    blocks: list[tuple[int, int, int]],
+) -> None:
+    """구간의 최소 편집 경로 일치 구간을 ``blocks``에 추가.
+
+    재귀 깊이가 편집 거리에 비례하지 않도록 명시적 stack으로 분할 구간 처리.
+    """
+
+    stack = [(alo, ahi, blo, bhi)]
+    while stack:
+        alo, ahi, blo, bhi = stack.pop()
+        start = alo
+        while alo < ahi and blo < bhi and a[alo] == b[blo]:
+            alo += 1
+            blo += 1
+        if alo > start:
+            blocks.append((start, blo - (alo - start), alo - start))
+        end = ahi
+        while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+            ahi -= 1
+            bhi -= 1
+        if end > ahi:
+            blocks.append((ahi, bhi, end - ahi))
+        if alo == ahi or blo == bhi:
+            continue
+        split = _middle_split(a, b, alo, ahi, blo, bhi)
+        if split is None:
+            continue
+        x, y = split
+        stack.append((alo + x, ahi, blo + y, bhi))
+        stack.append((alo, alo + x, blo, blo + y))
+
+
+def _unique_anchors(
+    a: Sequence[int],
+    b: Sequence[int],
+    alo: int,
+    ahi: int,
+    blo: int,
+    bhi: int,
+) -> list[tuple[int, int]]:
+    """양쪽 구간에 한 번씩만 나오는 서명 중 순서가 보존되는 최장 쌍 목록."""
+
+    seen_a: dict[int, int] = {}
+    for i in range(alo, ahi):
+        seen_a[a[i]] = -1 if a[i] in seen_a else i
+    seen_b: dict[int, int] = {}
+    for j in range(blo, bhi):
+        sig = b[j]
+        if seen_a.get(sig, -1) >= 0:
+            seen_b[sig] = -1 if sig in seen_b else j
+    pairs = [(seen_a[sig], j) for sig, j in seen_b.items() if j >= 0]
+    if not pairs:
+        return []
+    pairs.sort()
+
+    # patience sorting: 각 더미 꼭대기의 b 위치로 증가 부분열 길이 탐색
+    tops: list[int] = []
+    tails: list[int] = []
+    previous: list[int] = [-1] * len(pairs)
+    for index, (_, j) in enumerate(pairs):
+        low = bisect.bisect_left(tops, j)
+        if low:
+            previous[index] = tails[low - 1]
+        if low == len(tops):
+            tops.append(j)
+            tails.append(index)
+        else:
+            tops[low] = j
+            tails[low] = index
+    chain: list[tuple[int, int]] = []
+    index = tails[-1]
+    while index >= 0:
+        chain.append(pairs[index])
+        index = previous[index]
+    chain.reverse()
+    return chain
+
+
+def patience_opcodes(a: Sequence[int], b: Sequence[int]) -> list[Opcode]:
+    """유일 서명 고정점과 Myers 구간 정렬을 결합한 opcode."""
+
+    if list(a) == list(b):
+        return [("equal", 0, len(a), 0, len(b))] if a else []
+    blocks: list[tuple[int, int, int]] = []
+    stack = [(0, len(a), 0, len(b))]
+    while stack:
+        alo, ahi, blo, bhi = stack.pop()
+        anchors = _unique_anchors(a, b, alo, ahi, blo, bhi)
+        if not anchors:
+            _myers_blocks(a, b, alo, ahi, blo, bhi, blocks)
+            continue
+        i, j = alo, blo
+        for anchor_i, anchor_j in anchors:
+            if i < anchor_i and j < anchor_j:
+                stack.append((i, anchor_i, j, anchor_j))
+            blocks.append((anchor_i, anchor_j, 1))
+            i, j = anchor_i + 1, anchor_j + 1
+        if i < ahi and j < bhi:
+            stack.append((i, ahi, j, bhi))
+    blocks.sort()
+    return _opcodes(blocks, len(a), len(b))
+
+
+def auto_opcodes(a: Sequence[int], b: Sequence[int]) -> list[Opcode]:
+    """문서 크기에 따라 ``SequenceMatcher``와 patience 엔진 중 선택."""
+
+    if len(a) * len(b) <= SEQUENCE_MATCHER_MAX_CELLS:
+        return sequence_matcher_opcodes(a, b)
+    return patience_opcodes(a, b)
+
+
+ENGINES: dict[str, AlignmentEngine] = {
+    "auto": auto_opcodes,
+    "patience": patience_opcodes,
+    "sequence-matcher": sequence_matcher_opcodes,
+}
@@ -15,7 +15,6 @@
 """
 from __future__ import annotations
 
-import difflib
 import re
 from dataclasses import dataclass, field
 
@@ -41,6 +40,7 @@ from ..common.markdown import (
 from ..postprocessing import postprocess as _postprocess
 from ..postprocessing.postprocess import img_self_closing, replace_version
 from ..preprocessing import preprocess as _preprocess
+from .alignment import AlignmentEngine, auto_opcodes, intern_signatures
 
 
 @dataclass
@@ -818,6 +818,7 @@ def _alignment_annotations(
     *,
     version: str,
     canonical: bool,
+    engine: AlignmentEngine = auto_opcodes,
 ) -> tuple[dict[int, list[str]], list[Drift]]:
     """영어·번역 블록 정렬 연산을 주석 삽입과 drift로 변환.
 
@@ -829,17 +830,19 @@ def _alignment_annotations(
         annotation_blocks: 정규 주석 원문 블록.
         version: 문서 버전.
         canonical: 정규 주석 본문 사용 여부.
+        engine: 정수 서명 열의 opcode 계산 엔진.
 
     Returns:
         줄 위치별 삽입 주석과 drift 목록.
     """
 
-    en_sigs = [_sig(block, version) for block in en_blocks]
-    ko_sigs = [_sig(block, version) for block in ko_blocks]
-    matcher = difflib.SequenceMatcher(a=en_sigs, b=ko_sigs, autojunk=False)
+    en_ids, ko_ids = intern_signatures(
+        [_sig(block, version) for block in en_blocks],
+        [_sig(block, version) for block in ko_blocks],
+    )
     inserts: dict[int, list[str]] = {}
     drifts: list[Drift] = []
-    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+    for op, i1, i2, j1, j2 in engine(en_ids, ko_ids):
         if op == "equal":
             _annotate_equal_range(
                 en_blocks,
@@ -932,6 +935,7 @@ def annotate(
     canonical: bool = False,
     alignment_source: str | None = None,
     preserved_comment_indexes: frozenset[int] | None = None,
+    alignment_engine: AlignmentEngine = auto_opcodes,
 ) -> tuple[str, list[Drift]]:
     """한국어 문서에 영어 원문을 병기하고 결과와 drift 목록 반환.
 
@@ -982,5 +986,6 @@ def annotate(
         annotation_blocks,
         version=version,
         canonical=canonical,
+        engine=alignment_engine,
     )
     return _render_annotated_lines(ko_lines, inserts), drifts
@@ -5,14 +5,15 @@ from __future__ import annotations
 import os
 import stat
 import tempfile
+from collections.abc import Sequence
 from pathlib import Path
 
 
-def _fsync_parent(path: Path) -> None:
-    """파일 변경을 영구 저장하도록 상위 디렉터리를 디스크와 동기화."""
+def _fsync_directory(directory: Path) -> None:
+    """디렉터리 항목 변경을 디스크와 동기화."""
 
     descriptor = os.open(
-        path.parent,
+        directory,
         os.O_RDONLY | getattr(os, "O_DIRECTORY", 0),
     )
     try:
@@ -21,6 +22,12 @@ def _fsync_parent(path: Path) -> None:
         os.close(descriptor)
 
 
+def _fsync_parent(path: Path) -> None:
+    """파일 변경을 영구 저장하도록 상위 디렉터리를 디스크와 동기화."""
+
+    _fsync_directory(path.parent)
+
+
 def unlink_file(path: Path, *, missing_ok: bool = False) -> bool:
     """파일을 삭제하고 상위 디렉터리를 디스크와 동기화."""
 
@@ -34,6 +41,18 @@ def unlink_file(path: Path, *, missing_ok: bool = False) -> bool:
     return True
 
 
+def _preserved_mode(path: Path) -> int:
+    """교체할 일반 파일의 권한, 없거나 일반 파일이 아니면 ``0o644``."""
+
+    try:
+        current_status = path.lstat()
+    except FileNotFoundError:
+        return 0o644
+    if stat.S_ISREG(current_status.st_mode):
+        return stat.S_IMODE(current_status.st_mode)
+    return 0o644
+
+
 def atomic_write_text(
     path: Path,
     text: str,
@@ -42,17 +61,7 @@ def atomic_write_text(
 ) -> None:
     """기존 inode를 직접 변경하지 않고 텍스트 파일을 원자적으로 교체."""
 
-    try:
-        current_status = path.lstat()
-    except FileNotFoundError:
-        current_mode = 0o644
-    else:
-        current_mode = (
-            stat.S_IMODE(current_status.st_mode)
-            if stat.S_ISREG(current_status.st_mode)
-            else 0o644
-        )
-
+    current_mode = _preserved_mode(path)
     temporary: Path | None = None
     try:
         with tempfile.NamedTemporaryFile(
@@ -75,19 +84,8 @@ def atomic_write_text(
             temporary.unlink(missing_ok=True)
 
 
-def atomic_write_bytes(path: Path, content: bytes) -> None:
-    """기존 inode를 직접 변경하지 않고 바이너리 파일을 원자적으로 교체."""
-
-    try:
-        current_status = path.lstat()
-    except FileNotFoundError:
-        current_mode = 0o644
-    else:
-        current_mode = (
-            stat.S_IMODE(current_status.st_mode)
-            if stat.S_ISREG(current_status.st_mode)
-            else 0o644
-        )
+def _durable_temporary(path: Path, content: bytes) -> Path:
+    """대상과 같은 디렉터리에 내용을 동기화한 임시 파일 생성."""
 
     temporary: Path | None = None
     try:
@@ -99,12 +97,43 @@ def atomic_write_bytes(path: Path, content: bytes) -> None:
             delete=False,
         ) as stream:
             temporary = Path(stream.name)
-            os.fchmod(stream.fileno(), current_mode)
+            os.fchmod(stream.fileno(), _preserved_mode(path))
             stream.write(content)
             stream.flush()
             os.fsync(stream.fileno())
+    except BaseException:
+        if temporary is not None:
+            temporary.unlink(missing_ok=True)
+        raise
+    return temporary
+
+
+def atomic_write_bytes(path: Path, content: bytes) -> None:
+    """기존 inode를 직접 변경하지 않고 바이너리 파일을 원자적으로 교체."""
+
+    temporary = _durable_temporary(path, content)
+    try:
         os.replace(temporary, path)
         _fsync_parent(path)
     finally:
-        if temporary is not None:
+        temporary.unlink(missing_ok=True)
+
+
+def atomic_write_batch(contents: Sequence[tuple[Path, bytes]]) -> None:
+    """여러 파일을 각각 원자적으로 교체하고 상위 디렉터리는 한 번씩만 동기화.
+
+    모든 임시 파일을 먼저 동기화한 뒤 교체하므로 중간 실패 시 이미 교체된
+    파일만 새 내용이고 나머지는 기존 내용 그대로다.
+    """
+
+    temporaries: list[tuple[Path, Path]] = []
+    try:
+        for path, content in contents:
+            temporaries.append((_durable_temporary(path, content), path))
+        for temporary, path in temporaries:
+            os.replace(temporary, path)
+        for parent in dict.fromkeys(path.parent for _temporary, path in temporaries):
+            _fsync_directory(parent)
+    finally:
+        for temporary, _path in temporaries:
             temporary.unlink(missing_ok=True)
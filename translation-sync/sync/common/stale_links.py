@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import hashlib
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cache, cached_property
 from pathlib import Path
 from urllib.parse import urlsplit
 
@@ -59,6 +60,54 @@ def _matches_suffix_rule(rule: StaleLinkRule, target: str) -> bool:
     )
 
 
+class _SuffixTrie:
+    """대체 규칙 원본을 뒤에서부터 한 문자씩 따라가는 trie 노드."""
+
+    __slots__ = ("children", "rule")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _SuffixTrie] = {}
+        self.rule: StaleLinkRule | None = None
+
+    def insert(self, rule: StaleLinkRule) -> None:
+        """원본 문자열을 뒤집어 규칙 등록."""
+
+        node = self
+        for char in reversed(rule.source):
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _SuffixTrie()
+            node = child
+        if node.rule is None:
+            node.rule = rule
+
+    def longest_match(self, target: str) -> StaleLinkRule | None:
+        """경계 조건을 만족하는 가장 긴 접미사 대체 규칙.
+
+        같은 링크의 접미사끼리는 문자 수가 길수록 UTF-8 바이트 수도 길므로
+        가장 깊은 일치가 원본 바이트 길이 기준 최장 규칙이다.
+        """
+
+        node = self
+        best: StaleLinkRule | None = None
+        for offset in range(len(target) - 1, -1, -1):
+            child = node.children.get(target[offset])
+            if child is None:
+                break
+            node = child
+            if node.rule is not None and _matches_suffix_rule(node.rule, target):
+                best = node.rule
+        return best
+
+
+@dataclass(frozen=True)
+class _VersionRules:
+    """버전 하나의 정확 일치 폐기 규칙과 접미사 대체 규칙 색인."""
+
+    retired: dict[str, StaleLinkRule] = field(default_factory=dict)
+    suffixes: _SuffixTrie = field(default_factory=_SuffixTrie)
+
+
 @dataclass(frozen=True)
 class StaleLinkRegistry:
     """정규 JSON 원본 바이트와 SHA-256 해시를 포함한 오래된 링크 규칙 집합."""
@@ -67,6 +116,19 @@ class StaleLinkRegistry:
     sha256: str
     rules: tuple[StaleLinkRule, ...]
 
+    @cached_property
+    def _index(self) -> dict[str, _VersionRules]:
+        """첫 조회 때 한 번 만드는 버전별 규칙 색인."""
+
+        index: dict[str, _VersionRules] = {}
+        for rule in self.rules:
+            entry = index.setdefault(rule.version, _VersionRules())
+            if rule.target is None:
+                entry.retired.setdefault(rule.source, rule)
+            else:
+                entry.suffixes.insert(rule)
+        return index
+
     def matching_rule(
         self,
         target: str,
@@ -77,22 +139,13 @@ class StaleLinkRegistry:
         if not _is_supported_target(target):
             return None
 
-        effective_version = version or "master"
-        exact_retired: StaleLinkRule | None = None
-        suffix_matches: list[StaleLinkRule] = []
-        for rule in self.rules:
-            if rule.version != effective_version:
-                continue
-            if rule.target is None and target == rule.source:
-                exact_retired = rule
-                break
-            if _matches_suffix_rule(rule, target):
-                suffix_matches.append(rule)
-        if exact_retired is not None:
-            return exact_retired
-        if not suffix_matches:
+        entry = self._index.get(version or "master")
+        if entry is None:
             return None
-        return max(suffix_matches, key=lambda rule: len(rule.source.encode("utf-8")))
+        retired = entry.retired.get(target)
+        if retired is not None:
+            return retired
+        return entry.suffixes.longest_match(target)
 
 
 def _canonical_json(value: object) -> bytes:
@@ -225,17 +278,32 @@ def load_stale_link_registry(path: Path = REGISTRY_PATH) -> StaleLinkRegistry:
     )
 
 
-DEFAULT_STALE_LINK_REGISTRY = load_stale_link_registry()
+@cache
+def default_stale_link_registry() -> StaleLinkRegistry:
+    """저장소 기본 레지스트리. 처음 필요할 때 한 번만 읽고 검증한다."""
+
+    return load_stale_link_registry()
+
+
+def __getattr__(name: str) -> StaleLinkRegistry:
+    """``DEFAULT_STALE_LINK_REGISTRY``는 처음 참조할 때 기본 레지스트리로 로딩."""
+
+    if name == "DEFAULT_STALE_LINK_REGISTRY":
+        return default_stale_link_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def canonical_stale_link_target(
     target: str,
     version: str | None,
     *,
-    registry: StaleLinkRegistry = DEFAULT_STALE_LINK_REGISTRY,
+    registry: StaleLinkRegistry | None = None,
 ) -> str | None:
     """레지스트리 규칙에 따른 정규 링크 대상 또는 폐기 상태 반환."""
 
+    if registry is None:
+        registry = default_stale_link_registry()
+
     rule = registry.matching_rule(target, version)
     if rule is None or rule.target is None:
         return None if rule is not None else target
@@ -32,9 +32,9 @@ from ..common.markdown import (
     strip_title_attrs,
 )
 from ..common.stale_links import (
-    DEFAULT_STALE_LINK_REGISTRY,
     StaleLinkRegistry,
     canonical_stale_link_target,
+    default_stale_link_registry,
 )
 
 _VERSION_RE = re.compile(r"\{\{\s*version\s*\}\}")
@@ -429,9 +429,12 @@ def normalize_retired_list_labels(
     text: str,
     version: str,
     *,
-    registry: StaleLinkRegistry = DEFAULT_STALE_LINK_REGISTRY,
+    registry: StaleLinkRegistry | None = None,
 ) -> str:
     """폐기 대상 목록 레이블에서 이전 실행이 추가한 인라인 코드 구분자 제거."""
+    if registry is None:
+        registry = default_stale_link_registry()
+
     labels = {
         rule.source.removeprefix("#").replace("-", " ").title()
         for rule in registry.rules
@@ -463,9 +466,12 @@ def normalize_stale_link_targets(
     text: str,
     version: str,
     *,
-    registry: StaleLinkRegistry = DEFAULT_STALE_LINK_REGISTRY,
+    registry: StaleLinkRegistry | None = None,
 ) -> str:
     """코드와 주석을 보존하며 알려진 오래된 업스트림 링크 대상 보정."""
+    if registry is None:
+        registry = default_stale_link_registry()
+
     masked = _mask_link_excluded_spans(text)
     out: list[str] = []
     cursor = 0
@@ -627,10 +633,13 @@ def postprocess(
     version: str,
     placeholders: Mapping[str, str],
     *,
-    registry: StaleLinkRegistry = DEFAULT_STALE_LINK_REGISTRY,
+    registry: StaleLinkRegistry | None = None,
 ) -> str:
     """번역 Markdown을 정규화하고 현재 복원표의 원본 값 복원."""
 
+    if registry is None:
+        registry = default_stale_link_registry()
+
     text = _map_outside_code_blocks(
         text, lambda body: _postprocess_markdown_body(body, version, registry)
     )
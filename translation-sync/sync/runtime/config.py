@@ -13,11 +13,11 @@ import os
 import shlex
 import time
 from dataclasses import dataclass
+from ipaddress import ip_address
 from pathlib import Path
 from types import MappingProxyType
 from typing import Mapping
-
-import tiktoken
+from urllib.parse import urlsplit
 
 from .failure import IssueCode
 
@@ -44,6 +44,7 @@ _DEFAULT_PROVIDER = "openai"
 _DEFAULT_OPENAI_MODEL = "gpt-5.6-luna"
 _OPTIONAL = (
     "TRANSLATION_CLI_TIMEOUT",
+    "TRANSLATION_PACK_MAX_BLOCKS",
     "TRANSLATION_REASONING_EFFORT",
 )
 _REQUEST_BUDGET_KEYS = (
@@ -66,6 +67,9 @@ PROVIDER_BUDGET_PROFILE_VERSION = 1
 # 측정된 overhead가 아닌 프로젝트 고정값.
 PROVIDER_FRAMING_OVERHEAD_TOKENS = 128_000
 OPENAI_API_BASE_URL = "https://api.openai.com/v1"
+# 로컬 가짜 provider용 base URL 재정의. ``load_config``는 환경에서 읽지 않으므로
+# 테스트·벤치마크가 ``Config``를 직접 만들 때만 설정되고 loopback 주소만 허용한다.
+OPENAI_BASE_URL_OVERRIDE_KEY = "TRANSLATION_TEST_OPENAI_BASE_URL"
 
 
 @dataclass(frozen=True)
@@ -194,6 +198,26 @@ def validate_cli_command(command: str) -> tuple[str, str]:
     return parts[0], parts[1]
 
 
+def openai_api_base_url(cfg: Config) -> str:
+    """설정의 OpenAI API base URL. 재정의는 loopback HTTP 주소만 허용."""
+
+    override = cfg.get(OPENAI_BASE_URL_OVERRIDE_KEY).strip()
+    if not override:
+        return OPENAI_API_BASE_URL
+    parts = urlsplit(override)
+    host = parts.hostname or ""
+    try:
+        loopback = host == "localhost" or ip_address(host).is_loopback
+    except ValueError:
+        loopback = False
+    if parts.scheme != "http" or not loopback:
+        raise ConfigError(
+            f"{OPENAI_BASE_URL_OVERRIDE_KEY} must be a loopback http URL",
+            IssueCode.INVALID_RUNTIME_OPTION,
+        )
+    return override
+
+
 def cli_auth_environment(cfg: Config) -> dict[str, str]:
     """검증된 설정의 단일 명시적 CLI 인증 방식."""
 
@@ -247,7 +271,7 @@ def provider_config_sha256(cfg: Config) -> str:
         if cfg.get("OPENAI_API_KEY"):
             auth_modes.append("OPENAI_API_KEY")
         adapter: dict[str, object] = {
-            "api_base_url": OPENAI_API_BASE_URL,
+            "api_base_url": openai_api_base_url(cfg),
         }
     elif cfg.provider == "cli":
         auth_modes.extend(
@@ -285,6 +309,8 @@ def provider_config_sha256(cfg: Config) -> str:
         "run_timeout_seconds": cfg.get("TRANSLATION_RUN_TIMEOUT_SECONDS"),
         "tokenizer_encoding": cfg.get("TRANSLATION_TOKENIZER_ENCODING"),
     }
+    if cfg.get("TRANSLATION_PACK_MAX_BLOCKS", "0") not in {"0", "1"}:
+        payload["pack_max_blocks"] = cfg.get("TRANSLATION_PACK_MAX_BLOCKS")
     canonical = json.dumps(
         payload,
         ensure_ascii=True,
@@ -379,6 +405,8 @@ def _validate_integer_option(key: str, value: str, *, allow_zero: bool) -> None:
 def _validate_tokenizer_encoding(name: str) -> None:
     """설치된 tiktoken encoding 이름 검증."""
 
+    import tiktoken
+
     if name not in tiktoken.list_encoding_names():
         raise ConfigError(
             f"TOKENIZER_METADATA_UNAVAILABLE: unknown tokenizer encoding {name!r}",
@@ -555,6 +583,8 @@ def _add_optional_values(
             continue
         if key == "TRANSLATION_CLI_TIMEOUT":
             _validate_integer_option(key, value, allow_zero=False)
+        if key == "TRANSLATION_PACK_MAX_BLOCKS":
+            _validate_integer_option(key, value, allow_zero=True)
         values[key] = value
 
 
@@ -0,0 +1,129 @@
+"""마지막 성공 실행의 입력 digest와 변경 없음 빠른 종료 판정.
+
+고정 매니페스트, ``versions.json``, 버전별 ``documentation.md``와 사이드바,
+링크 레지스트리, 구현 digest, 영어 원문 트리 서명이 마지막 성공 실행과 모두
+같으면 원문 동기화·변경 감지·사이드바 계획을 다시 해도 작업 트리가 바뀌지
+않는다. 이 판정은 고정된 파일 몇 개만 읽고, 영어 원문 트리는 파일 내용 대신
+경로·크기·수정 시각만 본다. Git은 호출하지 않는다.
+
+기록은 번역할 원문 변경이 없어 작업 트리를 그대로 둔 성공 실행에서만 남긴다.
+번역 결과를 기록한 실행은 커밋 전 작업 트리에 따라 다음 실행의 변경 감지가
+달라지므로 기록하지 않는다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from ..common.files import atomic_write_bytes
+from ..common.versions import load_versions
+from .state import implementation_digest
+
+LAST_RUN_FILENAME = "last-successful-run.json"
+LAST_RUN_FORMAT_VERSION = 2
+_EN_DOCS = Path("i18n") / "en" / "docusaurus-plugin-content-docs"
+
+
+def _file_part(label: str, path: Path) -> bytes:
+    """digest에 넣을 label과 파일 바이트. 없는 파일은 별도 표식으로 구분."""
+
+    try:
+        content = path.read_bytes()
+    except FileNotFoundError:
+        return f"{label}\0missing\0".encode("utf-8")
+    return f"{label}\0{len(content)}\0".encode("utf-8") + content
+
+
+def _tree_part(label: str, root: Path) -> bytes:
+    """digest에 넣을 label과 트리 서명. 파일마다 상대 경로·크기·수정 시각(ns).
+
+    원문 동기화 뒤 손으로 고친 원문은 매니페스트가 같아도 변경 감지 대상이므로
+    내용을 읽지 않는 stat 서명으로 잡는다. 없는 디렉터리는 별도 표식으로 구분.
+    """
+
+    if not root.is_dir():
+        return f"{label}\0missing\0".encode("utf-8")
+    entries: list[str] = []
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        relative = Path(directory).relative_to(root).as_posix()
+        for name in sorted(filenames):
+            stat = os.stat(os.path.join(directory, name))
+            entries.append(f"{relative}/{name}\0{stat.st_size}\0{stat.st_mtime_ns}")
+    signature = "\0".join(entries)
+    return f"{label}\0{len(entries)}\0{signature}\0".encode("utf-8")
+
+
+def input_digest(
+    repo_root: Path,
+    *,
+    manifest: bytes,
+    registry_path: Path,
+    entrypoint: Path,
+    version: str | None,
+) -> str:
+    """빠른 종료 판정에 쓰는 실행 입력 전체의 SHA-256.
+
+    Args:
+        repo_root: 저장소 루트.
+        manifest: 고정 업스트림 매니페스트 바이트.
+        registry_path: stale-link 레지스트리 경로.
+        entrypoint: 실행 중인 진입점 원문 경로.
+        version: 선택한 단일 버전, 전체 실행이면 ``None``.
+
+    Raises:
+        OSError: 입력 파일을 읽지 못함.
+        ValueError: ``versions.json``이 올바르지 않음.
+    """
+
+    digest = hashlib.sha256()
+    digest.update(b"format\0%d\0" % LAST_RUN_FORMAT_VERSION)
+    digest.update(f"version\0{version or ''}\0".encode("utf-8"))
+    digest.update(f"implementation\0{implementation_digest()}\0".encode("utf-8"))
+    digest.update(_file_part("entrypoint", entrypoint))
+    digest.update(b"manifest\0%d\0" % len(manifest))
+    digest.update(manifest)
+    digest.update(_file_part("registry", registry_path))
+    versions_path = repo_root / "versions.json"
+    digest.update(_file_part("versions", versions_path))
+    digest.update(_tree_part("sources", repo_root / _EN_DOCS))
+    for supported in load_versions(versions_path):
+        digest.update(
+            _file_part(
+                f"documentation:{supported}",
+                repo_root / _EN_DOCS / f"version-{supported}" / "documentation.md",
+            )
+        )
+        digest.update(
+            _file_part(
+                f"sidebar:{supported}",
+                repo_root / "versioned_sidebars" / f"version-{supported}-sidebars.json",
+            )
+        )
+    return digest.hexdigest()
+
+
+def is_unchanged(state_dir: Path, digest: str) -> bool:
+    """마지막 성공 실행의 입력 digest와 같은지. 기록이 없거나 손상되면 ``False``."""
+
+    try:
+        recorded = json.loads((state_dir / LAST_RUN_FILENAME).read_bytes())
+    except (OSError, ValueError):
+        return False
+    return recorded == {"format": LAST_RUN_FORMAT_VERSION, "inputs": digest}
+
+
+def record_success(state_dir: Path, digest: str) -> None:
+    """성공 실행의 입력 digest를 원자적으로 기록. 실패해도 실행 결과는 유지."""
+
+    payload = {"format": LAST_RUN_FORMAT_VERSION, "inputs": digest}
+    try:
+        state_dir.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(
+            state_dir / LAST_RUN_FILENAME,
+            (json.dumps(payload, sort_keys=True) + "\n").encode("utf-8"),
+        )
+    except OSError:
+        return
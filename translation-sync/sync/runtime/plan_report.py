@@ -0,0 +1,168 @@
+"""provider 호출 없이 계산한 ``--plan-only`` 실행 계획 보고서.
+
+사전검증이 만든 계획에서 (버전, 문서, locale)마다 provider 요청 블록, provider
+비호출 블록, 기존 번역 재사용 블록과 다른 버전 응답을 공유할 블록 수, 요청 입력의
+정확한 token 수와 출력 예약 token 수를 집계한다. 예상 소요 시간은 요청당 시간과
+동시 요청 수로 계산한 값이며, 응답 계약 교정 재시도는 포함하지 않는다.
+"""
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+
+PLAN_REPORT_FORMATS = ("text", "json")
+
+
+@dataclass(frozen=True)
+class PlannedTarget:
+    """locale 대상 하나의 계획 집계."""
+
+    version: str
+    document: str
+    locale: str
+    state: str
+    provider_blocks: int
+    provider_free_blocks: int
+    reused_blocks: int
+    shared_blocks: int
+    input_tokens: int | None
+    reserved_output_tokens: int | None
+
+
+def _total(values: Iterable[int | None]) -> int | None:
+    """값 합계, 하나라도 알 수 없으면 ``None``."""
+
+    total = 0
+    for value in values:
+        if value is None:
+            return None
+        total += value
+    return total
+
+
+@dataclass(frozen=True)
+class PlanReport:
+    """실행 전체 계획 집계와 예상 소요 시간."""
+
+    targets: tuple[PlannedTarget, ...]
+    deleted_documents: int
+    concurrency: int
+    request_seconds: float | None
+    run_timeout_seconds: int | None
+
+    @property
+    def provider_requests(self) -> int:
+        """provider에 보낼 첫 요청 수."""
+
+        return sum(target.provider_blocks for target in self.targets)
+
+    @property
+    def projected_seconds(self) -> float | None:
+        """동시 요청 수로 나눈 provider 요청 소요 시간, 요청당 시간을 모르면 ``None``."""
+
+        if self.request_seconds is None:
+            return None
+        return math.ceil(self.provider_requests / self.concurrency) * self.request_seconds
+
+    def totals(self) -> dict[str, int | None]:
+        """블록 수와 token 수 합계."""
+
+        return {
+            "provider_blocks": self.provider_requests,
+            "provider_free_blocks": sum(t.provider_free_blocks for t in self.targets),
+            "reused_blocks": sum(t.reused_blocks for t in self.targets),
+            "shared_blocks": sum(t.shared_blocks for t in self.targets),
+            "input_tokens": _total(t.input_tokens for t in self.targets),
+            "reserved_output_tokens": _total(
+                t.reserved_output_tokens for t in self.targets
+            ),
+        }
+
+
+def render_json(report: PlanReport) -> str:
+    """보고서의 JSON 표현."""
+
+    projected = report.projected_seconds
+    return json.dumps(
+        {
+            "targets": [asdict(target) for target in report.targets],
+            "deleted_documents": report.deleted_documents,
+            "totals": report.totals(),
+            "concurrency": report.concurrency,
+            "request_seconds": report.request_seconds,
+            "projected_seconds": projected,
+            "run_timeout_seconds": report.run_timeout_seconds,
+        },
+        ensure_ascii=False,
+        indent=2,
+    )
+
+
+def _cell(value: int | None) -> str:
+    """표 칸 값, 알 수 없으면 ``-``."""
+
+    return "-" if value is None else str(value)
+
+
+def render_text(report: PlanReport) -> str:
+    """사람이 읽는 표 형식 보고서."""
+
+    header = (
+        "version", "document", "locale", "state",
+        "provider", "free", "reused", "shared", "input", "output",
+    )
+    rows = [header]
+    for target in report.targets:
+        rows.append(
+            (
+                target.version,
+                target.document,
+                target.locale,
+                target.state,
+                str(target.provider_blocks),
+                str(target.provider_free_blocks),
+                str(target.reused_blocks),
+                str(target.shared_blocks),
+                _cell(target.input_tokens),
+                _cell(target.reserved_output_tokens),
+            )
+        )
+    totals = report.totals()
+    rows.append(
+        (
+            "total", "", "", "",
+            str(totals["provider_blocks"]),
+            str(totals["provider_free_blocks"]),
+            str(totals["reused_blocks"]),
+            str(totals["shared_blocks"]),
+            _cell(totals["input_tokens"]),
+            _cell(totals["reserved_output_tokens"]),
+        )
+    )
+    widths = [max(len(row[column]) for row in rows) for column in range(len(header))]
+    lines = [
+        "  ".join(
+            cell.ljust(width) if column < 4 else cell.rjust(width)
+            for column, (cell, width) in enumerate(zip(row, widths, strict=True))
+        ).rstrip()
+        for row in rows
+    ]
+    if report.deleted_documents:
+        lines.append(f"deleted documents: {report.deleted_documents}")
+    projected = report.projected_seconds
+    if projected is None:
+        lines.append(
+            f"projected provider time: unknown (concurrency {report.concurrency})"
+        )
+    else:
+        line = (
+            f"projected provider time: {projected:.0f}s "
+            f"({report.provider_requests} request(s) x {report.request_seconds:g}s, "
+            f"concurrency {report.concurrency})"
+        )
+        if report.run_timeout_seconds is not None:
+            line += f", run timeout {report.run_timeout_seconds}s"
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,215 @@
+"""(버전, 문서, locale) 번역 대상별 CPU·메모리 할당 profile.
+
+``cpu``는 ``cProfile``로 대상 하나의 번역을 측정해 ``.pstats``와 flamegraph
+도구가 읽는 collapsed stack(``.cpu.folded``, 단위 µs)을 기록한다. provider adapter
+호출 동안은 profiler를 멈추므로 네트워크·외부 CLI 대기 시간은 들어가지 않는다.
+``cProfile``은 호출 edge만 기록하므로 collapsed stack은 함수 자체 시간을 호출자별
+누적 시간 비율로 나눠 펼친 근사값이다.
+
+``alloc``은 ``tracemalloc``으로 대상이 끝날 때 아직 살아 있는 할당을 호출 stack별
+byte 수(``.alloc.folded``)로 기록한다.
+"""
+from __future__ import annotations
+
+import cProfile
+import pstats
+import re
+import sys
+import tracemalloc
+from collections import Counter
+from collections.abc import Iterator, Mapping
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+
+PROFILE_MODES = ("cpu", "alloc")
+DEFAULT_PROFILE_DIR = ".translation-profiles"
+ALLOC_TRACEBACK_FRAMES = 64
+# 펼친 stack 수를 제한하는 최소 가중치 비율. 전체 시간의 이 비율보다 작은 경로는 버린다.
+_MIN_STACK_FRACTION = 1 / 200_000
+_MAX_STACK_DEPTH = 128
+
+_SOURCE_ROOT = Path(__file__).resolve().parents[2]
+_UNSAFE_NAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+_PAUSED = nullcontext()
+
+_ACTIVE: cProfile.Profile | None = None
+
+Function = tuple[str, int, str]
+
+
+def _frame_label(filename: str, lineno: int, name: str | None = None) -> str:
+    """collapsed stack의 frame 이름. 구분자 ``;``와 공백은 쓰지 않는다."""
+
+    path = Path(filename)
+    try:
+        location = path.resolve().relative_to(_SOURCE_ROOT).as_posix()
+    except (OSError, ValueError):
+        location = path.name or filename
+    label = f"{location}:{lineno}" if name is None else f"{name}@{location}:{lineno}"
+    return label.replace(";", ":").replace(" ", "_")
+
+
+def collapse_pstats(stats: Mapping[Function, tuple]) -> Counter[str]:
+    """``pstats.Stats.stats``를 µs 단위 collapsed stack으로 펼침.
+
+    함수마다 자체 시간을 호출자 edge의 누적 시간 비율로 나누어 호출자 쪽으로
+    거슬러 올라간다. 재귀 호출은 처음 만난 지점에서 stack을 끊는다.
+    """
+
+    total = sum(entry[2] for entry in stats.values()) * 1_000_000
+    threshold = max(1.0, total * _MIN_STACK_FRACTION)
+    stacks: Counter[str] = Counter()
+
+    def climb(function: Function, weight: float, path: list[str], seen: set[Function]) -> None:
+        """호출자 쪽으로 가중치를 나누며 stack을 완성."""
+
+        callers = stats[function][4] if function in stats else {}
+        edges = [(caller, edge[3]) for caller, edge in callers.items() if caller not in seen]
+        if not edges or len(path) >= _MAX_STACK_DEPTH:
+            stacks[";".join(reversed(path))] += weight
+            return
+        edge_total = sum(share for _, share in edges)
+        for caller, share in edges:
+            portion = weight * (share / edge_total if edge_total else 1 / len(edges))
+            if portion < threshold:
+                continue
+            path.append(_function_label(caller))
+            seen.add(caller)
+            climb(caller, portion, path, seen)
+            seen.discard(caller)
+            path.pop()
+
+    for function, entry in stats.items():
+        weight = entry[2] * 1_000_000
+        if weight >= threshold:
+            climb(function, weight, [_function_label(function)], {function})
+    return Counter({stack: round(weight) for stack, weight in stacks.items() if round(weight)})
+
+
+def _function_label(function: Function) -> str:
+    """cProfile 함수 key의 frame 이름."""
+
+    filename, lineno, name = function
+    if filename == "~":
+        return name.replace(";", ":").replace(" ", "_")
+    return _frame_label(filename, lineno, name)
+
+
+def collapse_snapshot(snapshot: tracemalloc.Snapshot) -> Counter[str]:
+    """살아 있는 할당을 byte 단위 collapsed stack으로 묶음."""
+
+    stacks: Counter[str] = Counter()
+    for statistic in snapshot.statistics("traceback"):
+        frames = [_frame_label(frame.filename, frame.lineno) for frame in statistic.traceback]
+        # tracemalloc traceback은 바깥 frame부터 가장 안쪽 frame 순서다.
+        stacks[";".join(frames)] += statistic.size
+    return stacks
+
+
+def write_folded(path: Path, stacks: Counter[str]) -> None:
+    """collapsed stack 파일 기록. 가중치가 큰 stack부터 쓴다."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        "".join(
+            f"{stack} {weight}\n"
+            for stack, weight in sorted(stacks.items(), key=lambda item: (-item[1], item[0]))
+        ),
+        encoding="utf-8",
+    )
+
+
+def paused() -> AbstractContextManager[object]:
+    """측정 중인 CPU profile을 잠시 멈추는 context. 측정 중이 아니면 빈 context."""
+
+    profile = _ACTIVE
+    if profile is None:
+        return _PAUSED
+    return _paused(profile)
+
+
+@contextmanager
+def _paused(profile: cProfile.Profile) -> Iterator[None]:
+    """profiler를 멈췄다가 다시 시작."""
+
+    profile.disable()
+    try:
+        yield
+    finally:
+        profile.enable()
+
+
+class TargetProfiler:
+    """번역 대상마다 profile 파일을 남기는 측정기."""
+
+    def __init__(self, mode: str, directory: Path) -> None:
+        """측정 방식과 출력 디렉터리 설정."""
+
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"unsupported profile mode: {mode!r}")
+        self.mode = mode
+        self.directory = directory
+
+    def stem(self, version: str, document: str, locale: str) -> str:
+        """대상별 출력 파일 이름 앞부분."""
+
+        return _UNSAFE_NAME_RE.sub("_", f"{version}--{document}--{locale}".replace("/", "__"))
+
+    @contextmanager
+    def target(self, version: str, document: str, locale: str) -> Iterator[None]:
+        """대상 하나를 측정하고 끝나면 profile 파일 기록."""
+
+        stem = self.stem(version, document, locale)
+        if self.mode == "cpu":
+            with self._cpu(stem):
+                yield
+        else:
+            with self._alloc(stem):
+                yield
+
+    @contextmanager
+    def _cpu(self, stem: str) -> Iterator[None]:
+        """``cProfile`` 측정."""
+
+        global _ACTIVE
+        if _ACTIVE is not None:
+            raise RuntimeError("a target profile is already active")
+        profile = cProfile.Profile()
+        _ACTIVE = profile
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            _ACTIVE = None
+            stats = pstats.Stats(profile)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            stats.dump_stats(self.directory / f"{stem}.pstats")
+            folded = self.directory / f"{stem}.cpu.folded"
+            write_folded(folded, collapse_pstats(stats.stats))  # type: ignore[attr-defined]
+            print(f"profile written: {folded}", file=sys.stderr)
+
+    @contextmanager
+    def _alloc(self, stem: str) -> Iterator[None]:
+        """``tracemalloc`` 측정."""
+
+        if tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc is already tracing")
+        tracemalloc.start(ALLOC_TRACEBACK_FRAMES)
+        try:
+            yield
+        finally:
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                (
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, __file__),
+                )
+            )
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            folded = self.directory / f"{stem}.alloc.folded"
+            write_folded(folded, collapse_snapshot(snapshot))
+            print(
+                f"profile written: {folded} (peak {peak / 1024 / 1024:.1f} MiB)",
+                file=sys.stderr,
+            )
@@ -0,0 +1,308 @@
+"""OpenTelemetry 호환 span 기록과 로컬 OTLP-JSON 파일 exporter.
+
+``TRANSLATION_SPAN_EXPORT``에 경로를 지정한 실행만 span을 만든다. 지정하지
+않으면 ``span``은 공용 빈 context를 돌려주므로 비용이 거의 없고, OpenTelemetry
+SDK를 포함한 외부 패키지는 import하지 않는다.
+
+trace ID는 실패 보고서와 같은 ``TRANSLATION_RUN_ID``에서 만든다. 실행 ID가 이미
+32자리 hex이면 그대로 쓰고, 아니면 SHA-256 앞 32자리를 쓴다. 기록은 최상위 span이
+끝날 때마다 OTLP/JSON ``ExportTraceServiceRequest`` 한 줄로 추가하므로 collector
+없이 파일로 보관하거나 나중에 collector로 보낼 수 있다.
+"""
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import ParamSpec, Protocol, TextIO, TypeVar
+
+SPAN_EXPORT_ENV = "TRANSLATION_SPAN_EXPORT"
+SERVICE_NAME = "translation-sync"
+
+# OTLP Status.code와 Span.kind 값.
+_STATUS_ERROR = 2
+_KIND_INTERNAL = 1
+
+_TRACE_ID_RE = re.compile(r"[0-9a-f]{32}")
+_DISABLED = nullcontext()
+
+AttributeValue = str | int | float | bool
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+@dataclass(frozen=True)
+class FinishedSpan:
+    """종료된 span 하나."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    start_unix_nano: int
+    end_unix_nano: int
+    attributes: tuple[tuple[str, AttributeValue], ...]
+    error: str | None = None
+
+
+class SpanExporter(Protocol):
+    """종료된 span 묶음을 내보내는 exporter."""
+
+    def export(self, spans: Sequence[FinishedSpan]) -> None:
+        """최상위 span 하나에 속한 span 묶음 전달."""
+
+    def shutdown(self) -> None:
+        """남은 자원 정리."""
+
+
+def trace_id_for(run_id: str | None) -> str:
+    """실행 ID에서 만든 32자리 hex trace ID, 실행 ID가 없으면 무작위 값."""
+
+    if not run_id:
+        return os.urandom(16).hex()
+    lowered = run_id.lower()
+    if _TRACE_ID_RE.fullmatch(lowered) and lowered != "0" * 32:
+        return lowered
+    return hashlib.sha256(run_id.encode("utf-8")).hexdigest()[:32]
+
+
+def _any_value(value: AttributeValue) -> dict[str, object]:
+    """OTLP/JSON ``AnyValue`` 표현. 64-bit 정수는 protobuf JSON 규칙대로 문자열."""
+
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_span(span: FinishedSpan) -> dict[str, object]:
+    """OTLP/JSON ``Span`` 표현."""
+
+    document: dict[str, object] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": _KIND_INTERNAL,
+        "startTimeUnixNano": str(span.start_unix_nano),
+        "endTimeUnixNano": str(span.end_unix_nano),
+        "attributes": [
+            {"key": key, "value": _any_value(value)} for key, value in span.attributes
+        ],
+        "status": (
+            {"code": _STATUS_ERROR, "message": span.error}
+            if span.error is not None
+            else {}
+        ),
+    }
+    if span.parent_span_id is not None:
+        document["parentSpanId"] = span.parent_span_id
+    return document
+
+
+def otlp_request(spans: Sequence[FinishedSpan]) -> dict[str, object]:
+    """span 묶음의 OTLP/JSON ``ExportTraceServiceRequest`` 표현."""
+
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": _any_value(SERVICE_NAME)}
+                    ]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": SERVICE_NAME},
+                        "spans": [_otlp_span(span) for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class OtlpJsonFileExporter:
+    """OTLP/JSON 요청을 한 줄씩 파일에 추가하는 기본 exporter."""
+
+    def __init__(self, path: Path) -> None:
+        """기록할 파일 경로 설정."""
+
+        self.path: Path | None = path
+        self._stream: TextIO | None = None
+
+    def export(self, spans: Sequence[FinishedSpan]) -> None:
+        """span 묶음을 한 줄로 추가. 기록 실패는 내보내기만 끔."""
+
+        if self.path is None or not spans:
+            return
+        try:
+            if self._stream is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._stream = self.path.open("a", encoding="utf-8")
+            self._stream.write(
+                json.dumps(otlp_request(spans), ensure_ascii=False, separators=(",", ":"))
+                + "\n"
+            )
+            self._stream.flush()
+        except OSError:
+            print(
+                f"span export disabled: could not write {self.path}",
+                file=sys.stderr,
+            )
+            self.path = None
+
+    def shutdown(self) -> None:
+        """파일 닫기."""
+
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+
+class Tracer:
+    """실행 하나의 span 기록기."""
+
+    def __init__(self, exporter: SpanExporter, *, trace_id: str) -> None:
+        """exporter와 trace ID 설정."""
+
+        self.exporter = exporter
+        self.trace_id = trace_id
+        self._stack: list[tuple[str, dict[str, AttributeValue]]] = []
+        self._finished: list[FinishedSpan] = []
+
+    @contextmanager
+    def span(self, name: str, attributes: Mapping[str, AttributeValue]) -> Iterator[None]:
+        """span 하나의 시작과 종료 기록. 예외는 오류 상태로 남기고 다시 던짐."""
+
+        parent = self._stack[-1][0] if self._stack else None
+        span_id = os.urandom(8).hex()
+        values = dict(attributes)
+        self._stack.append((span_id, values))
+        start = time.time_ns()
+        error: str | None = None
+        try:
+            yield
+        except BaseException as exc:
+            error = type(exc).__name__
+            raise
+        finally:
+            self._stack.pop()
+            self._finished.append(
+                FinishedSpan(
+                    name=name,
+                    trace_id=self.trace_id,
+                    span_id=span_id,
+                    parent_span_id=parent,
+                    start_unix_nano=start,
+                    end_unix_nano=time.time_ns(),
+                    attributes=tuple(values.items()),
+                    error=error,
+                )
+            )
+            if not self._stack:
+                self.flush()
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        """진행 중인 가장 안쪽 span에 attribute 추가."""
+
+        if self._stack:
+            self._stack[-1][1][key] = value
+
+    def flush(self) -> None:
+        """종료된 span을 exporter로 전달."""
+
+        finished, self._finished = self._finished, []
+        if finished:
+            self.exporter.export(finished)
+
+    def shutdown(self) -> None:
+        """남은 span을 내보내고 exporter 정리."""
+
+        self._stack.clear()
+        self.flush()
+        self.exporter.shutdown()
+
+
+_TRACER: Tracer | None = None
+
+
+def install(tracer: Tracer | None) -> None:
+    """프로세스 전역 span 기록기 설정. ``None``이면 끔."""
+
+    global _TRACER
+    _TRACER = tracer
+
+
+def enabled() -> bool:
+    """span을 기록하는 중인지 여부."""
+
+    return _TRACER is not None
+
+
+def span(name: str, **attributes: AttributeValue | None) -> AbstractContextManager[None]:
+    """span context. 꺼져 있으면 공용 빈 context, 값이 ``None``인 attribute는 생략."""
+
+    tracer = _TRACER
+    if tracer is None:
+        return _DISABLED
+    return tracer.span(
+        name,
+        {key: value for key, value in attributes.items() if value is not None},
+    )
+
+
+def set_attribute(key: str, value: AttributeValue) -> None:
+    """진행 중인 span에 attribute 추가. 꺼져 있으면 무시."""
+
+    if _TRACER is not None:
+        _TRACER.set_attribute(key, value)
+
+
+def traced(name: str) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
+    """함수 호출 전체를 span 하나로 기록하는 decorator."""
+
+    def decorate(func: Callable[_P, _R]) -> Callable[_P, _R]:
+        @functools.wraps(func)
+        def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            tracer = _TRACER
+            if tracer is None:
+                return func(*args, **kwargs)
+            with tracer.span(name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def open_tracer(
+    run_id: str | None,
+    environment: Mapping[str, str] | None = None,
+) -> Tracer | None:
+    """환경 변수에 지정된 파일로 내보내는 기록기, 지정하지 않으면 ``None``."""
+
+    values = os.environ if environment is None else environment
+    value = values.get(SPAN_EXPORT_ENV, "").strip()
+    if not value:
+        return None
+    return Tracer(OtlpJsonFileExporter(Path(value)), trace_id=trace_id_for(run_id))
+
+
+def shutdown() -> None:
+    """전역 기록기를 정리하고 끔."""
+
+    global _TRACER
+    tracer, _TRACER = _TRACER, None
+    if tracer is not None:
+        tracer.shutdown()
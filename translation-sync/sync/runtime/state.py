@@ -0,0 +1,52 @@
+"""실행 사이에 재사용하는 로컬 상태 디렉터리와 구현 digest.
+
+상태 디렉터리는 ``TRANSLATION_STATE_DIR``를 지정했을 때만 사용한다.
+저장한 값은 모두 결정적 계산의 memo이므로, 디렉터리가 없거나 손상되어도
+실행 결과는 바뀌지 않고 다시 계산만 한다.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+
+STATE_DIR_ENV = "TRANSLATION_STATE_DIR"
+_PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+
+def state_directory(environment: Mapping[str, str] | None = None) -> Path | None:
+    """설정된 절대 경로 상태 디렉터리, 미설정이면 ``None``.
+
+    Raises:
+        ValueError: 상태 디렉터리가 절대 경로가 아님.
+    """
+
+    runtime_environment = os.environ if environment is None else environment
+    value = runtime_environment.get(STATE_DIR_ENV, "").strip()
+    if not value:
+        return None
+    path = Path(value)
+    if not path.is_absolute():
+        raise ValueError(f"{STATE_DIR_ENV} must be an absolute path")
+    return path
+
+
+@lru_cache(maxsize=1)
+def implementation_digest() -> str:
+    """``sync`` 패키지 Python 원문 전체의 SHA-256.
+
+    memo key에 포함해 판정 코드가 바뀌면 이전 실행의 결과를 재사용하지 않는다.
+    """
+
+    digest = hashlib.sha256()
+    for path in sorted(
+        _PACKAGE_ROOT.rglob("*.py"),
+        key=lambda item: item.relative_to(_PACKAGE_ROOT).as_posix(),
+    ):
+        digest.update(path.relative_to(_PACKAGE_ROOT).as_posix().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
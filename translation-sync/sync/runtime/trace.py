@@ -0,0 +1,269 @@
+"""실행 단계별 시간·자원 계측과 JSON Lines trace.
+
+``TRANSLATION_TRACE_REPORT``에 경로를 지정한 실행만 계측한다. 지정하지 않으면
+단계 context는 아무것도 측정하지 않는 공용 span을 돌려준다.
+
+최상위 단계(설정, 원문 동기화, 변경 감지, 사전검증, 번역, 사이드바)가 끝날 때마다
+그 안에서 집계한 기록을 trace 파일에 한 줄씩 추가한다. 후처리·복구·검증·승인처럼
+블록마다 반복되는 하위 단계는 (단계, 버전, 문서, locale)별로 호출 수와 합계만
+남기며, 하위 단계 시간은 상위 단계 시간에 포함된다. 실행이 끝나면 단계별 합계 표를
+표준 오류에 출력한다. 단계마다 같은 이름의 span도 연다(``spans`` 참고).
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Protocol, TextIO
+
+from . import spans
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+TRACE_REPORT_ENV = "TRANSLATION_TRACE_REPORT"
+
+
+class ProviderTotals(Protocol):
+    """provider 호출 누적값을 제공하는 기록기."""
+
+    requests: int
+    transport: int
+    response_evaluation: int
+    provider_seconds: float
+    input_tokens: int
+    output_tokens: int
+    cached_input_tokens: int
+
+
+def peak_rss_kib() -> int | None:
+    """현재 프로세스의 최대 상주 메모리(KiB), 측정할 수 없으면 ``None``."""
+
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 byte, Linux는 KiB 단위로 보고한다.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+@dataclass
+class StageRecord:
+    """(단계, 버전, 문서, locale)별 누적 측정값."""
+
+    stage: str
+    version: str | None
+    document: str | None
+    locale: str | None
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_rss_kib: int | None = None
+    provider_requests: int = 0
+    provider_seconds: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_input_tokens: int = 0
+    transport_attempts: int = 0
+    response_evaluations: int = 0
+    failed: int = 0
+
+
+class Span:
+    """진행 중인 단계에 provider 누적값을 덧붙이는 handle."""
+
+    def __init__(self, record: StageRecord | None) -> None:
+        """기록 대상 연결. ``None``이면 아무것도 기록하지 않음."""
+
+        self._record = record
+
+    def record_provider(self, totals: ProviderTotals) -> None:
+        """provider 호출 누적값을 단계 기록에 더함."""
+
+        record = self._record
+        if record is None:
+            return
+        record.provider_requests += totals.requests
+        record.provider_seconds += totals.provider_seconds
+        record.input_tokens += totals.input_tokens
+        record.output_tokens += totals.output_tokens
+        record.cached_input_tokens += totals.cached_input_tokens
+        record.transport_attempts += totals.transport
+        record.response_evaluations += totals.response_evaluation
+
+
+_DISABLED_SPAN = Span(None)
+
+
+class RunTrace:
+    """실행 하나의 단계 계측기."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        """trace 파일 경로 설정. ``None``이면 계측하지 않음."""
+
+        self.path = path
+        self.enabled = path is not None
+        self._stream: TextIO | None = None
+        self._context: list[tuple[str | None, str | None, str | None]] = []
+        self._pending: dict[tuple[str, str | None, str | None, str | None], StageRecord] = {}
+        self._totals: dict[str, StageRecord] = {}
+
+    @contextmanager
+    def stage(
+        self,
+        name: str,
+        *,
+        version: str | None = None,
+        document: str | None = None,
+        locale: str | None = None,
+    ) -> Iterator[Span]:
+        """단계 실행 시간과 자원을 측정하고 같은 이름의 span을 여는 context.
+
+        버전·문서·locale을 생략하면 감싸는 단계의 값을 이어받는다.
+        """
+
+        with spans.span(name, version=version, document=document, locale=locale):
+            if not self.enabled:
+                yield _DISABLED_SPAN
+                return
+            with self._measure(name, version, document, locale) as span:
+                yield span
+
+    @contextmanager
+    def _measure(
+        self,
+        name: str,
+        version: str | None,
+        document: str | None,
+        locale: str | None,
+    ) -> Iterator[Span]:
+        """단계 하나의 측정값을 집계 기록에 더함."""
+
+        if self._context and version is None and document is None and locale is None:
+            version, document, locale = self._context[-1]
+        key = (name, version, document, locale)
+        record = self._pending.get(key)
+        if record is None:
+            record = self._pending[key] = StageRecord(name, version, document, locale)
+        self._context.append((version, document, locale))
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield Span(record)
+        except BaseException:
+            record.failed += 1
+            raise
+        finally:
+            record.calls += 1
+            record.wall_seconds += time.perf_counter() - wall
+            record.cpu_seconds += time.process_time() - cpu
+            record.peak_rss_kib = peak_rss_kib()
+            self._context.pop()
+            if not self._context:
+                self._flush()
+
+    def _flush(self) -> None:
+        """최상위 단계 안에서 집계한 기록을 trace 파일과 합계에 반영."""
+
+        records = list(self._pending.values())
+        self._pending.clear()
+        for record in records:
+            total = self._totals.get(record.stage)
+            if total is None:
+                total = self._totals[record.stage] = StageRecord(record.stage, None, None, None)
+            for name in (
+                "calls", "wall_seconds", "cpu_seconds", "provider_requests",
+                "provider_seconds", "input_tokens", "output_tokens",
+                "cached_input_tokens", "transport_attempts", "response_evaluations", "failed",
+            ):
+                setattr(total, name, getattr(total, name) + getattr(record, name))
+            if record.peak_rss_kib is not None:
+                total.peak_rss_kib = max(total.peak_rss_kib or 0, record.peak_rss_kib)
+        self._write(records)
+
+    def _write(self, records: list[StageRecord]) -> None:
+        """기록을 JSON Lines로 추가. 기록 실패는 계측만 끔."""
+
+        if self.path is None or not records:
+            return
+        try:
+            if self._stream is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._stream = self.path.open("a", encoding="utf-8")
+            for record in records:
+                self._stream.write(
+                    json.dumps(asdict(record), ensure_ascii=False, sort_keys=True) + "\n"
+                )
+            self._stream.flush()
+        except OSError:
+            print(
+                f"trace disabled: could not write {self.path}",
+                file=sys.stderr,
+            )
+            self.path = None
+
+    def totals(self) -> list[StageRecord]:
+        """기록된 단계별 합계, 처음 기록된 순서."""
+
+        return list(self._totals.values())
+
+    def summary(self) -> str:
+        """단계별 합계 표."""
+
+        header = (
+            "stage", "calls", "wall s", "cpu s", "rss MiB",
+            "provider s", "requests", "in tok", "out tok", "cached tok", "attempts",
+        )
+        rows = [header]
+        for total in self.totals():
+            rows.append(
+                (
+                    total.stage,
+                    str(total.calls),
+                    f"{total.wall_seconds:.3f}",
+                    f"{total.cpu_seconds:.3f}",
+                    "-" if total.peak_rss_kib is None else f"{total.peak_rss_kib / 1024:.1f}",
+                    f"{total.provider_seconds:.3f}",
+                    str(total.provider_requests),
+                    str(total.input_tokens),
+                    str(total.output_tokens),
+                    str(total.cached_input_tokens),
+                    str(total.transport_attempts),
+                )
+            )
+        widths = [max(len(row[column]) for row in rows) for column in range(len(header))]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if column == 0 else cell.rjust(width)
+                for column, (cell, width) in enumerate(zip(row, widths, strict=True))
+            )
+            for row in rows
+        )
+
+    def close(self, stderr: TextIO | None = None) -> None:
+        """남은 기록을 반영하고 합계 표 출력 후 파일 닫기."""
+
+        if not self.enabled:
+            return
+        self._context.clear()
+        self._flush()
+        if self._totals:
+            print(self.summary(), file=stderr if stderr is not None else sys.stderr)
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        self.enabled = False
+
+
+def open_trace(environment: Mapping[str, str] | None = None) -> RunTrace:
+    """환경 변수에 지정된 trace, 지정하지 않으면 계측하지 않는 trace."""
+
+    values = os.environ if environment is None else environment
+    value = values.get(TRACE_REPORT_ENV, "").strip()
+    return RunTrace(Path(value) if value else None)
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from .generator import (
+    SIDEBAR_INDEX_FILENAME,
     SidebarResult,
     latest_stable_version,
     load_versions,
@@ -14,6 +15,7 @@ from .generator import (
 )
 
 __all__ = (
+    "SIDEBAR_INDEX_FILENAME",
     "SidebarResult",
     "latest_stable_version",
     "load_versions",
@@ -2,6 +2,9 @@
 
 영어 ``documentation.md``의 제목과 문서 링크에서 버전별 사이드바 생성.
 동기화 시 대상 버전의 번역별 사이드바 오버라이드 JSON 파일 제거.
+
+digest 색인을 지정하면 ``documentation.md``, ``versions.json``, 기존 사이드바
+digest와 문서 ID 집합이 마지막 기록과 같은 버전은 파싱·직렬화 없이 확인한다.
 """
 from __future__ import annotations
 
@@ -19,6 +22,7 @@ from ..common.versions import (
     load_versions as _load_versions,
     validate_version_token as _validate_version_token,
 )
+from ..runtime.state import implementation_digest
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
 DOC_LINK_RE = re.compile(r"^\s*-\s*\[([^\]\n]+)]\(([^)\s]+)\)\s*$")
@@ -26,6 +30,8 @@ API_DOCS_HREF_RE = re.compile(
     r"^https://api\.laravel\.com/docs/(?:master|\d+\.x)/?$"
 )
 SIDEBAR_LOCALES = ("ko", "ja")
+SIDEBAR_INDEX_FILENAME = "sidebar-index.json"
+SIDEBAR_INDEX_SCHEMA_VERSION = 1
 
 
 @dataclass(frozen=True)
@@ -42,13 +48,15 @@ class _SidebarPlan:
     """버전 하나의 입력 스냅숏과 검증·적용 계획."""
 
     version: str
-    expected: dict
+    # 색인으로 확인한 계획은 기존 사이드바가 곧 생성 결과이므로 ``None``.
+    expected: dict | None
     documentation_bytes: bytes | None
     approved_sidebar_bytes: bytes | None
     generated_sidebar_bytes: bytes
     sidebar_changed: bool
     locale_paths_to_remove: tuple[Path, ...]
     issues: tuple[str, ...]
+    doc_ids: tuple[str, ...] = ()
 
     @property
     def changed(self) -> bool:
@@ -785,16 +793,157 @@ def _plan_version(version: str, *, repo_root: Path) -> _SidebarPlan:
         and approved_sidebar_bytes != generated_sidebar_bytes,
         locale_paths_to_remove=locale_paths_to_remove,
         issues=tuple(issues),
+        doc_ids=tuple(_doc_ids(expected.get("tutorialSidebar", []))),
     )
 
 
+def _source_doc_ids(version: str, *, repo_root: Path) -> set[str]:
+    """버전 원문 디렉터리의 일반 Markdown 파일 문서 ID. 읽지 못하면 빈 집합."""
+
+    directory = _safe_repo_path(
+        _documentation_path(repo_root, version), repo_root
+    ).parent
+    try:
+        with os.scandir(directory) as entries:
+            return {
+                entry.name.removesuffix(".md")
+                for entry in entries
+                if entry.name.endswith(".md") and entry.is_file(follow_symlinks=False)
+            }
+    except OSError:
+        return set()
+
+
+def _indexed_plan(
+    version: str,
+    entry: object,
+    versions_sha256: str,
+    *,
+    repo_root: Path,
+) -> _SidebarPlan | None:
+    """색인 기록과 입력 digest가 모두 같은 버전의 변경 없는 계획.
+
+    문서·사이드바 digest, 문서 ID 집합 중 하나라도 다르거나 경로 문제가 있으면
+    ``None``을 돌려 전체 계획을 수립하게 한다.
+    """
+
+    if not isinstance(entry, dict) or entry.get("versions_sha256") != versions_sha256:
+        return None
+    doc_ids = entry.get("doc_ids")
+    if not isinstance(doc_ids, list) or not all(isinstance(item, str) for item in doc_ids):
+        return None
+    version = _supported_version(version, repo_root)
+    documentation_bytes, issues = _read_documentation_snapshot(
+        version,
+        repo_root=repo_root,
+    )
+    if (
+        issues
+        or documentation_bytes is None
+        or _sha256(documentation_bytes) != entry.get("documentation_sha256")
+    ):
+        return None
+    sidebar_path = _safe_repo_path(_sidebar_path(repo_root, version), repo_root)
+    if sidebar_path.is_symlink() or not sidebar_path.is_file():
+        return None
+    sidebar_bytes = sidebar_path.read_bytes()
+    if _sha256(sidebar_bytes) != entry.get("sidebar_sha256"):
+        return None
+    if not set(doc_ids) <= _source_doc_ids(version, repo_root=repo_root):
+        return None
+    locale_paths, locale_issues = _existing_repo_paths(
+        locale_sidebar_paths(repo_root, version), repo_root
+    )
+    if locale_issues:
+        return None
+    return _SidebarPlan(
+        version=version,
+        expected=None,
+        documentation_bytes=documentation_bytes,
+        approved_sidebar_bytes=sidebar_bytes,
+        generated_sidebar_bytes=sidebar_bytes,
+        sidebar_changed=False,
+        locale_paths_to_remove=tuple(locale_paths),
+        issues=(),
+        doc_ids=tuple(doc_ids),
+    )
+
+
+def _load_index(path: Path | None) -> dict[str, object]:
+    """현재 구현이 기록한 버전별 색인 항목. 없거나 손상되면 빈 색인."""
+
+    if path is None:
+        return {}
+    try:
+        index = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(index, dict)
+        or index.get("schema_version") != SIDEBAR_INDEX_SCHEMA_VERSION
+        or index.get("implementation") != implementation_digest()
+        or not isinstance(index.get("versions"), dict)
+    ):
+        return {}
+    return index["versions"]
+
+
+def _record_index(
+    path: Path,
+    index: dict[str, object],
+    plans: list[_SidebarPlan],
+    results: list[SidebarResult],
+    versions_json_bytes: bytes,
+) -> None:
+    """적용 후 문제 없는 버전의 digest를 색인에 기록. 기록 실패는 무시."""
+
+    versions = dict(index)
+    versions_sha256 = _sha256(versions_json_bytes)
+    for plan, result in zip(plans, results, strict=True):
+        if result.issues:
+            versions.pop(plan.version, None)
+            continue
+        versions[plan.version] = {
+            "doc_ids": sorted(set(plan.doc_ids)),
+            "documentation_sha256": _sha256(plan.documentation_bytes or b""),
+            "sidebar_sha256": _sha256(plan.generated_sidebar_bytes),
+            "versions_sha256": versions_sha256,
+        }
+    payload = {
+        "implementation": implementation_digest(),
+        "schema_version": SIDEBAR_INDEX_SCHEMA_VERSION,
+        "versions": versions,
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(path, json.dumps(payload, sort_keys=True, indent=2) + "\n")
+    except OSError:
+        return
+
+
 def _plan_candidate_set(
-    versions: list[str], *, repo_root: Path
+    versions: list[str],
+    *,
+    repo_root: Path,
+    index: dict[str, object] | None = None,
 ) -> _SidebarCandidateSet:
-    """모든 대상 버전의 입력 해시로 봉인된 적용 후보 생성."""
+    """모든 대상 버전의 입력 해시로 봉인된 적용 후보 생성.
+
+    ``index``에 기록과 입력 digest가 같은 버전은 전체 계획 대신 색인 확인만 한다.
+    """
 
     versions_json_bytes = _versions_path(repo_root).read_bytes()
-    plans = [_plan_version(version, repo_root=repo_root) for version in versions]
+    versions_sha256 = _sha256(versions_json_bytes)
+    plans = [
+        _indexed_plan(
+            version,
+            (index or {}).get(version),
+            versions_sha256,
+            repo_root=repo_root,
+        )
+        or _plan_version(version, repo_root=repo_root)
+        for version in versions
+    ]
     return _SidebarCandidateSet(
         plans=tuple(plans),
         input_hash=(
@@ -872,12 +1021,18 @@ def sync_version(
 
 
 def sync_versions(
-    versions: list[str], *, write: bool = False, repo_root: Path = REPO_ROOT
+    versions: list[str],
+    *,
+    write: bool = False,
+    repo_root: Path = REPO_ROOT,
+    index_path: Path | None = None,
 ) -> list[SidebarResult]:
     """대상 버전 전체의 사이드바 검증 또는 일괄 동기화.
 
     검증 모드에서는 기존 산출물과 기대 산출물의 차이 보고.
     쓰기 모드에서는 모든 버전의 계획이 유효하고 재검증한 입력 해시가 같을 때만 일괄 적용.
+    ``index_path``를 지정하면 digest 색인으로 변경 없는 버전을 확인하고,
+    쓰기 모드 적용 뒤 색인을 갱신한다.
     """
 
     if not versions:
@@ -890,7 +1045,8 @@ def sync_versions(
         for version in load_versions(repo_root)
         if version in requested_versions
     ]
-    candidate = _plan_candidate_set(unique_versions, repo_root=repo_root)
+    index = _load_index(index_path)
+    candidate = _plan_candidate_set(unique_versions, repo_root=repo_root, index=index)
     plans = list(candidate.plans)
     if not write:
         return [
@@ -910,7 +1066,7 @@ def sync_versions(
             )
             for plan in plans
         ]
-    rechecked = _plan_candidate_set(unique_versions, repo_root=repo_root)
+    rechecked = _plan_candidate_set(unique_versions, repo_root=repo_root, index=index)
     if (
         any(plan.issues for plan in rechecked.plans)
         or rechecked.input_hash != candidate.input_hash
@@ -923,7 +1079,16 @@ def sync_versions(
             )
             for plan in plans
         ]
-    return _apply_plans(plans, repo_root=repo_root)
+    results = _apply_plans(plans, repo_root=repo_root)
+    if index_path is not None:
+        _record_index(
+            index_path,
+            index,
+            plans,
+            results,
+            _versions_path(repo_root).read_bytes(),
+        )
+    return results
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -23,6 +23,7 @@ from pathlib import Path
 
 from ..common.files import atomic_write_bytes, unlink_file
 from ..common.versions import load_versions
+from ..runtime import spans
 from ..runtime.process import ProcessTreeError, run_process_tree
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
@@ -159,6 +160,7 @@ def _remaining_timeout(
     return min(remaining, cap) if cap is not None else remaining
 
 
+@spans.traced("upstream.prepare")
 def _prepare_upstream(
     repo_dir: Path,
     refs: dict[str, str],
@@ -0,0 +1,390 @@
+"""기존 annotation 문서에서 구축하는 말뭉치 단위 번역 메모리.
+
+KO·JA 문서는 영어 원문 annotation 주석과 번역 본문을 블록 단위로 함께 보관한다.
+모든 버전의 두 locale 문서를 읽어 정규화한 annotation → 번역 블록 색인을 SQLite에
+저장하고, 문서 digest가 바뀐 파일만 다시 색인한다. 색인 결과는 후보일 뿐이며
+호출자는 응답 계약과 문서 검증을 그대로 적용해야 한다.
+
+annotation이 정확히 같지 않아도 영어 단어 bigram 집합의 Jaccard 유사도가 높은
+블록은 provider 요청의 참고 번역으로 제안한다. 유사도 색인은 실행 중 처음 조회할 때
+한 번 만들고 고정하므로, 같은 실행의 사전검증과 실제 요청은 같은 제안을 받는다.
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+import sqlite3
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from . import patch
+
+MEMORY_FILENAME = "translation-memory.sqlite3"
+MEMORY_SCHEMA_VERSION = 1
+MAX_CANDIDATES = 3
+MAX_SIMILAR = 3
+# 제안 전체 길이 상한. 요청 예산 대비 무시할 수 있는 크기로 유지한다.
+MAX_SIMILAR_CHARS = 4000
+SIMILARITY_THRESHOLD = 0.5
+# 이보다 많은 블록에 나타나는 bigram은 변별력이 없어 후보 집계에서 제외한다.
+MAX_POSTINGS = 1000
+_WORD_RE = re.compile(r"\w+")
+
+
+def locale_roots(repo_root: Path) -> dict[str, Path]:
+    """locale별 번역 문서 루트."""
+
+    return {
+        "ko": repo_root / "versioned_docs",
+        "ja": repo_root / "i18n" / "ja" / "docusaurus-plugin-content-docs",
+    }
+
+
+def annotated_blocks(document: str | None) -> dict[str, str]:
+    """문서의 canonical annotation과 소유 블록 본문 쌍.
+
+    같은 annotation이 두 번 이상 나타나면 대응이 모호하므로 제외한다.
+    """
+
+    if not document:
+        return {}
+    blocks = patch._blocks(document)
+    counts = Counter(block.comment for block in blocks)
+    return {
+        block.comment: block.text
+        for block in blocks
+        if counts[block.comment] == 1
+    }
+
+
+def shingles(english: str) -> frozenset[int]:
+    """정규화한 영어 단어 bigram의 hash 집합. 세 단어 미만이면 빈 집합."""
+
+    words = _WORD_RE.findall(english.lower())
+    if len(words) < 3:
+        return frozenset()
+    return frozenset(hash(gram) for gram in zip(words, words[1:]))
+
+
+@dataclass
+class _SimilarityIndex:
+    """locale 하나의 annotation bigram 역색인."""
+
+    comments: list[str] = field(default_factory=list)
+    texts: list[str] = field(default_factory=list)
+    sizes: list[int] = field(default_factory=list)
+    postings: dict[int, list[int]] = field(default_factory=dict)
+
+    def add(self, comment: str, text: str) -> None:
+        """annotation과 대표 번역 블록 추가."""
+
+        grams = shingles(comment)
+        if not grams:
+            return
+        entry = len(self.comments)
+        self.comments.append(comment)
+        self.texts.append(text)
+        self.sizes.append(len(grams))
+        for gram in grams:
+            self.postings.setdefault(gram, []).append(entry)
+
+    def scored(self, english: str) -> list[tuple[float, int]]:
+        """유사도 기준 이상인 (Jaccard, 항목) 목록을 높은 순으로 반환."""
+
+        grams = shingles(english)
+        if not grams:
+            return []
+        shared: Counter[int] = Counter()
+        for gram in grams:
+            entries = self.postings.get(gram)
+            if entries is not None and len(entries) <= MAX_POSTINGS:
+                shared.update(entries)
+        scored = [
+            (count / (len(grams) + self.sizes[entry] - count), entry)
+            for entry, count in shared.items()
+        ]
+        return sorted(
+            (item for item in scored if item[0] >= SIMILARITY_THRESHOLD),
+            key=lambda item: (-item[0], self.comments[item[1]]),
+        )
+
+
+class TranslationMemory:
+    """annotation 원문으로 조회하는 영속 번역 블록 색인."""
+
+    def __init__(self, path: Path | str, repo_root: Path) -> None:
+        """색인 저장소 열기.
+
+        Args:
+            path: SQLite 파일 경로 또는 ``":memory:"``.
+            repo_root: locale 문서를 찾을 저장소 루트.
+
+        Raises:
+            sqlite3.Error: 저장소를 열거나 준비할 수 없음.
+        """
+
+        self._repo_root = repo_root
+        self._fresh = False
+        self._similarity: dict[str, _SimilarityIndex] = {}
+        if isinstance(path, Path):
+            path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != MEMORY_SCHEMA_VERSION:
+            connection.executescript(
+                "DROP TABLE IF EXISTS documents;"
+                "DROP TABLE IF EXISTS blocks;"
+            )
+        connection.executescript(
+            "CREATE TABLE IF NOT EXISTS documents ("
+            "locale TEXT NOT NULL, path TEXT NOT NULL, sha256 TEXT NOT NULL,"
+            "PRIMARY KEY (locale, path));"
+            "CREATE TABLE IF NOT EXISTS blocks ("
+            "locale TEXT NOT NULL, path TEXT NOT NULL,"
+            "comment TEXT NOT NULL, text TEXT NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS blocks_by_comment "
+            "ON blocks (locale, comment);"
+            "CREATE INDEX IF NOT EXISTS blocks_by_path ON blocks (locale, path);"
+            f"PRAGMA user_version = {MEMORY_SCHEMA_VERSION};"
+        )
+        connection.commit()
+        self._connection: sqlite3.Connection | None = connection
+
+    def _relative(self, path: Path) -> str:
+        """저장소 루트 기준 POSIX 상대 경로."""
+
+        return path.relative_to(self._repo_root).as_posix()
+
+    @staticmethod
+    def _replace_document(
+        connection: sqlite3.Connection,
+        locale: str,
+        key: str,
+        document: str,
+    ) -> None:
+        """문서 하나의 색인 항목을 현재 내용으로 교체. commit은 호출자 책임.
+
+        블록 사이 빈 줄은 위치에 따라 달라지므로 줄바꿈 하나로 정규화해 보관한다.
+        """
+
+        digest = hashlib.sha256(document.encode("utf-8")).hexdigest()
+        connection.execute(
+            "DELETE FROM blocks WHERE locale = ? AND path = ?",
+            (locale, key),
+        )
+        connection.executemany(
+            "INSERT INTO blocks (locale, path, comment, text) VALUES (?, ?, ?, ?)",
+            (
+                (locale, key, comment, text.rstrip("\n") + "\n")
+                for comment, text in annotated_blocks(document).items()
+            ),
+        )
+        connection.execute(
+            "INSERT OR REPLACE INTO documents (locale, path, sha256) "
+            "VALUES (?, ?, ?)",
+            (locale, key, digest),
+        )
+
+    def refresh(self) -> int:
+        """digest가 바뀐 locale 문서만 다시 색인하고 사라진 문서 제거.
+
+        Returns:
+            다시 색인하거나 제거한 문서 수.
+
+        Raises:
+            sqlite3.Error: 색인을 갱신할 수 없음.
+        """
+
+        connection = self._connection
+        if connection is None:
+            return 0
+        known = {
+            (locale, path): digest
+            for locale, path, digest in connection.execute(
+                "SELECT locale, path, sha256 FROM documents"
+            )
+        }
+        seen: set[tuple[str, str]] = set()
+        changed = 0
+        for locale, root in locale_roots(self._repo_root).items():
+            for path in sorted(root.glob("version-*/**/*.md")):
+                if path.is_symlink() or not path.is_file():
+                    continue
+                key = self._relative(path)
+                seen.add((locale, key))
+                try:
+                    contents = path.read_bytes()
+                    digest = hashlib.sha256(contents).hexdigest()
+                    if known.get((locale, key)) == digest:
+                        continue
+                    self._replace_document(
+                        connection, locale, key, contents.decode("utf-8")
+                    )
+                except (OSError, UnicodeDecodeError):
+                    continue
+                changed += 1
+        for locale, key in known.keys() - seen:
+            connection.execute(
+                "DELETE FROM blocks WHERE locale = ? AND path = ?",
+                (locale, key),
+            )
+            connection.execute(
+                "DELETE FROM documents WHERE locale = ? AND path = ?",
+                (locale, key),
+            )
+            changed += 1
+        connection.commit()
+        self._fresh = True
+        return changed
+
+    def locale_of(self, path: Path) -> str | None:
+        """번역 문서 경로의 locale, 색인 대상이 아니면 ``None``."""
+
+        for locale, root in locale_roots(self._repo_root).items():
+            if path.is_relative_to(root) and path.suffix == ".md":
+                return locale
+        return None
+
+    def record_document(self, path: Path, document: str) -> None:
+        """승인되어 기록된 locale 문서를 색인에 즉시 반영.
+
+        저장소 오류는 색인을 끄는 방향으로만 처리해 문서 기록을 막지 않는다.
+        """
+
+        connection = self._connection
+        locale = self.locale_of(path)
+        if connection is None or locale is None:
+            return
+        try:
+            self._replace_document(
+                connection, locale, self._relative(path), document
+            )
+            connection.commit()
+        except sqlite3.Error:
+            self._connection = None
+
+    def candidates(
+        self,
+        locale: str,
+        comment: str,
+        *,
+        limit: int = MAX_CANDIDATES,
+    ) -> list[str]:
+        """annotation이 정확히 같은 번역 블록 후보를 사용 빈도순으로 반환."""
+
+        connection = self._connection
+        if connection is None:
+            return []
+        try:
+            if not self._fresh:
+                self.refresh()
+            rows = connection.execute(
+                "SELECT text, COUNT(*) AS uses FROM blocks "
+                "WHERE locale = ? AND comment = ? "
+                "GROUP BY text ORDER BY uses DESC, text LIMIT ?",
+                (locale, comment, limit),
+            ).fetchall()
+        except sqlite3.Error:
+            self._connection = None
+            return []
+        return [text for text, _uses in rows]
+
+    def _similarity_index(self, locale: str) -> _SimilarityIndex:
+        """locale 유사도 색인. 실행 중 처음 호출할 때 한 번만 구축.
+
+        Raises:
+            sqlite3.Error: 색인 원본을 읽을 수 없음.
+        """
+
+        index = self._similarity.get(locale)
+        if index is not None:
+            return index
+        index = _SimilarityIndex()
+        connection = self._connection
+        if connection is not None:
+            if not self._fresh:
+                self.refresh()
+            previous: str | None = None
+            for comment, text, _uses in connection.execute(
+                "SELECT comment, text, COUNT(*) AS uses FROM blocks "
+                "WHERE locale = ? GROUP BY comment, text "
+                "ORDER BY comment, uses DESC, text",
+                (locale,),
+            ):
+                if comment == previous:
+                    continue
+                previous = comment
+                if len(text) <= MAX_SIMILAR_CHARS:
+                    index.add(comment, text)
+        self._similarity[locale] = index
+        return index
+
+    def similar(
+        self,
+        locale: str,
+        comments: Iterable[str],
+        *,
+        limit: int = MAX_SIMILAR,
+    ) -> list[str]:
+        """annotation들과 영어 표현이 비슷한 기존 번역 블록 제안.
+
+        Args:
+            locale: 목표 locale.
+            comments: 요청 원문의 canonical annotation.
+            limit: 반환할 최대 블록 수.
+
+        Returns:
+            annotation별 유사도 순으로 고른 번역 블록. 전체 길이는
+            ``MAX_SIMILAR_CHARS`` 이하.
+        """
+
+        if self._connection is None:
+            return []
+        try:
+            index = self._similarity_index(locale)
+        except sqlite3.Error:
+            self._connection = None
+            return []
+        ranked = [index.scored(comment) for comment in comments]
+        chosen: list[str] = []
+        used: set[int] = set()
+        remaining = MAX_SIMILAR_CHARS
+        depth = 0
+        while len(chosen) < limit and any(depth < len(items) for items in ranked):
+            for items in ranked:
+                if depth >= len(items) or len(chosen) >= limit:
+                    continue
+                entry = items[depth][1]
+                text = index.texts[entry]
+                if entry in used or len(text) > remaining:
+                    continue
+                used.add(entry)
+                chosen.append(text)
+                remaining -= len(text)
+            depth += 1
+        return chosen
+
+    def close(self) -> None:
+        """저장소 연결 닫기."""
+
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+def open_memory(
+    state_dir: Path | None,
+    repo_root: Path,
+) -> TranslationMemory | None:
+    """상태 디렉터리의 번역 메모리, 없거나 열 수 없으면 ``None``."""
+
+    if state_dir is None:
+        return None
+    try:
+        return TranslationMemory(state_dir / MEMORY_FILENAME, repo_root)
+    except (OSError, sqlite3.Error):
+        return None
@@ -5,11 +5,13 @@
 """
 from __future__ import annotations
 
+import bisect
 import re
 from collections import Counter
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import cached_property
 
 from ..annotation.annotate import Block, split_blocks
 from ..common.markdown import (
@@ -1273,7 +1275,7 @@ def existing_context(text: str, segment: BlockChange) -> str:
 
 def _existing_replacement_context(
     text: str,
-    blocks: list[AnnotatedBlock],
+    blocks: Sequence[AnnotatedBlock],
     segment: BlockChange,
 ) -> str:
     """교체·삭제 segment의 기존 locale 문맥 탐색.
@@ -1311,7 +1313,7 @@ def _existing_replacement_context(
 
 
 def _neighbor_existing_context(
-    blocks: list[AnnotatedBlock],
+    blocks: Sequence[AnnotatedBlock],
     segment: BlockChange,
 ) -> str | None:
     """삽입 segment의 이전·다음 anchor 문맥 탐색.
@@ -1425,7 +1427,7 @@ def apply_segments(
             else None
         )
         prepared.append((segment, translated, old_found))
-    text = existing
+    document = _LineBuffer(existing)
     offsets_shifted = False
 
     ordered = [
@@ -1440,50 +1442,59 @@ def apply_segments(
         if code_state is PlanState.TARGET and fenced_code_change:
             continue
         if segment.code_block is not None:
-            text = _apply_code_block(text, segment.code_block, state=code_state)
+            document.replace_text(
+                _apply_code_block(document.text, segment.code_block, state=code_state)
+            )
             continue
         if segment.is_named_anchor_change:
-            text = _apply_named_anchor_change(text, segment, translated)
+            document.replace_text(
+                _apply_named_anchor_change(document.text, segment, translated)
+            )
             continue
         if segment.is_admonition_marker_change:
-            before_line_count = len(text.splitlines(keepends=True))
-            text = _apply_admonition_marker_change(text, segment, translated)
+            before_line_count = len(document.lines)
+            document.replace_text(
+                _apply_admonition_marker_change(document.text, segment, translated)
+            )
             offsets_shifted = offsets_shifted or (
-                len(text.splitlines(keepends=True)) != before_line_count
+                len(document.lines) != before_line_count
             )
             continue
         if segment.is_inline_code_identifier_list and _inline_code_list_is_applied(
-            text, segment
+            document.text, segment
         ):
             continue
         if target_state and (segment.old_anchors or segment.new_anchors):
             if segment.is_deletion:
-                _reject_target_deletion_residue(text, segment)
+                _reject_target_deletion_residue(document.text, segment)
             elif segment.needs_translation:
-                _require_target_block_bodies(text, segment)
+                _require_target_block_bodies(document.text, segment)
             continue
         has_old_source = bool(
             segment.old_source or _meaningful_lines(segment.old_lines)
         )
         if offsets_shifted and has_old_source:
-            old_found = _find_old_blocks(_blocks(text), segment, required=False)
+            old_found = _find_old_blocks(document.blocks, segment, required=False)
         if has_old_source and segment.needs_translation:
             if translated is None:
                 raise PatchError("missing translated replacement block")
-            text = (
-                _replace_resolved_blocks(text, old_found, translated)
-                if old_found
-                else _replace_segment(text, segment, translated)
-            )
+            if old_found:
+                document.splice(
+                    old_found[0].start,
+                    old_found[-1].end,
+                    _resolved_replacement(old_found, translated),
+                )
+            else:
+                document.replace_text(
+                    _replace_segment(document.text, segment, translated)
+                )
         elif segment.is_deletion:
             if segment.deleted_code_block is not None:
-                text = _delete_fenced_code_block(text, segment)
+                document.replace_text(_delete_fenced_code_block(document.text, segment))
+            elif old_found:
+                document.splice(old_found[0].start, old_found[-1].end, "")
             else:
-                text = (
-                    _delete_resolved_blocks(text, old_found)
-                    if old_found
-                    else _delete_segment(text, segment)
-                )
+                document.replace_text(_delete_segment(document.text, segment))
         elif segment.needs_translation:
             if translated is None:
                 raise PatchError("missing translated insertion block")
@@ -1498,19 +1509,25 @@ def apply_segments(
                     or segment.before_context
                     or segment.after_context
                 ):
-                    text = _insert_block(text, segment, translated, force=True)
+                    document.replace_text(
+                        _insert_block(document.text, segment, translated, force=True)
+                    )
                 else:
-                    text = _insert_fenced_code_block(text, segment, translated)
+                    document.replace_text(
+                        _insert_fenced_code_block(document.text, segment, translated)
+                    )
             else:
-                text = _insert_block(
-                    text,
-                    segment,
-                    translated,
-                    force=source_state
-                    or (code_state is PlanState.SOURCE and fenced_code_change),
+                document.replace_text(
+                    _insert_block(
+                        document.text,
+                        segment,
+                        translated,
+                        force=source_state
+                        or (code_state is PlanState.SOURCE and fenced_code_change),
+                    )
                 )
 
-    return _ensure_single_eof_newline(text)
+    return _ensure_single_eof_newline(document.text)
 
 
 def apply_plan(
@@ -1923,27 +1940,295 @@ def _strip_retained_admonition_marker(
     return "".join(lines)
 
 
-def _blocks(text: str) -> list[AnnotatedBlock]:
+def _blocks(text: str) -> AnnotatedDocumentIndex:
     """locale 문서의 annotation 소유 block 목록."""
 
-    lines = text.splitlines(keepends=True)
-    starts = _comment_starts(lines)
+    return _document_index(text)
+
+
+def _parse_blocks(
+    lines: list[str], start: int = 0, limit: int | None = None
+) -> tuple[list[AnnotatedBlock], bool]:
+    """줄 범위의 annotation block과 범위 끝의 code fence 내부 여부.
+
+    ``start``는 code fence 밖이어야 하며, 마지막 block은 ``limit``에서 끝남.
+    """
+
+    limit = len(lines) if limit is None else limit
+    starts, in_code = _scan_comment_starts(lines, start, limit)
     blocks: list[AnnotatedBlock] = []
 
-    for index, start in enumerate(starts):
-        comment_end, comment = _read_comment(lines, start)
-        next_start = starts[index + 1] if index + 1 < len(starts) else len(lines)
+    for index, comment_start in enumerate(starts):
+        comment_end, comment = _read_comment(lines, comment_start)
+        next_start = starts[index + 1] if index + 1 < len(starts) else limit
         end = _translated_block_end(lines, comment_end, next_start)
         blocks.append(
             AnnotatedBlock(
-                start=start,
+                start=comment_start,
                 end=end,
                 comment=_normalize_text(comment),
-                text="".join(lines[start:end]),
+                text="".join(lines[comment_start:end]),
             )
         )
 
-    return blocks
+    return blocks, in_code
+
+
+class AnnotatedDocumentIndex(Sequence[AnnotatedBlock]):
+    """locale 문서 줄과 정규화 annotation → block 위치 색인.
+
+    block 목록처럼 순회·색인할 수 있으며, ``spliced``는 바뀐 줄 주변 block만 다시 읽어
+    전체 문서를 다시 파싱하지 않고 편집 후 색인 생성.
+    ``disjoint``가 거짓이면 여러 줄 주석 안의 ``<!--`` 줄로 block 범위가 겹친 문서.
+    """
+
+    def __init__(
+        self,
+        lines: list[str],
+        blocks: list[AnnotatedBlock],
+        *,
+        disjoint: bool,
+        text: str | None = None,
+    ):
+        self.lines = lines
+        self.disjoint = disjoint
+        self._blocks = blocks
+        if text is not None:
+            self.text = text
+
+    @classmethod
+    def build(cls, text: str) -> AnnotatedDocumentIndex:
+        """문서 전체를 파싱한 색인."""
+
+        return cls.from_lines(text.splitlines(keepends=True), text=text)
+
+    @classmethod
+    def from_lines(
+        cls, lines: list[str], *, text: str | None = None
+    ) -> AnnotatedDocumentIndex:
+        """줄 목록 전체를 파싱한 색인."""
+
+        blocks = _parse_blocks(lines)[0]
+        return cls(lines, blocks, disjoint=_blocks_are_disjoint(blocks), text=text)
+
+    @cached_property
+    def text(self) -> str:
+        """색인한 locale 문서. 편집으로 만든 색인은 처음 요청할 때 생성."""
+
+        return "".join(self.lines)
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def __getitem__(self, index):
+        return self._blocks[index]
+
+    def __iter__(self):
+        return iter(self._blocks)
+
+    @cached_property
+    def _positions(self) -> dict[str, list[int]]:
+        """정규화 annotation별 block 위치."""
+
+        positions: dict[str, list[int]] = {}
+        for position, block in enumerate(self._blocks):
+            positions.setdefault(block.comment, []).append(position)
+        return positions
+
+    @cached_property
+    def _starts(self) -> dict[int, int]:
+        """시작 줄별 block 위치."""
+
+        return {block.start: position for position, block in enumerate(self._blocks)}
+
+    def index(
+        self, block: AnnotatedBlock, start: int = 0, stop: int | None = None
+    ) -> int:
+        """block 위치. 시작 줄로 바로 찾고 같은 block인지 확인."""
+
+        position = self._starts.get(block.start)
+        if (
+            position is None
+            or self._blocks[position] != block
+            or position < start
+            or (stop is not None and position >= stop)
+        ):
+            raise ValueError("block is not in document index")
+        return position
+
+    def exact_positions(self, normalized: str) -> list[int]:
+        """정규화 annotation이 정확히 같은 block 위치."""
+
+        return self._positions.get(normalized, [])
+
+    def spliced(self, start: int, end: int, replacement: str) -> AnnotatedDocumentIndex:
+        """``lines[start:end]``를 ``replacement``로 바꾼 문서의 색인.
+
+        바뀐 줄과 직전 block만 다시 읽고 뒤쪽 block은 줄 위치만 이동.
+        줄 경계가 아닌 편집, 겹치는 block이 있는 문서와 code fence 상태가 바뀌는 편집은
+        전체 파싱으로 처리.
+        """
+
+        lines = self.lines
+        if not self.disjoint or not _splits_on_line_boundaries(lines, start, replacement):
+            return AnnotatedDocumentIndex.build(
+                "".join(lines[:start]) + replacement + "".join(lines[end:])
+            )
+        inserted = replacement.splitlines(keepends=True)
+        new_lines = lines[:start] + inserted + lines[end:]
+        delta = len(inserted) - (end - start)
+        blocks = self._blocks
+        # 직전 block은 다음 주석 위치까지 번역 본문이 이어질 수 있어 함께 다시 읽음
+        first = bisect.bisect_left(blocks, start, key=_block_start)
+        after = bisect.bisect_left(blocks, end, lo=first, key=_block_start)
+        if first:
+            first -= 1
+            window_start = blocks[first].start
+        else:
+            window_start = 0
+        window_end = (
+            blocks[after].start + delta if after < len(blocks) else len(new_lines)
+        )
+        window, in_code = _parse_blocks(new_lines, window_start, window_end)
+        if in_code and after < len(blocks):
+            return AnnotatedDocumentIndex.from_lines(new_lines)
+        following = blocks[after:]
+        if delta:
+            following = [
+                AnnotatedBlock(
+                    block.start + delta, block.end + delta, block.comment, block.text
+                )
+                for block in following
+            ]
+        edge = blocks[max(first - 1, 0) : first] + window + following[:1]
+        return AnnotatedDocumentIndex(
+            new_lines,
+            blocks[:first] + window + following,
+            disjoint=_blocks_are_disjoint(edge),
+        )
+
+
+def _splits_on_line_boundaries(lines: list[str], start: int, replacement: str) -> bool:
+    """줄 범위 교체 결과를 다시 나눠도 앞뒤 줄 경계가 그대로인지 여부."""
+
+    return (not start or lines[start - 1].endswith("\n")) and (
+        not replacement or replacement.endswith("\n")
+    )
+
+
+def _blocks_are_disjoint(blocks: list[AnnotatedBlock]) -> bool:
+    """인접 block 줄 범위가 겹치지 않는지 여부."""
+
+    return all(
+        previous.end <= block.start for previous, block in zip(blocks, blocks[1:])
+    )
+
+
+def _block_start(block: AnnotatedBlock) -> int:
+    """block 시작 줄."""
+
+    return block.start
+
+
+_DOCUMENT_INDEX_CACHE_SIZE = 16
+_DOCUMENT_INDEXES: dict[str, AnnotatedDocumentIndex] = {}
+
+
+def _remember_document_index(index: AnnotatedDocumentIndex) -> AnnotatedDocumentIndex:
+    """최근 문서 색인으로 등록하고 오래된 색인 제거."""
+
+    _DOCUMENT_INDEXES.pop(index.text, None)
+    _DOCUMENT_INDEXES[index.text] = index
+    while len(_DOCUMENT_INDEXES) > _DOCUMENT_INDEX_CACHE_SIZE:
+        del _DOCUMENT_INDEXES[next(iter(_DOCUMENT_INDEXES))]
+    return index
+
+
+def _document_index(text: str) -> AnnotatedDocumentIndex:
+    """문서별로 캐시된 annotation block 색인."""
+
+    index = _DOCUMENT_INDEXES.get(text)
+    if index is None:
+        index = AnnotatedDocumentIndex.build(text)
+    return _remember_document_index(index)
+
+
+def _spliced_text(text: str, start: int, end: int, replacement: str) -> str:
+    """locale 문서 줄 범위 교체 결과. 편집 후 색인을 함께 등록."""
+
+    return _remember_document_index(
+        _document_index(text).spliced(start, end, replacement)
+    ).text
+
+
+class _LineBuffer:
+    """segment 적용 중인 locale 문서 줄 버퍼.
+
+    annotation block 편집은 줄 목록만 바꾸고, 문자열은 문자열 기반 helper가 요청할 때와
+    적용이 끝날 때 생성. block 색인은 처음 요청된 뒤부터 편집마다 증분 갱신.
+    """
+
+    def __init__(self, text: str):
+        self._text: str | None = text
+        self._lines = text.splitlines(keepends=True)
+        self._index: AnnotatedDocumentIndex | None = None
+
+    @property
+    def lines(self) -> list[str]:
+        """현재 문서 줄. 호출자는 수정하지 않음."""
+
+        return self._lines
+
+    @property
+    def text(self) -> str:
+        """현재 문서 문자열. 색인이 있으면 같은 문자열로 등록해 helper 재파싱 방지."""
+
+        if self._text is None:
+            if self._index is not None:
+                self._text = _remember_document_index(self._index).text
+            else:
+                self._text = "".join(self._lines)
+        return self._text
+
+    @property
+    def blocks(self) -> AnnotatedDocumentIndex:
+        """현재 문서의 annotation block 색인."""
+
+        if self._index is None:
+            cached = _DOCUMENT_INDEXES.get(self._text) if self._text is not None else None
+            self._index = cached or AnnotatedDocumentIndex.from_lines(
+                self._lines, text=self._text
+            )
+            self._lines = self._index.lines
+        return self._index
+
+    def splice(self, start: int, end: int, replacement: str) -> None:
+        """``lines[start:end]``를 ``replacement``로 교체."""
+
+        if self._index is not None:
+            self._index = self._index.spliced(start, end, replacement)
+            self._lines = self._index.lines
+        elif _splits_on_line_boundaries(self._lines, start, replacement):
+            self._lines[start:end] = replacement.splitlines(keepends=True)
+        else:
+            lines = self._lines
+            self.replace_text(
+                "".join(lines[:start]) + replacement + "".join(lines[end:])
+            )
+            return
+        self._text = None
+
+    def replace_text(self, text: str) -> None:
+        """문자열 기반 helper 결과로 교체. 같은 문자열이면 유지."""
+
+        if text is self._text:
+            return
+        self._text = text
+        self._index = _DOCUMENT_INDEXES.get(text)
+        if self._index is not None:
+            self._lines = self._index.lines
+        else:
+            self._lines = text.splitlines(keepends=True)
 
 
 def _annotation_anchor_sequence(text: str) -> tuple[str, ...]:
@@ -2145,7 +2430,7 @@ def _insert_source_comments(
 
 def _source_comment_insertion_index(
     text: str,
-    blocks: list[AnnotatedBlock],
+    blocks: Sequence[AnnotatedBlock],
     comment: SourceComment,
 ) -> int:
     """원문 작성 주석의 locale 삽입 줄 위치 계산.
@@ -2291,7 +2576,7 @@ def _located_plan_comment_blocks(
 
 
 def _locate_non_plan_comment_blocks(
-    blocks: list[AnnotatedBlock],
+    blocks: Sequence[AnnotatedBlock],
     plan_blocks: list[AnnotatedBlock],
     comments: tuple[SourceComment, ...],
     plan_prefixes: dict[int, int],
@@ -2419,10 +2704,19 @@ def _translated_block_end(lines: list[str], start: int, limit: int) -> int:
 def _comment_starts(lines: list[str]) -> list[int]:
     """독립 HTML 주석이 시작되는 줄 위치 목록."""
 
+    return _scan_comment_starts(lines, 0, len(lines))[0]
+
+
+def _scan_comment_starts(
+    lines: list[str], start: int, limit: int
+) -> tuple[list[int], bool]:
+    """줄 범위의 독립 HTML 주석 시작 위치와 범위 끝의 code fence 내부 여부."""
+
     starts: list[int] = []
     in_code = False
     fence = ""
-    for index, line in enumerate(lines):
+    for index in range(start, limit):
+        line = lines[index]
         token = fence_token(line)
         if token:
             if not in_code:
@@ -2434,7 +2728,7 @@ def _comment_starts(lines: list[str]) -> list[int]:
         stripped = line.lstrip()
         if not in_code and stripped.startswith("<!--"):
             starts.append(index)
-    return starts
+    return starts, in_code
 
 
 def _read_comment(lines: list[str], start: int) -> tuple[int, str]:
@@ -2462,7 +2756,7 @@ def _read_comment(lines: list[str], start: int) -> tuple[int, str]:
 
 
 def _find_block(
-    blocks: list[AnnotatedBlock],
+    blocks: Sequence[AnnotatedBlock],
     comment: str,
     *,
     occurrence: int | None = None,
@@ -2486,7 +2780,7 @@ def _find_block(
 
 
 def _find_anchored_blocks(
-    blocks: list[AnnotatedBlock],
+    blocks: Sequence[AnnotatedBlock],
     anchors: tuple[str, ...],
     *,
     occurrence: int | None = None,
@@ -2522,7 +2816,7 @@ def _find_anchored_blocks(
 
 
 def _anchored_block_candidates(
-    blocks: list[AnnotatedBlock],
+    blocks: Sequence[AnnotatedBlock],
     anchors: tuple[str, ...],
 ) -> list[tuple[AnnotatedBlock, ...]]:
     """연속 annotation anchor와 일치하는 locale 블록 후보 수집.
@@ -2535,19 +2829,23 @@ def _anchored_block_candidates(
         연속 block 범위 후보.
     """
 
-    matches = [set(_matching_blocks(blocks, anchor)) for anchor in anchors]
+    first = _matching_positions(blocks, anchors[0])
+    if not first:
+        return []
+    following = [set(_matching_positions(blocks, anchor)) for anchor in anchors[1:]]
     return [
         tuple(blocks[start : start + len(anchors)])
-        for start in range(len(blocks) - len(anchors) + 1)
-        if all(
-            blocks[start + offset] in anchor_matches
-            for offset, anchor_matches in enumerate(matches)
+        for start in first
+        if start + len(anchors) <= len(blocks)
+        and all(
+            start + offset in positions
+            for offset, positions in enumerate(following, start=1)
         )
     ]
 
 
 def _filter_anchored_block_candidates(
-    blocks: list[AnnotatedBlock],
+    blocks: Sequence[AnnotatedBlock],
     candidates: list[tuple[AnnotatedBlock, ...]],
     *,
     previous_anchor: str | None,
@@ -2587,7 +2885,7 @@ def _filter_anchored_block_candidates(
 
 
 def _neighboring_plan_anchor(
-    blocks: list[AnnotatedBlock], index: int, direction: int
+    blocks: Sequence[AnnotatedBlock], index: int, direction: int
 ) -> AnnotatedBlock | None:
     """block 주변에서 계획에 포함된 가장 가까운 anchor."""
 
@@ -2599,16 +2897,38 @@ def _neighboring_plan_anchor(
     return None
 
 
-def _matching_blocks(blocks: list[AnnotatedBlock], comment: str) -> list[AnnotatedBlock]:
+def _matching_blocks(
+    blocks: Sequence[AnnotatedBlock], comment: str
+) -> list[AnnotatedBlock]:
     """정규화한 annotation이 일치하는 locale block 목록."""
 
+    return [blocks[position] for position in _matching_positions(blocks, comment)]
+
+
+def _matching_positions(blocks: Sequence[AnnotatedBlock], comment: str) -> list[int]:
+    """정규화한 annotation이 일치하는 locale block 위치 목록.
+
+    문서 색인은 정확히 일치하는 annotation을 바로 찾고, 부분 일치만 전체 block 확인.
+    """
+
     normalized = _normalize_text(comment)
-    exact = [block for block in blocks if block.comment == normalized]
+    if isinstance(blocks, AnnotatedDocumentIndex):
+        exact = blocks.exact_positions(normalized)
+    else:
+        exact = [
+            position
+            for position, block in enumerate(blocks)
+            if block.comment == normalized
+        ]
     if exact:
         return exact
     if not _can_match_partial_comment(normalized):
         return []
-    candidates = [block for block in blocks if normalized in block.comment]
+    candidates = [
+        position
+        for position, block in enumerate(blocks)
+        if normalized in block.comment
+    ]
     return candidates if len(candidates) == 1 else []
 
 
@@ -2630,7 +2950,6 @@ def _replace_block(
 ) -> str:
     """블록 교체."""
 
-    lines = text.splitlines(keepends=True)
     found = _find_anchored_blocks(
         _blocks(text),
         anchors or (old_comment,),
@@ -2638,10 +2957,7 @@ def _replace_block(
         previous_anchor=previous_anchor,
         next_anchor=next_anchor,
     )
-    replacement = _format_replacement(
-        translated, trailing=_trailing_separator(found[-1].text)
-    )
-    return "".join(lines[: found[0].start]) + replacement + "".join(lines[found[-1].end :])
+    return _replace_resolved_blocks(text, found, translated)
 
 
 def _replace_resolved_blocks(
@@ -2649,15 +2965,17 @@ def _replace_resolved_blocks(
 ) -> str:
     """탐색된 블록 교체."""
 
-    lines = text.splitlines(keepends=True)
-    replacement = _format_replacement(
-        translated, trailing=_trailing_separator(found[-1].text)
-    )
-    return "".join(lines[: found[0].start]) + replacement + "".join(
-        lines[found[-1].end :]
+    return _spliced_text(
+        text, found[0].start, found[-1].end, _resolved_replacement(found, translated)
     )
 
 
+def _resolved_replacement(found: tuple[AnnotatedBlock, ...], translated: str) -> str:
+    """탐색된 블록 자리에 들어갈 번역 block과 기존 후행 구분 줄."""
+
+    return _format_replacement(translated, trailing=_trailing_separator(found[-1].text))
+
+
 def _replace_segment(text: str, segment: BlockChange, translated: str) -> str:
     """segment 교체."""
 
@@ -2690,7 +3008,7 @@ def _replace_segment(text: str, segment: BlockChange, translated: str) -> str:
 
 
 def _find_old_blocks(
-    blocks: list[AnnotatedBlock],
+    blocks: Sequence[AnnotatedBlock],
     segment: BlockChange,
     *,
     required: bool = True,
@@ -2711,7 +3029,7 @@ def _find_old_blocks(
 
 
 def _find_applied_new_blocks(
-    blocks: list[AnnotatedBlock], segment: BlockChange
+    blocks: Sequence[AnnotatedBlock], segment: BlockChange
 ) -> tuple[AnnotatedBlock, ...] | None:
     """이미 적용된 신규 블록 탐색."""
 
@@ -2745,7 +3063,6 @@ def _delete_block(
 ) -> str:
     """블록 삭제."""
 
-    lines = text.splitlines(keepends=True)
     found = _find_anchored_blocks(
         _blocks(text),
         anchors or (old_comment,),
@@ -2753,7 +3070,7 @@ def _delete_block(
         previous_anchor=previous_anchor,
         next_anchor=next_anchor,
     )
-    return "".join(lines[: found[0].start]) + "".join(lines[found[-1].end :])
+    return _delete_resolved_blocks(text, found)
 
 
 def _delete_resolved_blocks(
@@ -2761,8 +3078,7 @@ def _delete_resolved_blocks(
 ) -> str:
     """탐색된 블록 삭제."""
 
-    lines = text.splitlines(keepends=True)
-    return "".join(lines[: found[0].start]) + "".join(lines[found[-1].end :])
+    return _spliced_text(text, found[0].start, found[-1].end, "")
 
 
 def _insert_fenced_code_block(
@@ -2935,11 +3251,7 @@ def _insert_block(
         return existing_insert
     annotated_boundary = _annotated_insertion_boundary(blocks, segment)
     if annotated_boundary is not None:
-        return (
-            "".join(lines[:annotated_boundary])
-            + insertion
-            + "".join(lines[annotated_boundary:])
-        )
+        return _spliced_text(text, annotated_boundary, annotated_boundary, insertion)
     raw_insertion = _format_raw_insertion(translated, segment)
     raw_text = _insert_near_raw_context(lines, segment, raw_insertion)
     if raw_text is not None:
@@ -2966,7 +3278,7 @@ def _insert_block(
 def _insert_at_annotation_context(
     text: str,
     lines: list[str],
-    blocks: list[AnnotatedBlock],
+    blocks: Sequence[AnnotatedBlock],
     segment: BlockChange,
     translated: str,
     insertion: str,
@@ -2994,12 +3306,7 @@ def _insert_at_annotation_context(
         )
         if block:
             separator = "" if block.text.endswith("\n\n") else "\n"
-            return (
-                "".join(lines[: block.end])
-                + separator
-                + insertion
-                + "".join(lines[block.end :])
-            )
+            return _spliced_text(text, block.end, block.end, separator + insertion)
     if segment.after_context:
         block = _context_anchor_block(
             blocks,
@@ -3008,7 +3315,7 @@ def _insert_at_annotation_context(
             segment.old_next_anchor_ordinal,
         )
         if block:
-            return "".join(lines[: block.start]) + insertion + "".join(lines[block.start :])
+            return _spliced_text(text, block.start, block.start, insertion)
     if segment.after_context is None and segment.before_context:
         # 원문 끝 추가는 이전 문맥의 번역 여부와 관계없이 같은 경계 사용
         return text.rstrip("\n") + "\n\n" + _format_replacement(translated, trailing="\n")
@@ -3016,7 +3323,7 @@ def _insert_at_annotation_context(
 
 
 def _context_anchor_block(
-    blocks: list[AnnotatedBlock],
+    blocks: Sequence[AnnotatedBlock],
     context: str,
     neighbor_anchor: str | None,
     neighbor_ordinal: int | None,
@@ -3282,7 +3589,7 @@ def _replace_or_delete_named_anchor(
 
 def _anchor_occurrence_at_context(
     lines: list[str],
-    blocks: list[AnnotatedBlock],
+    blocks: Sequence[AnnotatedBlock],
     anchor_indexes: list[int],
     segment: BlockChange,
 ) -> bool | None:
@@ -3312,7 +3619,7 @@ def _anchor_occurrence_at_context(
 
 def _anchor_after_context_match(
     lines: list[str],
-    blocks: list[AnnotatedBlock],
+    blocks: Sequence[AnnotatedBlock],
     anchor_indexes: list[int],
     context: str | None,
 ) -> tuple[bool, bool]:
@@ -3344,7 +3651,7 @@ def _anchor_after_context_match(
 
 def _anchor_before_context_match(
     lines: list[str],
-    blocks: list[AnnotatedBlock],
+    blocks: Sequence[AnnotatedBlock],
     anchor_indexes: list[int],
     context: str | None,
 ) -> tuple[bool, bool]:
@@ -3681,7 +3988,7 @@ def _admonition_source_region(
 
 
 def _named_anchor_insertion_boundary(
-    blocks: list[AnnotatedBlock], segment: BlockChange
+    blocks: Sequence[AnnotatedBlock], segment: BlockChange
 ) -> int | None:
     """named anchor 주변의 유일한 삽입 경계."""
 
@@ -3717,7 +4024,7 @@ def _named_anchor_insertion_boundary(
 
 
 def _annotated_insertion_boundary(
-    blocks: list[AnnotatedBlock], segment: BlockChange
+    blocks: Sequence[AnnotatedBlock], segment: BlockChange
 ) -> int | None:
     """annotation 소유 block 사이의 유일한 삽입 경계."""
 
@@ -4853,7 +5160,7 @@ def _source_text_lines(segment: BlockChange) -> tuple[str, ...]:
 
 def _raw_context_bounds(
     lines: list[str],
-    blocks: list[AnnotatedBlock],
+    blocks: Sequence[AnnotatedBlock],
     segment: BlockChange,
     *,
     match_evidence: bool = True,
@@ -4967,7 +5274,7 @@ def _expand_end_to_code_fence(lines: list[str], end: int) -> int:
 
 def _before_context_boundaries(
     lines: list[str],
-    blocks: list[AnnotatedBlock],
+    blocks: Sequence[AnnotatedBlock],
     context: str,
     *,
     include_code: bool = False,
@@ -4988,7 +5295,7 @@ def _before_context_boundaries(
 
 def _after_context_boundaries(
     lines: list[str],
-    blocks: list[AnnotatedBlock],
+    blocks: Sequence[AnnotatedBlock],
     context: str,
     *,
     include_code: bool = False,
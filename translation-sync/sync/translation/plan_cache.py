@@ -0,0 +1,292 @@
+"""실행 간 재사용하는 PatchPlan 직렬화 저장소.
+
+계획은 정규화한 (이전 원문, 새 원문)만의 함수이고, 계획 상태는 여기에 기존 locale
+문서가 더해진 함수다. 두 결과를 각각 (원문 digest, 계획 형식 버전, 구현 digest)와
+(계획 digest, locale 문서 digest, 구현 digest)를 key로 SQLite에 보관해 재실행,
+``--doc`` 재현, 전체 재번역 강등이 ``hunks_between``과 block 확장을 다시 하지 않게 한다.
+
+저장 형식은 dataclass field 이름을 그대로 쓴 JSON이라 사람이 읽고 비교할 수 있다.
+복원할 수 없는 항목과 저장소 오류는 다시 계산하는 방향으로만 처리한다.
+"""
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import sqlite3
+import types
+import typing
+from collections.abc import Callable
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from ..runtime.state import implementation_digest
+from . import patch
+
+PLAN_CACHE_FILENAME = "patch-plans.sqlite3"
+PLAN_CACHE_SCHEMA_VERSION = 1
+# dataclass field 구성을 바꾸면 올린다. 구현 digest와 별도로 저장 형식 자체를 구분한다.
+PLAN_FORMAT_VERSION = 1
+
+
+def _sha256(text: str) -> str:
+    """UTF-8 텍스트의 SHA-256 hex digest."""
+
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _plain(value: Any) -> Any:
+    """dataclass·tuple 값을 JSON 값으로 변환."""
+
+    if dataclasses.is_dataclass(value):
+        return {
+            item.name: _plain(getattr(value, item.name))
+            for item in dataclasses.fields(value)
+        }
+    if isinstance(value, tuple):
+        return [_plain(item) for item in value]
+    return value
+
+
+@cache
+def _field_types(cls: type) -> dict[str, Any]:
+    """dataclass field 이름별 해석된 type hint."""
+
+    return typing.get_type_hints(cls)
+
+
+def _restore(hint: Any, value: Any) -> Any:
+    """type hint에 맞춰 JSON 값을 복원.
+
+    Raises:
+        ValueError: 값이 type hint와 맞지 않음.
+    """
+
+    origin = typing.get_origin(hint)
+    if origin in (types.UnionType, typing.Union):
+        options = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+        if value is None and len(options) < len(typing.get_args(hint)):
+            return None
+        if len(options) != 1:
+            raise ValueError(f"unsupported plan field type {hint!r}")
+        return _restore(options[0], value)
+    if origin is tuple:
+        item_type, ellipsis = typing.get_args(hint)
+        if ellipsis is not Ellipsis or not isinstance(value, list):
+            raise ValueError(f"expected list for {hint!r}")
+        return tuple(_restore(item_type, item) for item in value)
+    if dataclasses.is_dataclass(hint):
+        names = {item.name for item in dataclasses.fields(hint)}
+        if not isinstance(value, dict) or set(value) != names:
+            raise ValueError(f"fields do not match {hint.__name__}")
+        hints = _field_types(hint)
+        return hint(**{name: _restore(hints[name], value[name]) for name in names})
+    if hint is int and isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if hint in (str, bool) and type(value) is hint:
+        return value
+    raise ValueError(f"expected {hint!r}, got {type(value).__name__}")
+
+
+def encode_plan(plan: patch.PatchPlan) -> str:
+    """계획의 안정된 JSON 표현."""
+
+    return json.dumps(
+        {"format": PLAN_FORMAT_VERSION, "plan": _plain(plan)},
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+
+
+def plan_id(plan: patch.PatchPlan) -> str:
+    """계획 JSON 표현의 짧은 digest. span의 ``plan_id`` attribute로 쓴다."""
+
+    return _sha256(encode_plan(plan))[:16]
+
+
+def decode_plan(text: str) -> patch.PatchPlan:
+    """``encode_plan`` 결과에서 계획 복원.
+
+    Raises:
+        ValueError: 형식 버전이 다르거나 계획 구조가 맞지 않음.
+    """
+
+    document = json.loads(text)
+    if not isinstance(document, dict) or document.get("format") != PLAN_FORMAT_VERSION:
+        raise ValueError("unsupported plan format")
+    return _restore(patch.PatchPlan, document.get("plan"))
+
+
+class PatchPlanCache:
+    """PatchPlan과 계획 상태의 영속 memo."""
+
+    def __init__(
+        self,
+        path: Path | None,
+        *,
+        implementation: str | None = None,
+    ) -> None:
+        """저장소 열기.
+
+        Args:
+            path: SQLite 파일 경로. ``None``이면 현재 프로세스 안에서만 유지.
+            implementation: 계획 코드 digest. 생략하면 ``sync`` 패키지 digest.
+        """
+
+        self._implementation = implementation or implementation_digest()
+        self._plans: dict[str, patch.PatchPlan] = {}
+        self._states: dict[str, patch.PlanState] = {}
+        self._connection: sqlite3.Connection | None = None
+        self.hits = 0
+        self.misses = 0
+        if path is not None:
+            self._connection = self._open(path)
+
+    @staticmethod
+    def _open(path: Path) -> sqlite3.Connection | None:
+        """계획·상태 테이블을 준비한 연결, 실패하면 ``None``."""
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(path)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS plans ("
+                "key TEXT PRIMARY KEY, plan TEXT NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS states ("
+                "key TEXT PRIMARY KEY, state TEXT NOT NULL)"
+            )
+            connection.commit()
+        except (OSError, sqlite3.Error):
+            return None
+        return connection
+
+    def key(self, kind: str, *sources: str) -> str:
+        """계획 종류와 입력 원문, 형식·구현 버전을 결합한 key."""
+
+        return _sha256(
+            "\0".join(
+                (
+                    f"schema={PLAN_CACHE_SCHEMA_VERSION}",
+                    f"format={PLAN_FORMAT_VERSION}",
+                    f"implementation={self._implementation}",
+                    f"kind={kind}",
+                    *(f"source={_sha256(source)}" for source in sources),
+                )
+            )
+        )
+
+    def _select(self, table: str, column: str, key: str) -> str | None:
+        """테이블에 저장된 값, 없거나 저장소를 쓸 수 없으면 ``None``."""
+
+        if self._connection is None:
+            return None
+        try:
+            row = self._connection.execute(
+                f"SELECT {column} FROM {table} WHERE key = ?",
+                (key,),
+            ).fetchone()
+        except sqlite3.Error:
+            self._connection = None
+            return None
+        return None if row is None else row[0]
+
+    def _insert(self, table: str, column: str, key: str, value: str) -> None:
+        """테이블에 값 기록."""
+
+        if self._connection is None:
+            return
+        try:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {table} (key, {column}) VALUES (?, ?)",
+                (key, value),
+            )
+            self._connection.commit()
+        except sqlite3.Error:
+            self._connection = None
+
+    def lookup(self, key: str) -> patch.PatchPlan | None:
+        """저장된 계획, 없거나 복원할 수 없으면 ``None``."""
+
+        if key in self._plans:
+            return self._plans[key]
+        stored = self._select("plans", "plan", key)
+        if stored is None:
+            return None
+        try:
+            plan = decode_plan(stored)
+        except (TypeError, ValueError):
+            return None
+        self._plans[key] = plan
+        return plan
+
+    def store(self, key: str, plan: patch.PatchPlan) -> None:
+        """계획을 memo에 기록."""
+
+        self._plans[key] = plan
+        self._insert("plans", "plan", key, encode_plan(plan))
+
+    def plan(self, key: str, build: Callable[[], patch.PatchPlan]) -> patch.PatchPlan:
+        """memo된 계획 또는 새로 만들어 기록한 계획."""
+
+        cached = self.lookup(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        plan = build()
+        self.store(key, plan)
+        return plan
+
+    def state(
+        self,
+        plan: patch.PatchPlan,
+        existing: str | None,
+        compute: Callable[[], patch.PlanState],
+    ) -> patch.PlanState:
+        """계획과 기존 locale 문서에 대한 memo된 상태 또는 새 판정.
+
+        판정 실패(``PatchError``)는 기록하지 않고 그대로 전달한다.
+        """
+
+        key = _sha256(
+            "\0".join(
+                (
+                    f"schema={PLAN_CACHE_SCHEMA_VERSION}",
+                    f"implementation={self._implementation}",
+                    f"plan={_sha256(encode_plan(plan))}",
+                    "existing=absent" if existing is None else f"existing={_sha256(existing)}",
+                )
+            )
+        )
+        if key in self._states:
+            return self._states[key]
+        stored = self._select("states", "state", key)
+        try:
+            state = patch.PlanState(stored) if stored is not None else None
+        except ValueError:
+            state = None
+        if state is None:
+            state = compute()
+            self._insert("states", "state", key, state.value)
+        self._states[key] = state
+        return state
+
+    def close(self) -> None:
+        """저장소 연결 닫기."""
+
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+def open_plan_cache(state_dir: Path | None) -> PatchPlanCache | None:
+    """상태 디렉터리의 계획 저장소, 상태 디렉터리가 없으면 ``None``."""
+
+    if state_dir is None:
+        return None
+    return PatchPlanCache(state_dir / PLAN_CACHE_FILENAME)
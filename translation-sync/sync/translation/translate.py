@@ -6,18 +6,18 @@ provider: openai | cli.
 """
 from __future__ import annotations
 
+import hashlib
 import math
 import os
 import re
 import subprocess
 import tempfile
 import time
-from dataclasses import dataclass
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Callable
 
-import tiktoken
-
 from ..common.versions import validate_version_token
 from ..runtime.config import (
     Config,
@@ -26,9 +26,11 @@ from ..runtime.config import (
     PROVIDER_FRAMING_OVERHEAD_TOKENS,
     RequestBudget,
     cli_auth_environment,
+    openai_api_base_url,
     validate_cli_command,
 )
 from ..runtime.failure import IssueCode
+from ..runtime import profiling, spans
 from ..runtime.process import ProcessTreeError, run_process_tree
 from ..verification.response_contract import RESPONSE_CONTRACT_VERSION
 
@@ -38,6 +40,13 @@ MAX_CHUNK_LINES = 400
 MAX_ATTEMPTS = 5
 MAX_COMPLETED_RESPONSE_ATTEMPTS = 5
 RETRY_DELAY_SECONDS = 300
+# 묶음 요청에 넣을 수 있는 단일 요청의 최대 token 수.
+PACK_MAX_BLOCK_TOKENS = 400
+# 묶음 응답 token을 원문 요청 token의 배수로 어림한 값. 번역과 원문 주석을 함께 돌려준다.
+PACKED_OUTPUT_EXPANSION = 4
+_PACK_DELIMITER_RE = re.compile(
+    r"^=== translation-sync block (\d+) ===[ \t]*$", re.MULTILINE
+)
 _CLI_DISABLED_FEATURES = (
     "apps",
     "browser_use",
@@ -144,22 +153,57 @@ class RunDeadlineExceeded(IncompleteTranslation):
 
 @dataclass
 class ProviderAttemptCounter:
-    """단일 fixture 또는 문서에서 수행한 provider 시도 횟수."""
+    """단일 fixture 또는 문서에서 수행한 provider 시도 횟수와 사용량.
+
+    ``count_tokens``가 참일 때만 요청·응답 token을 tokenizer로 센다.
+    """
 
     transport: int = 0
     response_evaluation: int = 0
+    requests: int = 0
+    provider_seconds: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_input_tokens: int = 0
+    count_tokens: bool = False
 
     def record_transport(self) -> None:
         """물리 provider adapter 호출 횟수 증가."""
 
         self.transport += 1
 
+    def record_provider_time(self, seconds: float) -> None:
+        """provider adapter 호출 소요 시간 누적."""
+
+        self.provider_seconds += seconds
+
+    def record_request(self, input_tokens: int) -> None:
+        """논리 provider 요청 수와 입력 token 누적."""
+
+        self.requests += 1
+        self.input_tokens += input_tokens
+
+    def record_output(self, output_tokens: int) -> None:
+        """완료된 응답의 출력 token 누적."""
+
+        self.output_tokens += output_tokens
+
+    def record_cached_input(self, cached_tokens: int) -> None:
+        """provider가 보고한 prompt cache 적중 입력 token 누적."""
+
+        self.cached_input_tokens += cached_tokens
+
     def record_response_evaluation(self) -> None:
         """완료된 provider 응답의 계약 평가 횟수 증가."""
 
         self.response_evaluation += 1
 
 
+# provider 전송 중인 시도 기록기. adapter가 응답의 provider 보고 사용량을 더한다.
+_ACTIVE_ATTEMPT_COUNTER: ContextVar[ProviderAttemptCounter | None] = ContextVar(
+    "translation_attempt_counter", default=None
+)
+
 _FEEDBACK_COMMENT_BUDGET = 2000
 
 
@@ -257,9 +301,11 @@ class TranslationRequest:
     verification_feedback: str | None = None
     version: str | None = None
     response_contract_version: int = RESPONSE_CONTRACT_VERSION
+    similar_translations: tuple[str, ...] = ()
+    document_context: str | None = None
 
-    def render(self) -> str:
-        """source·기존 문맥·diff·feedback을 단일 provider 입력으로 렌더링."""
+    def sections(self) -> str:
+        """diff·source·기존 문맥·유사 번역·feedback section. 묶음 요청의 block 본문."""
 
         existing = (
             self.existing_translation
@@ -274,6 +320,17 @@ class TranslationRequest:
             if self.diff_text is not None
             else ""
         )
+        similar_section = (
+            _request_section(
+                "Similar Translated Blocks",
+                "\n".join(
+                    block if block.endswith("\n") else f"{block}\n"
+                    for block in self.similar_translations
+                ),
+            )
+            if self.similar_translations
+            else ""
+        )
         feedback_section = (
             _request_section(
                 "Previous Output Verification Failure",
@@ -283,16 +340,76 @@ class TranslationRequest:
             else ""
         )
         return (
-            "# Translation Sync Input\n\n"
             f"{diff_section}"
             f"{_request_section('English Source', self.source)}"
             f"{_request_section('Existing Translation Context', existing)}"
+            f"{similar_section}"
             f"{feedback_section}"
+        )
+
+    def render(self) -> str:
+        """문서 문맥 뒤에 block별 section을 이어 단일 provider 입력으로 렌더링.
+
+        머리말과 ``document_context``는 같은 문서의 block 요청끼리 byte 단위로 같아
+        instructions에 이어지는 provider prompt cache prefix가 된다.
+        """
+
+        return (
+            "# Translation Sync Input\n\n"
+            f"{_document_context_section(self.document_context)}"
+            f"{self.sections()}"
             "## Output\n\n"
             "Return only the translated Markdown block(s) for the English Source."
         )
 
 
+def _pack_delimiter(index: int) -> str:
+    """묶음 요청과 응답에서 ``index``번째 block을 여는 구분선."""
+
+    return f"=== translation-sync block {index} ==="
+
+
+def _document_context_section(context: str | None) -> str:
+    """같은 문서의 block 요청이 공유하는 문서 문맥 section. 없으면 빈 문자열."""
+
+    if context is None:
+        return ""
+    return _request_section("Document Headings", context)
+
+
+@dataclass(frozen=True)
+class PackedTranslationRequest:
+    """같은 문서의 작은 block 요청 여러 개를 구분선으로 묶은 단일 provider 요청."""
+
+    requests: tuple[TranslationRequest, ...]
+
+    def __post_init__(self) -> None:
+        """묶은 요청이 같은 문서 문맥을 공유하는지 검증."""
+
+        contexts = {request.document_context for request in self.requests}
+        if len(contexts) > 1:
+            raise ValueError("packed requests must share one document context")
+
+    def render(self) -> str:
+        """공유 문서 문맥 뒤에 block마다 구분선과 요청 section을 이어 붙인 provider 입력."""
+
+        blocks = "".join(
+            f"{_pack_delimiter(index)}\n\n{request.sections()}"
+            for index, request in enumerate(self.requests, start=1)
+        )
+        return (
+            "# Translation Sync Packed Input\n\n"
+            f"{_document_context_section(self.requests[0].document_context)}"
+            f"The {len(self.requests)} blocks below are independent translation "
+            "requests.\n\n"
+            f"{blocks}"
+            "## Output\n\n"
+            "For every block, in order, write its delimiter line exactly as given "
+            "and then only the translated Markdown block(s) for that block's "
+            "English Source."
+        )
+
+
 def _request_section(title: str, payload: str) -> str:
     """payload의 끝 줄바꿈을 보존한 provider 요청 section 생성."""
 
@@ -371,6 +488,138 @@ def effective_prompt(prompt: str) -> str:
     return prompt + _ANNOTATION_FORMAT
 
 
+def pack_limit(config: Config) -> int:
+    """설정된 묶음 요청당 최대 block 수. 2 미만이면 묶지 않는다."""
+
+    return int(config.get("TRANSLATION_PACK_MAX_BLOCKS", "0"))
+
+
+def _packable_tokens(request: TranslationRequest, budget: RequestBudget | None) -> int:
+    """묶음 판단용 요청 token 수. 예산이 없는 identity는 공백 단위 근사."""
+
+    if budget is None:
+        return len(request.render().split())
+    return _count_tokens(request.render(), budget.tokenizer_encoding)
+
+
+def pack_requests(
+    requests: list[TranslationRequest],
+    config: Config,
+    prompt: str,
+) -> list[list[int]]:
+    """연속한 작은 요청을 요청 예산 안에서 묶은 index 목록.
+
+    교정 지침이 있거나 구분선 문자열을 포함한 요청, ``PACK_MAX_BLOCK_TOKENS``보다
+    큰 요청은 묶지 않고 인접 묶음도 끊는다. 문서 문맥이 달라지는 곳에서도
+    묶음을 끊는다. 묶음 출력은 요청 token의
+    ``PACKED_OUTPUT_EXPANSION``배로 어림해 출력 예약량을 넘지 않게 하고, 입력은
+    단일 요청과 같은 예산 검증을 통과해야 한다. block이 하나뿐인 묶음은 반환하지
+    않는다.
+    """
+
+    limit = pack_limit(config)
+    if limit < 2:
+        return []
+    budget = config.request_budget()
+    system = effective_prompt(prompt)
+    groups: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+
+    def close() -> None:
+        """진행 중인 묶음 확정."""
+
+        if len(current) > 1:
+            groups.append(list(current))
+        current.clear()
+
+    for index, request in enumerate(requests):
+        tokens = _packable_tokens(request, budget)
+        if current and request.document_context != requests[current[0]].document_context:
+            close()
+            current_tokens = 0
+        if (
+            request.verification_feedback is not None
+            or _PACK_DELIMITER_RE.search(request.render())
+            or tokens > PACK_MAX_BLOCK_TOKENS
+        ):
+            close()
+            current_tokens = 0
+            continue
+        candidate = [*current, index]
+        fits = len(candidate) <= limit
+        if fits and budget is not None:
+            fits = (current_tokens + tokens) * PACKED_OUTPUT_EXPANSION <= (
+                budget.reserved_output_tokens
+            )
+            if fits:
+                packed = PackedTranslationRequest(
+                    tuple(requests[member] for member in candidate)
+                )
+                try:
+                    _validate_request_budget(system, packed.render(), config)
+                except UnsupportedOversizeBlock:
+                    fits = False
+        if not fits:
+            close()
+            current_tokens = 0
+        current.append(index)
+        current_tokens += tokens
+    close()
+    return groups
+
+
+def split_packed_response(text: str, count: int) -> list[str] | None:
+    """묶음 응답을 block별 응답으로 분리. 구분선 순서가 어긋나면 ``None``."""
+
+    matches = list(_PACK_DELIMITER_RE.finditer(text))
+    if [int(match.group(1)) for match in matches] != list(range(1, count + 1)):
+        return None
+    if text[: matches[0].start()].strip():
+        return None
+    ends = [match.start() for match in matches[1:]] + [len(text)]
+    return [
+        text[match.end() : end].strip("\r\n")
+        for match, end in zip(matches, ends, strict=True)
+    ]
+
+
+def translate_packed(
+    packed: PackedTranslationRequest,
+    config: Config,
+    prompt: str | None = None,
+    *,
+    deadline: float | None = None,
+    clock: Callable[[], float] = time.monotonic,
+    attempt_counter: ProviderAttemptCounter | None = None,
+) -> list[str] | None:
+    """묶음 요청을 한 번에 번역하고 block별 응답으로 분리.
+
+    live 응답의 끝 줄바꿈은 단일 요청처럼 제거된다. identity provider는 block마다
+    단일 요청과 같은 응답을 돌려준다. 구분선을 지키지 않은 응답은 ``None``이다.
+    """
+
+    for request in packed.requests:
+        _require_response_contract_version(request)
+    if config.provider == "identity":
+        return [translate_request(request, config) for request in packed.requests]
+    counter_arguments = (
+        {"attempt_counter": attempt_counter}
+        if attempt_counter is not None
+        else {}
+    )
+    response = translate_text(
+        packed.render(),
+        config,
+        prompt,
+        split=False,
+        deadline=deadline,
+        clock=clock,
+        **counter_arguments,
+    )
+    return split_packed_response(response, len(packed.requests))
+
+
 def split_chunks(content: str, max_lines: int = MAX_CHUNK_LINES) -> list[str]:
     """호출자가 제공한 atomic owner를 단일 provider 요청으로 보존.
 
@@ -415,8 +664,14 @@ def translate_text(
     chunks = split_chunks(content) if split else [content]
     for chunk in chunks:
         _validate_request_budget(system, chunk, config)
-    translated = [
-        _with_retries(
+    count_tokens = attempt_counter is not None and attempt_counter.count_tokens
+    translated: list[str] = []
+    for chunk in chunks:
+        if attempt_counter is not None:
+            attempt_counter.record_request(
+                _usage_tokens(system + chunk, budget) if count_tokens else 0
+            )
+        result = _with_retries(
             _translate_chunk,
             chunk,
             config,
@@ -425,8 +680,9 @@ def translate_text(
             clock=clock,
             attempt_counter=attempt_counter,
         )
-        for chunk in chunks
-    ]
+        if count_tokens:
+            attempt_counter.record_output(_usage_tokens(result, budget))
+        translated.append(result)
     if not split:
         return "".join(translated)
     return join_chunk_outputs(chunks, translated)
@@ -466,9 +722,20 @@ def _validate_request_budget(instructions: str, payload: str, config: Config) ->
     return input_tokens
 
 
+def _usage_tokens(text: str, budget: RequestBudget) -> int:
+    """계측용 token 수. tokenizer를 쓸 수 없으면 0."""
+
+    try:
+        return _count_tokens(text, budget.tokenizer_encoding)
+    except Exception:
+        return 0
+
+
 def _count_tokens(text: str, encoding_name: str) -> int:
     """지정 tokenizer encoding으로 text의 정확한 token 수 계산."""
 
+    import tiktoken
+
     return len(
         tiktoken.get_encoding(encoding_name).encode(
             text,
@@ -487,6 +754,38 @@ def _require_response_contract_version(request: TranslationRequest) -> None:
         )
 
 
+def _fit_similar_translations(
+    request: TranslationRequest,
+    instructions: str,
+    config: Config,
+) -> TranslationRequest:
+    """요청 예산 안에 들어가는 유사 번역 제안만 남긴 요청.
+
+    유사 번역은 선택 참고 문맥이므로 제안이 없는 요청을 먼저 예산에 맞춰 보고,
+    그 뒤 순서대로 제안을 더하며 예산을 넘기는 제안은 버린다. 제안 없이도 넘치는
+    요청은 제안을 모두 뺀 채 돌려주어 예산 검증이 원문 block 기준으로 실패하게 한다.
+    """
+
+    if not request.similar_translations or config.request_budget() is None:
+        return request
+    fitted = replace(request, similar_translations=())
+    try:
+        _validate_request_budget(instructions, fitted.render(), config)
+    except UnsupportedOversizeBlock:
+        return fitted
+    for block in request.similar_translations:
+        candidate = replace(
+            fitted,
+            similar_translations=(*fitted.similar_translations, block),
+        )
+        try:
+            _validate_request_budget(instructions, candidate.render(), config)
+        except UnsupportedOversizeBlock:
+            continue
+        fitted = candidate
+    return fitted
+
+
 def preflight_request(
     request: TranslationRequest,
     config: Config,
@@ -506,9 +805,38 @@ def preflight_request(
     if budget is None:
         return
     instructions = effective_prompt(prompt if prompt is not None else load_prompt())
+    request = _fit_similar_translations(request, instructions, config)
     _validate_request_budget(instructions, request.render(), config)
 
 
+def request_input_tokens(
+    request: TranslationRequest,
+    config: Config,
+    prompt: str | None = None,
+) -> int | None:
+    """provider 호출 없이 센 요청 지시문과 입력의 정확한 token 수.
+
+    요청 예산이 없는 설정에서는 tokenizer를 알 수 없으므로 ``None``.
+    예산 검증의 framing 여유분과 UTF-8 상한은 더하지 않는다.
+    """
+
+    budget = config.request_budget()
+    if budget is None:
+        return None
+    instructions = effective_prompt(prompt if prompt is not None else load_prompt())
+    request = _fit_similar_translations(request, instructions, config)
+    try:
+        return _count_tokens(
+            instructions, budget.tokenizer_encoding
+        ) + _count_tokens(request.render(), budget.tokenizer_encoding)
+    except Exception as exc:
+        raise ConfigError(
+            "TOKENIZER_METADATA_UNAVAILABLE: tokenizer could not be loaded "
+            f"{budget.tokenizer_encoding!r}",
+            IssueCode.TOKENIZER_METADATA_UNAVAILABLE,
+        ) from exc
+
+
 def join_chunk_outputs(source_chunks: list[str], translated_chunks: list[str]) -> str:
     """source별 줄바꿈 끝을 복원하며 번역 chunk 결합."""
 
@@ -553,6 +881,9 @@ def translate_request(
             raise ProviderRequestRejected(
                 "identity response could not be rendered canonically"
             ) from None
+    if request.similar_translations and config.provider in {"openai", "cli"}:
+        prompt = prompt if prompt is not None else load_prompt()
+        request = _fit_similar_translations(request, effective_prompt(prompt), config)
     counter_arguments = (
         {"attempt_counter": attempt_counter}
         if attempt_counter is not None
@@ -669,11 +1000,19 @@ def _transport_attempt(
         성공 응답과 재시도 가능한 마지막 오류.
     """
 
+    started = time.monotonic()
     try:
         if attempt_counter is not None:
             attempt_counter.record_transport()
-        result = func(chunk, config, prompt)
+        active = _ACTIVE_ATTEMPT_COUNTER.set(attempt_counter)
+        try:
+            with profiling.paused():
+                result = func(chunk, config, prompt)
+        finally:
+            _ACTIVE_ATTEMPT_COUNTER.reset(active)
     except Exception as exc:
+        if attempt_counter is not None:
+            attempt_counter.record_provider_time(time.monotonic() - started)
         if isinstance(exc, ProviderPartialResponse):
             raise
         if _is_retryable(exc):
@@ -682,6 +1021,8 @@ def _transport_attempt(
             CliProviderFailed if config.provider == "cli" else ProviderRequestRejected
         )
         raise error_type(_provider_error_message(exc)) from None
+    if attempt_counter is not None:
+        attempt_counter.record_provider_time(time.monotonic() - started)
     require_run_deadline(deadline, clock=clock)
     if result.strip():
         return result, None
@@ -701,21 +1042,50 @@ def _with_retries(
 ) -> str:
     """공유 기한과 transport 상한 안에서 provider 호출 재시도."""
 
-    last_error: BaseException | None = None
-    delay = RETRY_DELAY_SECONDS
-    request_timeout = _request_timeout_seconds(config)
-
-    for attempt in range(1, MAX_ATTEMPTS + 1):
-        _require_deadline_budget(deadline, request_timeout, clock())
-        result, last_error = _transport_attempt(
+    with spans.span("provider.request", provider=config.provider):
+        return _retried_provider_call(
             func,
             chunk,
             config,
             prompt,
-            deadline=deadline,
+            sleep=sleep,
             clock=clock,
+            deadline=deadline,
             attempt_counter=attempt_counter,
         )
+
+
+def _retried_provider_call(
+    func: Callable[[str, Config, str], str],
+    chunk: str,
+    config: Config,
+    prompt: str,
+    *,
+    sleep: Callable[[float], None],
+    clock: Callable[[], float],
+    deadline: float | None,
+    attempt_counter: ProviderAttemptCounter | None,
+) -> str:
+    """transport 시도를 상한까지 반복하고 마지막 오류를 안정된 예외로 변환."""
+
+    last_error: BaseException | None = None
+    delay = RETRY_DELAY_SECONDS
+    request_timeout = _request_timeout_seconds(config)
+
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        _require_deadline_budget(deadline, request_timeout, clock())
+        with spans.span("provider.attempt", attempt=attempt):
+            result, last_error = _transport_attempt(
+                func,
+                chunk,
+                config,
+                prompt,
+                deadline=deadline,
+                clock=clock,
+                attempt_counter=attempt_counter,
+            )
+            if last_error is not None:
+                spans.set_attribute("error.type", type(last_error).__name__)
         if result is not None:
             return result
         if attempt < MAX_ATTEMPTS:
@@ -908,7 +1278,7 @@ def _translate_responses_api(
 
     client = OpenAI(
         api_key=config.get("OPENAI_API_KEY"),
-        base_url=OPENAI_API_BASE_URL,
+        base_url=openai_api_base_url(config),
         organization="",
         project="",
         **client_runtime,
@@ -919,12 +1289,14 @@ def _translate_responses_api(
         input=chunk,
         reasoning={"effort": config.get("TRANSLATION_REASONING_EFFORT", "medium")},
         store=False,
+        prompt_cache_key=prompt_cache_key(prompt),
         **(
             {"max_output_tokens": budget.reserved_output_tokens}
             if budget is not None
             else {}
         ),
     )
+    _record_cached_input(response)
     if response.status != "completed":
         response_status = _known_provider_status(
             response.status,
@@ -937,6 +1309,24 @@ def _translate_responses_api(
     return response.output_text or ""
 
 
+def prompt_cache_key(prompt: str) -> str:
+    """같은 instructions를 쓰는 요청을 같은 provider prompt cache로 모으는 key."""
+
+    return "translation-sync-" + hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:32]
+
+
+def _record_cached_input(response: object) -> None:
+    """응답 usage의 prompt cache 적중 token을 전송 중인 시도 기록기에 더함."""
+
+    counter = _ACTIVE_ATTEMPT_COUNTER.get()
+    if counter is None:
+        return
+    details = getattr(getattr(response, "usage", None), "input_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None)
+    if isinstance(cached, int) and cached > 0:
+        counter.record_cached_input(cached)
+
+
 def _translate_openai(chunk: str, config: Config, prompt: str) -> str:
     """재시도 없는 OpenAI API adapter로 단일 요청 실행."""
 
@@ -0,0 +1,163 @@
+"""실행 간 재사용하는 응답 계약 판정 memo.
+
+같은 영어 owner 블록과 같은 provider 응답은 버전·실행이 달라도 같은 판정을
+받으므로, (원문 digest, 응답 digest, 판정 범위, 계약 버전, 구현 digest)를
+key로 위반 목록을 SQLite에 보관한다. 저장소 오류는 memo를 끄고 다시 계산하는
+방향으로만 처리해 판정을 느슨하게 만들지 않는다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from collections.abc import Callable
+from pathlib import Path
+
+from ..runtime.state import implementation_digest
+from .response_contract import RESPONSE_CONTRACT_VERSION
+
+MEMO_FILENAME = "verified-blocks.sqlite3"
+MEMO_SCHEMA_VERSION = 1
+
+
+def _sha256(text: str) -> str:
+    """UTF-8 텍스트의 SHA-256 hex digest."""
+
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class VerifiedBlockMemo:
+    """응답 계약 위반 목록의 영속 memo."""
+
+    def __init__(
+        self,
+        path: Path | None,
+        *,
+        implementation: str | None = None,
+    ) -> None:
+        """memo 저장소 열기.
+
+        Args:
+            path: SQLite 파일 경로. ``None``이면 현재 프로세스 안에서만 유지.
+            implementation: 판정 코드 digest. 생략하면 ``sync`` 패키지 digest.
+        """
+
+        self._implementation = implementation or implementation_digest()
+        self._entries: dict[str, list[str]] = {}
+        self._connection: sqlite3.Connection | None = None
+        self.hits = 0
+        self.misses = 0
+        if path is not None:
+            self._connection = self._open(path)
+
+    @staticmethod
+    def _open(path: Path) -> sqlite3.Connection | None:
+        """memo 테이블을 준비한 연결, 실패하면 ``None``."""
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(path)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS verdicts ("
+                "key TEXT PRIMARY KEY, issues TEXT NOT NULL)"
+            )
+            connection.commit()
+        except (OSError, sqlite3.Error):
+            return None
+        return connection
+
+    def key(self, translated: str, source: str, *, scope: str) -> str:
+        """판정 입력과 계약·구현 버전을 결합한 memo key."""
+
+        return _sha256(
+            "\0".join(
+                (
+                    f"schema={MEMO_SCHEMA_VERSION}",
+                    f"contract={RESPONSE_CONTRACT_VERSION}",
+                    f"implementation={self._implementation}",
+                    f"scope={scope}",
+                    f"source={_sha256(source)}",
+                    f"response={_sha256(translated)}",
+                )
+            )
+        )
+
+    def lookup(self, key: str) -> list[str] | None:
+        """저장된 위반 목록, 없으면 ``None``."""
+
+        if key in self._entries:
+            return list(self._entries[key])
+        if self._connection is None:
+            return None
+        try:
+            row = self._connection.execute(
+                "SELECT issues FROM verdicts WHERE key = ?",
+                (key,),
+            ).fetchone()
+        except sqlite3.Error:
+            self._connection = None
+            return None
+        if row is None:
+            return None
+        try:
+            issues = json.loads(row[0])
+        except ValueError:
+            return None
+        if not isinstance(issues, list) or not all(
+            isinstance(issue, str) for issue in issues
+        ):
+            return None
+        self._entries[key] = issues
+        return list(issues)
+
+    def store(self, key: str, issues: list[str]) -> None:
+        """위반 목록을 memo에 기록."""
+
+        self._entries[key] = list(issues)
+        if self._connection is None:
+            return
+        try:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO verdicts (key, issues) VALUES (?, ?)",
+                (key, json.dumps(issues, ensure_ascii=False)),
+            )
+            self._connection.commit()
+        except sqlite3.Error:
+            self._connection = None
+
+    def issues(
+        self,
+        translated: str,
+        source: str,
+        *,
+        scope: str,
+        compute: Callable[[], list[str]],
+    ) -> list[str]:
+        """memo된 위반 목록 또는 새로 계산해 기록한 위반 목록."""
+
+        key = self.key(translated, source, scope=scope)
+        cached = self.lookup(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        issues = compute()
+        self.store(key, issues)
+        return issues
+
+    def close(self) -> None:
+        """저장소 연결 닫기."""
+
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+def open_memo(state_dir: Path | None) -> VerifiedBlockMemo | None:
+    """상태 디렉터리의 memo, 상태 디렉터리가 없으면 ``None``."""
+
+    if state_dir is None:
+        return None
+    return VerifiedBlockMemo(state_dir / MEMO_FILENAME)
@@ -21,6 +21,7 @@ from ..common.markdown import (
 )
 from ..common.stale_links import StaleLinkRegistry
 from ..common.versions import validate_version_token
+from ..runtime import spans
 from . import response_contract
 from . import verify as legacy_verify
 from .structure import (
@@ -1292,6 +1293,7 @@ def _structure_comparison_text(source: str, text: str) -> str:
     return "".join(lines[closing + 1 :]).lstrip("\r\n")
 
 
+@spans.traced("verify.document")
 def verify_document(
     inputs: VerificationInput,
     *,
@@ -0,0 +1,146 @@
+"""응답 계약 언어 판정용 Unicode 문자 체계 범위표 생성.
+
+``unicode_scripts.py``는 이 모듈이 만든 산출물이며 직접 수정하지 않는다.
+Python의 ``unicodedata`` 버전이 바뀌면 다음 명령으로 다시 생성한다.
+
+    python -m sync.verification.generate_unicode_scripts
+"""
+from __future__ import annotations
+
+import sys
+import unicodedata
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+TARGET_UNICODE_VERSION = "15.1"
+OUTPUT_PATH = Path(__file__).with_name("unicode_scripts.py")
+
+# 실행 Python이 15.1 이후 Unicode를 싣더라도 판정 기준을 15.1 Letter로 고정.
+POST_UNICODE_15_1_LETTER_RANGES = (
+    (0x1C89, 0x1C8A),
+    (0xA7CB, 0xA7CD),
+    (0xA7DA, 0xA7DC),
+    (0x105C0, 0x105F3),
+    (0x10D4A, 0x10D65),
+    (0x10D6F, 0x10D85),
+    (0x10EC2, 0x10EC4),
+    (0x11380, 0x11389),
+    (0x1138B, 0x1138B),
+    (0x1138E, 0x1138E),
+    (0x11390, 0x113B5),
+    (0x113B7, 0x113B7),
+    (0x113D1, 0x113D1),
+    (0x113D3, 0x113D3),
+    (0x11BC0, 0x11BE0),
+    (0x13460, 0x143FA),
+    (0x16100, 0x1611D),
+    (0x16D40, 0x16D6C),
+    (0x18CFF, 0x18CFF),
+    (0x1E5D0, 0x1E5ED),
+    (0x1E5F0, 0x1E5F0),
+)
+_RANGES_PER_LINE = 4
+
+
+def is_unicode_15_1_letter(char: str) -> bool:
+    """문자가 Unicode 15.1의 Letter 범주인지 여부."""
+
+    if not unicodedata.category(char).startswith("L"):
+        return False
+    codepoint = ord(char)
+    return not any(
+        start <= codepoint <= end
+        for start, end in POST_UNICODE_15_1_LETTER_RANGES
+    )
+
+
+def is_hangul_letter(char: str) -> bool:
+    """한국어 목표 문자 체계에 속하는 Letter인지 여부."""
+
+    if not is_unicode_15_1_letter(char):
+        return False
+    return unicodedata.name(char, "").startswith(("HANGUL ", "HALFWIDTH HANGUL "))
+
+
+def is_japanese_letter(char: str) -> bool:
+    """일본어 목표 문자 체계(가나·한자)에 속하는 Letter인지 여부."""
+
+    if not is_unicode_15_1_letter(char):
+        return False
+    name = unicodedata.name(char, "")
+    return (
+        "HIRAGANA" in name
+        or "KATAKANA" in name
+        or name.startswith("CJK UNIFIED IDEOGRAPH-")
+        or name.startswith("CJK COMPATIBILITY IDEOGRAPH-")
+    )
+
+
+def codepoint_ranges(
+    predicate: Callable[[str], bool],
+) -> tuple[tuple[int, int], ...]:
+    """전체 code point 중 조건을 만족하는 연속 구간의 닫힌 범위 목록."""
+
+    def ranges() -> Iterator[tuple[int, int]]:
+        """조건을 만족하는 구간을 code point 순서로 생성."""
+
+        start: int | None = None
+        for codepoint in range(sys.maxunicode + 1):
+            if predicate(chr(codepoint)):
+                if start is None:
+                    start = codepoint
+            elif start is not None:
+                yield start, codepoint - 1
+                start = None
+        if start is not None:
+            yield start, sys.maxunicode
+
+    return tuple(ranges())
+
+
+def _render_ranges(name: str, ranges: tuple[tuple[int, int], ...]) -> str:
+    """범위 목록을 고정 폭 Python tuple 선언으로 렌더링."""
+
+    lines = [f"{name} = ("]
+    for index in range(0, len(ranges), _RANGES_PER_LINE):
+        chunk = ranges[index:index + _RANGES_PER_LINE]
+        lines.append(
+            "    "
+            + " ".join(f"(0x{start:05X}, 0x{end:05X})," for start, end in chunk)
+        )
+    lines.append(")")
+    return "\n".join(lines)
+
+
+def render_module() -> str:
+    """현재 ``unicodedata`` 기준 범위표 모듈 원문."""
+
+    tables = (
+        ("LETTER_RANGES", codepoint_ranges(is_unicode_15_1_letter)),
+        ("HANGUL_LETTER_RANGES", codepoint_ranges(is_hangul_letter)),
+        ("JAPANESE_LETTER_RANGES", codepoint_ranges(is_japanese_letter)),
+    )
+    header = (
+        '"""Unicode 15.1 Letter와 목표 문자 체계의 code point 범위표.\n'
+        "\n"
+        "``python -m sync.verification.generate_unicode_scripts``가 생성한 파일이며\n"
+        "직접 수정하지 않는다. 각 범위는 정렬된 닫힌 구간이다.\n"
+        '"""\n'
+        "\n"
+        f'TARGET_UNICODE_VERSION = "{TARGET_UNICODE_VERSION}"\n'
+        f'UNICODE_DATA_VERSION = "{unicodedata.unidata_version}"\n'
+    )
+    body = "\n\n".join(_render_ranges(name, ranges) for name, ranges in tables)
+    return f"{header}\n{body}\n"
+
+
+def main() -> int:
+    """범위표 모듈을 다시 생성해 기록."""
+
+    OUTPUT_PATH.write_text(render_module(), encoding="utf-8")
+    print(f"wrote {OUTPUT_PATH.name} (unicodedata {unicodedata.unidata_version})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -56,8 +56,13 @@ from ..common.markdown import (
 )
 from ..common.versions import validate_version_token
 from ..postprocessing.postprocess import replace_version
+from .unicode_scripts import (
+    HANGUL_LETTER_RANGES,
+    JAPANESE_LETTER_RANGES,
+    LETTER_RANGES,
+)
 
-RESPONSE_CONTRACT_VERSION = 1
+RESPONSE_CONTRACT_VERSION = 2
 
 _UNORDERED_LIST_RE = re.compile(r"^([ \t]*)([-*+])[ \t]+(\S.*)$")
 _ORDERED_LIST_RE = re.compile(r"^([ \t]*)(\d+)([.)])[ \t]+(\S.*)$")
@@ -69,29 +74,6 @@ _ADMONITION_MARKER_RE = re.compile(
 )
 _TARGET_LOCALES = frozenset(("ko", "ja"))
 # Python 3.14의 Unicode 16.0 대신 계약 버전 1의 문자 범위를 Unicode 15.1로 고정
-_POST_UNICODE_15_1_LETTER_RANGES = (
-    (0x1C89, 0x1C8A),
-    (0xA7CB, 0xA7CD),
-    (0xA7DA, 0xA7DC),
-    (0x105C0, 0x105F3),
-    (0x10D4A, 0x10D65),
-    (0x10D6F, 0x10D85),
-    (0x10EC2, 0x10EC4),
-    (0x11380, 0x11389),
-    (0x1138B, 0x1138B),
-    (0x1138E, 0x1138E),
-    (0x11390, 0x113B5),
-    (0x113B7, 0x113B7),
-    (0x113D1, 0x113D1),
-    (0x113D3, 0x113D3),
-    (0x11BC0, 0x11BE0),
-    (0x13460, 0x143FA),
-    (0x16100, 0x1611D),
-    (0x16D40, 0x16D6C),
-    (0x18CFF, 0x18CFF),
-    (0x1E5D0, 0x1E5ED),
-    (0x1E5F0, 0x1E5F0),
-)
 _DISPLAY_ATTRIBUTES = frozenset(
     ("alt", "placeholder", "aria-label", "aria-description")
 )
@@ -2491,6 +2473,35 @@ def _normalized_language_prose(text: str) -> str:
     ).strip()
 
 
+def _range_bounds(
+    ranges: tuple[tuple[int, int], ...],
+) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """정렬된 닫힌 구간표를 ``bisect``용 시작·끝 배열로 분리."""
+
+    return (
+        tuple(start for start, _end in ranges),
+        tuple(end for _start, end in ranges),
+    )
+
+
+_LETTER_BOUNDS = _range_bounds(LETTER_RANGES)
+_TARGET_SCRIPT_BOUNDS = {
+    "ko": _range_bounds(HANGUL_LETTER_RANGES),
+    "ja": _range_bounds(JAPANESE_LETTER_RANGES),
+}
+
+
+def _in_ranges(
+    codepoint: int,
+    bounds: tuple[tuple[int, ...], tuple[int, ...]],
+) -> bool:
+    """code point가 생성된 범위표의 한 구간에 속하는지 여부."""
+
+    starts, ends = bounds
+    index = bisect_right(starts, codepoint) - 1
+    return index >= 0 and codepoint <= ends[index]
+
+
 def _unicode_letter_count(text: str) -> int:
     """NFC 정규화 후 Unicode 15.1 Letter code point 수."""
 
@@ -2503,34 +2514,19 @@ def _unicode_letter_count(text: str) -> int:
 def _is_unicode_15_1_letter(char: str) -> bool:
     """문자가 Unicode 15.1의 Letter 범주인지 여부."""
 
-    if not unicodedata.category(char).startswith("L"):
-        return False
-    codepoint = ord(char)
-    return not any(
-        start <= codepoint <= end
-        for start, end in _POST_UNICODE_15_1_LETTER_RANGES
-    )
+    if char.isascii():
+        return char.isalpha()
+    return _in_ranges(ord(char), _LETTER_BOUNDS)
 
 
 def _target_script_count(text: str, locale: str) -> int:
     """로캘에 해당하는 문자 체계의 code point 수."""
 
-    def belongs(char: str) -> bool:
-        """문자가 현재 로캘의 허용 문자 범위에 속하는지 여부."""
-
-        if not _is_unicode_15_1_letter(char):
-            return False
-        name = unicodedata.name(char, "")
-        if locale == "ko":
-            return name.startswith(("HANGUL ", "HALFWIDTH HANGUL "))
-        return (
-            "HIRAGANA" in name
-            or "KATAKANA" in name
-            or name.startswith("CJK UNIFIED IDEOGRAPH-")
-            or name.startswith("CJK COMPATIBILITY IDEOGRAPH-")
-        )
-
-    return sum(belongs(char) for char in text)
+    bounds = _TARGET_SCRIPT_BOUNDS["ko" if locale == "ko" else "ja"]
+    return sum(
+        not char.isascii() and _in_ranges(ord(char), bounds)
+        for char in text
+    )
 
 
 def _inline_markup_is_subset(
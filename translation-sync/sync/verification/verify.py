@@ -45,9 +45,9 @@ from ..common.markdown import (
     strip_title_attr_line,
 )
 from ..common.stale_links import (
-    DEFAULT_STALE_LINK_REGISTRY,
     StaleLinkRegistry,
     canonical_stale_link_target,
+    default_stale_link_registry,
 )
 from ..postprocessing.postprocess import admonition_types, img_self_closing
 from .response_contract import (
@@ -205,7 +205,7 @@ def _link_targets(
     text: str,
     version: str | None = None,
     *,
-    registry: StaleLinkRegistry = DEFAULT_STALE_LINK_REGISTRY,
+    registry: StaleLinkRegistry,
 ) -> Counter[str]:
     """정규화된 Markdown 링크 target 출현 횟수 수집."""
 
@@ -225,7 +225,7 @@ def _link_labels(
     text: str,
     version: str | None = None,
     *,
-    registry: StaleLinkRegistry = DEFAULT_STALE_LINK_REGISTRY,
+    registry: StaleLinkRegistry,
 ) -> list[str]:
     """정렬된 multiset 순서의 Markdown 링크 label 수집."""
 
@@ -253,7 +253,7 @@ def _link_pairs(
     text: str,
     version: str | None = None,
     *,
-    registry: StaleLinkRegistry = DEFAULT_STALE_LINK_REGISTRY,
+    registry: StaleLinkRegistry,
 ) -> tuple[tuple[str, tuple[str, ...]], ...]:
     """label별 target 순서를 보존한 Markdown 링크 쌍 서명 수집.
 
@@ -298,7 +298,7 @@ def _link_titles(
     text: str,
     version: str | None = None,
     *,
-    registry: StaleLinkRegistry = DEFAULT_STALE_LINK_REGISTRY,
+    registry: StaleLinkRegistry,
 ) -> list[tuple[str, str, str]]:
     """정렬된 multiset 순서의 Markdown 링크 title 서명 수집.
 
@@ -328,7 +328,7 @@ def _image_signatures(
     text: str,
     version: str | None = None,
     *,
-    registry: StaleLinkRegistry = DEFAULT_STALE_LINK_REGISTRY,
+    registry: StaleLinkRegistry,
 ) -> list[tuple[str, str]]:
     """Markdown 이미지의 정규화된 target·title 서명 수집."""
 
@@ -351,7 +351,7 @@ def _reference_definition_signatures(
     text: str,
     version: str | None = None,
     *,
-    registry: StaleLinkRegistry = DEFAULT_STALE_LINK_REGISTRY,
+    registry: StaleLinkRegistry,
 ) -> tuple[
     tuple[str | None, ...],
     tuple[str, ...],
@@ -386,7 +386,7 @@ def _normalize_link_target(
     target: str,
     version: str | None = None,
     *,
-    registry: StaleLinkRegistry = DEFAULT_STALE_LINK_REGISTRY,
+    registry: StaleLinkRegistry,
 ) -> str | None:
     """문서 버전과 stale-link 규칙을 적용해 링크 target 정규화."""
 
@@ -449,7 +449,7 @@ def _comparable_link_target(
     target: str,
     version: str | None = None,
     *,
-    registry: StaleLinkRegistry = DEFAULT_STALE_LINK_REGISTRY,
+    registry: StaleLinkRegistry,
 ) -> str | None:
     """폐기 규칙을 포함해 비교 가능한 링크 target 반환."""
 
@@ -1045,9 +1045,11 @@ def _structural_line_matches(expected: str, actual: str) -> bool:
     if expected_normalized.startswith("|"):
         return _table_line_signature(expected) == _table_line_signature(actual)
     if expected_normalized.startswith(("- [", "* [")):
+        registry = default_stale_link_registry()
         return (
             actual_normalized.startswith(expected_normalized[:2])
-            and _link_pairs(expected) == _link_pairs(actual)
+            and _link_pairs(expected, registry=registry)
+            == _link_pairs(actual, registry=registry)
         )
     return bool(
         (
@@ -1852,7 +1854,7 @@ def verify(
     *,
     version: str | None = None,
     allow_source_echo: bool = False,
-    registry: StaleLinkRegistry = DEFAULT_STALE_LINK_REGISTRY,
+    registry: StaleLinkRegistry | None = None,
 ) -> list[str]:
     """Locale 문서의 잔존 패턴과 원문 구조 보존 검증.
 
@@ -1866,6 +1868,10 @@ def verify(
     Returns:
         발견 순서의 위반 label. 빈 목록이면 통과.
     """
+
+    if registry is None:
+        registry = default_stale_link_registry()
+
     issues = _basic_issues(text, source)
     if source is None:
         return issues
@@ -0,0 +1,142 @@
+"""블록 서명 정렬 엔진의 opcode 형식과 기준 구현 동등성 검증."""
+
+import random
+import unittest
+from unittest.mock import patch
+
+from sync import annotate
+from sync.annotation import alignment
+
+
+def _lcs_length(a: list[int], b: list[int]) -> int:
+    """동적 계획법으로 구한 최장 공통 부분열 길이."""
+
+    previous = [0] * (len(b) + 1)
+    for x in a:
+        current = [0]
+        for j, y in enumerate(b):
+            current.append(previous[j] + 1 if x == y else max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
+
+
+class AlignmentEngineTests(unittest.TestCase):
+    """patience·Myers 엔진과 SequenceMatcher 기준 구현 비교 테스트 모음."""
+
+    def assertValidOpcodes(self, opcodes, a, b) -> int:
+        """opcode가 양쪽을 빈틈없이 덮고 equal 구간이 실제로 같은지 확인 후 일치 수 반환."""
+
+        i = j = matched = 0
+        for op, i1, i2, j1, j2 in opcodes:
+            self.assertEqual((i1, j1), (i, j))
+            if op == "equal":
+                self.assertEqual(a[i1:i2], b[j1:j2])
+                matched += i2 - i1
+            i, j = i2, j2
+        self.assertEqual((i, j), (len(a), len(b)))
+        return matched
+
+    def test_interned_ids_are_shared_between_sequences(self):
+        """같은 서명은 양쪽에서 같은 정수 ID로 변환."""
+
+        a, b = alignment.intern_signatures(
+            [("text", "para"), ("code", "x"), ("text", "para")],
+            [("code", "x"), ("heading", 2)],
+        )
+
+        self.assertEqual(a, [0, 1, 0])
+        self.assertEqual(b, [1, 2])
+
+    def test_patience_matches_sequence_matcher_on_parallel_edits(self):
+        """유일 앵커 사이의 삭제·삽입·치환은 SequenceMatcher와 같은 opcode 생성."""
+
+        cases = [
+            ([], []),
+            ([1, 2, 3], [1, 2, 3]),
+            ([1, 2, 3, 4], [1, 3, 4]),
+            ([1, 2, 3], [1, 2, 5, 3]),
+            ([1, 2, 3, 4], [1, 5, 3, 4]),
+            ([1, 0, 2, 0, 3], [1, 0, 2, 3]),
+            ([7, 0, 0, 8, 0, 9], [7, 0, 0, 8, 6, 0, 9]),
+            ([1, 2], [3, 4]),
+        ]
+        for a, b in cases:
+            with self.subTest(a=a, b=b):
+                self.assertEqual(
+                    alignment.patience_opcodes(a, b),
+                    alignment.sequence_matcher_opcodes(a, b),
+                )
+
+    def test_engines_produce_valid_opcodes_and_myers_gaps_are_minimal(self):
+        """반복 서명이 많은 무작위 입력에서 opcode가 유효하고 Myers 구간이 최장 공통 부분열 보장."""
+
+        rng = random.Random(0)
+        for _ in range(300):
+            alphabet = rng.randint(1, 5)
+            a = [rng.randrange(alphabet) for _ in range(rng.randint(0, 20))]
+            b = [rng.randrange(alphabet + 1) for _ in range(rng.randint(0, 20))]
+            blocks: list[tuple[int, int, int]] = []
+            alignment._myers_blocks(a, b, 0, len(a), 0, len(b), blocks)
+            myers = alignment._opcodes(sorted(blocks), len(a), len(b))
+
+            self.assertEqual(self.assertValidOpcodes(myers, a, b), _lcs_length(a, b))
+            self.assertValidOpcodes(alignment.patience_opcodes(a, b), a, b)
+
+    def test_auto_engine_switches_to_patience_above_cell_limit(self):
+        """서명 쌍 수 상한 이하에서는 SequenceMatcher, 초과하면 patience 결과 사용."""
+
+        a = [2, 2, 2]
+        b = [0, 1, 2]
+
+        self.assertNotEqual(
+            alignment.sequence_matcher_opcodes(a, b),
+            alignment.patience_opcodes(a, b),
+        )
+        self.assertEqual(
+            alignment.auto_opcodes(a, b),
+            alignment.sequence_matcher_opcodes(a, b),
+        )
+        with patch.object(alignment, "SEQUENCE_MATCHER_MAX_CELLS", 8):
+            self.assertEqual(
+                alignment.auto_opcodes(a, b),
+                alignment.patience_opcodes(a, b),
+            )
+
+    def test_annotate_is_identical_across_engines_for_parallel_documents(self):
+        """영어 블록 누락 drift가 있는 문서도 두 엔진의 병기 결과와 drift가 같음."""
+
+        english = (
+            "# Title\n\n"
+            "Intro paragraph.\n\n"
+            "```php\nreturn 1;\n```\n\n"
+            "## Added\n\n"
+            "New paragraph.\n\n"
+            "```php\nreturn 1;\n```\n\n"
+            "Closing paragraph.\n"
+        )
+        korean = (
+            "# 제목\n\n"
+            "소개 문단입니다.\n\n"
+            "```php\nreturn 1;\n```\n\n"
+            "```php\nreturn 1;\n```\n\n"
+            "마무리 문단입니다.\n"
+        )
+
+        results = [
+            annotate.annotate(english, korean, "13.x", alignment_engine=engine)
+            for engine in (
+                alignment.sequence_matcher_opcodes,
+                alignment.patience_opcodes,
+            )
+        ]
+
+        self.assertEqual(results[0][0], results[1][0])
+        self.assertEqual(
+            [(drift.op, drift.en_lines) for drift in results[0][1]],
+            [(drift.op, drift.en_lines) for drift in results[1][1]],
+        )
+        self.assertEqual([drift.op for drift in results[0][1]], ["delete"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@ import io
 import tempfile
 import unittest
 from collections import Counter
-from contextlib import redirect_stderr
+from contextlib import redirect_stderr, redirect_stdout
 from unittest.mock import patch
 
 import annotate_cli
@@ -354,6 +354,69 @@ class AnnotateCliTests(unittest.TestCase):
         self.assertEqual(exit_code, 2)
         self.assertIn("invalid document path", stderr.getvalue())
 
+    def test_bulk_mode_summarizes_and_writes_only_clean_documents(self):
+        """일괄 모드가 통과 문서만 모아 기록하고 집계와 재번역 필요 문서를 출력하는지 검증."""
+
+        stdout = io.StringIO()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = annotate_cli.Path(tmp)
+            en_root = root / "i18n/en/docusaurus-plugin-content-docs/version-12.x"
+            ko_root = root / "versioned_docs/version-12.x"
+            en_root.mkdir(parents=True)
+            ko_root.mkdir(parents=True)
+            (root / "versions.json").write_text('["master", "12.x"]\n', encoding="utf-8")
+            (en_root / "clean.md").write_text("# Clean\n", encoding="utf-8")
+            (ko_root / "clean.md").write_text("# Clean\n", encoding="utf-8")
+            (en_root / "drift.md").write_text(
+                "# Drift\n\nAdded paragraph.\n",
+                encoding="utf-8",
+            )
+            (ko_root / "drift.md").write_text("# Drift\n", encoding="utf-8")
+            (en_root / "untranslated.md").write_text("# Missing\n", encoding="utf-8")
+
+            with redirect_stdout(stdout), patch.object(
+                annotate_cli,
+                "REPO",
+                root,
+            ), patch.object(
+                annotate_cli.sys,
+                "argv",
+                ["annotate_cli.py", "--all-versions", "--write", "--jobs", "1"],
+            ):
+                exit_code = annotate_cli.main()
+
+            self.assertEqual(exit_code, 1)
+            self.assertEqual(
+                (ko_root / "clean.md").read_text(encoding="utf-8"),
+                "<!-- # Clean -->\n# Clean\n",
+            )
+            self.assertEqual(
+                (ko_root / "drift.md").read_text(encoding="utf-8"),
+                "# Drift\n",
+            )
+        output = stdout.getvalue()
+        self.assertIn("NEEDS-FIX: 12.x/drift.md", output)
+        self.assertIn(
+            "documents=2 clean=1 needs-fix=1 errors=0 written=1",
+            output,
+        )
+
+    def test_bulk_mode_requires_a_document_selection(self):
+        """일괄 모드에서 문서 범위를 지정하지 않으면 사용법 오류를 반환하는지 검증."""
+
+        stderr = io.StringIO()
+
+        with redirect_stderr(stderr), patch.object(
+            annotate_cli.sys,
+            "argv",
+            ["annotate_cli.py", "--version", "12.x", "--write"],
+        ):
+            exit_code = annotate_cli.main()
+
+        self.assertEqual(exit_code, 2)
+        self.assertIn("--all-versions", stderr.getvalue())
+
 
 class AnnotateTests(unittest.TestCase):
     """annotate 동작과 경계 조건 테스트 모음."""
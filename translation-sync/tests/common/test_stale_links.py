@@ -11,7 +11,11 @@ from urllib.parse import urlsplit
 from sync.common.markdown import markdown_links
 from sync.common.stale_links import (
     DEFAULT_STALE_LINK_REGISTRY,
+    StaleLinkRegistry,
     StaleLinkRegistryError,
+    StaleLinkRule,
+    _is_supported_target,
+    _matches_suffix_rule,
     canonical_stale_link_target,
     load_stale_link_registry,
 )
@@ -47,6 +51,28 @@ def _load_english_documents() -> dict[str, dict[str, str]]:
     }
 
 
+def _linear_matching_rule(
+    registry: StaleLinkRegistry,
+    target: str,
+    version: str | None,
+) -> StaleLinkRule | None:
+    """색인 도입 전 전체 규칙 선형 탐색 기준 구현."""
+
+    if not _is_supported_target(target):
+        return None
+    suffix_matches: list[StaleLinkRule] = []
+    for rule in registry.rules:
+        if rule.version != (version or "master"):
+            continue
+        if rule.target is None and target == rule.source:
+            return rule
+        if _matches_suffix_rule(rule, target):
+            suffix_matches.append(rule)
+    if not suffix_matches:
+        return None
+    return max(suffix_matches, key=lambda rule: len(rule.source.encode("utf-8")))
+
+
 def _target_resolves(
     target: str,
     version: str,
@@ -130,6 +156,58 @@ class StaleLinkRegistryTests(unittest.TestCase):
             "https://laravel.com/docs/10.x/migrations#generating-migrations",
         )
 
+    def test_indexed_lookup_matches_linear_scan(self):
+        """버전 색인과 접미사 trie 조회가 선형 탐색과 같은 규칙을 고르는지 검증."""
+
+        rules: list[StaleLinkRule] = []
+        for version in ("10.x", "master"):
+            for index in range(200):
+                page = f"/docs/{version}/page{index}"
+                rules.extend(
+                    StaleLinkRule(version, source, target, mode)
+                    for source, target, mode in (
+                        (page, None, "bare-inline-code"),
+                        (f"page{index}#old", f"page{index}#new", None),
+                        (f"#anchor{index}", f"#renamed{index}", None),
+                        (f"ge{index}#old", "wrong", None),
+                        (f"{page}#old", "/docs/x", None),
+                        (f"세션{index}", f"세션-{index}", None),
+                    )
+                )
+        registry = StaleLinkRegistry(b"", "", tuple(rules))
+        targets = [
+            target
+            for index in (0, 7, 199, 200)
+            for version in ("10.x", "master")
+            for target in (
+                f"/docs/{version}/page{index}",
+                f"/docs/{version}/page{index}#old",
+                f"/docs/{version}/subpage{index}#old",
+                f"page{index}#old",
+                f"https://laravel.com/docs/{version}/page{index}#old",
+                f"/docs/{version}/page{index}#anchor{index}",
+                f"/docs/{version}/세션{index}",
+                f"/docs/{version}/x세션{index}",
+                f"//example.com/page{index}#old",
+            )
+        ]
+
+        for version in ("10.x", "master", None, "11.x"):
+            for target in targets:
+                with self.subTest(version=version, target=target):
+                    self.assertEqual(
+                        registry.matching_rule(target, version),
+                        _linear_matching_rule(registry, target, version),
+                    )
+        for target in targets:
+            with self.subTest(registry="default", target=target):
+                self.assertEqual(
+                    DEFAULT_STALE_LINK_REGISTRY.matching_rule(target, "10.x"),
+                    _linear_matching_rule(
+                        DEFAULT_STALE_LINK_REGISTRY, target, "10.x"
+                    ),
+                )
+
     def test_registry_covers_only_current_broken_internal_links(self):
         """registry가 현재 영어 원문의 깨진 내부 링크만 포함하고 교체 대상은 유효하며 모든 규칙이 사용되는지 검증."""
 
@@ -10,6 +10,7 @@ from unittest.mock import call, patch
 
 import main
 from sync import config, diff, translate, verify
+from sync.runtime import trace as run_trace
 
 
 class MainPipelineTests(unittest.TestCase):
@@ -423,6 +424,70 @@ class MainPipelineTests(unittest.TestCase):
             self.assertFalse((root / "versioned_docs").exists())
             self.assertFalse((root / "i18n/ja").exists())
 
+    def test_identical_blocks_across_versions_are_translated_once(self):
+        """버전 간 같은 provider 요청을 한 번만 번역하고 각 버전에 기록하는지 검증."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            changes = []
+            for version in ("13.x", "12.x"):
+                source = (
+                    root
+                    / f"i18n/en/docusaurus-plugin-content-docs/version-{version}"
+                    / "example.md"
+                )
+                source.parent.mkdir(parents=True)
+                source.write_text("Shared paragraph text.\n", encoding="utf-8")
+                changes.append(
+                    diff.SourceChange(
+                        path=(
+                            "i18n/en/docusaurus-plugin-content-docs/"
+                            f"version-{version}/example.md"
+                        ),
+                        status="A",
+                    )
+                )
+            cfg = config.Config(provider="cli", values={"TRANSLATION_PROVIDER": "cli"})
+
+            with redirect_stderr(io.StringIO()) as stderr, patch.object(
+                main, "REPO_ROOT", root
+            ), patch.object(main, "_SHARED_TRANSLATIONS", None), patch.object(
+                main.translate,
+                "translate_request",
+                return_value="<!-- Shared paragraph text. -->\n공유 문단입니다.",
+            ) as request_mock, patch.object(
+                main.response_contract,
+                "verify",
+                return_value=[],
+            ), patch.object(main.verify, "verify", return_value=[]):
+                prepared, issues = main._preflight_all_translation_targets(
+                    changes,
+                    cfg,
+                    {"ko": "ko", "ja": "ja"},
+                )
+                results = [
+                    main._translate_one(
+                        change,
+                        cfg,
+                        "ko",
+                        main._ko_output(change),
+                        locale="ko",
+                        prepared_target=prepared[(change.path, "ko")],
+                    )
+                    for change in changes
+                ]
+                reused = main._SHARED_TRANSLATIONS.reused
+
+            self.assertEqual(issues, [])
+            self.assertEqual(results, [[], []])
+            self.assertEqual(request_mock.call_count, 1)
+            self.assertEqual(reused, 1)
+            self.assertIn("reusing 2 provider request(s)", stderr.getvalue())
+            self.assertEqual(
+                (root / "versioned_docs/version-13.x/example.md").read_bytes(),
+                (root / "versioned_docs/version-12.x/example.md").read_bytes(),
+            )
+
     def test_request_time_config_error_is_reported_without_traceback(self):
         """요청 시점 설정 오류를 트레이스백 없이 보고하는지 검증."""
 
@@ -551,6 +616,75 @@ class MainPipelineTests(unittest.TestCase):
             self.assertIn("Second source paragraph.", requests[1])
             self.assertNotIn("description: Create plan fixture.", "\n".join(requests))
 
+    def test_added_document_packs_small_blocks_and_falls_back_per_block(self):
+        """작은 block을 한 번에 묶어 번역하고 계약 실패 block만 개별 요청하는지 검증."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            source_path = (
+                root
+                / "i18n/en/docusaurus-plugin-content-docs/version-12.x/example.md"
+            )
+            source_path.parent.mkdir(parents=True)
+            source_path.write_text(
+                "# Example\n\n"
+                "First source paragraph.\n\n"
+                "Second source paragraph.\n",
+                encoding="utf-8",
+            )
+            dest = root / "versioned_docs/version-12.x/example.md"
+            change = diff.SourceChange(
+                path="i18n/en/docusaurus-plugin-content-docs/version-12.x/example.md",
+                status="A",
+            )
+            cfg = config.Config(
+                provider="cli",
+                values={
+                    "TRANSLATION_PROVIDER": "cli",
+                    "TRANSLATION_PACK_MAX_BLOCKS": "8",
+                },
+            )
+
+            with patch.object(main, "REPO_ROOT", root), patch.object(
+                main.translate,
+                "translate_packed",
+                return_value=[
+                    "<!-- First source paragraph. -->\n첫 번째 번역 문단.",
+                    "BROKEN",
+                ],
+            ) as packed_mock, patch.object(
+                main.translate,
+                "translate_request",
+                return_value="<!-- Second source paragraph. -->\n두 번째 번역 문단.",
+            ) as request_mock, patch.object(
+                main.response_contract,
+                "verify",
+                side_effect=lambda translated, *_args, **_kwargs: (
+                    ["provider original comment mismatch"]
+                    if "BROKEN" in translated
+                    else []
+                ),
+            ), patch.object(main.verify, "verify", return_value=[]):
+                issues = main._translate_added_document(change, cfg, "prompt", dest)
+
+            self.assertEqual(issues, [])
+            self.assertEqual(
+                dest.read_text(encoding="utf-8"),
+                "<!-- # Example -->\n"
+                "# Example\n\n"
+                "<!-- First source paragraph. -->\n"
+                "첫 번째 번역 문단.\n\n"
+                "<!-- Second source paragraph. -->\n"
+                "두 번째 번역 문단.\n",
+            )
+            packed = packed_mock.call_args.args[0]
+            self.assertEqual(len(packed.requests), 2)
+            self.assertEqual(request_mock.call_count, 1)
+            self.assertIn(
+                "Second source paragraph.", request_mock.call_args.args[0].source
+            )
+            self.assertEqual(main._PACKED_RESPONSES, {})
+
     def test_added_document_rejects_invalid_provider_contract_without_writing(self):
         """추가된 문서의 잘못된 공급자 계약을 출력 기록 없이 거부하는지 검증."""
 
@@ -2186,6 +2320,58 @@ class MainPipelineTests(unittest.TestCase):
         self.assertEqual(result, "repaired\n")
         self.assertEqual(provider.call_count, 1)
 
+    def test_block_requests_of_one_document_share_a_byte_stable_prefix(self):
+        """같은 문서의 block 요청이 기존 heading 문맥까지 같은 prefix를 갖는지 검증."""
+
+        change = diff.SourceChange(
+            path="i18n/en/docusaurus-plugin-content-docs/version-13.x/example.md",
+            status="M",
+        )
+        existing = (
+            "<!-- # Example -->\n# 예제\n\n"
+            "<!-- First text. -->\n첫 문장입니다.\n\n"
+            "<!-- ## Details -->\n## 세부 사항\n\n"
+            "<!-- Second text. -->\n둘째 문장입니다.\n"
+        )
+        block_changes = [
+            main.patch_utils.BlockChange(
+                old_lines=(f"{name} text.",),
+                new_lines=(f"{name} text, revised.",),
+                before_context=None,
+                after_context=None,
+                old_source=f"{name} text.\n",
+                new_source=f"{name} text, revised.\n",
+            )
+            for name in ("First", "Second")
+        ]
+        cfg = config.Config(provider="cli", values={"TRANSLATION_PROVIDER": "cli"})
+
+        with patch.object(main.translate, "preflight_request") as preflight:
+            for block_change in block_changes:
+                main._prepare_block_translation(
+                    change,
+                    block_change,
+                    cfg,
+                    "prompt",
+                    existing,
+                    placeholders={},
+                    locale="ko",
+                )
+
+        first, second = (
+            recorded.args[0].render() for recorded in preflight.call_args_list
+        )
+        prefix = (
+            "# Translation Sync Input\n\n"
+            "## Document Headings\n\n"
+            "<!-- # Example -->\n# 예제\n"
+            "<!-- ## Details -->\n## 세부 사항\n\n"
+            "## English Diff"
+        )
+        self.assertTrue(first.startswith(prefix))
+        self.assertTrue(second.startswith(prefix))
+        self.assertNotEqual(first, second)
+
     def test_translate_one_skips_an_already_current_prose_and_code_hunk(self):
         """이미 최신인 산문과 코드 변경 묶음을 건너뛰는지 검증."""
 
@@ -3766,7 +3952,7 @@ class MainPipelineTests(unittest.TestCase):
 
         calls: list[tuple[list[str], bool]] = []
 
-        def sync_versions(versions, *, write=False, repo_root=None):
+        def sync_versions(versions, *, write=False, repo_root=None, index_path=None):
             """요청된 버전 목록 동기화."""
 
             calls.append((versions, write))
@@ -4268,5 +4454,45 @@ class MainPipelineTests(unittest.TestCase):
             "prompt loading failed: missing prompt file: prompt.md\n",
         )
 
+    def test_translate_changes_writes_outputs_under_the_given_root(self):
+        """내장용 진입점이 지정 root에 ko·ja 출력을 쓰고 모듈 전역은 바꾸지 않는지 검증."""
+
+        source = "i18n/en/docusaurus-plugin-content-docs/version-13.x/intro.md"
+        cfg = config.Config(
+            provider="identity", values={"TRANSLATION_PROVIDER": "identity"}
+        )
+        saved_root = main.REPO_ROOT
+        saved_trace = main._TRACE
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "versions.json").write_text('["master", "13.x"]\n', encoding="utf-8")
+            (root / source).parent.mkdir(parents=True)
+            (root / source).write_text("# Intro\n\nFirst paragraph.\n", encoding="utf-8")
+
+            trace = run_trace.RunTrace()
+            with patch.object(
+                main, "REPO_ROOT", Path(tmp) / "unused"
+            ) as global_root:
+                issues = main.translate_changes(
+                    [diff.SourceChange(path=source, status="A")],
+                    cfg,
+                    repo_root=root,
+                    trace=trace,
+                )
+                self.assertIs(main.REPO_ROOT, global_root)
+
+            self.assertEqual(issues, [])
+            self.assertTrue((root / "versioned_docs/version-13.x/intro.md").is_file())
+            self.assertTrue(
+                (
+                    root
+                    / "i18n/ja/docusaurus-plugin-content-docs/version-13.x/intro.md"
+                ).is_file()
+            )
+        self.assertIs(main.REPO_ROOT, saved_root)
+        self.assertIs(main._TRACE, saved_trace)
+        self.assertIsNone(main._RUN_SCOPE.get())
+
+
 if __name__ == "__main__":
     unittest.main()
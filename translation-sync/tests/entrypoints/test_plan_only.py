@@ -0,0 +1,251 @@
+"""``--plan-only`` 실행 계획 보고서의 집계와 무기록 실행 검증."""
+
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import patch
+
+import main
+from sync import config, diff, translate
+from sync.runtime import plan_report
+from sync.runtime import state as run_state
+from sync.translation import patch as patch_utils
+
+_BUDGET = {
+    "TRANSLATION_PROVIDER": "openai",
+    "TRANSLATION_MODEL": "gpt-5.6-luna",
+    "TRANSLATION_CONTEXT_WINDOW_TOKENS": "200000",
+    "TRANSLATION_RESERVED_OUTPUT_TOKENS": "200",
+    "TRANSLATION_REQUEST_TIMEOUT_SECONDS": "60",
+    "TRANSLATION_RUN_TIMEOUT_SECONDS": "600",
+    "TRANSLATION_TOKENIZER_ENCODING": "o200k_base",
+}
+_SOURCE = (
+    "# Title\n\nParagraph one.\n\n```php\nreturn 1;\n```\n\nParagraph two.\n"
+)
+_PROMPTS = {"ko": "ko prompt", "ja": "ja prompt"}
+
+
+def _added(version: str) -> diff.SourceChange:
+    """버전별 추가 문서 변경."""
+
+    return diff.SourceChange(
+        path=f"i18n/en/docusaurus-plugin-content-docs/version-{version}/example.md",
+        status="A",
+    )
+
+
+def _create_target() -> main._PreparedTranslationTarget:
+    """provider 블록 둘과 provider 비호출 블록 둘인 생성 대상."""
+
+    return main._PreparedTranslationTarget(
+        source=_SOURCE,
+        existing=None,
+        existing_bytes=None,
+        plan=patch_utils.build_create_plan(_SOURCE),
+        state=patch_utils.PlanState.CREATE,
+        placeholders=MappingProxyType({}),
+        block_requests=MappingProxyType({}),
+    )
+
+
+class PlanOnlyTests(unittest.TestCase):
+    """provider 호출·파일 기록 없는 계획 보고서 테스트 모음."""
+
+    def test_report_counts_blocks_tokens_and_cross_version_sharing(self):
+        """버전 간 같은 요청은 뒤 버전에서 공유로 세고 token과 예상 시간 집계."""
+
+        changes = [_added("12.x"), _added("13.x")]
+        prepared = {
+            (change.path, locale): _create_target()
+            for change in changes
+            for locale in ("ko", "ja")
+        }
+        cfg = config.Config(provider="openai", values=_BUDGET)
+
+        with patch.object(main, "_SHARED_TRANSLATIONS", None), patch.object(
+            translate, "_count_tokens", side_effect=lambda text, _: len(text)
+        ), patch.object(
+            translate,
+            "translate_request",
+            side_effect=AssertionError("plan report must not call providers"),
+        ):
+            self.assertEqual(main._share_cross_version_requests(changes, prepared, cfg), 4)
+            report = main._plan_report(
+                changes,
+                prepared,
+                cfg,
+                _PROMPTS,
+                concurrency=3,
+                request_seconds=None,
+            )
+
+        rows = [
+            (t.version, t.locale, t.provider_blocks, t.provider_free_blocks, t.shared_blocks)
+            for t in report.targets
+        ]
+        self.assertEqual(
+            rows,
+            [
+                ("12.x", "ko", 2, 2, 0),
+                ("12.x", "ja", 2, 2, 0),
+                ("13.x", "ko", 0, 2, 2),
+                ("13.x", "ja", 0, 2, 2),
+            ],
+        )
+        first = report.targets[0]
+        self.assertGreater(first.input_tokens, 0)
+        self.assertEqual(first.reserved_output_tokens, 400)
+        self.assertEqual(report.targets[2].input_tokens, 0)
+        self.assertEqual(report.totals()["input_tokens"], 2 * first.input_tokens)
+        self.assertEqual(report.projected_seconds, 120.0)
+        self.assertIn("projected provider time: 120s", plan_report.render_text(report))
+
+    def test_reused_blocks_and_unknown_budget(self):
+        """재사용 블록은 요청에서 빼고 요청 예산이 없으면 token과 시간을 알 수 없음."""
+
+        change = _added("13.x")
+        prepared = {(change.path, locale): _create_target() for locale in ("ko", "ja")}
+        cfg = config.Config(provider="cli", values={"TRANSLATION_PROVIDER": "cli"})
+
+        with patch.object(main, "_SHARED_TRANSLATIONS", None), patch.object(
+            main,
+            "_reused_create_block",
+            side_effect=lambda owner, *_: "재사용" if "one" in owner.source else None,
+        ):
+            report = main._plan_report(
+                [change],
+                prepared,
+                cfg,
+                _PROMPTS,
+                concurrency=1,
+                request_seconds=None,
+            )
+
+        self.assertEqual(
+            [(t.provider_blocks, t.reused_blocks) for t in report.targets],
+            [(1, 1), (1, 1)],
+        )
+        self.assertIsNone(report.totals()["input_tokens"])
+        self.assertIsNone(report.projected_seconds)
+
+    def test_main_plan_only_prints_json_without_translating(self):
+        """``--plan-only=json``은 사전검증 뒤 보고서만 표준 출력에 남기고 종료."""
+
+        change = _added("13.x")
+        prepared = {(change.path, locale): _create_target() for locale in ("ko", "ja")}
+        stdout = io.StringIO()
+
+        def upstream_main(**_):
+            print("version-13.x: 1 files")
+            return 0
+
+        with redirect_stdout(stdout), redirect_stderr(io.StringIO()), patch.object(
+            main.sys,
+            "argv",
+            ["main.py", "--plan-only=json", "--plan-request-seconds", "1.5"],
+        ), patch.object(main.upstream, "main", side_effect=upstream_main), patch.object(
+            main.diff, "changed_sources", return_value=[change]
+        ), patch.object(
+            main.config,
+            "load_config",
+            return_value=config.Config(
+                provider="cli", values={"TRANSLATION_PROVIDER": "cli"}
+            ),
+        ), patch.object(
+            main, "_load_prompts", return_value=_PROMPTS
+        ), patch.object(
+            main, "_validate_file_states", return_value=[]
+        ), patch.object(
+            main, "_preflight_all_translation_targets", return_value=(prepared, [])
+        ), patch.object(
+            main,
+            "_translate_one",
+            side_effect=AssertionError("plan-only must not translate"),
+        ), patch.object(
+            main,
+            "_sync_sidebars",
+            side_effect=AssertionError("plan-only must not write sidebars"),
+        ):
+            exit_code = main.main()
+
+        self.assertEqual(exit_code, 0)
+        document = json.loads(stdout.getvalue())
+        self.assertEqual(document["totals"]["provider_blocks"], 4)
+        self.assertEqual(document["projected_seconds"], 6.0)
+        self.assertEqual(
+            [target["locale"] for target in document["targets"]], ["ko", "ja"]
+        )
+
+    def test_main_plan_only_leaves_the_state_directory_untouched(self):
+        """``--plan-only``는 실행 상태 디렉터리의 memo·메모리·계획 저장소를 만들지 않음."""
+
+        change = _added("13.x")
+        prepared = {(change.path, locale): _create_target() for locale in ("ko", "ja")}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            state_dir = Path(tmp) / "state"
+            with redirect_stdout(io.StringIO()), redirect_stderr(
+                io.StringIO()
+            ), patch.dict(
+                main.os.environ, {run_state.STATE_DIR_ENV: str(state_dir)}
+            ), patch.object(
+                main.sys, "argv", ["main.py", "--plan-only"]
+            ), patch.object(
+                main.upstream, "main", return_value=0
+            ), patch.object(
+                main.diff, "changed_sources", return_value=[change]
+            ), patch.object(
+                main.config,
+                "load_config",
+                return_value=config.Config(
+                    provider="cli", values={"TRANSLATION_PROVIDER": "cli"}
+                ),
+            ), patch.object(
+                main, "_load_prompts", return_value=_PROMPTS
+            ), patch.object(
+                main, "_validate_file_states", return_value=[]
+            ), patch.object(
+                main, "_preflight_all_translation_targets", return_value=(prepared, [])
+            ):
+                exit_code = main.main()
+
+            self.assertEqual(exit_code, 0)
+            self.assertFalse(state_dir.exists())
+        self.assertIsNone(main._CONTRACT_MEMO)
+        self.assertIsNone(main._TRANSLATION_MEMORY)
+        self.assertIsNone(main._PLAN_CACHE)
+
+    def test_plan_options_are_validated_before_upstream_sync(self):
+        """잘못된 보고서 형식과 ``--plan-only`` 없는 예상 시간 option 거부."""
+
+        cases = [
+            (["--plan-only=yaml"], "--plan-only must be one of: text, json"),
+            (["--plan-only", "--plan-only"], "--plan-only may only be specified once"),
+            (["--plan-concurrency", "2"], "--plan-concurrency requires --plan-only"),
+            (
+                ["--plan-only", "--plan-concurrency", "0"],
+                "--plan-concurrency must be a positive integer",
+            ),
+        ]
+        for argv, message in cases:
+            stderr = io.StringIO()
+            with self.subTest(argv=argv), redirect_stderr(stderr), patch.object(
+                main.sys, "argv", ["main.py", *argv]
+            ), patch.object(
+                main.upstream,
+                "main",
+                side_effect=AssertionError("upstream should not run"),
+            ):
+                self.assertEqual(main.main(), 1)
+                self.assertEqual(
+                    stderr.getvalue(), f"configuration failed: {message}\n"
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
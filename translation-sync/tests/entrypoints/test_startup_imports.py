@@ -0,0 +1,69 @@
+"""진입점의 지연 import 대상 검증."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+SYNC_ROOT = Path(__file__).resolve().parents[2]
+ENTRYPOINTS = ("main", "annotate_cli")
+# 진입점 import만으로 불러오면 안 되는 module. 실제 provider 호출·token 계산 때 import한다.
+DEFERRED_MODULES = ("openai", "tiktoken")
+
+
+def _run(code: str) -> subprocess.CompletedProcess[str]:
+    """``translation-sync``를 import 경로로 둔 새 인터프리터에서 code 실행."""
+
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (str(SYNC_ROOT), environment.get("PYTHONPATH")))
+    )
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=SYNC_ROOT,
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+class StartupImportTests(unittest.TestCase):
+    """진입점 지연 import 회귀 테스트 모음."""
+
+    def test_entrypoints_do_not_import_deferred_modules(self):
+        """진입점 import는 provider·tokenizer module을 불러오지 않음."""
+
+        for module in ENTRYPOINTS:
+            with self.subTest(module=module):
+                result = _run(
+                    f"import sys, {module}\n"
+                    f"print(sorted(set({DEFERRED_MODULES!r}) & set(sys.modules)))\n"
+                )
+
+                self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_stage_aliases_and_stale_link_registry_load_on_first_use(self):
+        """``annotate_cli``는 쓰지 않는 단계를 실행하지 않고 링크 레지스트리는 첫 사용 때 읽음."""
+
+        result = _run(
+            "import sys, annotate_cli, sync\n"
+            "from sync.common import stale_links\n"
+            "print(sorted(name for name in sync.__all__\n"
+            "    if type(getattr(sync, name)).__name__ == '_LazyModule'))\n"
+            "print(stale_links.default_stale_link_registry.cache_info().currsize)\n"
+            "stale_links.DEFAULT_STALE_LINK_REGISTRY\n"
+            "print(stale_links.default_stale_link_registry.cache_info().currsize)\n"
+        )
+
+        deferred, before, after = result.stdout.splitlines()
+        for stage in ("patch", "sidebar", "translate", "upstream"):
+            self.assertIn(repr(stage), deferred)
+        self.assertEqual((before, after), ("0", "1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
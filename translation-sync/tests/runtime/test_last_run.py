@@ -0,0 +1,176 @@
+"""마지막 성공 실행 입력 digest와 변경 없음 빠른 종료 검증."""
+
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+import main
+from sync import config
+from sync.runtime import last_run
+from sync.runtime import state as run_state
+
+_MANIFEST = b'{"schema_version":1,"entries":[]}\n'
+
+
+def _write_inputs(root: Path) -> None:
+    """두 버전의 versions.json, 목차 문서, 사이드바와 레지스트리."""
+
+    (root / "versions.json").write_text('["master", "13.x"]\n', encoding="utf-8")
+    for version in ("master", "13.x"):
+        docs = root / last_run._EN_DOCS / f"version-{version}"
+        docs.mkdir(parents=True)
+        (docs / "documentation.md").write_text("- [Intro](/docs/{{version}}/intro)\n")
+    (root / "versioned_sidebars").mkdir()
+    (root / "versioned_sidebars" / "version-13.x-sidebars.json").write_text("{}\n")
+    (root / "stale-links.json").write_text("{}\n")
+    (root / "main.py").write_text("")
+
+
+def _digest(root: Path, *, manifest: bytes = _MANIFEST, version: str | None = None) -> str:
+    """임시 저장소의 입력 digest."""
+
+    return last_run.input_digest(
+        root,
+        manifest=manifest,
+        registry_path=root / "stale-links.json",
+        entrypoint=root / "main.py",
+        version=version,
+    )
+
+
+class InputDigestTests(unittest.TestCase):
+    """입력 digest 구성과 기록 왕복 테스트 모음."""
+
+    def test_digest_tracks_each_input(self):
+        """매니페스트·선택 버전·목차·사이드바·레지스트리가 바뀌면 digest가 바뀜."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write_inputs(root)
+            baseline = _digest(root)
+            self.assertEqual(_digest(root), baseline)
+
+            changed = {
+                _digest(root, manifest=_MANIFEST.replace(b"[]", b"[1]")),
+                _digest(root, version="13.x"),
+            }
+            edits = (
+                root / last_run._EN_DOCS / "version-13.x" / "documentation.md",
+                root / "versioned_sidebars" / "version-master-sidebars.json",
+                root / "stale-links.json",
+            )
+            for path in edits:
+                path.write_text("changed\n")
+                changed.add(_digest(root))
+
+        self.assertNotIn(baseline, changed)
+        self.assertEqual(len(changed), 5)
+
+    def test_digest_tracks_source_tree_edits(self):
+        """동기화 뒤 고치거나 추가·삭제한 영어 원문이 있으면 digest가 바뀜."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write_inputs(root)
+            source = root / last_run._EN_DOCS / "version-13.x" / "intro.md"
+            source.write_text("# Intro\n")
+            os.utime(source, ns=(1_000_000_000, 1_000_000_000))
+            baseline = _digest(root)
+
+            source.write_text("# Intro!\n")
+            os.utime(source, ns=(1_000_000_000, 1_000_000_000))
+            resized = _digest(root)
+            source.write_text("# Intro\n")
+            os.utime(source, ns=(2_000_000_000, 2_000_000_000))
+            touched = _digest(root)
+            os.utime(source, ns=(1_000_000_000, 1_000_000_000))
+            self.assertEqual(_digest(root), baseline)
+            (source.parent / "added.md").write_text("# Added\n")
+            added = _digest(root)
+            (source.parent / "added.md").unlink()
+            source.unlink()
+            removed = _digest(root)
+
+        self.assertEqual(len({baseline, resized, touched, added, removed}), 5)
+
+    def test_recorded_digest_matches_only_the_same_inputs(self):
+        """기록이 없거나 손상되면 변경으로 보고, 기록한 digest만 일치."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            state_dir = Path(tmp) / "state"
+            self.assertFalse(last_run.is_unchanged(state_dir, "a" * 64))
+
+            last_run.record_success(state_dir, "a" * 64)
+            self.assertTrue(last_run.is_unchanged(state_dir, "a" * 64))
+            self.assertFalse(last_run.is_unchanged(state_dir, "b" * 64))
+
+            (state_dir / last_run.LAST_RUN_FILENAME).write_text("{")
+            self.assertFalse(last_run.is_unchanged(state_dir, "a" * 64))
+
+
+class NoOpRunTests(unittest.TestCase):
+    """``main`` 빠른 종료 경로 테스트 모음."""
+
+    def _main(self, environment: dict[str, str], argv: list[str]) -> tuple[int, str, int]:
+        """원문 동기화·변경 감지·사이드바를 대체한 실행의 종료 코드, 출력, 원문 동기화 횟수."""
+
+        stdout = io.StringIO()
+        with patch.dict(main.os.environ, environment), patch.object(
+            main.sys, "argv", argv
+        ), patch.object(
+            main.config,
+            "load_config",
+            return_value=config.Config(provider="cli", values={"TRANSLATION_PROVIDER": "cli"}),
+        ), patch.object(main, "_open_run_state"), patch.object(
+            main.upstream, "main", return_value=0
+        ) as upstream_main, patch.object(
+            main.diff, "changed_sources", return_value=[]
+        ), patch.object(
+            main, "_sync_sidebars", return_value=[]
+        ), redirect_stdout(stdout):
+            exit_code = main.main()
+        return exit_code, stdout.getvalue(), upstream_main.call_count
+
+    def test_unchanged_inputs_skip_configuration_and_source_sync(self):
+        """변경 없는 성공 실행 뒤 같은 입력의 실행은 설정·원문 동기화 없이 종료."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = Path(tmp) / "manifest.json"
+            manifest.write_bytes(_MANIFEST)
+            environment = {
+                run_state.STATE_DIR_ENV: str(Path(tmp) / "state"),
+                main.upstream.MANIFEST_ENV: str(manifest),
+            }
+
+            first = self._main(environment, ["main.py"])
+            second = self._main(environment, ["main.py"])
+            filtered = self._main(environment, ["main.py", "--version", "13.x"])
+            manifest.write_bytes(_MANIFEST.replace(b"[]", b"[1]"))
+            repinned = self._main(environment, ["main.py"])
+
+        self.assertEqual(first, (0, "no source changes to translate\n", 1))
+        self.assertEqual(second, (0, "no input changes since last successful run\n", 0))
+        self.assertEqual(filtered[2], 1)
+        self.assertEqual(repinned[2], 1)
+
+    def test_unpinned_manifest_never_skips(self):
+        """매니페스트 파일이 없거나 상태 디렉터리가 없으면 매번 원문을 동기화."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            state_dir = str(Path(tmp) / "state")
+            unpinned = {
+                run_state.STATE_DIR_ENV: state_dir,
+                main.upstream.MANIFEST_ENV: str(Path(tmp) / "missing.json"),
+            }
+            runs = [self._main(unpinned, ["main.py"]) for _ in range(2)]
+            stateless = [self._main({}, ["main.py"]) for _ in range(2)]
+
+        self.assertEqual([run[2] for run in runs + stateless], [1, 1, 1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
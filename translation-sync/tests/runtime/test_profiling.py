@@ -0,0 +1,195 @@
+"""번역 대상별 profile 기록과 ``--profile`` 실행 검증."""
+
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import patch
+
+import main
+from sync import diff
+from sync.runtime import profiling
+from sync.translation import patch as patch_utils
+
+
+def _busy_paused_work() -> int:
+    """profile에서 빠져야 하는 계산."""
+
+    return sum(range(20_000))
+
+
+def _busy_profiled_work() -> int:
+    """profile에 남아야 하는 계산."""
+
+    return sum(range(20_000))
+
+
+class CollapseTests(unittest.TestCase):
+    """collapsed stack 변환 테스트 모음."""
+
+    def test_self_time_is_split_across_callers(self):
+        """함수 자체 시간을 호출자 누적 시간 비율로 나누고 호출자 쪽으로 펼침."""
+
+        root = ("~", 0, "<root>")
+        left = ("/x/a.py", 1, "left")
+        right = ("/x/a.py", 5, "right")
+        leaf = ("/x/b.py", 3, "leaf")
+        stats = {
+            root: (1, 1, 0.001, 0.009, {}),
+            left: (1, 1, 0.001, 0.004, {root: (1, 1, 0.001, 0.004)}),
+            right: (1, 1, 0.0, 0.004, {root: (1, 1, 0.0, 0.004)}),
+            leaf: (
+                2,
+                2,
+                0.006,
+                0.006,
+                {left: (1, 1, 0.003, 0.003), right: (1, 1, 0.003, 0.003)},
+            ),
+        }
+
+        stacks = profiling.collapse_pstats(stats)
+
+        self.assertEqual(
+            stacks,
+            {
+                "<root>": 1000,
+                "<root>;left@a.py:1": 1000,
+                "<root>;left@a.py:1;leaf@b.py:3": 3000,
+                "<root>;right@a.py:5;leaf@b.py:3": 3000,
+            },
+        )
+
+
+class TargetProfilerTests(unittest.TestCase):
+    """대상별 profile 파일 기록 테스트 모음."""
+
+    def test_cpu_profile_excludes_paused_provider_calls(self):
+        """멈춘 구간의 함수는 빠지고 대상 파일 이름에 버전·문서·locale이 들어감."""
+
+        with tempfile.TemporaryDirectory() as tmp, redirect_stderr(io.StringIO()):
+            profiler = profiling.TargetProfiler("cpu", Path(tmp))
+            with profiler.target("13.x", "guide/intro.md", "ko"):
+                _busy_profiled_work()
+                with profiling.paused():
+                    _busy_paused_work()
+            folded = Path(tmp) / "13.x--guide__intro.md--ko.cpu.folded"
+            text = folded.read_text()
+            self.assertTrue((Path(tmp) / "13.x--guide__intro.md--ko.pstats").exists())
+
+        self.assertIn("_busy_profiled_work@", text)
+        self.assertNotIn("_busy_paused_work", text)
+        for line in text.splitlines():
+            stack, weight = line.rsplit(" ", 1)
+            self.assertTrue(stack)
+            self.assertGreater(int(weight), 0)
+
+    def test_alloc_profile_records_live_allocations(self):
+        """대상이 끝날 때 남은 할당을 이 파일의 stack으로 기록."""
+
+        retained: list[bytes] = []
+        with tempfile.TemporaryDirectory() as tmp, redirect_stderr(io.StringIO()):
+            profiler = profiling.TargetProfiler("alloc", Path(tmp))
+            with profiler.target("13.x", "intro.md", "ja"):
+                retained.append(bytes(1_000_000))
+            text = (Path(tmp) / "13.x--intro.md--ja.alloc.folded").read_text()
+
+        top = text.splitlines()[0]
+        self.assertIn("test_profiling.py:", top)
+        self.assertGreaterEqual(int(top.rsplit(" ", 1)[1]), 1_000_000)
+
+
+class ProfileOptionTests(unittest.TestCase):
+    """``--profile`` option과 offline 실행 테스트 모음."""
+
+    def test_profile_options_are_validated(self):
+        """잘못된 방식과 ``--profile`` 없는 보조 option 거부."""
+
+        cases = [
+            (["--profile=wall"], "--profile must be one of: cpu, alloc"),
+            (["--profile-identity"], "--profile-identity requires --profile"),
+            (["--profile", "--profile-identity=yes"], "--profile-identity does not take a value"),
+            (["--profile", "--plan-only"], "--profile cannot be combined with --plan-only"),
+        ]
+        for argv, message in cases:
+            stderr = io.StringIO()
+            with self.subTest(argv=argv), redirect_stderr(stderr), patch.object(
+                main.sys, "argv", ["main.py", *argv]
+            ), patch.object(
+                main.upstream,
+                "main",
+                side_effect=AssertionError("upstream should not run"),
+            ):
+                self.assertEqual(main.main(), 1)
+                self.assertEqual(stderr.getvalue(), f"configuration failed: {message}\n")
+
+    def test_identity_profile_runs_offline_without_writing(self):
+        """offline profile은 원문 동기화·사이드바·출력 기록 없이 대상마다 profile 기록."""
+
+        source = "# Title\n\nParagraph.\n"
+        change = diff.SourceChange(
+            path="i18n/en/docusaurus-plugin-content-docs/version-13.x/example.md",
+            status="A",
+        )
+        target = main._PreparedTranslationTarget(
+            source=source,
+            existing=None,
+            existing_bytes=None,
+            plan=patch_utils.build_create_plan(source),
+            state=patch_utils.PlanState.CREATE,
+            placeholders=MappingProxyType({}),
+            block_requests=MappingProxyType({}),
+        )
+        configs: list[str] = []
+
+        def translate_one(_change, cfg, *_args, **_kwargs):
+            """offline 설정과 기록 차단 확인."""
+
+            configs.append(cfg.provider)
+            self.assertFalse(main._WRITE_OUTPUTS)
+            return []
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()), patch.object(
+                main.sys,
+                "argv",
+                ["main.py", "--profile", "--profile-identity", "--profile-dir", tmp],
+            ), patch.object(
+                main.upstream, "main", side_effect=AssertionError("offline profile must not sync")
+            ), patch.object(
+                main.config, "load_config", side_effect=AssertionError("offline profile needs no config")
+            ), patch.object(
+                main, "_select_changes", return_value=[change]
+            ), patch.object(
+                main, "_load_prompts", return_value={"ko": "ko", "ja": "ja"}
+            ), patch.object(
+                main, "_validate_file_states", return_value=[]
+            ), patch.object(
+                main,
+                "_preflight_all_translation_targets",
+                return_value=({(change.path, "ko"): target, (change.path, "ja"): target}, []),
+            ), patch.object(
+                main, "_translate_one", side_effect=translate_one
+            ), patch.object(
+                main, "_sync_sidebars", side_effect=AssertionError("offline profile must not write sidebars")
+            ):
+                self.assertEqual(main.main(), 0)
+
+            written = sorted(path.name for path in Path(tmp).iterdir())
+
+        self.assertEqual(configs, ["identity", "identity"])
+        self.assertEqual(
+            written,
+            [
+                "13.x--example.md--ja.cpu.folded",
+                "13.x--example.md--ja.pstats",
+                "13.x--example.md--ko.cpu.folded",
+                "13.x--example.md--ko.pstats",
+            ],
+        )
+        self.assertTrue(main._WRITE_OUTPUTS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+"""span 기록, OTLP-JSON 파일 exporter와 trace ID 구성 검증."""
+
+import io
+import json
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import main
+from sync import config, translate
+from sync.runtime import spans
+
+
+class _CollectingExporter:
+    """내보낸 span 묶음을 보관하는 exporter."""
+
+    def __init__(self) -> None:
+        """빈 묶음 목록으로 시작."""
+
+        self.batches: list[list[spans.FinishedSpan]] = []
+        self.closed = False
+
+    def export(self, finished):
+        """묶음 보관."""
+
+        self.batches.append(list(finished))
+
+    def shutdown(self):
+        """종료 기록."""
+
+        self.closed = True
+
+
+def _attributes(span: spans.FinishedSpan) -> dict[str, object]:
+    """span attribute mapping."""
+
+    return dict(span.attributes)
+
+
+class SpanTests(unittest.TestCase):
+    """span 기록기 동작과 경계 조건 테스트 모음."""
+
+    def tearDown(self) -> None:
+        """전역 기록기 해제."""
+
+        spans.install(None)
+
+    def test_disabled_spans_share_one_empty_context(self):
+        """기록기가 없으면 span과 decorator가 아무것도 만들지 않음."""
+
+        @spans.traced("work")
+        def work() -> int:
+            """고정 값 반환."""
+
+            return 1
+
+        self.assertFalse(spans.enabled())
+        self.assertIs(spans.span("a", locale="ko"), spans.span("b"))
+        self.assertEqual(work(), 1)
+        spans.set_attribute("ignored", 1)
+
+    def test_trace_id_reuses_the_run_id(self):
+        """hex 실행 ID는 그대로, 다른 실행 ID는 안정된 digest로 trace ID 구성."""
+
+        hex_id = "0123456789ABCDEF0123456789abcdef"
+        self.assertEqual(spans.trace_id_for(hex_id), hex_id.lower())
+        self.assertEqual(spans.trace_id_for("run-1"), spans.trace_id_for("run-1"))
+        self.assertEqual(len(spans.trace_id_for("run-1")), 32)
+        self.assertNotEqual(spans.trace_id_for(None), spans.trace_id_for(None))
+
+    def test_retried_provider_call_records_attempt_spans(self):
+        """provider 요청 span 아래에 재시도마다 attempt span과 오류 유형 기록."""
+
+        exporter = _CollectingExporter()
+        spans.install(spans.Tracer(exporter, trace_id="a" * 32))
+        calls = 0
+
+        def respond(_chunk, _config, _prompt):
+            """첫 호출만 timeout."""
+
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise subprocess.TimeoutExpired(cmd="provider", timeout=1)
+            return "translated"
+
+        cfg = config.Config(provider="cli", values={"TRANSLATION_PROVIDER": "cli"})
+        with spans.span("translate", locale="ko", document="a.md", version=None):
+            translate._with_retries(
+                respond, "chunk", cfg, "prompt", sleep=lambda _: None
+            )
+
+        (batch,) = exporter.batches
+        self.assertEqual(
+            [span.name for span in batch],
+            ["provider.attempt", "provider.attempt", "provider.request", "translate"],
+        )
+        first, second, request, root = batch
+        self.assertEqual(_attributes(first), {"attempt": 1, "error.type": "TimeoutExpired"})
+        self.assertEqual(_attributes(second), {"attempt": 2})
+        self.assertEqual(_attributes(root), {"locale": "ko", "document": "a.md"})
+        self.assertEqual(first.parent_span_id, request.span_id)
+        self.assertEqual(request.parent_span_id, root.span_id)
+        self.assertIsNone(root.parent_span_id)
+
+    def test_failed_span_is_exported_with_error_status(self):
+        """예외로 끝난 span은 오류 상태와 예외 유형만 남김."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "spans.jsonl"
+            tracer = spans.open_tracer("run-1", {spans.SPAN_EXPORT_ENV: str(path)})
+            spans.install(tracer)
+            with self.assertRaises(ValueError), spans.span("verify", attempt=3):
+                raise ValueError("secret provider text")
+            spans.shutdown()
+
+            (line,) = path.read_text().splitlines()
+
+        request = json.loads(line)
+        resource = request["resourceSpans"][0]
+        (span,) = resource["scopeSpans"][0]["spans"]
+        self.assertEqual(
+            resource["resource"]["attributes"],
+            [{"key": "service.name", "value": {"stringValue": "translation-sync"}}],
+        )
+        self.assertEqual(span["traceId"], spans.trace_id_for("run-1"))
+        self.assertEqual(span["status"], {"code": 2, "message": "ValueError"})
+        self.assertEqual(
+            span["attributes"], [{"key": "attempt", "value": {"intValue": "3"}}]
+        )
+        self.assertNotIn("parentSpanId", span)
+        self.assertNotIn("secret", line)
+        self.assertFalse(spans.enabled())
+
+    def test_main_exports_stage_spans_under_the_run_id(self):
+        """``TRANSLATION_SPAN_EXPORT``를 지정한 실행은 단계 span을 실행 ID trace로 기록."""
+
+        def run() -> int:
+            """설정 단계 하나만 실행."""
+
+            with main._TRACE.stage("configuration"):
+                pass
+            return 0
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "spans.jsonl"
+            with patch.dict(
+                main.os.environ,
+                {spans.SPAN_EXPORT_ENV: str(path), main.RUN_ID_ENV: "run-7"},
+            ), patch.object(main, "_run", side_effect=run), patch.object(
+                main.sys, "stderr", io.StringIO()
+            ):
+                self.assertEqual(main.main(), 0)
+
+            (line,) = path.read_text().splitlines()
+
+        (span,) = json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        self.assertEqual(span["name"], "configuration")
+        self.assertEqual(span["traceId"], spans.trace_id_for("run-7"))
+        self.assertFalse(spans.enabled())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""실행 단계 계측의 집계, trace 파일과 합계 표 검증."""
+
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import main
+from sync import translate
+from sync.runtime import trace
+
+
+class RunTraceTests(unittest.TestCase):
+    """단계 계측기 동작과 경계 조건 테스트 모음."""
+
+    def test_nested_stages_inherit_context_and_flush_per_top_level_stage(self):
+        """하위 단계는 상위 단계의 문서·locale로 집계되고 최상위 단계 종료 시 기록."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "trace.jsonl"
+            run = trace.RunTrace(path)
+            counter = translate.ProviderAttemptCounter(
+                transport=2,
+                response_evaluation=1,
+                requests=1,
+                provider_seconds=0.5,
+                input_tokens=30,
+                output_tokens=20,
+                cached_input_tokens=12,
+            )
+            with run.stage("translate", version="13.x", document="a.md", locale="ko") as span:
+                for _ in range(3):
+                    with run.stage("postprocess"):
+                        pass
+                span.record_provider(counter)
+                self.assertFalse(path.exists())
+            with self.assertRaises(RuntimeError), run.stage("sidebar"):
+                raise RuntimeError("boom")
+            stderr = io.StringIO()
+            run.close(stderr=stderr)
+
+            lines = [json.loads(line) for line in path.read_text().splitlines()]
+
+        self.assertEqual(
+            [(line["stage"], line["locale"], line["calls"]) for line in lines],
+            [("translate", "ko", 1), ("postprocess", "ko", 3), ("sidebar", None, 1)],
+        )
+        self.assertEqual(lines[0]["provider_seconds"], 0.5)
+        self.assertEqual(lines[0]["transport_attempts"], 2)
+        self.assertEqual(lines[0]["cached_input_tokens"], 12)
+        self.assertEqual(lines[1]["document"], "a.md")
+        self.assertEqual(lines[2]["failed"], 1)
+        summary = stderr.getvalue().splitlines()
+        self.assertEqual(summary[0].split()[:3], ["stage", "calls", "wall"])
+        self.assertEqual(
+            [row.split()[0] for row in summary[1:]],
+            ["translate", "postprocess", "sidebar"],
+        )
+
+    def test_disabled_trace_records_nothing(self):
+        """경로가 없으면 계측하지 않고 종료 시 아무것도 출력하지 않음."""
+
+        run = trace.open_trace({})
+        with run.stage("translate") as span:
+            span.record_provider(translate.ProviderAttemptCounter(requests=1))
+        stderr = io.StringIO()
+        run.close(stderr=stderr)
+
+        self.assertFalse(run.enabled)
+        self.assertEqual(run.totals(), [])
+        self.assertEqual(stderr.getvalue(), "")
+
+    def test_main_writes_configured_trace_report(self):
+        """``TRANSLATION_TRACE_REPORT``를 지정한 실행은 단계 기록과 합계 표를 남김."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "trace.jsonl"
+            stderr = io.StringIO()
+            with patch.dict(
+                main.os.environ, {trace.TRACE_REPORT_ENV: str(path)}
+            ), patch.object(main.sys, "argv", ["main.py"]), patch.object(
+                main.sys, "stderr", stderr
+            ), patch.object(
+                main, "_run", side_effect=lambda: self._run_stage()
+            ):
+                self.assertEqual(main.main(), 0)
+
+            stages = [json.loads(line)["stage"] for line in path.read_text().splitlines()]
+
+        self.assertEqual(stages, ["configuration"])
+        self.assertIn("configuration", stderr.getvalue())
+        self.assertFalse(main._TRACE.enabled)
+
+    @staticmethod
+    def _run_stage() -> int:
+        """설정 단계 하나만 측정하는 실행."""
+
+        with main._TRACE.stage("configuration"):
+            pass
+        return 0
+
+
+if __name__ == "__main__":
+    unittest.main()
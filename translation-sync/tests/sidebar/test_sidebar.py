@@ -494,6 +494,81 @@ class SidebarSyncTests(unittest.TestCase):
                     ).exists()
                 )
 
+    def _sync_master_with_index(self, root: Path, index_path: Path) -> tuple[list, int]:
+        """digest 색인을 쓰는 master 동기화 결과와 전체 계획 횟수."""
+
+        original_plan = sidebar.generator._plan_version
+        with patch.object(
+            sidebar.generator, "_plan_version", side_effect=original_plan
+        ) as plan_version:
+            results = sidebar.sync_versions(
+                ["master"],
+                write=True,
+                repo_root=root,
+                index_path=index_path,
+            )
+        return results, plan_version.call_count
+
+    def test_digest_index_skips_planning_for_unchanged_versions(self):
+        """색인 기록과 입력 digest가 같으면 전체 계획 없이 변경 없음으로 확인."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self._write_repo(root)
+            index_path = root / "state" / sidebar.SIDEBAR_INDEX_FILENAME
+            sidebar_path = root / "versioned_sidebars/version-master-sidebars.json"
+
+            first, first_plans = self._sync_master_with_index(root, index_path)
+            written = sidebar_path.read_bytes()
+            second, second_plans = self._sync_master_with_index(root, index_path)
+            index = json.loads(index_path.read_text(encoding="utf-8"))
+
+            self.assertEqual((first[0].issues, first[0].changed), ([], True))
+            self.assertEqual(first_plans, 2)
+            self.assertEqual((second[0].issues, second[0].changed), ([], False))
+            self.assertEqual(second_plans, 0)
+            self.assertEqual(sidebar_path.read_bytes(), written)
+            self.assertEqual(
+                index["versions"]["master"]["doc_ids"],
+                ["ai", "dusk", "installation", "requests"],
+            )
+            self.assertEqual(
+                index["versions"]["master"]["sidebar_sha256"],
+                hashlib.sha256(written).hexdigest(),
+            )
+
+    def test_digest_index_mismatch_falls_back_to_full_planning(self):
+        """목차·사이드바 변경, 원문 삭제, 손상된 색인은 전체 계획으로 다시 확인."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self._write_repo(root)
+            index_path = root / "state" / sidebar.SIDEBAR_INDEX_FILENAME
+            docs = root / "i18n/en/docusaurus-plugin-content-docs/version-master"
+            sidebar_path = root / "versioned_sidebars/version-master-sidebars.json"
+            self._sync_master_with_index(root, index_path)
+
+            with (docs / "documentation.md").open("a", encoding="utf-8") as handle:
+                handle.write("- [Forge](https://forge.laravel.com)\n")
+            _, documentation_plans = self._sync_master_with_index(root, index_path)
+
+            sidebar_path.write_bytes(sidebar_path.read_bytes() + b"\n")
+            _, sidebar_plans = self._sync_master_with_index(root, index_path)
+
+            index_path.write_text("{", encoding="utf-8")
+            _, corrupt_plans = self._sync_master_with_index(root, index_path)
+
+            (docs / "dusk.md").unlink()
+            results, deleted_plans = self._sync_master_with_index(root, index_path)
+            _, after_failure_plans = self._sync_master_with_index(root, index_path)
+
+        self.assertEqual(
+            [documentation_plans, sidebar_plans, corrupt_plans, deleted_plans],
+            [2, 2, 2, 1],
+        )
+        self.assertIn("missing source doc for sidebar item: dusk", results[0].issues)
+        self.assertEqual(after_failure_plans, 1)
+
     def test_candidate_input_hash_uses_the_documented_canonical_envelope(self):
         """입력 hash의 canonical envelope 구성 검증."""
 
@@ -0,0 +1,265 @@
+"""로컬 가짜 provider를 통한 재시도·미완료·묶음 요청·streaming 검증."""
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.fake_provider import (
+    FakeProvider,
+    Scenario,
+    cli_config,
+    cli_requests,
+    response_text,
+    write_cli_stub,
+)
+from sync import config, response_contract, translate
+
+REQUEST_BUDGET_ENV = {
+    "TRANSLATION_CONTEXT_WINDOW_TOKENS": "200000",
+    "TRANSLATION_RESERVED_OUTPUT_TOKENS": "200",
+    "TRANSLATION_REQUEST_TIMEOUT_SECONDS": "60",
+    "TRANSLATION_RUN_TIMEOUT_SECONDS": "600",
+    "TRANSLATION_TOKENIZER_ENCODING": "o200k_base",
+}
+SOURCE = "# Title\n\nParagraph.\n"
+
+
+def _request_text(source: str = SOURCE) -> str:
+    """가짜 provider에 보낼 렌더링된 요청."""
+
+    return translate.TranslationRequest(
+        source=source, existing_translation=None, version="13.x"
+    ).render()
+
+
+class FakeProviderTests(unittest.TestCase):
+    """가짜 Responses 서버와 CLI stub 테스트 모음."""
+
+    def setUp(self):
+        """token 계산을 단어 수로 대체."""
+
+        token_counter = patch.object(
+            translate,
+            "_count_tokens",
+            side_effect=lambda text, _encoding: len(text.split()),
+        )
+        token_counter.start()
+        self.addCleanup(token_counter.stop)
+
+    def _call(self, func, cfg, sleeps):
+        """가짜 sleep으로 재시도를 포함한 provider 호출."""
+
+        return translate._with_retries(
+            func,
+            _request_text(),
+            cfg,
+            "prompt",
+            sleep=sleeps.append,
+            deadline=time.monotonic() + 10_000,
+        )
+
+    def test_rate_limit_burst_is_retried_until_identity_response(self):
+        """429·503 뒤 정상 응답을 받고 identity 렌더링 결과 반환."""
+
+        sleeps: list[float] = []
+        with FakeProvider(Scenario(version="13.x", burst=("429", "503"))) as provider:
+            out = self._call(
+                translate._translate_openai, provider.config(**REQUEST_BUDGET_ENV), sleeps
+            )
+            state = provider.state
+
+        self.assertEqual(out, response_contract.render_identity_response(SOURCE, "13.x"))
+        self.assertEqual(state.requests, 3)
+        self.assertEqual(dict(state.outcomes), {"429": 1, "503": 1, "ok": 1})
+        self.assertEqual(len(sleeps), 2)
+
+    def test_incomplete_status_is_rejected(self):
+        """미완료 상태 응답은 재시도 없이 부분 응답 오류."""
+
+        with FakeProvider(Scenario(burst=("incomplete",))) as provider:
+            with self.assertRaisesRegex(
+                translate.ProviderPartialResponse, "status=incomplete"
+            ):
+                self._call(
+                    translate._translate_openai, provider.config(**REQUEST_BUDGET_ENV), []
+                )
+
+    def test_packed_request_is_answered_per_block(self):
+        """묶음 요청은 block마다 구분선과 identity 응답으로 분리됨."""
+
+        sources = ("# One\n", "Two.\n", "Three.\n")
+        packed = translate.PackedTranslationRequest(
+            tuple(
+                translate.TranslationRequest(
+                    source=source, existing_translation=None, version="13.x"
+                )
+                for source in sources
+            )
+        )
+        with FakeProvider(Scenario(version="13.x")) as provider:
+            parts = translate.translate_packed(
+                packed,
+                provider.config(**REQUEST_BUDGET_ENV),
+                "prompt",
+                deadline=time.monotonic() + 10_000,
+            )
+            requests = provider.state.requests
+
+        self.assertEqual(requests, 1)
+        self.assertEqual(
+            parts,
+            [
+                response_contract.render_identity_response(source, "13.x").rstrip("\n")
+                for source in sources
+            ],
+        )
+
+    def test_annotated_response_keeps_placeholder_and_marks_target_prose(self):
+        """annotate 응답이 ``{{version}}``을 보존하고 산문에만 목표 언어 표식을 붙임."""
+
+        source = (
+            "> [!NOTE]\n"
+            "The [docs](/docs/{{version}}/x) cover it.\n\n"
+            "```php\n$a = 1;\n```\n"
+        )
+        request = translate.TranslationRequest(
+            source=source, existing_translation=None
+        ).render()
+
+        self.assertEqual(
+            response_text(request, "한국어로 번역", Scenario(annotate=True)),
+            "> [!NOTE]\n"
+            "> The [docs](/docs/{{version}}/x) cover it 번역번역번역번역.\n\n"
+            "```php\n$a = 1;\n```\n",
+        )
+        self.assertEqual(
+            response_text(request, "prompt", Scenario(annotate=True)),
+            "> [!NOTE]\n"
+            "<!-- The [docs](/docs/{{version}}/x) cover it. -->\n"
+            "The [docs](/docs/{{version}}/x) cover it.\n\n"
+            "```php\n$a = 1;\n```\n",
+        )
+
+    def test_cached_prefix_tokens_are_recorded_per_attempt(self):
+        """같은 instructions 요청은 prompt cache key를 공유하고 적중 token이 기록됨."""
+
+        counter = translate.ProviderAttemptCounter()
+        with FakeProvider() as provider:
+            cfg = provider.config(**REQUEST_BUDGET_ENV)
+            for source in ("First.\n", "Second.\n"):
+                translate.translate_request(
+                    translate.TranslationRequest(source=source, existing_translation=None),
+                    cfg,
+                    "prompt words " * 20,
+                    deadline=time.monotonic() + 10_000,
+                    attempt_counter=counter,
+                )
+            prefixes = provider.state.prefixes
+
+        self.assertEqual(
+            list(prefixes),
+            [translate.prompt_cache_key(translate.effective_prompt("prompt words " * 20))],
+        )
+        self.assertGreater(counter.cached_input_tokens, 40)
+
+    def test_streaming_request_returns_text_deltas(self):
+        """``stream=True`` 요청은 delta event를 이어 붙이면 전체 본문."""
+
+        from openai import OpenAI
+
+        with FakeProvider() as provider:
+            client = OpenAI(api_key="fake", base_url=provider.base_url, max_retries=0)
+            events = list(
+                client.responses.create(
+                    model="gpt-5.6-luna",
+                    input=_request_text("x" * 600 + "\n"),
+                    stream=True,
+                )
+            )
+
+        deltas = [event.delta for event in events if event.type == "response.output_text.delta"]
+        self.assertEqual(len(deltas), 3)
+        self.assertEqual("".join(deltas), "x" * 600 + "\n")
+        self.assertEqual(events[-1].type, "response.completed")
+
+    def test_base_url_override_accepts_only_loopback_http(self):
+        """재정의 base URL은 loopback HTTP만 허용하고 설정 해시에 반영."""
+
+        with FakeProvider() as provider:
+            cfg = provider.config(**REQUEST_BUDGET_ENV)
+        self.assertEqual(config.openai_api_base_url(cfg), provider.base_url)
+        remote = config.Config(
+            provider="openai",
+            values={
+                **cfg.values,
+                config.OPENAI_BASE_URL_OVERRIDE_KEY: "https://api.example.com/v1",
+            },
+        )
+        with self.assertRaisesRegex(config.ConfigError, "loopback"):
+            config.openai_api_base_url(remote)
+        default = config.Config(
+            provider="openai",
+            values={
+                key: value
+                for key, value in cfg.values.items()
+                if key != config.OPENAI_BASE_URL_OVERRIDE_KEY
+            },
+        )
+        self.assertNotEqual(
+            config.provider_config_sha256(cfg), config.provider_config_sha256(default)
+        )
+
+    def test_cli_stub_replays_faults_across_processes(self):
+        """CLI stub은 process마다 요청 순서를 이어 장애 뒤 원문을 돌려줌."""
+
+        sleeps: list[float] = []
+        with tempfile.TemporaryDirectory() as tmp:
+            stub = write_cli_stub(Path(tmp), Scenario(burst=("503",)))
+            cfg = config.load_config(
+                {
+                    "TRANSLATION_PROVIDER": "cli",
+                    "TRANSLATION_CLI_COMMAND": f"{stub} exec",
+                    "TRANSLATION_MODEL": "gpt-5.6-luna",
+                    "CODEX_API_KEY": "fake",
+                    **REQUEST_BUDGET_ENV,
+                }
+            )
+            out = self._call(translate._translate_cli, cfg, sleeps)
+            claimed = sorted(path.name for path in (Path(tmp) / "codex-requests").iterdir())
+
+        self.assertEqual(out, SOURCE)
+        self.assertEqual(claimed, ["0", "1"])
+        self.assertEqual(len(sleeps), 1)
+
+
+    def test_packed_cli_request_runs_one_sandboxed_process(self):
+        """묶음 요청이 격리 설정을 유지한 CLI process 하나로 번역되는지 검증."""
+
+        packed = translate.PackedTranslationRequest(
+            tuple(
+                translate.TranslationRequest(source=source, existing_translation=None)
+                for source in ("One.\n", "Two.\n", "Three.\n")
+            )
+        )
+        run = translate.run_process_tree
+        with tempfile.TemporaryDirectory() as tmp:
+            stub = write_cli_stub(Path(tmp))
+            cfg = cli_config(stub, **REQUEST_BUDGET_ENV)
+            with patch.object(translate, "run_process_tree", wraps=run) as process:
+                parts = translate.translate_packed(
+                    packed, cfg, "prompt", deadline=time.monotonic() + 10_000
+                )
+            requests = cli_requests(stub)
+
+        self.assertEqual(parts, ["One.", "Two.", "Three."])
+        self.assertEqual(requests, 1)
+        command = process.call_args.args[0]
+        self.assertIn("--ephemeral", command)
+        self.assertEqual(command[command.index("--sandbox") + 1], "read-only")
+        self.assertNotEqual(process.call_args.kwargs["env"]["HOME"], str(Path.home()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,240 @@
+"""말뭉치 단위 번역 메모리의 색인·갱신·재사용 검증."""
+
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+import main
+from sync import config, diff
+from sync.runtime import state as run_state
+from sync.translation import memory
+
+
+def _write(path: Path, text: str) -> Path:
+    """상위 디렉터리를 만들고 UTF-8 문서 기록."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class TranslationMemoryTests(unittest.TestCase):
+    """annotation 색인 구축과 증분 갱신 테스트 모음."""
+
+    def test_candidates_span_versions_and_exclude_ambiguous_blocks(self):
+        """모든 버전의 locale 문서에서 유일한 annotation 블록만 후보로 수집."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write(
+                root / "versioned_docs/version-11.x/a.md",
+                "<!-- Shared text. -->\n공유 문장입니다.\n\n"
+                "<!-- Twice. -->\n첫 번째.\n\n"
+                "<!-- Twice. -->\n두 번째.\n",
+            )
+            _write(
+                root / "versioned_docs/version-12.x/b.md",
+                "<!-- Shared text. -->\n공유 문장입니다.\n",
+            )
+            _write(
+                root / "i18n/ja/docusaurus-plugin-content-docs/version-12.x/b.md",
+                "<!-- Shared text. -->\n共有する文です。\n",
+            )
+            tm = memory.TranslationMemory(":memory:", root)
+
+            self.assertEqual(
+                tm.candidates("ko", "Shared text."),
+                ["<!-- Shared text. -->\n공유 문장입니다.\n"],
+            )
+            self.assertEqual(
+                tm.candidates("ja", "Shared text."),
+                ["<!-- Shared text. -->\n共有する文です。\n"],
+            )
+            self.assertEqual(tm.candidates("ko", "Twice."), [])
+            tm.close()
+
+    def test_refresh_reindexes_only_changed_and_removed_documents(self):
+        """digest가 같은 문서는 건너뛰고 바뀐 문서와 삭제된 문서만 반영."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            store = root / "state" / memory.MEMORY_FILENAME
+            kept = _write(
+                root / "versioned_docs/version-12.x/kept.md",
+                "<!-- Kept. -->\n유지합니다.\n",
+            )
+            changed = _write(
+                root / "versioned_docs/version-12.x/changed.md",
+                "<!-- Old. -->\n예전입니다.\n",
+            )
+            first = memory.TranslationMemory(store, root)
+            self.assertEqual(first.refresh(), 2)
+            first.close()
+
+            changed.write_text("<!-- New. -->\n새 문장입니다.\n", encoding="utf-8")
+            kept.unlink()
+            second = memory.TranslationMemory(store, root)
+
+            self.assertEqual(second.refresh(), 2)
+            self.assertEqual(second.refresh(), 0)
+            self.assertEqual(second.candidates("ko", "Kept."), [])
+            self.assertEqual(second.candidates("ko", "Old."), [])
+            self.assertEqual(
+                second.candidates("ko", "New."),
+                ["<!-- New. -->\n새 문장입니다.\n"],
+            )
+            second.close()
+
+    def test_recorded_document_is_visible_without_refresh(self):
+        """승인된 문서 기록을 다음 조회에 바로 반영하고 범위 밖 경로는 무시."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            tm = memory.TranslationMemory(":memory:", root)
+            tm.refresh()
+            tm.record_document(
+                root / "versioned_docs/version-12.x/new.md",
+                "<!-- Added. -->\n추가했습니다.\n",
+            )
+            tm.record_document(root / "docs/other.md", "<!-- Other. -->\n기타.\n")
+
+            self.assertEqual(
+                tm.candidates("ko", "Added."),
+                ["<!-- Added. -->\n추가했습니다.\n"],
+            )
+            self.assertEqual(tm.candidates("ko", "Other."), [])
+            tm.close()
+
+    def test_similar_blocks_rank_near_duplicates_and_stay_fixed_for_the_run(self):
+        """단어 하나가 다른 annotation을 제안하고 실행 중 기록은 제안에 반영하지 않음."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write(
+                root / "versioned_docs/version-11.x/a.md",
+                "<!-- You may call the save method on the model instance. -->\n"
+                "모델 인스턴스에서 save 메서드를 호출할 수 있습니다.\n\n"
+                "<!-- Queues allow you to defer time consuming tasks. -->\n"
+                "큐를 사용하면 시간이 걸리는 작업을 미룰 수 있습니다.\n",
+            )
+            tm = memory.TranslationMemory(":memory:", root)
+
+            similar = tm.similar(
+                "ko",
+                ["You may call the update method on the model instance."],
+            )
+            tm.record_document(
+                root / "versioned_docs/version-12.x/b.md",
+                "<!-- You may call the update method on the model instance. -->\n"
+                "모델 인스턴스에서 update 메서드를 호출할 수 있습니다.\n",
+            )
+            again = tm.similar(
+                "ko",
+                ["You may call the update method on the model instance."],
+            )
+
+            self.assertEqual(
+                similar,
+                [
+                    "<!-- You may call the save method on the model instance. -->\n"
+                    "모델 인스턴스에서 save 메서드를 호출할 수 있습니다.\n"
+                ],
+            )
+            self.assertEqual(again, similar)
+            self.assertEqual(tm.similar("ko", ["Unrelated words entirely here."]), [])
+            self.assertEqual(tm.similar("ko", ["Short."]), [])
+            tm.close()
+
+    def test_provider_request_carries_similar_blocks_for_the_locale(self):
+        """번역 메모리가 열린 실행의 요청에만 유사 번역 section 포함."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write(
+                root / "i18n/ja/docusaurus-plugin-content-docs/version-11.x/a.md",
+                "<!-- You may call the save method on the model instance. -->\n"
+                "モデルインスタンスで save メソッドを呼び出せます。\n",
+            )
+            tm = memory.TranslationMemory(":memory:", root)
+            source = "You may call the update method on the model instance.\n"
+
+            with patch.object(main, "_TRANSLATION_MEMORY", tm):
+                ja = main._translation_request(source, None, locale="ja")
+                ko = main._translation_request(source, None, locale="ko")
+            tm.close()
+
+        self.assertIn("## Similar Translated Blocks", ja.render())
+        self.assertIn("save メソッド", ja.render())
+        self.assertEqual(ko.similar_translations, ())
+
+    def test_new_document_is_filled_from_memory_without_provider_calls(self):
+        """다른 버전의 같은 annotation 번역으로 신규 문서를 provider 없이 생성."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            relative = "i18n/en/docusaurus-plugin-content-docs/version-12.x/moved.md"
+            _write(root / relative, "A sentence translated before.\n")
+            _write(
+                root / "versioned_docs/version-11.x/original.md",
+                "<!-- A sentence translated before. -->\n"
+                "이미 번역한 문장입니다.\n",
+            )
+            dest = root / "versioned_docs/version-12.x/moved.md"
+            change = diff.SourceChange(path=relative, status="A")
+            cfg = config.Config(provider="cli", values={"TRANSLATION_PROVIDER": "cli"})
+            tm = memory.TranslationMemory(":memory:", root)
+
+            with patch.object(main, "REPO_ROOT", root), patch.object(
+                main, "_TRANSLATION_MEMORY", tm
+            ), patch.object(
+                main.translate,
+                "translate_request",
+                side_effect=AssertionError("memory hit must not call provider"),
+            ):
+                issues = main._translate_one(change, cfg, "prompt", dest, locale="ko")
+
+            self.assertEqual(issues, [])
+            self.assertIn("이미 번역한 문장입니다.", dest.read_text(encoding="utf-8"))
+            self.assertEqual(
+                tm.candidates("ko", "A sentence translated before."),
+                ["<!-- A sentence translated before. -->\n이미 번역한 문장입니다.\n"],
+            )
+            tm.close()
+
+    def test_main_closes_and_resets_the_run_memory(self):
+        """main() 종료 시 열었던 번역 메모리 연결을 닫고 전역 메모리를 비움."""
+
+        opened: list[memory.TranslationMemory] = []
+
+        def open_memory(state_dir, repo_root):
+            tm = memory.TranslationMemory(state_dir / memory.MEMORY_FILENAME, repo_root)
+            opened.append(tm)
+            return tm
+
+        with tempfile.TemporaryDirectory() as tmp, patch.dict(
+            main.os.environ, {run_state.STATE_DIR_ENV: str(Path(tmp) / "state")}
+        ), patch.object(main.sys, "argv", ["main.py"]), patch.object(
+            main.config,
+            "load_config",
+            return_value=config.Config(provider="cli", values={"TRANSLATION_PROVIDER": "cli"}),
+        ), patch.object(
+            main.translation_memory, "open_memory", side_effect=open_memory
+        ), patch.object(
+            main.upstream, "main", return_value=0
+        ), patch.object(
+            main.diff, "changed_sources", return_value=[]
+        ), patch.object(
+            main, "_sync_sidebars", return_value=[]
+        ), redirect_stdout(io.StringIO()):
+            self.assertEqual(main.main(), 0)
+
+        self.assertEqual(len(opened), 1)
+        self.assertIsNone(opened[0]._connection)
+        self.assertIsNone(main._TRANSLATION_MEMORY)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@
 
 import difflib
 import unittest
+from unittest.mock import patch as mock_patch
 
 from sync import diff, patch, preprocess, verify
 
@@ -3438,5 +3439,187 @@ class AdmonitionMarkerTests(unittest.TestCase):
         self.assertEqual(result, "  > [!WARNING]\n  > 번역 본문.\n")
 
 
+class AnnotatedDocumentIndexTests(unittest.TestCase):
+    """annotation block 색인의 증분 갱신을 검증함."""
+
+    def assertMatchesFullParse(self, index: patch.AnnotatedDocumentIndex) -> None:
+        """편집 후 색인이 같은 문서의 전체 파싱 결과와 같은지 확인함."""
+
+        full = patch.AnnotatedDocumentIndex.build(index.text)
+        self.assertEqual(list(index), list(full))
+        self.assertEqual(index.lines, full.lines)
+
+    def test_spliced_index_matches_full_parse(self):
+        """교체·삭제·삽입과 code fence를 여는 편집 뒤에도 전체 파싱과 같은 block을 유지함."""
+
+        text = (
+            "# Title\n\n"
+            "<!-- Alpha. -->\n알파.\n\n"
+            "```html\n<!-- not an anchor -->\n```\n\n"
+            "<!-- Beta. -->\n베타.\n"
+            "<!-- Gamma. -->\n감마.\n\n"
+            "<!-- Delta. -->\n델타.\n"
+        )
+        index = patch.AnnotatedDocumentIndex.build(text)
+        edits = [
+            (2, 5, "<!-- Alpha changed. -->\n바뀐 알파.\n\n"),
+            (10, 12, ""),
+            (10, 10, "<!-- Inserted. -->\n삽입.\n\n"),
+            (5, 5, "```php\n"),
+            (0, 0, "<!-- Lead. -->\n머리.\n\n"),
+        ]
+        for start, end, replacement in edits:
+            with self.subTest(start=start, end=end):
+                index = index.spliced(start, end, replacement)
+                self.assertMatchesFullParse(index)
+
+    def test_overlapping_comment_blocks_fall_back_to_full_parse(self):
+        """여러 줄 주석 안의 주석 시작 줄로 block이 겹치면 전체 파싱으로 갱신함."""
+
+        text = (
+            "<!--\nLicense text\n<!-- nested\nmore text\n-->\n본문.\n\n"
+            "<!-- Tail. -->\n꼬리.\n"
+        )
+        index = patch.AnnotatedDocumentIndex.build(text)
+
+        self.assertFalse(index.disjoint)
+        spliced = index.spliced(3, 4, "")
+        self.assertMatchesFullParse(spliced)
+
+    def test_line_buffer_matches_string_splices(self):
+        """줄 버퍼 편집 결과가 문자열 재조합과 같고 줄 경계가 아닌 편집도 같은 줄로 나눔."""
+
+        text = "<!-- A. -->\n가.\n\n<!-- B. -->\n나.\n\n<!-- C. -->\n다.\n"
+        document = patch._LineBuffer(text)  # noqa: SLF001
+        expected = text
+        edits = [
+            (6, 8, "<!-- C2. -->\n다2.\n"),
+            (3, 6, ""),
+            (0, 0, "앞 줄 "),
+            (1, 1, "<!-- D. -->\n라.\n\n"),
+        ]
+        for start, end, replacement in edits:
+            with self.subTest(start=start, end=end):
+                lines = expected.splitlines(keepends=True)
+                expected = "".join(lines[:start]) + replacement + "".join(lines[end:])
+                document.splice(start, end, replacement)
+
+                self.assertEqual(document.lines, expected.splitlines(keepends=True))
+                self.assertEqual(
+                    list(document.blocks),
+                    list(patch.AnnotatedDocumentIndex.build(expected)),
+                )
+        self.assertEqual(document.text, expected)
+
+    def test_line_buffer_paths_match_the_string_splice_helper(self):
+        """색인 유무와 문자열 교체 뒤 편집까지 줄 버퍼 결과가 문자열 splice와 같음."""
+
+        text = "<!-- A. -->\n가.\n\n<!-- B. -->\n나.\n\n<!-- C. -->\n다.\n"
+        edits = [
+            (6, 8, "<!-- C2. -->\n다2.\n"),
+            (0, 0, "앞 줄 "),
+            (3, 6, ""),
+            (1, 1, "<!-- D. -->\n라.\n\n"),
+            (0, 2, "<!-- E. -->\n마."),
+        ]
+
+        def unindexed() -> patch._LineBuffer:  # noqa: SLF001
+            return patch._LineBuffer(text)  # noqa: SLF001
+
+        def indexed() -> patch._LineBuffer:  # noqa: SLF001
+            document = patch._LineBuffer(text)  # noqa: SLF001
+            document.blocks
+            return document
+
+        def replaced() -> patch._LineBuffer:  # noqa: SLF001
+            document = patch._LineBuffer("")  # noqa: SLF001
+            document.replace_text(patch._blocks(text).text)  # noqa: SLF001
+            return document
+
+        for name, build in (
+            ("unindexed", unindexed),
+            ("indexed", indexed),
+            ("replaced", replaced),
+        ):
+            with self.subTest(path=name):
+                document = build()
+                expected = text
+                for start, end, replacement in edits:
+                    lines = expected.splitlines(keepends=True)
+                    joined = "".join(lines[:start]) + replacement + "".join(lines[end:])
+                    expected = patch._spliced_text(  # noqa: SLF001
+                        expected, start, end, replacement
+                    )
+                    self.assertEqual(expected, joined)
+                    document.splice(start, end, replacement)
+                    self.assertEqual(document.lines, expected.splitlines(keepends=True))
+                self.assertEqual(document.text, expected)
+                self.assertEqual(
+                    list(document.blocks),
+                    list(patch.AnnotatedDocumentIndex.build(expected)),
+                )
+
+    def test_anchor_lookup_uses_index_positions(self):
+        """색인 조회가 정확 일치·부분 일치·연속 anchor 후보를 목록 탐색과 같게 반환함."""
+
+        text = (
+            "<!-- Shared. -->\n공유 1.\n\n"
+            "<!-- Next. -->\n다음 1.\n\n"
+            "<!-- Shared. -->\n공유 2.\n\n"
+            "<!-- Next. -->\n다음 2.\n\n"
+            "<!-- Only one longer line. -->\n한 줄.\n"
+        )
+        index = patch._blocks(text)  # noqa: SLF001
+        blocks = list(index)
+
+        for comment in ("Shared.", "longer line", "Missing."):
+            with self.subTest(comment=comment):
+                self.assertEqual(
+                    patch._matching_blocks(index, comment),  # noqa: SLF001
+                    patch._matching_blocks(blocks, comment),  # noqa: SLF001
+                )
+        self.assertEqual(
+            patch._anchored_block_candidates(index, ("Shared.", "Next.")),  # noqa: SLF001
+            [(blocks[0], blocks[1]), (blocks[2], blocks[3])],
+        )
+        self.assertEqual(index.index(blocks[3]), 3)
+
+    def test_apply_plan_parses_input_and_result_once_for_annotated_edits(self):
+        """annotation block 교체가 이어져도 입력과 결과 문서만 한 번씩 파싱함."""
+
+        old = "First.\n\nSecond.\n\nThird.\n\nFourth.\n"
+        new = "First changed.\n\nSecond.\n\nThird changed.\n\nFourth changed.\n"
+        existing = (
+            "<!-- First. -->\n첫째.\n\n"
+            "<!-- Second. -->\n둘째.\n\n"
+            "<!-- Third. -->\n셋째.\n\n"
+            "<!-- Fourth. -->\n넷째.\n"
+        )
+        translated = [
+            "<!-- First changed. -->\n첫째 변경.\n",
+            "<!-- Third changed. -->\n셋째 변경.\n",
+            "<!-- Fourth changed. -->\n넷째 변경.\n",
+        ]
+        plan = _plan(old, new)
+        patch._DOCUMENT_INDEXES.clear()  # noqa: SLF001
+
+        with mock_patch.object(
+            patch.AnnotatedDocumentIndex,
+            "from_lines",
+            wraps=patch.AnnotatedDocumentIndex.from_lines,
+        ) as parse:
+            result = patch.apply_plan(existing, plan, translated)
+
+        self.assertEqual(len(plan.changes), 3)
+        self.assertEqual(parse.call_count, 2)
+        self.assertEqual(
+            result,
+            "<!-- First changed. -->\n첫째 변경.\n\n"
+            "<!-- Second. -->\n둘째.\n\n"
+            "<!-- Third changed. -->\n셋째 변경.\n\n"
+            "<!-- Fourth changed. -->\n넷째 변경.\n",
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,203 @@
+"""PatchPlan 직렬화 형식과 계획 저장소의 재사용·무효화 검증."""
+
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+import main
+from sync import config, diff
+from sync.runtime import state as run_state
+from sync.translation import patch as patch_utils
+from sync.translation import plan_cache
+
+
+def _plan(old: str, new: str) -> patch_utils.PatchPlan:
+    """메모리의 두 원문 사이 계획."""
+
+    return patch_utils.build_plan(diff.hunks_between(old, new), new)
+
+
+_REORDER_OLD = (
+    "# Doc\n\n- [Alpha](#alpha)\n- [Beta](#beta)\n\n"
+    '<a name="alpha"></a>\n## Alpha\n\nAlpha body.\n\n'
+    '<a name="beta"></a>\n## Beta\n\nBeta body.\n'
+)
+_REORDER_NEW = (
+    "# Doc\n\n- [Beta](#beta)\n- [Alpha](#alpha)\n\n"
+    '<a name="beta"></a>\n## Beta\n\nBeta body.\n\n'
+    '<a name="alpha"></a>\n## Alpha\n\nAlpha body.\n'
+)
+_CODE_OLD = "Intro.\n\n```php\nreturn 1;\n```\n\n| A | B |\n|---|---|\n| x | y |\n"
+_CODE_NEW = "Intro.\n\n```php\nreturn 2;\n```\n\n| A | B |\n|---|---|\n| x | z |\n"
+
+
+class PlanFormatTests(unittest.TestCase):
+    """계획 JSON 형식의 왕복과 엄격한 복원 테스트 모음."""
+
+    def test_plans_round_trip_through_the_stable_format(self):
+        """이름 절 재배치·코드·표·생성 계획이 같은 값으로 복원되고 표현이 안정됨."""
+
+        plans = [
+            _plan(_REORDER_OLD, _REORDER_NEW),
+            _plan("Intro.\n", "Intro.\n\n<!-- note -->\n\nAdded.\n"),
+            _plan(_CODE_OLD, _CODE_NEW),
+            patch_utils.build_create_plan("---\ntitle: T\n---\n\n# Doc\n\nBody.\n"),
+        ]
+        self.assertIsNotNone(plans[0].named_section_reorder)
+
+        for plan in plans:
+            with self.subTest(plan=plan):
+                encoded = plan_cache.encode_plan(plan)
+                restored = plan_cache.decode_plan(encoded)
+
+                self.assertEqual(restored, plan)
+                self.assertEqual(plan_cache.encode_plan(restored), encoded)
+
+    def test_malformed_plans_are_rejected(self):
+        """형식 버전·field 구성·값 형식이 맞지 않으면 ``ValueError``."""
+
+        document = json.loads(
+            plan_cache.encode_plan(_plan("Intro.\n", "Intro changed.\n"))
+        )
+        change = document["plan"]["changes"][0]
+        variants = [
+            {**document, "format": plan_cache.PLAN_FORMAT_VERSION + 1},
+            {**document, "plan": {**document["plan"], "extra": 1}},
+            {**document, "plan": {**document["plan"], "is_create": 0}},
+            {
+                **document,
+                "plan": {
+                    **document["plan"],
+                    "changes": [{**change, "old_block_ordinal": "1"}],
+                },
+            },
+        ]
+        for variant in variants:
+            with self.subTest(variant=variant), self.assertRaises(ValueError):
+                plan_cache.decode_plan(json.dumps(variant))
+
+
+class PatchPlanCacheTests(unittest.TestCase):
+    """계획 저장소의 key 구성과 영속성 테스트 모음."""
+
+    def test_persisted_plan_is_reused_until_the_implementation_changes(self):
+        """저장된 계획을 다음 실행이 재사용하고 구현 digest가 바뀌면 다시 계산."""
+
+        plan = _plan(_CODE_OLD, _CODE_NEW)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / plan_cache.PLAN_CACHE_FILENAME
+            first = plan_cache.PatchPlanCache(path, implementation="a")
+            first.plan(first.key("modified", _CODE_OLD, _CODE_NEW), lambda: plan)
+            first.close()
+
+            second = plan_cache.PatchPlanCache(path, implementation="a")
+            reused = second.plan(
+                second.key("modified", _CODE_OLD, _CODE_NEW),
+                lambda: self.fail("cached plan must not be rebuilt"),
+            )
+            second.close()
+
+            changed = plan_cache.PatchPlanCache(path, implementation="b")
+            self.assertIsNone(
+                changed.lookup(changed.key("modified", _CODE_OLD, _CODE_NEW))
+            )
+            changed.close()
+
+        self.assertEqual(reused, plan)
+        self.assertEqual((second.hits, second.misses), (1, 0))
+
+    def test_plan_state_is_keyed_by_the_existing_document(self):
+        """계획 상태는 locale 문서별로 기록하고 판정 실패는 기록하지 않음."""
+
+        plan = _plan("Intro.\n", "Intro changed.\n")
+        cache = plan_cache.PatchPlanCache(None, implementation="a")
+        calls: list[str | None] = []
+
+        def compute(existing):
+            calls.append(existing)
+            return patch_utils.plan_state(existing, plan)
+
+        source = "<!-- Intro. -->\n소개.\n"
+        target = "<!-- Intro changed. -->\n소개 변경.\n"
+        states = [
+            cache.state(plan, existing, lambda existing=existing: compute(existing))
+            for existing in (source, source, target)
+        ]
+        with self.assertRaises(patch_utils.PatchError):
+            cache.state(plan, None, lambda: compute(None))
+        with self.assertRaises(patch_utils.PatchError):
+            cache.state(plan, None, lambda: compute(None))
+
+        self.assertEqual(
+            states,
+            [
+                patch_utils.PlanState.SOURCE,
+                patch_utils.PlanState.SOURCE,
+                patch_utils.PlanState.TARGET,
+            ],
+        )
+        self.assertEqual(calls, [source, target, None, None])
+
+    def test_main_modified_plan_consults_the_run_cache(self):
+        """수정 문서 계획 구성이 실행 저장소의 계획을 재사용."""
+
+        old = "Intro.\n\nBody.\n"
+        current = "Intro.\n\nBody changed.\n"
+        change = diff.SourceChange(
+            path="i18n/en/docusaurus-plugin-content-docs/version-13.x/example.md",
+            status="M",
+            hunks=diff.hunks_between(old, current),
+        )
+        cache = plan_cache.PatchPlanCache(None, implementation="a")
+
+        with patch.object(main, "_PLAN_CACHE", cache):
+            first, _ = main._build_modified_plan(change, current)
+            with patch.object(
+                main.patch_utils,
+                "build_plan",
+                side_effect=AssertionError("cache hit must not rebuild"),
+            ):
+                second, pair = main._build_modified_plan(change, current)
+
+        self.assertIs(second, first)
+        self.assertEqual(pair.current.text, current)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_main_closes_and_resets_the_run_plan_cache(self):
+        """main() 종료 시 열었던 계획 저장소 연결을 닫고 전역 저장소를 비움."""
+
+        opened: list[plan_cache.PatchPlanCache] = []
+
+        def open_plan_cache(state_dir):
+            cache = plan_cache.PatchPlanCache(state_dir / plan_cache.PLAN_CACHE_FILENAME)
+            opened.append(cache)
+            return cache
+
+        with tempfile.TemporaryDirectory() as tmp, patch.dict(
+            main.os.environ, {run_state.STATE_DIR_ENV: str(Path(tmp) / "state")}
+        ), patch.object(main.sys, "argv", ["main.py"]), patch.object(
+            main.config,
+            "load_config",
+            return_value=config.Config(provider="cli", values={"TRANSLATION_PROVIDER": "cli"}),
+        ), patch.object(
+            main.plan_cache, "open_plan_cache", side_effect=open_plan_cache
+        ), patch.object(
+            main.upstream, "main", return_value=0
+        ), patch.object(
+            main.diff, "changed_sources", return_value=[]
+        ), patch.object(
+            main, "_sync_sidebars", return_value=[]
+        ), redirect_stdout(io.StringIO()):
+            self.assertEqual(main.main(), 0)
+
+        self.assertEqual(len(opened), 1)
+        self.assertIsNone(opened[0]._connection)
+        self.assertIsNone(main._PLAN_CACHE)
+
+
+if __name__ == "__main__":
+    unittest.main()
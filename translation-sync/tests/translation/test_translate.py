@@ -4,6 +4,7 @@ import errno
 import subprocess
 import traceback
 import unittest
+from dataclasses import replace
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from types import SimpleNamespace
@@ -109,6 +110,32 @@ class TranslateRetryTests(unittest.TestCase):
             rendered,
         )
 
+    def test_translation_request_renders_similar_blocks_after_existing_context(self):
+        """유사 번역 블록 section을 기존 문맥 뒤에 두고 없으면 생략하는지 검증."""
+
+        plain = translate.TranslationRequest(
+            source="Source.\n",
+            existing_translation=None,
+        )
+        request = translate.TranslationRequest(
+            source="Source.\n",
+            existing_translation=None,
+            similar_translations=(
+                "<!-- Similar one. -->\n비슷한 첫 문장.\n",
+                "<!-- Similar two. -->\n비슷한 둘째 문장.",
+            ),
+        )
+
+        self.assertNotIn("## Similar Translated Blocks", plain.render())
+        self.assertIn(
+            "## Existing Translation Context\n\n(none)\n\n"
+            "## Similar Translated Blocks\n\n"
+            "<!-- Similar one. -->\n비슷한 첫 문장.\n\n"
+            "<!-- Similar two. -->\n비슷한 둘째 문장.\n\n"
+            "## Output",
+            request.render(),
+        )
+
     def test_identity_test_config_has_no_api_credentials(self):
         """테스트용 `identity` 설정이 API 인증을 갖지 않는지 검증."""
 
@@ -231,10 +258,12 @@ class TranslateRetryTests(unittest.TestCase):
                 "OPENAI_ORG_ID": "unapproved-org-id",
                 "OPENAI_PROJECT": "unapproved-project",
                 "OPENAI_PROJECT_ID": "unapproved-project-id",
+                config.OPENAI_BASE_URL_OVERRIDE_KEY: "http://127.0.0.1:9/v1",
             }
         )
 
         for key in (
+            config.OPENAI_BASE_URL_OVERRIDE_KEY,
             "OPENAI_BASE_URL",
             "OPENAI_ORGANIZATION",
             "OPENAI_ORG_ID",
@@ -641,6 +670,68 @@ class TranslateRetryTests(unittest.TestCase):
             ):
                 translate._validate_request_budget(instructions, payload, cfg)
 
+    def test_similar_translations_are_dropped_to_fit_a_near_limit_block(self):
+        """예산 한계 근처 block은 넘치는 유사 번역만 빼고 그대로 요청되는지 검증."""
+
+        large = "<!-- Large. -->\n" + "한" * 1000 + "\n"
+        small = "<!-- Small. -->\n짧은 번역.\n"
+        request = translate.TranslationRequest(
+            source="Near-limit source.\n",
+            existing_translation=None,
+            version="12.x",
+            similar_translations=(large, small),
+        )
+        base = translate.TranslationRequest(
+            source=request.source,
+            existing_translation=None,
+            version="12.x",
+        )
+        instructions = translate.effective_prompt("prompt")
+        reserved_output = 200
+        base_bytes = len((instructions + base.render()).encode("utf-8"))
+
+        def cfg(slack: int) -> config.Config:
+            """base 요청보다 ``slack`` token 넓은 context window 설정."""
+
+            return config.Config(
+                provider="cli",
+                values={
+                    "TRANSLATION_PROVIDER": "cli",
+                    "TRANSLATION_MODEL": "gpt-5.6-luna",
+                    **REQUEST_BUDGET_ENV,
+                    "TRANSLATION_CONTEXT_WINDOW_TOKENS": str(
+                        translate.PROVIDER_FRAMING_OVERHEAD_TOKENS
+                        + base_bytes
+                        + reserved_output
+                        + slack
+                    ),
+                    "TRANSLATION_RESERVED_OUTPUT_TOKENS": str(reserved_output),
+                },
+            )
+
+        near_limit = cfg(200)
+        with self.assertRaises(translate.UnsupportedOversizeBlock):
+            translate._validate_request_budget(instructions, request.render(), near_limit)
+        translate.preflight_request(request, near_limit, "prompt")
+        with patch.object(
+            translate,
+            "_translate_chunk",
+            return_value="번역.",
+        ) as provider:
+            translate.translate_request(
+                request,
+                near_limit,
+                "prompt",
+                deadline=100.0,
+                clock=lambda: 0.0,
+            )
+
+        sent = provider.call_args.args[0]
+        self.assertIn("짧은 번역.", sent)
+        self.assertNotIn("한" * 1000, sent)
+        with self.assertRaisesRegex(translate.UnsupportedOversizeBlock, "context window"):
+            translate.preflight_request(request, cfg(-1), "prompt")
+
     def test_budgeted_request_requires_injected_absolute_deadline(self):
         """예산이 지정된 요청의 주입된 절대 기한 요구 검증."""
 
@@ -841,7 +932,7 @@ class TranslateRetryTests(unittest.TestCase):
         request = translate.TranslationRequest(
             source="Source.\n",
             existing_translation=None,
-            response_contract_version=2,
+            response_contract_version=3,
         )
         cfg = config.Config(provider="cli", values={"TRANSLATION_PROVIDER": "cli"})
 
@@ -852,7 +943,7 @@ class TranslateRetryTests(unittest.TestCase):
         ) as provider:
             with self.assertRaisesRegex(
                 translate.ProviderRequestRejected,
-                "unsupported response contract version: 2",
+                "unsupported response contract version: 3",
             ):
                 translate.translate_request(request, cfg, "prompt")
 
@@ -863,13 +954,13 @@ class TranslateRetryTests(unittest.TestCase):
 
         with self.assertRaisesRegex(
             ValueError,
-            "unsupported response contract version: 2",
+            "unsupported response contract version: 3",
         ):
             response_contract.verify(
                 "Source.\n",
                 "Source.\n",
                 locale=None,
-                contract_version=2,
+                contract_version=3,
             )
 
     def test_retry_does_not_wait_when_next_call_would_exceed_deadline(self):
@@ -1295,6 +1386,9 @@ class TranslateRetryTests(unittest.TestCase):
             input=request.render(),
             reasoning={"effort": "medium"},
             store=False,
+            prompt_cache_key=translate.prompt_cache_key(
+                "prompt" + translate._ANNOTATION_FORMAT
+            ),
             max_output_tokens=200,
         )
 
@@ -1399,6 +1493,47 @@ class TranslateRetryTests(unittest.TestCase):
         self.assertEqual(out, "a\n\nb\n")
         self.assertEqual(calls, ["a\n\nb\n"])
 
+    def test_attempt_counter_records_requests_latency_and_tokens(self):
+        """계측 기록기가 요청 수, provider 시간과 입출력 token을 누적하는지 검증."""
+
+        cfg = config.Config(
+            provider="cli",
+            values={
+                "TRANSLATION_PROVIDER": "cli",
+                "TRANSLATION_MODEL": "gpt-5.6-luna",
+                **REQUEST_BUDGET_ENV,
+            },
+        )
+        counted = translate.ProviderAttemptCounter(count_tokens=True)
+        uncounted = translate.ProviderAttemptCounter()
+
+        with patch.object(
+            translate, "_translate_chunk", return_value="번역"
+        ), patch.object(
+            translate, "_count_tokens", side_effect=lambda text, _: len(text)
+        ):
+            for counter in (counted, uncounted):
+                translate.translate_text(
+                    "a\n\nb\n",
+                    cfg,
+                    "prompt",
+                    split=False,
+                    deadline=1000.0,
+                    clock=lambda: 0.0,
+                    attempt_counter=counter,
+                )
+
+        system = translate.effective_prompt("prompt")
+        self.assertEqual(counted.requests, 1)
+        self.assertEqual(counted.transport, 1)
+        self.assertEqual(counted.input_tokens, len(system) + len("a\n\nb\n"))
+        self.assertEqual(counted.output_tokens, len("번역"))
+        self.assertGreaterEqual(counted.provider_seconds, 0.0)
+        self.assertEqual(
+            (uncounted.requests, uncounted.input_tokens, uncounted.output_tokens),
+            (1, 0, 0),
+        )
+
     def test_identity_request_returns_canonical_annotated_source_without_live_provider(self):
         """`identity` 요청에서 실시간 제공자 없이 표준 주석 원문 반환 검증."""
 
@@ -1620,6 +1755,119 @@ class TranslateRetryTests(unittest.TestCase):
 
         self.assertEqual(process.call_args.kwargs["timeout"], 17)
 
+    def test_packed_request_renders_each_block_after_its_delimiter(self):
+        """묶음 요청이 block마다 구분선과 단일 요청 section을 포함하는지 검증."""
+
+        first = translate.TranslationRequest(source="One.\n", existing_translation=None)
+        second = translate.TranslationRequest(
+            source="Two.\n", existing_translation="둘.", diff_text="+ Two."
+        )
+
+        rendered = translate.PackedTranslationRequest((first, second)).render()
+
+        self.assertTrue(first.render().endswith(first.sections() + "## Output\n\n"
+            "Return only the translated Markdown block(s) for the English Source."))
+        self.assertIn(
+            "=== translation-sync block 1 ===\n\n" + first.sections()
+            + "=== translation-sync block 2 ===\n\n" + second.sections(),
+            rendered,
+        )
+
+    def test_document_context_is_the_shared_prefix_of_block_requests(self):
+        """같은 문서의 block 요청이 문서 문맥까지 같은 prefix를 갖는지 검증."""
+
+        context = "<!-- ## Routing -->\n## 라우팅\n"
+        first = translate.TranslationRequest(
+            source="One.\n",
+            existing_translation="하나.",
+            diff_text="+ One.",
+            document_context=context,
+        )
+        second = translate.TranslationRequest(
+            source="Two.\n",
+            existing_translation="둘.",
+            diff_text="+ Two.",
+            document_context=context,
+        )
+        prefix = "# Translation Sync Input\n\n## Document Headings\n\n" + context + "\n"
+
+        self.assertTrue(first.render().startswith(prefix + "## English Diff"))
+        self.assertTrue(second.render().startswith(prefix + "## English Diff"))
+        self.assertNotIn(
+            "## Document Headings",
+            translate.TranslationRequest(source="One.\n", existing_translation=None).render(),
+        )
+        packed = translate.PackedTranslationRequest((first, second)).render()
+        self.assertTrue(
+            packed.startswith(
+                "# Translation Sync Packed Input\n\n## Document Headings\n\n"
+                + context
+                + "\nThe 2 blocks below"
+            )
+        )
+        self.assertEqual(packed.count("## Document Headings"), 1)
+        with self.assertRaisesRegex(ValueError, "one document context"):
+            translate.PackedTranslationRequest(
+                (first, replace(second, document_context=None))
+            )
+
+    def test_pack_requests_groups_adjacent_small_requests_within_budget(self):
+        """작은 연속 요청만 block 수·출력 예산 안에서 묶는지 검증."""
+
+        cfg = config.Config(
+            provider="openai",
+            values={
+                "TRANSLATION_MODEL": "gpt-5.6-luna",
+                "TRANSLATION_PACK_MAX_BLOCKS": "3",
+                **REQUEST_BUDGET_ENV,
+                "TRANSLATION_RESERVED_OUTPUT_TOKENS": "2000",
+            },
+        )
+        small = translate.TranslationRequest(source="Short.\n", existing_translation=None)
+        large = translate.TranslationRequest(
+            source="word " * translate.PACK_MAX_BLOCK_TOKENS, existing_translation=None
+        )
+        requests = [small, small, small, small, large, small, small]
+
+        self.assertEqual(
+            translate.pack_requests(requests, cfg, "prompt"),
+            [[0, 1, 2], [5, 6]],
+        )
+        tight = config.Config(
+            provider="openai",
+            values={**cfg.values, "TRANSLATION_RESERVED_OUTPUT_TOKENS": "150"},
+        )
+        self.assertEqual(translate.pack_requests(requests, tight, "prompt"), [])
+        disabled = config.Config(
+            provider="openai",
+            values={**cfg.values, "TRANSLATION_PACK_MAX_BLOCKS": "0"},
+        )
+        self.assertEqual(translate.pack_requests(requests, disabled, "prompt"), [])
+        other = replace(small, document_context="<!-- # Other -->\n# 다른 문서\n")
+        self.assertEqual(
+            translate.pack_requests([small, small, other, other], cfg, "prompt"),
+            [[0, 1], [2, 3]],
+        )
+
+    def test_split_packed_response_requires_every_delimiter_in_order(self):
+        """구분선이 순서대로 모두 있을 때만 block 응답으로 분리하는지 검증."""
+
+        response = (
+            "=== translation-sync block 1 ===\n\n하나.\n\n"
+            "=== translation-sync block 2 ===\n둘.\n"
+        )
+
+        self.assertEqual(translate.split_packed_response(response, 2), ["하나.", "둘."])
+        self.assertIsNone(translate.split_packed_response(response, 3))
+        self.assertIsNone(
+            translate.split_packed_response("preamble\n" + response, 2)
+        )
+        self.assertIsNone(
+            translate.split_packed_response(
+                response.replace("block 1", "block 3"), 2
+            )
+        )
+
     def test_cli_atomic_output_preserves_source_ending(self):
         """CLI 원자적 출력의 원문 끝 형식 보존 검증."""
 
@@ -0,0 +1,144 @@
+"""응답 계약 판정 memo의 재사용과 무효화 검증."""
+
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+import main
+from sync import config, diff
+from sync.runtime import state as run_state
+from sync.verification import contract_memo
+
+
+class VerifiedBlockMemoTests(unittest.TestCase):
+    """판정 memo의 key 구성과 영속성 테스트 모음."""
+
+    def test_persisted_verdict_is_reused_by_a_new_process_memo(self):
+        """저장된 판정을 다음 실행의 memo가 계산 없이 재사용."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / contract_memo.MEMO_FILENAME
+            first = contract_memo.VerifiedBlockMemo(path, implementation="a")
+            self.assertEqual(
+                first.issues(
+                    "응답",
+                    "Source.",
+                    scope="locale:ko",
+                    compute=lambda: ["issue"],
+                ),
+                ["issue"],
+            )
+            first.close()
+
+            second = contract_memo.VerifiedBlockMemo(path, implementation="a")
+            issues = second.issues(
+                "응답",
+                "Source.",
+                scope="locale:ko",
+                compute=lambda: self.fail("memo hit must not recompute"),
+            )
+            second.close()
+
+        self.assertEqual(issues, ["issue"])
+        self.assertEqual((second.hits, second.misses), (1, 0))
+
+    def test_scope_and_implementation_are_part_of_the_key(self):
+        """판정 범위나 구현 digest가 다르면 이전 판정을 재사용하지 않음."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / contract_memo.MEMO_FILENAME
+            memo = contract_memo.VerifiedBlockMemo(path, implementation="a")
+            memo.store(memo.key("응답", "Source.", scope="locale:ko"), [])
+            self.assertIsNone(
+                memo.lookup(memo.key("응답", "Source.", scope="locale:ja"))
+            )
+            memo.close()
+
+            changed = contract_memo.VerifiedBlockMemo(path, implementation="b")
+            self.assertIsNone(
+                changed.lookup(changed.key("응답", "Source.", scope="locale:ko"))
+            )
+            changed.close()
+
+    def test_unusable_store_falls_back_to_recomputation(self):
+        """열 수 없는 저장소는 판정을 생략하지 않고 매번 계산."""
+
+        with tempfile.TemporaryDirectory() as tmp:
+            blocker = Path(tmp) / "file"
+            blocker.write_text("", encoding="utf-8")
+            memo = contract_memo.VerifiedBlockMemo(
+                blocker / contract_memo.MEMO_FILENAME,
+                implementation="a",
+            )
+            calls: list[int] = []
+            memo.issues("a", "b", scope="locale:ko", compute=lambda: calls.append(1) or [])
+            fresh = contract_memo.VerifiedBlockMemo(
+                blocker / contract_memo.MEMO_FILENAME,
+                implementation="a",
+            )
+            fresh.issues("a", "b", scope="locale:ko", compute=lambda: calls.append(1) or [])
+
+        self.assertEqual(calls, [1, 1])
+
+    def test_main_contract_issues_consult_the_run_memo(self):
+        """주 파이프라인 계약 판정이 identity 경로까지 memo를 재사용."""
+
+        change = diff.SourceChange(
+            path="i18n/en/docusaurus-plugin-content-docs/version-12.x/example.md",
+            status="A",
+        )
+        cfg = config.Config(
+            provider="identity",
+            values={"TRANSLATION_PROVIDER": "identity"},
+        )
+        memo = contract_memo.VerifiedBlockMemo(None, implementation="a")
+        source = "Source paragraph.\n"
+        translated = "<!-- Source paragraph. -->\nSource paragraph.\n"
+
+        with patch.object(main, "_CONTRACT_MEMO", memo):
+            first = main._contract_issues(translated, source, cfg, change, "ko")
+            with patch.object(
+                main.response_contract,
+                "verify",
+                side_effect=AssertionError("memo hit must not verify"),
+            ):
+                second = main._contract_issues(translated, source, cfg, change, "ko")
+
+        self.assertEqual(first, second)
+        self.assertEqual((memo.hits, memo.misses), (1, 1))
+
+    def test_main_closes_and_resets_the_run_memo(self):
+        """main() 종료 시 열었던 memo 연결을 닫고 전역 memo를 비움."""
+
+        opened: list[contract_memo.VerifiedBlockMemo] = []
+
+        def open_memo(state_dir):
+            memo = contract_memo.VerifiedBlockMemo(state_dir / contract_memo.MEMO_FILENAME)
+            opened.append(memo)
+            return memo
+
+        with tempfile.TemporaryDirectory() as tmp, patch.dict(
+            main.os.environ, {run_state.STATE_DIR_ENV: str(Path(tmp) / "state")}
+        ), patch.object(main.sys, "argv", ["main.py"]), patch.object(
+            main.config,
+            "load_config",
+            return_value=config.Config(provider="cli", values={"TRANSLATION_PROVIDER": "cli"}),
+        ), patch.object(main.contract_memo, "open_memo", side_effect=open_memo), patch.object(
+            main.upstream, "main", return_value=0
+        ), patch.object(
+            main.diff, "changed_sources", return_value=[]
+        ), patch.object(
+            main, "_sync_sidebars", return_value=[]
+        ), redirect_stdout(io.StringIO()):
+            self.assertEqual(main.main(), 0)
+
+        self.assertEqual(len(opened), 1)
+        self.assertIsNone(opened[0]._connection)
+        self.assertIsNone(main._CONTRACT_MEMO)
+
+
+if __name__ == "__main__":
+    unittest.main()
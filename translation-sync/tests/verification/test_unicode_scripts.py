@@ -0,0 +1,65 @@
+"""생성된 Unicode 문자 체계 범위표와 ``unicodedata`` 판정의 동치성 검증."""
+
+import sys
+import unicodedata
+import unittest
+
+from sync import response_contract
+from sync.verification import generate_unicode_scripts, unicode_scripts
+
+
+class UnicodeScriptTableTests(unittest.TestCase):
+    """범위표 조회가 이름·범주 기반 판정과 모든 code point에서 같은지 검증."""
+
+    def test_ranges_are_sorted_disjoint_closed_intervals(self):
+        """bisect 조회가 가정하는 정렬·비중첩 구간 형태 유지."""
+
+        for ranges in (
+            unicode_scripts.LETTER_RANGES,
+            unicode_scripts.HANGUL_LETTER_RANGES,
+            unicode_scripts.JAPANESE_LETTER_RANGES,
+        ):
+            previous_end = -2
+            for start, end in ranges:
+                self.assertLessEqual(start, end)
+                self.assertGreater(start, previous_end + 1)
+                previous_end = end
+
+    @unittest.skipUnless(
+        unicodedata.unidata_version == unicode_scripts.UNICODE_DATA_VERSION,
+        "range tables were generated from a different unicodedata version",
+    )
+    def test_lookup_matches_unicodedata_for_every_code_point(self):
+        """전체 code point에서 Letter·한글·가나/한자 판정이 일치."""
+
+        mismatches: list[tuple[str, int]] = []
+        for codepoint in range(sys.maxunicode + 1):
+            char = chr(codepoint)
+            if response_contract._is_unicode_15_1_letter(char) != (
+                generate_unicode_scripts.is_unicode_15_1_letter(char)
+            ):
+                mismatches.append(("letter", codepoint))
+            if response_contract._target_script_count(char, "ko") != int(
+                generate_unicode_scripts.is_hangul_letter(char)
+            ):
+                mismatches.append(("ko", codepoint))
+            if response_contract._target_script_count(char, "ja") != int(
+                generate_unicode_scripts.is_japanese_letter(char)
+            ):
+                mismatches.append(("ja", codepoint))
+
+        self.assertEqual(mismatches, [])
+
+    def test_target_script_ratio_counts_mixed_prose(self):
+        """혼합 산문의 목표 문자 비율을 범위표로 계산."""
+
+        self.assertEqual(response_contract.target_script_ratio("한국어ab", "ko"), 0.6)
+        self.assertEqual(
+            response_contract.target_script_ratio("ひらがなカタカナ漢字", "ja"),
+            1.0,
+        )
+        self.assertEqual(response_contract.target_script_ratio("abc", "ja"), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@
 import unittest
 
 from sync import response_contract, verify
+from sync.common.stale_links import default_stale_link_registry
 
 
 class VerifyContentTests(unittest.TestCase):
@@ -1427,11 +1428,15 @@ echo 'ok';
         target = "#actions-handled-by-resource-controller"
 
         self.assertEqual(
-            verify._normalize_link_target(target, version="9.x"),
+            verify._normalize_link_target(
+                target, version="9.x", registry=default_stale_link_registry()
+            ),
             target,
         )
         self.assertEqual(
-            verify._normalize_link_target(target, version="10.x"),
+            verify._normalize_link_target(
+                target, version="10.x", registry=default_stale_link_registry()
+            ),
             "#actions-handled-by-resource-controllers",
         )
 
@@ -1441,11 +1446,15 @@ echo 'ok';
         target = "#agents-integration"
 
         self.assertEqual(
-            verify._normalize_link_target(target, version="12.x"),
+            verify._normalize_link_target(
+                target, version="12.x", registry=default_stale_link_registry()
+            ),
             "#agent-integration",
         )
         self.assertEqual(
-            verify._normalize_link_target(target, version="13.x"),
+            verify._normalize_link_target(
+                target, version="13.x", registry=default_stale_link_registry()
+            ),
             target,
         )
 